@@ -3,7 +3,6 @@ The Fourth datetime library. ALl public names should be imported here and
 declared in __all__.
 
 TODO feature list:
-* spanning datetime type
 * setup changelog - semantic version statement
 * Docs
 """
@@ -11,6 +10,81 @@ from __future__ import annotations
 
 __version__ = "0.0.11"
 
-__all__ = ("LocalDatetime", "UTCDatetime")
+__all__ = (
+    "Format",
+    "Instant",
+    "LocalDatetime",
+    "LocalDatetimeArray",
+    "LocalDatetimeRange",
+    "LocalInterval",
+    "LocalIntervalIndex",
+    "LocalIntervalSet",
+    "LocalTimeIndex",
+    "ParseCache",
+    "ParseResult",
+    "UTCDatetime",
+    "UTCDatetimeArray",
+    "UTCDatetimeRange",
+    "UTCInterval",
+    "UTCIntervalIndex",
+    "UTCIntervalSet",
+    "UTCTimeIndex",
+    "Zone",
+)
 
-from .types import LocalDatetime, UTCDatetime
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+from .array import (
+    LocalDatetimeArray,
+    LocalDatetimeRange,
+    UTCDatetimeArray,
+    UTCDatetimeRange,
+)
+from .cache import ParseCache
+from .format import Format
+from .instant import Instant
+from .types import LocalDatetime, ParseResult, UTCDatetime
+from .zone import Zone
+
+# the modules of the optional subsystems, by the public names they provide, only
+# imported when one of the names is first used, to keep `import fourth` fast
+_LAZY_NAMES = {
+    "LocalIntervalIndex": ".index",
+    "LocalTimeIndex": ".index",
+    "UTCIntervalIndex": ".index",
+    "UTCTimeIndex": ".index",
+    "LocalInterval": ".interval",
+    "LocalIntervalSet": ".interval",
+    "UTCInterval": ".interval",
+    "UTCIntervalSet": ".interval",
+}
+
+if TYPE_CHECKING:
+    from .index import (
+        LocalIntervalIndex,
+        LocalTimeIndex,
+        UTCIntervalIndex,
+        UTCTimeIndex,
+    )
+    from .interval import LocalInterval, LocalIntervalSet, UTCInterval, UTCIntervalSet
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the module of an optional subsystem when one of its names is first used.
+
+    :raises AttributeError: When the name isn't one of them.
+    """
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+    # later uses find the name without calling this again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
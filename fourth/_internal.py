@@ -4,7 +4,34 @@ Anything defined here IS NOT part of the public API, and can change at any time.
 """
 from __future__ import annotations
 
-__all__ = ("contains_timezone",)
+__all__ = (
+    "EPOCH_NAIVE",
+    "EPOCH_ORDINAL",
+    "EPOCH_UTC",
+    "ISO_SUFFIXES",
+    "MAX_EPOCH_US",
+    "MIN_EPOCH_US",
+    "ONE_MICROSECOND",
+    "common_type",
+    "contains_timezone",
+    "datetime_to_epoch_us",
+    "epoch_us_to_datetime",
+    "timedelta_to_us",
+)
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+
+if TYPE_CHECKING:
+    from .types import BaseDatetime
+
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+EPOCH_NAIVE = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+# the proleptic Gregorian ordinal of 1970-01-01
+EPOCH_ORDINAL = EPOCH_NAIVE.toordinal()
+# the text iso_format() writes after the time, by the _tzinfo of the Datetime type
+ISO_SUFFIXES: Dict[Optional[timezone], str] = {None: "", timezone.utc: "+00:00"}
 
 
 def contains_timezone(format_string: str) -> bool:
@@ -28,3 +55,72 @@ def contains_timezone(format_string: str) -> bool:
                 is_format_char = True
 
     return False  # reached end of string without finding one, return False
+
+
+def common_type(values: List[Any], verb: str) -> Optional[Type[BaseDatetime]]:
+    """
+    Find the Datetime type of a list of values, for the bulk functions that take
+    values of either type but not a mix of them.
+
+    :param values: The values to check.
+    :param verb: What is done with the values, for the error message.
+    :return: LocalDatetime or UTCDatetime, whichever all the values are instances
+        of, or None if there are no values.
+    :raises TypeError: When the values aren't all LocalDatetime or all UTCDatetime.
+    """
+    from .types import LocalDatetime, UTCDatetime
+
+    if not values:
+        return None
+
+    for cls in (LocalDatetime, UTCDatetime):
+        if isinstance(values[0], cls):
+            if all(isinstance(value, cls) for value in values):
+                return cls
+            break
+
+    raise TypeError(f"can only {verb} values that are all LocalDatetime or UTCDatetime")
+
+
+def datetime_to_epoch_us(at: datetime) -> int:
+    """
+    Convert a datetime to an integer number of microseconds since the epoch.
+
+    Aware datetimes are measured from the UTC epoch, naive datetimes are measured
+    from the naive (wall clock) epoch.
+
+    :param at: The datetime to convert.
+    :return: The number of microseconds since 1970-01-01T00:00:00.
+    """
+    delta = at - (EPOCH_NAIVE if at.tzinfo is None else EPOCH_UTC)
+    # cheaper than floor dividing by ONE_MICROSECOND
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def timedelta_to_us(delta: timedelta) -> int:
+    """
+    Convert a timedelta to an integer number of microseconds.
+
+    :param delta: The timedelta to convert.
+    :return: The number of microseconds.
+    """
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def epoch_us_to_datetime(microseconds: int, tzinfo: Optional[timezone]) -> datetime:
+    """
+    Convert an integer number of microseconds since the epoch to a datetime.
+    The inverse of datetime_to_epoch_us().
+
+    :param microseconds: The number of microseconds since 1970-01-01T00:00:00.
+    :param tzinfo: Either timezone.utc for an aware datetime, or None for a naive one.
+    :return: The datetime.
+    """
+    epoch = EPOCH_NAIVE if tzinfo is None else EPOCH_UTC
+    # cheaper than timedelta(microseconds=microseconds)
+    return epoch + ONE_MICROSECOND * microseconds
+
+
+# the range of microseconds since the epoch that a datetime can represent
+MIN_EPOCH_US = datetime_to_epoch_us(datetime.min)
+MAX_EPOCH_US = datetime_to_epoch_us(datetime.max)
@@ -0,0 +1,755 @@
+"""
+Columnar containers and ranges for the datetime types that Fourth provides.
+"""
+from __future__ import annotations
+
+__all__ = (
+    "BaseDatetimeArray",
+    "BaseDatetimeRange",
+    "LocalDatetimeArray",
+    "LocalDatetimeRange",
+    "UTCDatetimeArray",
+    "UTCDatetimeRange",
+)
+
+from array import array
+from datetime import datetime, timedelta, timezone
+from itertools import repeat
+from operator import add, eq, floordiv, ge, gt, le, lt, mul, ne, sub
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from ._internal import MAX_EPOCH_US, MIN_EPOCH_US, ONE_MICROSECOND, datetime_to_epoch_us
+from .types import BaseDatetime, LocalDatetime, UTCDatetime, _from_us_many
+
+if TYPE_CHECKING:
+    from .zone import Zone
+
+D = TypeVar("D", bound=BaseDatetime)
+A = TypeVar("A", bound="BaseDatetimeArray[Any]")
+R = TypeVar("R", bound="BaseDatetimeRange[Any]")
+
+# how many elements repr() shows from each end of a long array
+_REPR_EDGE_ITEMS = 3
+
+
+def _as_int64_view(buffer: Any) -> memoryview:
+    """
+    Return a one dimensional memoryview with format "q" over the buffer,
+    without copying it.
+
+    :param buffer: An object supporting the buffer protocol, with either signed
+        64 bit integer items or byte items.
+    :return: A memoryview with format "q".
+    :raises TypeError: When the buffer's items can't be viewed as 64 bit integers.
+    """
+    view = memoryview(buffer)
+
+    if view.format == "q":
+        return view
+    elif view.format in ("B", "b", "c"):
+        return view.cast("q")
+    elif view.format == "l" and view.itemsize == 8:
+        return view.cast("B").cast("q")
+    else:
+        raise TypeError(
+            f"can't view a buffer with format '{view.format}' as 64 bit integers"
+        )
+
+
+def _int64_values(values: Any) -> memoryview:
+    """
+    Return a one dimensional "q" memoryview of integer values. A buffer with
+    signed 64 bit integer items is wrapped without copying, and any other iterable
+    of integers is copied.
+
+    :raises TypeError: When values is a buffer with more than one dimension, or
+        items that can't be viewed as 64 bit integers.
+    """
+    try:
+        memoryview(values)
+    except TypeError:
+        view = memoryview(array("q", values))
+    else:
+        view = _as_int64_view(values)
+
+    if view.ndim != 1:
+        raise TypeError("can only wrap a one dimensional buffer")
+    return view
+
+
+class BaseDatetimeArray(Sequence[D]):
+    """
+    Base class for Fourth's immutable columnar sequences of Datetimes.
+
+    Rather than one object per value, the values are stored in a single contiguous
+    buffer of signed 64 bit integers, each the number of microseconds since
+    1970-01-01T00:00:00. Datetime instances are only built when an element is
+    indexed or iterated over.
+
+    Slicing returns a new array which is a view sharing the same buffer.
+
+    The rich comparison operators are element-wise. They compare against either
+    another array of the same type and length, or any single value that the
+    element type can be compared with, and return a list of booleans.
+    """
+
+    # Class Attributes
+
+    _item_type: ClassVar[Type[BaseDatetime]]
+    _tzinfo: ClassVar[Optional[timezone]]
+    _min_us: ClassVar[int]
+    _max_us: ClassVar[int]
+
+    # Instance Attributes
+
+    _data: memoryview
+
+    __slots__ = ("_data",)
+
+    # Special Methods
+
+    def __init__(self, values: Iterable[D] = ()) -> None:
+        """
+        Initialise an array from an iterable of Datetime instances.
+
+        :param values: The Datetime instances to store.
+        :raises TypeError: When one of the values isn't the array's element type.
+        """
+        self._data = memoryview(array("q", map(self._to_epoch_us, values)))
+
+    def __repr__(self) -> str:
+        """
+        Construct a command-line representation of the array.
+        For short arrays, should be able to eval() this and get back an equal array.
+
+        :return: The representation of the array.
+        """
+        if len(self) <= 2 * _REPR_EDGE_ITEMS:
+            items = ", ".join(map(repr, self))
+        else:
+            items = "{}, ..., {}".format(
+                ", ".join(map(repr, self[:_REPR_EDGE_ITEMS])),
+                ", ".join(map(repr, self[-_REPR_EDGE_ITEMS:])),
+            )
+        return f"{self.__class__.__name__}([{items}])"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @overload
+    def __getitem__(self, index: int) -> D:
+        ...
+
+    @overload
+    def __getitem__(self: A, index: slice) -> A:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Get a single element, or a slice of the array.
+
+        :param index: An integer index, or a slice.
+        :return: A Datetime for an integer index.
+            An array sharing this array's buffer for a slice.
+        """
+        if isinstance(index, slice):
+            return self._from_view(self._data[index])
+        else:
+            return self._from_epoch_us(self._data[index])
+
+    def __iter__(self) -> Iterator[D]:
+        return _from_us_many(self._item_type, self._data)  # type: ignore[arg-type]
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, self._item_type):
+            return self._to_epoch_us(value) in self._data
+        else:
+            return False
+
+    def __reduce__(self) -> Any:
+        """
+        Called when the array is pickled.
+        Pickles the underlying buffer, rather than the individual elements.
+        """
+        return (self.__class__.from_epoch_microseconds, (array("q", self._data),))
+
+    # Rich Comparison Methods
+
+    def _compare(self, other: Any, compare: Callable[[int, int], bool]) -> Any:
+        """
+        Do an element-wise rich comparison with other. This method contains the
+        common logic for all the rich comparisons.
+
+        :param other: An array of the same type and length, or a single value.
+        :param compare: A function to compare the integer values.
+        :return: A list of booleans. Otherwise NotImplemented.
+        """
+        if isinstance(other, self.__class__):
+            self._check_same_length(other)
+            return list(map(compare, self._data, other._data))
+
+        other_us = self._scalar_to_epoch_us(other)
+        if other_us is None:
+            return NotImplemented
+        return list(map(compare, self._data, repeat(other_us, len(self))))
+
+    def __eq__(self, other: Any) -> List[bool]:  # type: ignore[override]
+        return self._compare(other, eq)  # type: ignore[no-any-return]
+
+    def __ne__(self, other: Any) -> List[bool]:  # type: ignore[override]
+        return self._compare(other, ne)  # type: ignore[no-any-return]
+
+    def __lt__(self, other: Any) -> List[bool]:
+        return self._compare(other, lt)  # type: ignore[no-any-return]
+
+    def __le__(self, other: Any) -> List[bool]:
+        return self._compare(other, le)  # type: ignore[no-any-return]
+
+    def __gt__(self, other: Any) -> List[bool]:
+        return self._compare(other, gt)  # type: ignore[no-any-return]
+
+    def __ge__(self, other: Any) -> List[bool]:
+        return self._compare(other, ge)  # type: ignore[no-any-return]
+
+    # element-wise __eq__ means the array can't be hashed
+    __hash__ = None  # type: ignore[assignment]
+
+    # Numeric Methods
+
+    def __add__(self: A, other: Any) -> A:
+        """
+        Add a timedelta to every element of the array.
+
+        :param other: The timedelta to add.
+        :return: A new array which is the result.
+        """
+        if isinstance(other, timedelta):
+            return self._shifted(other // ONE_MICROSECOND)
+        else:
+            return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self: A, other: Any) -> Union[A, array[int]]:
+        """
+        Subtract an array of the same type and length, a single value, or a
+        timedelta, from every element of this array.
+
+        :param other: The object being subtracted from this.
+        :return: For a timedelta, a new array which is the result.
+            Otherwise an array("q") of the differences in microseconds.
+        """
+        if isinstance(other, timedelta):
+            return self._shifted(-(other // ONE_MICROSECOND))
+        elif isinstance(other, self.__class__):
+            self._check_same_length(other)
+            return array("q", map(sub, self._data, other._data))
+
+        other_us = self._scalar_to_epoch_us(other)
+        if other_us is None:
+            return NotImplemented
+        return array("q", map(sub, self._data, repeat(other_us, len(self))))
+
+    # Constructors
+
+    @classmethod
+    def from_epoch_microseconds(cls: Type[A], values: Any) -> A:
+        """
+        Return a new array from integer microseconds since the epoch.
+
+        When values supports the buffer protocol with signed 64 bit integer items,
+        (e.g. array.array("q")) it is wrapped without copying. Note that means
+        changes to the buffer will be visible through the returned array.
+        Any other iterable of integers is copied.
+
+        :param values: The microseconds since 1970-01-01T00:00:00.
+        :return: An array of the values.
+        :raises OverflowError: When a value is outside the range of the element type.
+        """
+        result = cls._from_view(_int64_values(values))
+        result._check_range()
+        return result
+
+    @classmethod
+    def from_epoch_seconds(cls: Type[A], values: Any) -> A:
+        """
+        Return a new array from integer seconds since the epoch.
+
+        :param values: The seconds since 1970-01-01T00:00:00, as a buffer with
+            signed 64 bit integer items (e.g. array.array("q") or a NumPy int64
+            array) or an iterable of integers.
+        :return: An array of the values.
+        :raises OverflowError: When a value is outside the range of the element type.
+        """
+        return cls._from_scaled(_int64_values(values), 1_000_000, 1)
+
+    @classmethod
+    def from_epoch_milliseconds(cls: Type[A], values: Any) -> A:
+        """
+        Return a new array from integer milliseconds since the epoch.
+
+        :param values: The milliseconds since 1970-01-01T00:00:00, as a buffer with
+            signed 64 bit integer items (e.g. array.array("q") or a NumPy int64
+            array) or an iterable of integers.
+        :return: An array of the values.
+        :raises OverflowError: When a value is outside the range of the element type.
+        """
+        return cls._from_scaled(_int64_values(values), 1_000, 1)
+
+    @classmethod
+    def from_epoch_nanoseconds(cls: Type[A], values: Any) -> A:
+        """
+        Return a new array from integer nanoseconds since the epoch, rounded down
+        to the microsecond.
+
+        :param values: The nanoseconds since 1970-01-01T00:00:00, as a buffer with
+            signed 64 bit integer items (e.g. array.array("q") or a NumPy int64
+            array) or an iterable of integers.
+        :return: An array of the values.
+        """
+        return cls._from_scaled(_int64_values(values), 1, 1_000)
+
+    @classmethod
+    def _from_view(cls: Type[A], view: memoryview) -> A:
+        """
+        Return a new array using the view as its buffer.
+        The view is trusted to be a one dimensional "q" view of in range values.
+        """
+        instance = cls.__new__(cls)
+        instance._data = view
+        return instance
+
+    @classmethod
+    def _from_scaled(
+        cls: Type[A], view: memoryview, multiplier: int, divisor: int
+    ) -> A:
+        """
+        Return a new array of the values in a "q" view, converted to microseconds
+        by multiplying by multiplier and floor dividing by divisor.
+
+        :raises OverflowError: When a value is outside the range of the element type.
+        """
+        size = len(view)
+        if size and (
+            min(view) * multiplier // divisor < cls._min_us
+            or max(view) * multiplier // divisor > cls._max_us
+        ):
+            raise OverflowError("date value out of range")
+
+        if multiplier == 1:
+            data = array("q", map(floordiv, view, repeat(divisor, size)))
+        else:
+            data = array("q", map(mul, view, repeat(multiplier, size)))
+        return cls._from_view(memoryview(data))
+
+    # Instance Methods
+
+    def count(self, value: Any) -> int:
+        if isinstance(value, self._item_type):
+            return self._data.tolist().count(self._to_epoch_us(value))
+        else:
+            return 0
+
+    def index(self, value: Any, start: int = 0, stop: int = 9223372036854775807) -> int:
+        if isinstance(value, self._item_type):
+            return self._data.tolist().index(self._to_epoch_us(value), start, stop)
+        else:
+            raise ValueError(f"{value!r} is not in {self.__class__.__name__}")
+
+    def to_epoch_microseconds(self) -> array[int]:
+        """
+        Return a copy of the values as microseconds since the epoch.
+
+        :return: An array("q") of microseconds since 1970-01-01T00:00:00.
+        """
+        return array("q", self._data)
+
+    def to_epoch_seconds(self) -> array[int]:
+        """
+        Return the values as integer seconds since the epoch, rounded down.
+
+        :return: An array("q") of seconds since 1970-01-01T00:00:00.
+        """
+        return array("q", map(floordiv, self._data, repeat(1_000_000, len(self))))
+
+    def to_epoch_milliseconds(self) -> array[int]:
+        """
+        Return the values as integer milliseconds since the epoch, rounded down.
+
+        :return: An array("q") of milliseconds since 1970-01-01T00:00:00.
+        """
+        return array("q", map(floordiv, self._data, repeat(1_000, len(self))))
+
+    def to_epoch_nanoseconds(self) -> array[int]:
+        """
+        Return the values as integer nanoseconds since the epoch.
+
+        Signed 64 bit nanoseconds only reach from 1677-09-21 to 2262-04-11, the
+        same as NumPy's datetime64[ns].
+
+        :return: An array("q") of nanoseconds since 1970-01-01T00:00:00.
+        :raises OverflowError: When a value is outside that range.
+        """
+        try:
+            return array("q", map(mul, self._data, repeat(1_000, len(self))))
+        except OverflowError:
+            raise OverflowError("date value out of range for nanoseconds") from None
+
+    def _to_epoch_us(self, value: Any) -> int:
+        """
+        Convert an element to microseconds since the epoch.
+
+        :raises TypeError: When the value isn't the array's element type.
+        """
+        if not isinstance(value, self._item_type):
+            raise TypeError(
+                f"{self.__class__.__name__} can only store "
+                f"{self._item_type.__name__}, not '{type(value).__name__}'"
+            )
+        return value._us
+
+    def _from_epoch_us(self, microseconds: int) -> D:
+        return self._item_type._from_us(microseconds)  # type: ignore[return-value]
+
+    def _scalar_to_epoch_us(self, value: Any) -> Optional[int]:
+        """
+        Convert a single value the element type can be compared with to
+        microseconds since the epoch.
+
+        :return: The microseconds, or None if the value can't be compared.
+        """
+        if isinstance(value, self._item_type):
+            return self._to_epoch_us(value)
+        elif isinstance(value, datetime) and (
+            (value.tzinfo is None) == (self._tzinfo is None)
+        ):
+            return datetime_to_epoch_us(value)
+        else:
+            return None
+
+    def _check_same_length(self, other: BaseDatetimeArray[Any]) -> None:
+        if len(self) != len(other):
+            raise ValueError(
+                f"operands have different lengths {len(self)} and {len(other)}"
+            )
+
+    def _check_range(self) -> None:
+        if len(self) and (
+            min(self._data) < self._min_us or max(self._data) > self._max_us
+        ):
+            raise OverflowError("date value out of range")
+
+    def _shifted(self: A, microseconds: int) -> A:
+        result = self._from_view(
+            memoryview(
+                array("q", map(add, self._data, repeat(microseconds, len(self))))
+            )
+        )
+        result._check_range()
+        return result
+
+
+class LocalDatetimeArray(BaseDatetimeArray[LocalDatetime]):
+    """
+    An immutable columnar sequence of LocalDatetime instances.
+
+    Values are stored as microseconds since the naive 1970-01-01T00:00:00.
+    Compares element-wise with LocalDatetime and naive datetime.datetime instances.
+    """
+
+    _item_type = LocalDatetime
+    _tzinfo = None
+    _min_us = datetime_to_epoch_us(LocalDatetime.min.as_datetime())
+    _max_us = datetime_to_epoch_us(LocalDatetime.max.as_datetime())
+
+    __slots__ = ()
+
+    def to_utc(
+        self,
+        zone: Union[str, Zone],
+        *,
+        ambiguous: str = "raise",
+        nonexistent: str = "raise",
+    ) -> UTCDatetimeArray:
+        """
+        Return the UTC instants of these wall times in a time zone, as
+        LocalDatetime.to_utc() would for each one.
+
+        :param zone: The IANA name of the zone, like "Australia/Perth", or a Zone.
+        :param ambiguous: How to convert ambiguous wall times, as for
+            LocalDatetime.to_utc().
+        :param nonexistent: How to convert wall times that don't exist, as for
+            LocalDatetime.to_utc().
+        :return: A UTCDatetimeArray of the instants.
+        :raises ValueError: When a wall time is ambiguous or doesn't exist, and
+            that is set to "raise".
+        """
+        from .zone import get_zone
+
+        if isinstance(zone, str):
+            zone = get_zone(zone)
+        return zone.to_utc_many(  # type: ignore[return-value]
+            self, ambiguous=ambiguous, nonexistent=nonexistent, packed=True
+        )
+
+
+class UTCDatetimeArray(BaseDatetimeArray[UTCDatetime]):
+    """
+    An immutable columnar sequence of UTCDatetime instances.
+
+    Values are stored as microseconds since 1970-01-01T00:00:00+00:00.
+    Compares element-wise with UTCDatetime and aware datetime.datetime instances.
+    """
+
+    _item_type = UTCDatetime
+    _tzinfo = timezone.utc
+    _min_us = datetime_to_epoch_us(UTCDatetime.min.as_datetime())
+    _max_us = datetime_to_epoch_us(UTCDatetime.max.as_datetime())
+
+    __slots__ = ()
+
+    def to_local(self, zone: Union[str, Zone]) -> LocalDatetimeArray:
+        """
+        Return the wall times in a time zone at these instants, as
+        UTCDatetime.to_local() would for each one.
+
+        :param zone: The IANA name of the zone, like "Australia/Perth", or a Zone.
+        :return: A LocalDatetimeArray of the wall times.
+        """
+        from .zone import get_zone
+
+        if isinstance(zone, str):
+            zone = get_zone(zone)
+        return zone.to_local_many(self, packed=True)  # type: ignore[return-value]
+
+
+class BaseDatetimeRange(Sequence[D]):
+    """
+    Base class for Fourth's immutable lazy ranges of Datetimes, like range() is
+    for integers.
+
+    The range is stored as a range of integer microseconds since
+    1970-01-01T00:00:00, so len(), indexing, slicing, `in`, index() and count()
+    take constant time, however long the range is. Datetime instances are only
+    built when an element is indexed or iterated over, and they are built
+    straight from the integers, without validating each one.
+    """
+
+    # Class Attributes
+
+    _item_type: ClassVar[Type[BaseDatetime]]
+    _array_type: ClassVar[Type[BaseDatetimeArray[Any]]]
+
+    # Instance Attributes
+
+    _range: range
+
+    __slots__ = ("_range",)
+
+    # Special Methods
+
+    def __init__(self, start: D, stop: D, step: timedelta) -> None:
+        """
+        Initialise a range of the Datetimes from start, up to but not including
+        stop, step apart.
+
+        :param start: The first Datetime in the range.
+        :param stop: The Datetime the range stops before.
+        :param step: The difference between each Datetime and the next.
+            A negative step counts down from start to stop.
+        :raises TypeError: When start or stop isn't the range's element type,
+            or step isn't a timedelta.
+        :raises ValueError: When step is zero.
+        """
+        for bound in (start, stop):
+            if not isinstance(bound, self._item_type):
+                raise TypeError(
+                    f"{self.__class__.__name__} start and stop must be "
+                    f"{self._item_type.__name__}, not '{type(bound).__name__}'"
+                )
+        if not isinstance(step, timedelta):
+            raise TypeError(
+                f"{self.__class__.__name__} step must be timedelta, "
+                f"not '{type(step).__name__}'"
+            )
+        if not step:
+            raise ValueError(f"{self.__class__.__name__} step must not be zero")
+
+        self._range = range(start._us, stop._us, step // ONE_MICROSECOND)
+
+    def __repr__(self) -> str:
+        """
+        Construct a command-line representation of the range.
+        Unless it ends at the very first or last Datetime, should be able to eval()
+        this and get back an equal range.
+
+        :return: The representation of the range.
+        """
+        name = self.__class__.__name__
+        start, stop, step = self._range.start, self._range.stop, self._range.step
+
+        if not self:
+            # every empty range is equal
+            start = stop = 0
+        elif not MIN_EPOCH_US <= stop <= MAX_EPOCH_US:
+            # a slice's stop can be past the first or last Datetime, so use the
+            # stop just past the last element instead
+            stop = self._range[-1] + (1 if step > 0 else -1)
+            if not MIN_EPOCH_US <= stop <= MAX_EPOCH_US:
+                return f"{name}([{self[0]!r}, ..., {self[-1]!r}], {self.step!r})"
+
+        return (
+            f"{name}({self._from_epoch_us(start)!r}, "
+            f"{self._from_epoch_us(stop)!r}, {self.step!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    @overload
+    def __getitem__(self, index: int) -> D:
+        ...
+
+    @overload
+    def __getitem__(self: R, index: slice) -> R:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        """
+        Get a single element, or a slice of the range.
+
+        :param index: An integer index, or a slice.
+        :return: A Datetime for an integer index. A new range for a slice.
+        """
+        if isinstance(index, slice):
+            return self._from_range(self._range[index])
+        else:
+            return self._from_epoch_us(self._range[index])
+
+    def __iter__(self) -> Iterator[D]:
+        return _from_us_many(self._item_type, self._range)  # type: ignore[arg-type]
+
+    def __reversed__(self) -> Iterator[D]:
+        return _from_us_many(
+            self._item_type, reversed(self._range)  # type: ignore[arg-type]
+        )
+
+    def __contains__(self, value: Any) -> bool:
+        if isinstance(value, self._item_type):
+            return value._us in self._range
+        else:
+            return False
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Ranges are equal when they contain the same Datetimes in the same order.
+        """
+        if isinstance(other, self.__class__):
+            return self._range == other._range
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._range)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Called when the range is pickled.
+        Pickles the range of integers, rather than the Datetimes.
+        """
+        return self.__class__._from_range, (self._range,)
+
+    # Constructors
+
+    @classmethod
+    def _from_range(cls: Type[R], microseconds: range) -> R:
+        """
+        Return a new Datetime range from a range of microseconds since the epoch.
+        Every element of the range is trusted to be in range.
+        """
+        instance = cls.__new__(cls)
+        instance._range = microseconds
+        return instance
+
+    # Instance Properties
+
+    @property
+    def step(self) -> timedelta:
+        return ONE_MICROSECOND * self._range.step
+
+    # Instance Methods
+
+    def count(self, value: Any) -> int:
+        if isinstance(value, self._item_type):
+            return self._range.count(value._us)
+        else:
+            return 0
+
+    def index(self, value: Any, start: int = 0, stop: int = 9223372036854775807) -> int:
+        if isinstance(value, self._item_type) and value._us in self._range:
+            # each value is in the range at most once
+            index = self._range.index(value._us)
+            first, last, _ = slice(start, stop).indices(len(self))
+            if first <= index < last:
+                return index
+        raise ValueError(f"{value!r} is not in {self.__class__.__name__}")
+
+    def to_array(self) -> BaseDatetimeArray[D]:
+        """
+        Return the Datetimes in the range as an array.
+
+        :return: A LocalDatetimeArray or UTCDatetimeArray.
+        """
+        return self._array_type._from_view(memoryview(self.to_epoch_microseconds()))
+
+    def to_epoch_microseconds(self) -> array[int]:
+        """
+        Return the values in the range as microseconds since the epoch.
+
+        :return: An array("q") of microseconds since 1970-01-01T00:00:00.
+        """
+        return array("q", self._range)
+
+    def _from_epoch_us(self, microseconds: int) -> D:
+        return self._item_type._from_us(microseconds)  # type: ignore[return-value]
+
+
+class LocalDatetimeRange(BaseDatetimeRange[LocalDatetime]):
+    """
+    An immutable lazy range of LocalDatetime instances, evenly spaced in time.
+
+    Returned by LocalDatetime.range().
+    """
+
+    _item_type = LocalDatetime
+    _array_type = LocalDatetimeArray
+
+    __slots__ = ()
+
+
+class UTCDatetimeRange(BaseDatetimeRange[UTCDatetime]):
+    """
+    An immutable lazy range of UTCDatetime instances, evenly spaced in time.
+
+    Returned by UTCDatetime.range().
+    """
+
+    _item_type = UTCDatetime
+    _array_type = UTCDatetimeArray
+
+    __slots__ = ()
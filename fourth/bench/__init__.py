@@ -0,0 +1,298 @@
+"""
+Benchmarks for Fourth.
+
+Each benchmark times an operation on Fourth's types side by side with the
+equivalent operation using the standard library's datetime module. Results can be
+saved as JSON, and compared against a saved baseline to catch regressions.
+
+Memory benchmarks instead measure the memory taken by the values an operation
+builds, side by side with the standard library's equivalent values.
+
+Run with `python -m fourth.bench`, see `python -m fourth.bench --help` for options.
+"""
+from __future__ import annotations
+
+__all__ = (
+    "Benchmark",
+    "BenchmarkResult",
+    "Comparison",
+    "MemoryBenchmark",
+    "MemoryResult",
+    "compare_results",
+    "measure_memory",
+    "results_from_json",
+    "results_to_json",
+    "run_benchmarks",
+)
+
+import gc
+import platform
+import sys
+import timeit
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set
+
+
+class Benchmark(NamedTuple):
+    """
+    An operation to time, and its standard library equivalent.
+
+    `fourth` and `stdlib` are called with no arguments, many times over.
+    When `self_timed` is True they are only called once per repeat, and must
+    return how long the operation they measured took in nanoseconds.
+    """
+
+    name: str
+    fourth: Callable[[], Any]
+    stdlib: Optional[Callable[[], Any]]
+    self_timed: bool = False
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    The best time of a benchmark's operation, and its standard library equivalent,
+    in nanoseconds per call.
+    """
+
+    name: str
+    fourth_ns: float
+    stdlib_ns: Optional[float]
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """
+        How many times longer the operation took than the standard library
+        equivalent. None when there is no equivalent.
+        """
+        if self.stdlib_ns is None:
+            return None
+        return self.fourth_ns / self.stdlib_ns
+
+
+class MemoryBenchmark(NamedTuple):
+    """
+    An operation to measure the memory of the values it builds, and its standard
+    library equivalent.
+
+    `fourth` and `stdlib` are called with no arguments, and return the values.
+    """
+
+    name: str
+    fourth: Callable[[], Any]
+    stdlib: Optional[Callable[[], Any]]
+
+
+class MemoryResult(NamedTuple):
+    """
+    The memory taken by a memory benchmark's values, and their standard library
+    equivalent, in bytes.
+    """
+
+    name: str
+    fourth_bytes: int
+    stdlib_bytes: Optional[int]
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """
+        How many times more memory the values took than the standard library
+        equivalent. None when there is no equivalent.
+        """
+        if self.stdlib_bytes is None:
+            return None
+        return self.fourth_bytes / self.stdlib_bytes
+
+
+class Comparison(NamedTuple):
+    """
+    A benchmark result compared against its baseline.
+
+    Results with a standard library equivalent are compared by their ratio, so
+    that baselines are comparable between machines. Other results are compared
+    by their time.
+    """
+
+    name: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """
+        The relative change from the baseline, e.g. 0.1 is 10% slower.
+        """
+        return self.current / self.baseline - 1
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    *,
+    repeat: int = 5,
+    min_time: float = 0.02,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    """
+    Time each of the benchmarks.
+
+    :param benchmarks: The benchmarks to run.
+    :param repeat: How many times to time each operation. The best time is kept.
+    :param min_time: The minimum number of seconds each timing should take.
+        Operations are called as many times as needed to take this long.
+    :param progress: Called with each result as soon as it is ready.
+    :return: The results, in the same order as the benchmarks.
+    """
+    results = []
+
+    for benchmark in benchmarks:
+        time_ns = _self_time_ns if benchmark.self_timed else _time_ns
+        result = BenchmarkResult(
+            benchmark.name,
+            time_ns(benchmark.fourth, repeat, min_time),
+            None
+            if benchmark.stdlib is None
+            else time_ns(benchmark.stdlib, repeat, min_time),
+        )
+        if progress is not None:
+            progress(result)
+        results.append(result)
+
+    return results
+
+
+def measure_memory(
+    benchmarks: Iterable[MemoryBenchmark],
+    *,
+    progress: Optional[Callable[[MemoryResult], None]] = None,
+) -> List[MemoryResult]:
+    """
+    Measure the memory taken by the values each of the benchmarks builds.
+
+    The memory of a value is the size of every object reachable from it, counting
+    objects shared between values, like interned Datetimes, once. Classes, and
+    the objects only they reach, aren't counted.
+
+    :param benchmarks: The benchmarks to measure.
+    :param progress: Called with each result as soon as it is ready.
+    :return: The results, in the same order as the benchmarks.
+    """
+    results = []
+
+    for benchmark in benchmarks:
+        result = MemoryResult(
+            benchmark.name,
+            _retained_bytes(benchmark.fourth()),
+            None if benchmark.stdlib is None else _retained_bytes(benchmark.stdlib()),
+        )
+        if progress is not None:
+            progress(result)
+        results.append(result)
+
+    return results
+
+
+def compare_results(
+    baseline: Iterable[BenchmarkResult],
+    current: Iterable[BenchmarkResult],
+    threshold: float,
+) -> List[Comparison]:
+    """
+    Compare results against a baseline.
+
+    Only benchmarks in both the baseline and the current results are compared.
+
+    :param baseline: The baseline results.
+    :param current: The current results.
+    :param threshold: How much slower than the baseline a result can be before
+        it counts as a regression, e.g. 0.25 allows 25% slower.
+    :return: A Comparison for each benchmark, in the order of the current results.
+    """
+    baseline_by_name = {result.name: result for result in baseline}
+    comparisons = []
+
+    for result in current:
+        base = baseline_by_name.get(result.name)
+        if base is None:
+            continue
+
+        if result.ratio is not None and base.ratio is not None:
+            before, after = base.ratio, result.ratio
+        else:
+            before, after = base.fourth_ns, result.fourth_ns
+
+        comparisons.append(
+            Comparison(result.name, before, after, after > before * (1 + threshold))
+        )
+
+    return comparisons
+
+
+def results_to_json(results: Iterable[BenchmarkResult]) -> Dict[str, Any]:
+    """
+    Convert results to a JSON serializable dictionary, along with details of the
+    Python they were run on.
+    """
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": {
+            result.name: {
+                "fourth_ns": result.fourth_ns,
+                "stdlib_ns": result.stdlib_ns,
+                "ratio": result.ratio,
+            }
+            for result in results
+        },
+    }
+
+
+def results_from_json(data: Dict[str, Any]) -> List[BenchmarkResult]:
+    """
+    Convert a dictionary from results_to_json() back to results.
+    """
+    return [
+        BenchmarkResult(name, values["fourth_ns"], values["stdlib_ns"])
+        for name, values in data["results"].items()
+    ]
+
+
+def _time_ns(function: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """
+    Return the best time of calling the function, in nanoseconds per call.
+    """
+    timer = timeit.Timer(function)
+
+    # find how many calls it takes to reach min_time
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < min_time:
+        number *= 2
+        elapsed = timer.timeit(number)
+
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return best / number * 1e9
+
+
+def _self_time_ns(function: Callable[[], Any], repeat: int, min_time: float) -> float:
+    """
+    Return the best time a self timed function measured, in nanoseconds.
+    """
+    return float(min(function() for _ in range(repeat)))
+
+
+def _retained_bytes(value: Any) -> int:
+    """
+    Return the total size of the objects reachable from a value, without
+    counting any object twice, or following references to classes.
+    """
+    seen: Set[int] = set()
+    total = 0
+    pending = [value]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        pending.extend(gc.get_referents(obj))
+    return total
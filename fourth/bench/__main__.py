@@ -0,0 +1,186 @@
+"""
+Command line interface for the benchmarks, run with `python -m fourth.bench`.
+
+Examples:
+
+    # run every benchmark, and save the results as a baseline
+    python -m fourth.bench --output baseline.json
+
+    # run the parsing benchmarks, and fail if any regressed against the baseline
+    python -m fourth.bench -k parse. --compare baseline.json
+
+    # measure the memory taken by the values of the memory benchmarks
+    python -m fourth.bench --memory
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from fourth.bench import (
+    BenchmarkResult,
+    MemoryResult,
+    compare_results,
+    measure_memory,
+    results_from_json,
+    results_to_json,
+    run_benchmarks,
+)
+from fourth.bench.cases import all_benchmarks, memory_benchmarks
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m fourth.bench",
+        description="Benchmark Fourth's types against the standard library.",
+    )
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        metavar="PATTERN",
+        help="only run benchmarks whose name contains PATTERN (can be repeated)",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list the benchmarks and exit"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="how many times to time each operation (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.02,
+        help="minimum seconds for each timing (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure the memory taken by the values of the memory benchmarks, "
+        "rather than timing the benchmarks",
+    )
+    parser.add_argument(
+        "--output", metavar="FILE", help="write the results to FILE as JSON"
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="BASELINE",
+        help="compare against the JSON results in BASELINE, and exit with status 1 "
+        "if any benchmark regressed",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="how much slower than the baseline counts as a regression "
+        "(default: %(default)s, i.e. 25%%)",
+    )
+    options = parser.parse_args(arguments)
+
+    if options.memory:
+        if options.output is not None or options.compare is not None:
+            parser.error("--memory can't be used with --output or --compare")
+        return _main_memory(options.patterns, options.list)
+
+    benchmarks = [
+        benchmark
+        for benchmark in all_benchmarks()
+        if not options.patterns
+        or any(pattern in benchmark.name for pattern in options.patterns)
+    ]
+
+    if options.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+
+    # read the baseline first, so a bad path fails before the benchmarks run
+    baseline = None
+    if options.compare is not None:
+        with open(options.compare) as file:
+            baseline = results_from_json(json.load(file))
+
+    print(f"{'benchmark':<44}{'fourth':>12}{'stdlib':>12}{'ratio':>8}")
+    results = run_benchmarks(
+        benchmarks,
+        repeat=options.repeat,
+        min_time=options.min_time,
+        progress=_print_result,
+    )
+
+    if options.output is not None:
+        with open(options.output, "w") as file:
+            json.dump(results_to_json(results), file, indent=2)
+
+    if baseline is None:
+        return 0
+
+    comparisons = compare_results(baseline, results, options.threshold)
+    print()
+    print(f"{'benchmark':<44}{'baseline':>12}{'current':>12}{'change':>8}")
+    for comparison in comparisons:
+        print(
+            f"{comparison.name:<44}{comparison.baseline:>12.3f}"
+            f"{comparison.current:>12.3f}{comparison.change:>+8.0%}"
+            f"{'  REGRESSED' if comparison.regressed else ''}"
+        )
+
+    regressions = sum(comparison.regressed for comparison in comparisons)
+    print()
+    print(f"{regressions} of {len(comparisons)} benchmarks regressed")
+    return 1 if regressions else 0
+
+
+def _main_memory(patterns: Optional[List[str]], list_only: bool) -> int:
+    benchmarks = [
+        benchmark
+        for benchmark in memory_benchmarks()
+        if not patterns or any(pattern in benchmark.name for pattern in patterns)
+    ]
+
+    if list_only:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+        return 0
+
+    print(f"{'benchmark':<44}{'fourth':>12}{'stdlib':>12}{'ratio':>8}")
+    measure_memory(benchmarks, progress=_print_memory_result)
+    return 0
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    stdlib = "" if result.stdlib_ns is None else _format_ns(result.stdlib_ns)
+    ratio = "" if result.ratio is None else f"{result.ratio:.2f}x"
+    print(f"{result.name:<44}{_format_ns(result.fourth_ns):>12}{stdlib:>12}{ratio:>8}")
+
+
+def _print_memory_result(result: MemoryResult) -> None:
+    stdlib = "" if result.stdlib_bytes is None else _format_bytes(result.stdlib_bytes)
+    ratio = "" if result.ratio is None else f"{result.ratio:.2f}x"
+    print(
+        f"{result.name:<44}{_format_bytes(result.fourth_bytes):>12}{stdlib:>12}"
+        f"{ratio:>8}"
+    )
+
+
+def _format_bytes(size: int) -> str:
+    for unit, scale in (("MiB", 2 ** 20), ("KiB", 2 ** 10)):
+        if size >= scale:
+            return f"{size / scale:.2f} {unit}"
+    return f"{size} B"
+
+
+def _format_ns(nanoseconds: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if nanoseconds >= scale:
+            return f"{nanoseconds / scale:.2f} {unit}"
+    return f"{nanoseconds:.0f} ns"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1171 @@
+"""
+The benchmarks run by `python -m fourth.bench`.
+"""
+from __future__ import annotations
+
+__all__ = ("all_benchmarks", "memory_benchmarks")
+
+import atexit
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta, timezone
+from itertools import count, repeat
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Tuple
+
+import fourth
+from fourth import (
+    Instant,
+    LocalDatetime,
+    ParseCache,
+    UTCDatetime,
+    UTCDatetimeArray,
+    UTCInterval,
+    UTCIntervalIndex,
+    UTCIntervalSet,
+    UTCTimeIndex,
+    Zone,
+    instrument,
+)
+from fourth.bench import Benchmark, MemoryBenchmark
+from fourth.clock import CoarseClock, PreciseClock, set_clock
+from fourth.codec import dumps_many, loads_many
+from fourth.interop import from_datetime64, to_datetime64
+from fourth.iso import write_iso_format_many
+from fourth.json import dumps as json_dumps
+from fourth.json import loads as json_loads
+from fourth.logscan import LogScanner
+from fourth.parallel import ParallelParser
+from fourth.rounding import floor_many
+from fourth.types import _INTERN_POOL_SIZE
+
+# how many values the benchmarks of bulk operations work on
+BULK_SIZE = 1_000
+# how many records are in the payloads of the JSON benchmarks
+JSON_RECORDS = 1_000_000
+
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+UTC_FORMAT = "%Y-%m-%d %H:%M:%S%z"
+LOCAL_FORMAT = "%Y-%m-%d %H:%M:%S"
+HTTP_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+RFC3339_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def all_benchmarks() -> List[Benchmark]:
+    """
+    Return all the benchmarks, grouped by the kind of operation.
+    """
+    return (
+        construction_benchmarks()
+        + clock_benchmarks()
+        + instant_benchmarks()
+        + instrument_benchmarks()
+        + parsing_benchmarks()
+        + formatting_benchmarks()
+        + comparison_benchmarks()
+        + hashing_benchmarks()
+        + arithmetic_benchmarks()
+        + range_benchmarks()
+        + rounding_benchmarks()
+        + zone_benchmarks()
+        + pickling_benchmarks()
+        + codec_benchmarks()
+        + json_benchmarks()
+        + logscan_benchmarks()
+        + parallel_benchmarks()
+        + interop_benchmarks()
+        + index_benchmarks()
+        + interval_index_benchmarks()
+        + interval_benchmarks()
+        + import_benchmarks()
+    )
+
+
+def construction_benchmarks() -> List[Benchmark]:
+    utc = timezone.utc
+    aware = datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=utc)
+    offset = aware.astimezone(timezone(timedelta(hours=5, minutes=30)))
+    naive = datetime(2020, 1, 2, 3, 4, 5, 6)
+    timestamp = aware.timestamp()
+    # a column of float timestamps and of integer milliseconds, as read from a
+    # message queue or metrics store
+    timestamps = [timestamp + i * 0.001 for i in range(BULK_SIZE)]
+    milliseconds_column = array("q", range(1_577_934_245_000, 1_577_934_246_000))
+    # distinct milliseconds for interning, so once the pool is full every value
+    # interned evicts another, as in a long running event store
+    new_milliseconds = count(1_577_934_245_000)
+    filled: List[bool] = []
+
+    def intern_evicting_ns() -> float:
+        if not filled:
+            for _ in repeat(None, _INTERN_POOL_SIZE):
+                UTCDatetime.intern(
+                    UTCDatetime.from_epoch_milliseconds(next(new_milliseconds))
+                )
+            filled.append(True)
+        return _calls_ns(
+            lambda: UTCDatetime.intern(
+                UTCDatetime.from_epoch_milliseconds(next(new_milliseconds))
+            )
+        )
+
+    return [
+        Benchmark(
+            "construct.utc_at",
+            lambda: UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6),
+            lambda: datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=utc),
+        ),
+        Benchmark(
+            "construct.local_at",
+            lambda: LocalDatetime.at(2020, 1, 2, 3, 4, 5, 6),
+            lambda: datetime(2020, 1, 2, 3, 4, 5, 6),
+        ),
+        Benchmark("construct.utc_now", UTCDatetime.now, lambda: datetime.now(utc)),
+        Benchmark("construct.local_now", LocalDatetime.now, datetime.now),
+        Benchmark(
+            "construct.utc_from_timestamp",
+            lambda: UTCDatetime.from_timestamp(timestamp),
+            lambda: datetime.fromtimestamp(timestamp, utc),
+        ),
+        Benchmark(
+            "construct.utc_from_epoch_milliseconds",
+            lambda: UTCDatetime.from_epoch_milliseconds(1_577_934_245_000),
+            lambda: datetime.fromtimestamp(1_577_934_245_000 / 1_000, utc),
+        ),
+        Benchmark(
+            "construct.utc_from_timestamp_many",
+            lambda: UTCDatetime.from_timestamp_many(timestamps),
+            lambda: [datetime.fromtimestamp(t, utc) for t in timestamps],
+        ),
+        Benchmark(
+            "construct.utc_from_timestamp_many_packed",
+            lambda: UTCDatetime.from_timestamp_many(timestamps, packed=True),
+            lambda: [datetime.fromtimestamp(t, utc) for t in timestamps],
+        ),
+        Benchmark(
+            "construct.utc_array_from_epoch_milliseconds",
+            lambda: UTCDatetimeArray.from_epoch_milliseconds(milliseconds_column),
+            lambda: [
+                datetime.fromtimestamp(ms / 1_000, utc) for ms in milliseconds_column
+            ],
+        ),
+        Benchmark(
+            "construct.utc_init",
+            lambda: UTCDatetime(aware),
+            lambda: aware.astimezone(utc),
+        ),
+        Benchmark(
+            "construct.utc_init_offset",
+            lambda: UTCDatetime(offset),
+            lambda: offset.astimezone(utc),
+        ),
+        Benchmark(
+            "construct.local_init",
+            lambda: LocalDatetime(naive),
+            lambda: naive.replace(),
+        ),
+        Benchmark(
+            "construct.utc_trusted",
+            lambda: UTCDatetime.trusted(aware),
+            lambda: aware.astimezone(utc),
+        ),
+        Benchmark(
+            "construct.local_trusted",
+            lambda: LocalDatetime.trusted(naive),
+            lambda: naive.replace(),
+        ),
+        Benchmark(
+            "construct.utc_intern_evicting",
+            intern_evicting_ns,
+            lambda: _calls_ns(
+                lambda: datetime.fromtimestamp(next(new_milliseconds) / 1_000, utc)
+            ),
+            self_timed=True,
+        ),
+    ]
+
+
+def clock_benchmarks() -> List[Benchmark]:
+    utc = timezone.utc
+    tick = timedelta(milliseconds=1)
+    precise = PreciseClock()
+    coarse = CoarseClock(tick)
+
+    def background_now() -> float:
+        with CoarseClock(tick, background=True) as clock:
+            return _calls_ns(clock.now)
+
+    def utc_now_with_coarse() -> float:
+        previous = set_clock(CoarseClock(tick))
+        try:
+            return _calls_ns(UTCDatetime.now)
+        finally:
+            set_clock(previous)
+
+    return [
+        Benchmark("clock.precise_now", precise.now, lambda: datetime.now(utc)),
+        Benchmark("clock.coarse_now", coarse.now, lambda: datetime.now(utc)),
+        Benchmark(
+            "clock.coarse_background_now",
+            background_now,
+            lambda: _calls_ns(lambda: datetime.now(utc)),
+            self_timed=True,
+        ),
+        Benchmark(
+            "clock.utc_now_with_coarse",
+            utc_now_with_coarse,
+            lambda: _calls_ns(lambda: datetime.now(utc)),
+            self_timed=True,
+        ),
+    ]
+
+
+def instrument_benchmarks() -> List[Benchmark]:
+    utc = timezone.utc
+    iso = "2020-01-02T03:04:05.000006+00:00"
+
+    def instrumented_calls_ns(function: Callable[[], Any]) -> float:
+        with instrument.instrumented(sample_every=16):
+            return _calls_ns(function)
+
+    # disabled instrumentation is measured by the construct and parse benchmarks
+    return [
+        Benchmark(
+            "instrument.utc_at_enabled",
+            lambda: instrumented_calls_ns(lambda: UTCDatetime.at(2020, 1, 2)),
+            lambda: _calls_ns(lambda: datetime(2020, 1, 2, tzinfo=utc)),
+            self_timed=True,
+        ),
+        Benchmark(
+            "instrument.utc_from_iso_format_enabled",
+            lambda: instrumented_calls_ns(lambda: UTCDatetime.from_iso_format(iso)),
+            lambda: _calls_ns(lambda: datetime.fromisoformat(iso)),
+            self_timed=True,
+        ),
+    ]
+
+
+def instant_benchmarks() -> List[Benchmark]:
+    utc = timezone.utc
+    start = Instant.now()
+    stdlib_start = datetime.now(utc)
+    end = start + timedelta(seconds=1)
+    stdlib_end = stdlib_start + timedelta(seconds=1)
+
+    return [
+        Benchmark("instant.now", Instant.now, lambda: datetime.now(utc)),
+        Benchmark(
+            "instant.subtract", lambda: end - start, lambda: stdlib_end - stdlib_start
+        ),
+        Benchmark(
+            "instant.elapsed", start.elapsed, lambda: datetime.now(utc) - stdlib_start
+        ),
+        Benchmark("instant.to_utc", start.to_utc, lambda: stdlib_start.astimezone(utc)),
+    ]
+
+
+def parsing_benchmarks() -> List[Benchmark]:
+    utc_value = UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    local_value = LocalDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    utc_string = utc_value.iso_format()
+    local_string = local_value.iso_format()
+    utc_strptime_string = utc_value.strftime(UTC_FORMAT)
+    local_strptime_string = local_value.strftime(LOCAL_FORMAT)
+    http_string = utc_value.to_http_date()
+    rfc3339_string = utc_value.to_rfc3339()
+
+    step = timedelta(seconds=37, microseconds=1)
+    utc_strings = [(utc_value + step * i).iso_format() for i in range(BULK_SIZE)]
+    # log lines at second resolution, where each timestamp repeats many times
+    repeated_strings = [
+        (utc_value + timedelta(seconds=i // 50)).iso_format() for i in range(BULK_SIZE)
+    ]
+    cache = ParseCache(UTCDatetime)
+
+    def cached_from_iso_format_many() -> List[UTCDatetime]:
+        parse = cache.from_iso_format
+        return [parse(s) for s in repeated_strings]
+
+    local_strings = [(local_value + step * i).iso_format() for i in range(BULK_SIZE)]
+
+    return [
+        Benchmark(
+            "parse.utc_from_iso_format",
+            lambda: UTCDatetime.from_iso_format(utc_string),
+            lambda: datetime.fromisoformat(utc_string),
+        ),
+        Benchmark(
+            "parse.local_from_iso_format",
+            lambda: LocalDatetime.from_iso_format(local_string),
+            lambda: datetime.fromisoformat(local_string),
+        ),
+        Benchmark(
+            "parse.utc_strptime",
+            lambda: UTCDatetime.strptime(utc_strptime_string, UTC_FORMAT),
+            lambda: datetime.strptime(utc_strptime_string, UTC_FORMAT),
+        ),
+        Benchmark(
+            "parse.local_strptime",
+            lambda: LocalDatetime.strptime(local_strptime_string, LOCAL_FORMAT),
+            lambda: datetime.strptime(local_strptime_string, LOCAL_FORMAT),
+        ),
+        Benchmark(
+            "parse.utc_from_http_date",
+            lambda: UTCDatetime.from_http_date(http_string),
+            lambda: datetime.strptime(http_string, HTTP_FORMAT).replace(
+                tzinfo=timezone.utc
+            ),
+        ),
+        Benchmark(
+            "parse.utc_from_rfc3339",
+            lambda: UTCDatetime.from_rfc3339(rfc3339_string),
+            lambda: datetime.strptime(rfc3339_string, RFC3339_FORMAT).replace(
+                tzinfo=timezone.utc
+            ),
+        ),
+        Benchmark(
+            "parse.utc_from_iso_format_many",
+            lambda: UTCDatetime.from_iso_format_many(utc_strings),
+            lambda: [datetime.fromisoformat(s) for s in utc_strings],
+        ),
+        Benchmark(
+            "parse.utc_from_iso_format_many_packed",
+            lambda: UTCDatetime.from_iso_format_many(utc_strings, packed=True),
+            lambda: [datetime.fromisoformat(s) for s in utc_strings],
+        ),
+        Benchmark(
+            "parse.utc_from_iso_format_cached",
+            lambda: cache.from_iso_format(utc_string),
+            lambda: datetime.fromisoformat(utc_string),
+        ),
+        Benchmark(
+            "parse.utc_strptime_cached",
+            lambda: cache.strptime(utc_strptime_string, UTC_FORMAT),
+            lambda: datetime.strptime(utc_strptime_string, UTC_FORMAT),
+        ),
+        Benchmark(
+            "parse.utc_from_iso_format_repeated",
+            lambda: [UTCDatetime.from_iso_format(s) for s in repeated_strings],
+            lambda: [datetime.fromisoformat(s) for s in repeated_strings],
+        ),
+        Benchmark(
+            "parse.utc_from_iso_format_repeated_interned",
+            lambda: UTCDatetime.from_iso_format_many(repeated_strings, intern=True),
+            lambda: [datetime.fromisoformat(s) for s in repeated_strings],
+        ),
+        Benchmark(
+            "parse.utc_from_iso_format_repeated_cached",
+            cached_from_iso_format_many,
+            lambda: [datetime.fromisoformat(s) for s in repeated_strings],
+        ),
+        Benchmark(
+            "parse.local_from_iso_format_many",
+            lambda: LocalDatetime.from_iso_format_many(local_strings),
+            lambda: [datetime.fromisoformat(s) for s in local_strings],
+        ),
+    ]
+
+
+def formatting_benchmarks() -> List[Benchmark]:
+    utc_value = UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    local_value = LocalDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    utc_datetime = utc_value.as_datetime()
+    local_datetime = local_value.as_datetime()
+    # sorted, a few values per second, like the timestamps of a log
+    utc_values = sorted(_utc_values())
+    utc_datetimes = [value.as_datetime() for value in utc_values]
+    utc_array = UTCDatetimeArray(utc_values)
+
+    def join_iso_format() -> bytes:
+        return "".join(
+            [at.isoformat(timespec="microseconds") + "\n" for at in utc_datetimes]
+        ).encode()
+
+    return [
+        Benchmark(
+            "format.utc_iso_format",
+            utc_value.iso_format,
+            lambda: utc_datetime.isoformat(timespec="microseconds"),
+        ),
+        Benchmark(
+            "format.local_iso_format",
+            local_value.iso_format,
+            lambda: local_datetime.isoformat(timespec="microseconds"),
+        ),
+        Benchmark(
+            "format.utc_strftime",
+            lambda: utc_value.strftime(UTC_FORMAT),
+            lambda: utc_datetime.strftime(UTC_FORMAT),
+        ),
+        Benchmark(
+            "format.local_strftime",
+            lambda: local_value.strftime(ISO_FORMAT),
+            lambda: local_datetime.strftime(ISO_FORMAT),
+        ),
+        Benchmark(
+            "format.utc_format",
+            lambda: format(utc_value, UTC_FORMAT),
+            lambda: format(utc_datetime, UTC_FORMAT),
+        ),
+        Benchmark(
+            "format.utc_repr",
+            lambda: repr(utc_value),
+            lambda: repr(utc_datetime),
+        ),
+        Benchmark(
+            "format.utc_to_http_date",
+            utc_value.to_http_date,
+            lambda: utc_datetime.strftime(HTTP_FORMAT),
+        ),
+        Benchmark(
+            "format.utc_to_http_date_many",
+            lambda: [value.to_http_date() for value in utc_values],
+            lambda: [at.strftime(HTTP_FORMAT) for at in utc_datetimes],
+        ),
+        Benchmark(
+            "format.utc_to_rfc3339",
+            utc_value.to_rfc3339,
+            lambda: utc_datetime.strftime(RFC3339_FORMAT),
+        ),
+        Benchmark(
+            "format.utc_write_iso_format_many",
+            lambda: write_iso_format_many(utc_values, bytearray()),
+            join_iso_format,
+        ),
+        Benchmark(
+            "format.utc_write_iso_format_many_array",
+            lambda: write_iso_format_many(utc_array, bytearray()),
+            join_iso_format,
+        ),
+        Benchmark(
+            "format.utc_iso_format_join",
+            lambda: "".join(
+                [value.iso_format() + "\n" for value in utc_values]
+            ).encode(),
+            join_iso_format,
+        ),
+    ]
+
+
+def comparison_benchmarks() -> List[Benchmark]:
+    a = UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    b = UTCDatetime.at(2020, 1, 2, 3, 4, 5, 7)
+    a_datetime = a.as_datetime()
+    b_datetime = b.as_datetime()
+
+    values = _utc_values()
+    datetimes = [value.as_datetime() for value in values]
+
+    return [
+        Benchmark("compare.utc_lt", lambda: a < b, lambda: a_datetime < b_datetime),
+        Benchmark("compare.utc_eq", lambda: a == b, lambda: a_datetime == b_datetime),
+        Benchmark(
+            "compare.utc_eq_datetime",
+            lambda: a == b_datetime,
+            lambda: a_datetime == b_datetime,
+        ),
+        Benchmark(
+            "compare.utc_sorted",
+            lambda: sorted(values, reverse=True),
+            lambda: sorted(datetimes, reverse=True),
+        ),
+    ]
+
+
+def hashing_benchmarks() -> List[Benchmark]:
+    utc_value = UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    local_value = LocalDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    utc_datetime = utc_value.as_datetime()
+    local_datetime = local_value.as_datetime()
+
+    values = _utc_values()
+    datetimes = [value.as_datetime() for value in values]
+
+    return [
+        Benchmark("hash.utc_hash", lambda: hash(utc_value), lambda: hash(utc_datetime)),
+        Benchmark(
+            "hash.local_hash", lambda: hash(local_value), lambda: hash(local_datetime)
+        ),
+        Benchmark("hash.utc_set", lambda: set(values), lambda: set(datetimes)),
+    ]
+
+
+def arithmetic_benchmarks() -> List[Benchmark]:
+    utc_value = UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    local_value = LocalDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    other = UTCDatetime.at(2019, 12, 25)
+    utc_datetime = utc_value.as_datetime()
+    local_datetime = local_value.as_datetime()
+    other_datetime = other.as_datetime()
+    step = timedelta(seconds=1)
+
+    def add_loop(start: object) -> object:
+        value = start
+        for _ in range(BULK_SIZE):
+            value = value + step  # type: ignore[operator]
+        return value
+
+    return [
+        Benchmark(
+            "arithmetic.utc_add",
+            lambda: utc_value + step,
+            lambda: utc_datetime + step,
+        ),
+        Benchmark(
+            "arithmetic.local_add",
+            lambda: local_value + step,
+            lambda: local_datetime + step,
+        ),
+        Benchmark(
+            "arithmetic.utc_sub_timedelta",
+            lambda: utc_value - step,
+            lambda: utc_datetime - step,
+        ),
+        Benchmark(
+            "arithmetic.utc_sub_datetime",
+            lambda: utc_value - other,
+            lambda: utc_datetime - other_datetime,
+        ),
+        Benchmark(
+            "arithmetic.utc_add_loop",
+            lambda: add_loop(utc_value),
+            lambda: add_loop(utc_datetime),
+        ),
+    ]
+
+
+def range_benchmarks() -> List[Benchmark]:
+    start = UTCDatetime.at(2020, 1, 1)
+    step = timedelta(minutes=1)
+    stop = start + step * BULK_SIZE
+    start_datetime = start.as_datetime()
+    middle_datetime = (start + step * (BULK_SIZE // 2)).as_datetime()
+    values = UTCDatetime.range(start, stop, step)
+    middle = values[BULK_SIZE // 2]
+
+    def datetime_schedule() -> List[datetime]:
+        schedule = []
+        value = start_datetime
+        for _ in range(BULK_SIZE):
+            schedule.append(value)
+            value = value + step
+        return schedule
+
+    return [
+        Benchmark(
+            "range.utc_list",
+            lambda: list(UTCDatetime.range(start, stop, step)),
+            datetime_schedule,
+        ),
+        Benchmark(
+            "range.utc_to_array",
+            lambda: UTCDatetime.range(start, stop, step).to_array(),
+            None,
+        ),
+        Benchmark(
+            "range.utc_contains",
+            lambda: middle in values,
+            lambda: (middle_datetime - start_datetime) % step == timedelta(0),
+        ),
+    ]
+
+
+def rounding_benchmarks() -> List[Benchmark]:
+    value = UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    value_datetime = value.as_datetime()
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    five_minutes = timedelta(minutes=5)
+
+    values = sorted(_utc_values())
+    datetimes = [value.as_datetime() for value in values]
+    array = UTCDatetimeArray(values)
+
+    return [
+        Benchmark(
+            "round.utc_floor_hour",
+            lambda: value.floor("hour"),
+            lambda: value_datetime.replace(minute=0, second=0, microsecond=0),
+        ),
+        Benchmark(
+            "round.utc_floor_month",
+            lambda: value.floor("month"),
+            lambda: value_datetime.replace(
+                day=1, hour=0, minute=0, second=0, microsecond=0
+            ),
+        ),
+        Benchmark(
+            "round.floor_many_5_minutes",
+            lambda: floor_many(values, five_minutes),
+            lambda: [at - (at - epoch) % five_minutes for at in datetimes],
+        ),
+        Benchmark(
+            "round.floor_many_month",
+            lambda: floor_many(values, "month"),
+            lambda: [
+                at.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+                for at in datetimes
+            ],
+        ),
+        Benchmark(
+            "round.floor_array_5_minutes",
+            lambda: floor_many(array, five_minutes),
+            lambda: [at - (at - epoch) % five_minutes for at in datetimes],
+        ),
+        Benchmark(
+            "round.floor_many_5_minutes_interned",
+            lambda: floor_many(values, five_minutes, intern=True),
+            lambda: [at - (at - epoch) % five_minutes for at in datetimes],
+        ),
+    ]
+
+
+def zone_benchmarks() -> List[Benchmark]:
+    try:
+        from zoneinfo import ZoneInfo
+    except ImportError:
+        return []
+
+    utc = timezone.utc
+    zone = Zone("America/New_York")
+    zone_info = ZoneInfo("America/New_York")
+    start = UTCDatetime.at(2020, 1, 1)
+    step = timedelta(days=365) / BULK_SIZE
+    # sorted values over a year, which cross both of the year's transitions
+    values = list(UTCDatetime.range(start, start + step * BULK_SIZE, step))
+    walls = zone.to_local_many(values)
+    array = UTCDatetimeArray(values)
+    datetimes = [value.as_datetime() for value in values]
+    wall_datetimes = [wall.as_datetime() for wall in walls]
+
+    return [
+        Benchmark(
+            "zone.utc_to_local",
+            lambda: values[0].to_local(zone),
+            lambda: datetimes[0].astimezone(zone_info),
+        ),
+        Benchmark(
+            "zone.local_to_utc",
+            lambda: walls[0].to_utc(zone),
+            lambda: wall_datetimes[0].replace(tzinfo=zone_info).astimezone(utc),
+        ),
+        Benchmark(
+            "zone.to_local_many",
+            lambda: zone.to_local_many(values),
+            lambda: [value.astimezone(zone_info) for value in datetimes],
+        ),
+        Benchmark(
+            "zone.to_local_array",
+            lambda: array.to_local(zone),
+            lambda: [value.astimezone(zone_info) for value in datetimes],
+        ),
+        Benchmark(
+            "zone.to_utc_many",
+            lambda: zone.to_utc_many(walls, ambiguous="earlier"),
+            lambda: [
+                wall.replace(tzinfo=zone_info).astimezone(utc)
+                for wall in wall_datetimes
+            ],
+        ),
+    ]
+
+
+def pickling_benchmarks() -> List[Benchmark]:
+    utc_value = UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6)
+    utc_datetime = utc_value.as_datetime()
+    utc_pickle = pickle.dumps(utc_value)
+    datetime_pickle = pickle.dumps(utc_datetime)
+
+    values = _utc_values()
+    datetimes = [value.as_datetime() for value in values]
+
+    return [
+        Benchmark(
+            "pickle.utc_dumps",
+            lambda: pickle.dumps(utc_value),
+            lambda: pickle.dumps(utc_datetime),
+        ),
+        Benchmark(
+            "pickle.utc_loads",
+            lambda: pickle.loads(utc_pickle),
+            lambda: pickle.loads(datetime_pickle),
+        ),
+        Benchmark(
+            "pickle.utc_list_roundtrip",
+            lambda: pickle.loads(pickle.dumps(values)),
+            lambda: pickle.loads(pickle.dumps(datetimes)),
+        ),
+    ]
+
+
+def codec_benchmarks() -> List[Benchmark]:
+    values = sorted(_utc_values())
+    datetimes = [value.as_datetime() for value in values]
+    encoded = dumps_many(values)
+    delta_encoded = dumps_many(values, delta=True)
+    datetimes_pickle = pickle.dumps(datetimes)
+
+    return [
+        Benchmark(
+            "codec.utc_dumps_many",
+            lambda: dumps_many(values),
+            lambda: pickle.dumps(datetimes),
+        ),
+        Benchmark(
+            "codec.utc_dumps_many_delta",
+            lambda: dumps_many(values, delta=True),
+            lambda: pickle.dumps(datetimes),
+        ),
+        Benchmark(
+            "codec.utc_loads_many",
+            lambda: loads_many(encoded),
+            lambda: pickle.loads(datetimes_pickle),
+        ),
+        Benchmark(
+            "codec.utc_loads_many_delta",
+            lambda: loads_many(delta_encoded),
+            lambda: pickle.loads(datetimes_pickle),
+        ),
+        Benchmark(
+            "codec.utc_loads_many_packed",
+            lambda: loads_many(encoded, packed=True),
+            lambda: pickle.loads(datetimes_pickle),
+        ),
+    ]
+
+
+def json_benchmarks() -> List[Benchmark]:
+    # JSON_RECORDS records with two timestamp fields, in time order like an
+    # export of a table, as Fourth's and the stdlib's types, and as JSON text,
+    # only built when the benchmarks are first run
+    payloads: Dict[str, Any] = {}
+
+    def payload(name: str) -> Any:
+        if not payloads:
+            start = UTCDatetime.at(2020, 1, 1)
+            step = timedelta(milliseconds=37)
+            payloads["fourth"] = [
+                {
+                    "id": i,
+                    "name": f"record {i}",
+                    "created": start + step * i,
+                    "updated": start + step * i + timedelta(minutes=5),
+                }
+                for i in range(JSON_RECORDS)
+            ]
+            payloads["stdlib"] = [
+                {
+                    **record,
+                    "created": record["created"].as_datetime(),
+                    "updated": record["updated"].as_datetime(),
+                }
+                for record in payloads["fourth"]
+            ]
+            payloads["text"] = json_dumps(payloads["fourth"])
+        return payloads[name]
+
+    def per_record_ns(function: Callable[[Any], Any], name: str) -> float:
+        argument = payload(name)
+        start = perf_counter_ns()
+        function(argument)
+        return (perf_counter_ns() - start) / JSON_RECORDS
+
+    def stdlib_loads(text: str) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = json.loads(text)
+        for record in records:
+            record["created"] = datetime.fromisoformat(record["created"])
+            record["updated"] = datetime.fromisoformat(record["updated"])
+        return records
+
+    return [
+        Benchmark(
+            "json.utc_dumps_records",
+            lambda: per_record_ns(json_dumps, "fourth"),
+            lambda: per_record_ns(
+                lambda records: json.dumps(records, default=datetime.isoformat),
+                "stdlib",
+            ),
+            self_timed=True,
+        ),
+        Benchmark(
+            "json.utc_loads_records",
+            lambda: per_record_ns(
+                lambda text: json_loads(text, ["created", "updated"]), "text"
+            ),
+            lambda: per_record_ns(stdlib_loads, "text"),
+            self_timed=True,
+        ),
+    ]
+
+
+def logscan_benchmarks() -> List[Benchmark]:
+    start = UTCDatetime.at(2020, 1, 1)
+    step = timedelta(milliseconds=333)
+    middle = start + step * BULK_SIZE * 5
+    # the path of the log and its scanner, once the log is written
+    log: List[Tuple[str, LogScanner]] = []
+
+    def open_log() -> Tuple[str, LogScanner]:
+        """
+        Write a sorted log of BULK_SIZE * 10 lines, a few per second, the first
+        time one of the benchmarks runs. The scanner and the log are removed when
+        the interpreter exits.
+        """
+        if not log:
+            directory = tempfile.TemporaryDirectory()
+            path = os.path.join(directory.name, "bench.log")
+            with open(path, "w") as file:
+                for i in range(BULK_SIZE * 10):
+                    file.write(
+                        f"{(start + step * i).iso_format()} INFO request {i} handled\n"
+                    )
+            scanner = LogScanner(path)
+            # exit handlers run last registered first, so the scanner is closed
+            # before its file is removed
+            atexit.register(directory.cleanup)
+            atexit.register(scanner.close)
+            log.append((path, scanner))
+        return log[0]
+
+    def scan_lines() -> List[Tuple[UTCDatetime, int]]:
+        return list(open_log()[1])
+
+    def read_lines() -> List[Tuple[datetime, int]]:
+        values = []
+        offset = 0
+        with open(open_log()[0], "rb") as file:
+            for line in file:
+                values.append((datetime.fromisoformat(line[:32].decode()), offset))
+                offset += len(line)
+        return values
+
+    def read_lines_fourth() -> List[UTCDatetime]:
+        with open(open_log()[0]) as file:
+            return [UTCDatetime.from_iso_format(line[:32]) for line in file]
+
+    return [
+        Benchmark("logscan.scan", scan_lines, read_lines),
+        Benchmark(
+            "logscan.read_column", lambda: open_log()[1].read_column(), read_lines
+        ),
+        Benchmark("logscan.readline_from_iso_format", read_lines_fourth, read_lines),
+        Benchmark(
+            "logscan.find",
+            lambda: open_log()[1].find(middle),
+            lambda: bisect_left([at for at, _ in read_lines()], middle.as_datetime()),
+        ),
+    ]
+
+
+def parallel_benchmarks() -> List[Benchmark]:
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    strings = [
+        (start + timedelta(seconds=i)).isoformat() for i in range(BULK_SIZE * 100)
+    ]
+    # the worker processes are started on the first run, and kept for the rest
+    parser = ParallelParser(chunk_size=BULK_SIZE * 10)
+
+    return [
+        Benchmark(
+            "parallel.from_iso_format",
+            lambda: parser.from_iso_format(strings),
+            lambda: list(map(datetime.fromisoformat, strings)),
+        ),
+        Benchmark(
+            "parallel.from_iso_format_many_packed",
+            lambda: UTCDatetime.from_iso_format_many(strings, packed=True),
+            lambda: list(map(datetime.fromisoformat, strings)),
+        ),
+    ]
+
+
+def interop_benchmarks() -> List[Benchmark]:
+    try:
+        import numpy
+    except ImportError:
+        return []
+
+    values = _utc_values()
+    packed = UTCDatetimeArray(values)
+    datetime64s = to_datetime64(values)
+
+    def datetime64_from_datetimes() -> Any:
+        return numpy.array(
+            [value.as_datetime().replace(tzinfo=None) for value in values],
+            dtype="datetime64[us]",
+        )
+
+    return [
+        Benchmark(
+            "interop.utc_to_datetime64",
+            lambda: to_datetime64(values),
+            datetime64_from_datetimes,
+        ),
+        Benchmark(
+            "interop.utc_array_to_datetime64",
+            lambda: to_datetime64(packed),
+            datetime64_from_datetimes,
+        ),
+        Benchmark(
+            "interop.utc_from_datetime64",
+            lambda: from_datetime64(datetime64s, UTCDatetime),
+            lambda: [
+                UTCDatetime(at.replace(tzinfo=timezone.utc))
+                for at in datetime64s.astype(object)
+            ],
+        ),
+    ]
+
+
+def index_benchmarks() -> List[Benchmark]:
+    values = sorted(_utc_values() * 10)
+    datetimes = [value.as_datetime() for value in values]
+    index = UTCTimeIndex([(value, None) for value in values])
+    key = values[len(values) // 3] + timedelta(microseconds=1)
+    key_datetime = key.as_datetime()
+    end = key + timedelta(seconds=10)
+    end_datetime = end.as_datetime()
+
+    def add_remove(key: UTCDatetime) -> None:
+        index.add(key, None)
+        index.remove(key, None)
+
+    def insort_remove(key: datetime) -> None:
+        insort(datetimes, key)
+        datetimes.remove(key)
+
+    return [
+        Benchmark(
+            "index.utc_floor",
+            lambda: index.floor(key),
+            lambda: datetimes[bisect_right(datetimes, key_datetime) - 1],
+        ),
+        Benchmark(
+            "index.utc_range",
+            lambda: index.range(key, end),
+            lambda: datetimes[
+                bisect_left(datetimes, key_datetime) : bisect_left(
+                    datetimes, end_datetime
+                )
+            ],
+        ),
+        Benchmark(
+            "index.utc_add_remove",
+            lambda: add_remove(key),
+            lambda: insort_remove(key_datetime),
+        ),
+    ]
+
+
+def interval_index_benchmarks() -> List[Benchmark]:
+    # intervals up to a minute long, starting every 10 seconds out of order
+    size = 10 * BULK_SIZE
+    start = UTCDatetime.at(2020, 1, 1)
+    values = [start + timedelta(seconds=10 * ((i * 7919) % size)) for i in range(size)]
+    intervals = [
+        UTCInterval(value, value + timedelta(seconds=i % 60))
+        for i, value in enumerate(values)
+    ]
+    index = UTCIntervalIndex(zip(intervals, range(len(intervals))))
+    spans = [
+        (interval.start.as_datetime(), interval.end.as_datetime(), value)
+        for value, interval in enumerate(intervals)
+    ]
+    query = intervals[len(intervals) // 3]
+    query_start, query_end = query.start.as_datetime(), query.end.as_datetime()
+    instants = sorted(values[:: size // 100])
+    instant_datetimes = [instant.as_datetime() for instant in instants]
+
+    def spans_overlapping(start: datetime, end: datetime) -> List[object]:
+        return [span for span in spans if span[0] < end and start < span[1]]
+
+    def spans_containing(instant: datetime) -> List[object]:
+        return [span for span in spans if span[0] <= instant < span[1]]
+
+    return [
+        Benchmark(
+            "interval_index.utc_build",
+            lambda: UTCIntervalIndex(zip(intervals, range(len(intervals)))),
+            lambda: sorted(spans),
+        ),
+        Benchmark(
+            "interval_index.utc_overlapping",
+            lambda: index.overlapping(query),
+            lambda: spans_overlapping(query_start, query_end),
+        ),
+        Benchmark(
+            "interval_index.utc_containing",
+            lambda: index.containing(instants[0]),
+            lambda: spans_containing(instant_datetimes[0]),
+        ),
+        Benchmark(
+            "interval_index.utc_containing_many",
+            lambda: index.containing_many(instants),
+            lambda: [spans_containing(instant) for instant in instant_datetimes],
+        ),
+    ]
+
+
+def interval_benchmarks() -> List[Benchmark]:
+    values = _utc_values()
+    length = timedelta(seconds=0.25)
+    first = UTCIntervalSet(UTCInterval(value, value + length) for value in values)
+    second = UTCIntervalSet(
+        UTCInterval(value + length, value + 2 * length) for value in values[::2]
+    )
+    first_tuples = [(i.start.as_datetime(), i.end.as_datetime()) for i in first]
+    second_tuples = [(i.start.as_datetime(), i.end.as_datetime()) for i in second]
+    point = values[len(values) // 3]
+    point_datetime = point.as_datetime()
+
+    def tuples_union(
+        a: List[Tuple[datetime, datetime]], b: List[Tuple[datetime, datetime]]
+    ) -> List[Tuple[datetime, datetime]]:
+        merged: List[Tuple[datetime, datetime]] = []
+        for start, end in sorted(a + b):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    def tuples_contains(a: List[Tuple[datetime, datetime]], point: datetime) -> bool:
+        i = bisect_right(a, (point, datetime.max.replace(tzinfo=timezone.utc)))
+        return bool(i) and a[i - 1][1] > point
+
+    return [
+        Benchmark(
+            "interval.utc_union",
+            lambda: first | second,
+            lambda: tuples_union(first_tuples, second_tuples),
+        ),
+        Benchmark("interval.utc_intersection", lambda: first & second, None),
+        Benchmark("interval.utc_difference", lambda: first - second, None),
+        Benchmark(
+            "interval.utc_contains",
+            lambda: point in first,
+            lambda: tuples_contains(first_tuples, point_datetime),
+        ),
+    ]
+
+
+def import_benchmarks() -> List[Benchmark]:
+    return [
+        Benchmark(
+            "import.fourth",
+            lambda: _import_time_ns("fourth"),
+            lambda: _import_time_ns("datetime"),
+            self_timed=True,
+        ),
+    ]
+
+
+def memory_benchmarks() -> List[MemoryBenchmark]:
+    """
+    Return the memory benchmarks, which measure the values of an in-memory store
+    of events, with timestamps that repeat many times over.
+    """
+    size = 100 * BULK_SIZE
+    start = UTCDatetime.at(2020, 1, 1)
+    # an hour of events, at random microseconds
+    events = [
+        start + timedelta(microseconds=(i * 2_654_435_761) % 3_600_000_000)
+        for i in range(size)
+    ]
+    event_datetimes = [event.as_datetime() for event in events]
+    seconds = [event.iso_format()[:19] + "+00:00" for event in events]
+
+    def minutes_datetimes() -> List[datetime]:
+        return [at.replace(second=0, microsecond=0) for at in event_datetimes]
+
+    def seconds_datetimes() -> List[datetime]:
+        return [datetime.fromisoformat(s) for s in seconds]
+
+    return [
+        MemoryBenchmark(
+            "memory.utc_minutes",
+            lambda: floor_many(events, "minute"),
+            minutes_datetimes,
+        ),
+        MemoryBenchmark(
+            "memory.utc_minutes_interned",
+            lambda: floor_many(events, "minute", intern=True),
+            minutes_datetimes,
+        ),
+        MemoryBenchmark(
+            "memory.utc_minutes_array",
+            lambda: floor_many(events, "minute", packed=True),
+            minutes_datetimes,
+        ),
+        MemoryBenchmark(
+            "memory.utc_parsed_seconds",
+            lambda: UTCDatetime.from_iso_format_many(seconds).values,
+            seconds_datetimes,
+        ),
+        MemoryBenchmark(
+            "memory.utc_parsed_seconds_interned",
+            lambda: UTCDatetime.from_iso_format_many(seconds, intern=True).values,
+            seconds_datetimes,
+        ),
+    ]
+
+
+def _utc_values() -> List[UTCDatetime]:
+    """
+    Return BULK_SIZE UTCDatetimes that are out of order, with no duplicates.
+    """
+    start = UTCDatetime.at(2020, 1, 1)
+    return [
+        start + timedelta(seconds=(i * 7919) % BULK_SIZE, microseconds=i)
+        for i in range(BULK_SIZE)
+    ]
+
+
+def _calls_ns(function: Callable[[], Any], number: int = 100_000) -> float:
+    """
+    Measure how long a function takes per call, over many calls, for operations
+    that need setting up and tearing down around the calls.
+    """
+    start = perf_counter_ns()
+    for _ in repeat(None, number):
+        function()
+    return (perf_counter_ns() - start) / number
+
+
+def _import_time_ns(module: str) -> int:
+    """
+    Measure how long a module takes to import in a fresh interpreter, using
+    Python's `-X importtime` option.
+
+    :param module: The name of the module to import.
+    :return: The cumulative import time of the module, in nanoseconds.
+    """
+    # make sure the fresh interpreter imports this copy of fourth
+    environment = dict(os.environ)
+    source_directory = os.path.dirname(os.path.dirname(fourth.__file__))
+    environment["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [source_directory, environment.get("PYTHONPATH")])
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=environment,
+        check=True,
+    )
+
+    # lines are like "import time:       self [us] | cumulative | imported package"
+    for line in completed.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) * 1_000
+
+    raise RuntimeError(f"couldn't find the import time of {module}")
@@ -0,0 +1,204 @@
+"""
+A bounded LRU cache in front of the parsing constructors, for inputs that repeat
+the same datetime strings many times over.
+"""
+from __future__ import annotations
+
+__all__ = ("CacheInfo", "ParseCache")
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, NamedTuple, Tuple, Type, TypeVar, Union
+
+from .types import BaseDatetime, LocalDatetime, UTCDatetime
+
+T = TypeVar("T", bound=BaseDatetime)
+
+# strptime() results are keyed on (date string, format string), so they never
+# collide with from_iso_format() results, which are keyed on the date string
+_Key = Union[str, Tuple[str, str]]
+
+
+class CacheInfo(NamedTuple):
+    """
+    The counters of a ParseCache, as returned by ParseCache.cache_info().
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache(Generic[T]):
+    """
+    A bounded cache of parsed Datetimes, keyed on the strings they were parsed
+    from. When it is full the least recently used value is evicted.
+
+    Datetimes are immutable, so the same instance is returned for every hit.
+    Strings that fail to parse aren't cached, so they raise the same error every
+    time.
+
+    The cache is safe to share between threads. Hits don't take a lock, since
+    each OrderedDict operation they make is atomic, and strings are parsed
+    outside the lock, so a slow parse doesn't hold up other threads. As with
+    functools.lru_cache(), hits made at the same time by different threads can
+    be counted as one.
+    """
+
+    # Instance Attributes
+
+    _cls: Type[T]
+    _parse_iso_format: Callable[[str], T]
+    _parse_strptime: Callable[[str, str], T]
+    _maxsize: int
+    _values: OrderedDict[_Key, T]
+    _lock: threading.Lock
+    _hits: int
+    _misses: int
+    _evictions: int
+
+    __slots__ = (
+        "_cls",
+        "_parse_iso_format",
+        "_parse_strptime",
+        "_maxsize",
+        "_values",
+        "_lock",
+        "_hits",
+        "_misses",
+        "_evictions",
+    )
+
+    # Special Methods
+
+    def __init__(self, cls: Type[T], maxsize: int = 4096) -> None:
+        """
+        Initialise an empty cache.
+
+        :param cls: The Datetime type to parse strings to, LocalDatetime or
+            UTCDatetime.
+        :param maxsize: The most values to keep.
+        :raises TypeError: When cls isn't LocalDatetime or UTCDatetime.
+        :raises ValueError: When maxsize isn't positive.
+        """
+        if not (
+            isinstance(cls, type) and issubclass(cls, (LocalDatetime, UTCDatetime))
+        ):
+            raise TypeError(f"cls must be LocalDatetime or UTCDatetime, not {cls!r}")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+
+        self._cls = cls
+        self._parse_iso_format = getattr(cls, "from_iso_format")
+        self._parse_strptime = getattr(cls, "strptime")
+        self._maxsize = maxsize
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self._cls.__name__}, maxsize={self._maxsize})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    # Instance Properties
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    # Instance Methods
+
+    def from_iso_format(self, date_string: str) -> T:
+        """
+        Return the Datetime of an ISO 8601 formatted string, as the type's
+        from_iso_format() would, reusing the one already parsed from an equal
+        string if it is cached.
+
+        :param date_string: The ISO 8601 formatted datetime string.
+        :return: The corresponding Datetime.
+        :raises ValueError: When the string can't be parsed.
+        """
+        values = self._values
+        value = values.get(date_string)
+        if value is not None:
+            self._hits += 1
+            try:
+                values.move_to_end(date_string)
+            except KeyError:
+                # evicted by another thread since
+                pass
+            return value
+
+        return self._insert(date_string, self._parse_iso_format(date_string))
+
+    def strptime(self, date_string: str, format_string: str) -> T:
+        """
+        Return the Datetime of a string parsed according to a format string, as
+        the type's strptime() would, reusing the one already parsed from equal
+        strings if it is cached.
+
+        :param date_string: The datetime string.
+        :param format_string: The format string.
+        :return: The corresponding Datetime.
+        :raises ValueError: When the string can't be parsed.
+        """
+        key = (date_string, format_string)
+        values = self._values
+        value = values.get(key)
+        if value is not None:
+            self._hits += 1
+            try:
+                values.move_to_end(key)
+            except KeyError:
+                # evicted by another thread since
+                pass
+            return value
+
+        return self._insert(key, self._parse_strptime(date_string, format_string))
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Return the hit, miss and eviction counters, and the size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._values),
+            )
+
+    def clear(self) -> None:
+        """
+        Empty the cache, and reset its counters.
+        """
+        with self._lock:
+            self._values.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _insert(self, key: _Key, value: T) -> T:
+        """
+        Cache a newly parsed value, evicting the least recently used one if the
+        cache is full. If another thread cached the key first, its value is kept
+        and returned instead, so every caller gets the same instance.
+        """
+        with self._lock:
+            self._misses += 1
+            values = self._values
+            cached = values.get(key)
+            if cached is not None:
+                values.move_to_end(key)
+                return cached
+
+            values[key] = value
+            if len(values) > self._maxsize:
+                values.popitem(last=False)
+                self._evictions += 1
+            return value
@@ -0,0 +1,210 @@
+"""
+Clocks that UTCDatetime.now() can read the current time from.
+
+By default UTCDatetime.now() reads the system clock on every call. Code that
+asks for the time many times over, and doesn't need it to the microsecond, can
+instead plug in a CoarseClock, which hands out the same UTCDatetime until it is
+a tick old.
+"""
+from __future__ import annotations
+
+__all__ = ("Clock", "CoarseClock", "PreciseClock", "get_clock", "set_clock")
+
+import threading
+from abc import ABCMeta, abstractmethod
+from datetime import timedelta
+from time import monotonic_ns, time_ns
+from types import TracebackType
+from typing import Optional, Tuple, Type
+
+from . import types as _types
+from ._internal import timedelta_to_us
+from .types import UTCDatetime
+
+# the expiry of a coarse clock's value while a background thread refreshes it
+_NEVER = -1
+
+
+class Clock(metaclass=ABCMeta):
+    """
+    Base class for sources of the current time.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def now(self) -> UTCDatetime:
+        """
+        Return the current UTC date and time.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement now()")
+
+
+class PreciseClock(Clock):
+    """
+    A clock that reads the system clock on every call, to the microsecond.
+    This is what UTCDatetime.now() does by default.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+    def now(self) -> UTCDatetime:
+        return UTCDatetime._from_us(time_ns() // 1_000)
+
+
+class CoarseClock(Clock):
+    """
+    A clock that returns the same UTCDatetime until it is a tick old, so most
+    calls cost an attribute lookup rather than building a new instance.
+
+    The value is refreshed lazily, by the first call after it expires, using the
+    monotonic clock to tell when a tick has passed. Otherwise with
+    background=True, a daemon thread refreshes it every tick, and calls don't
+    read any clock. Stop the thread with close(), or by using the clock as a
+    context manager, after which the value is refreshed lazily again.
+
+    Values are at most a tick old, as long as the background thread gets to run.
+    Values never go backwards in time, unless the system clock does.
+    """
+
+    # Instance Attributes
+
+    _tick_ns: int
+    # (monotonic expiry in nanoseconds, value), replaced as a whole so that
+    # threads never see the expiry of one value with another value
+    _state: Tuple[int, UTCDatetime]
+    _stop: Optional[threading.Event]
+    _thread: Optional[threading.Thread]
+
+    __slots__ = ("_tick_ns", "_state", "_stop", "_thread")
+
+    # Special Methods
+
+    def __init__(
+        self, tick: timedelta = timedelta(milliseconds=1), *, background: bool = False
+    ) -> None:
+        """
+        Initialise a coarse clock.
+
+        :param tick: How long a value is reused for.
+        :param background: If True, refresh the value from a background thread
+            rather than lazily.
+        :raises ValueError: When the tick isn't positive.
+        """
+        tick_ns = timedelta_to_us(tick) * 1_000
+        if tick_ns <= 0:
+            raise ValueError("tick must be positive")
+
+        self._tick_ns = tick_ns
+        self._state = (0, UTCDatetime._from_us(time_ns() // 1_000))
+        self._stop = self._thread = None
+
+        if background:
+            self._stop = threading.Event()
+            self._refresh(_NEVER)
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop,), name=repr(self), daemon=True
+            )
+            self._thread.start()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"{timedelta(microseconds=self._tick_ns // 1_000)!r}, "
+            f"background={self._stop is not None})"
+        )
+
+    def __enter__(self) -> CoarseClock:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    # Instance Properties
+
+    @property
+    def tick(self) -> timedelta:
+        return timedelta(microseconds=self._tick_ns // 1_000)
+
+    # Instance Methods
+
+    def now(self) -> UTCDatetime:
+        """
+        Return the current UTC date and time, to within a tick.
+        """
+        expires, value = self._state
+        if expires == _NEVER or monotonic_ns() < expires:
+            return value
+        return self._refresh(monotonic_ns() + self._tick_ns)
+
+    def close(self) -> None:
+        """
+        Stop the background thread, if there is one. The value is refreshed
+        lazily afterwards.
+        """
+        stop, thread = self._stop, self._thread
+        if stop is not None and thread is not None:
+            stop.set()
+            thread.join()
+            self._stop = self._thread = None
+            self._state = (0, self._state[1])
+
+    def _refresh(self, expires: int) -> UTCDatetime:
+        """
+        Replace the value with the current time, keeping the latest value if the
+        system clock has gone back by less than a tick.
+        """
+        latest = self._state[1]
+        value = UTCDatetime._from_us(time_ns() // 1_000)
+        if latest._us - self._tick_ns // 1_000 < value._us < latest._us:
+            value = latest
+        self._state = (expires, value)
+        return value
+
+    def _run(self, stop: threading.Event) -> None:
+        """
+        Refresh the value every tick, until stop is set.
+        """
+        while not stop.wait(self._tick_ns / 1e9):
+            self._refresh(_NEVER)
+
+
+_precise = PreciseClock()
+_clock: Clock = _precise
+
+
+def get_clock() -> Clock:
+    """
+    Return the clock UTCDatetime.now() reads.
+    """
+    return _clock
+
+
+def set_clock(clock: Optional[Clock]) -> Clock:
+    """
+    Set the clock UTCDatetime.now() reads, for every thread.
+
+    :param clock: The clock to read, or None to go back to reading the system
+        clock on every call.
+    :return: The clock that was set before, so it can be restored.
+    :raises TypeError: When the clock isn't a Clock.
+    """
+    global _clock
+
+    if clock is None:
+        clock = _precise
+    elif not isinstance(clock, Clock):
+        raise TypeError(f"clock must be a Clock, not '{type(clock).__name__}'")
+
+    previous, _clock = _clock, clock
+    # the precise clock is UTCDatetime.now()'s own default, which skips the hook
+    _types._now_hook = None if clock is _precise else clock.now
+    return previous
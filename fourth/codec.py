@@ -0,0 +1,134 @@
+"""
+A compact binary encoding for sequences of Datetimes.
+
+The encoding is an 8 byte header followed by one 8 byte record per Datetime.
+
+The header is the magic bytes b"4th", a version byte, a byte for the type of the
+Datetimes, a flags byte and two reserved zero bytes.
+Each record is a signed 64 bit little-endian integer, the Datetime's microseconds
+since 1970-01-01T00:00:00. When the sequence is delta encoded, each record
+after the first is instead the difference from the previous Datetime.
+"""
+from __future__ import annotations
+
+__all__ = ("dumps_many", "loads_many")
+
+import struct
+import sys
+from array import array
+from itertools import accumulate, chain
+from operator import attrgetter, sub
+from typing import Any, Dict, Iterable, List, Type, Union
+
+from ._internal import MAX_EPOCH_US, MIN_EPOCH_US, common_type
+from .array import BaseDatetimeArray, LocalDatetimeArray, UTCDatetimeArray
+from .types import BaseDatetime, LocalDatetime, UTCDatetime, _intern_us_many
+
+_HEADER = struct.Struct("<3sBBBxx")
+_MAGIC = b"4th"
+_VERSION = 1
+
+# the type byte of an empty sequence, whose type isn't known
+_EMPTY = 0
+_TYPES: Dict[int, Type[BaseDatetime]] = {1: LocalDatetime, 2: UTCDatetime}
+_TYPE_BYTES = {cls: type_byte for type_byte, cls in _TYPES.items()}
+_ARRAY_TYPES: Dict[Type[BaseDatetime], Type[BaseDatetimeArray[Any]]] = {
+    LocalDatetime: LocalDatetimeArray,
+    UTCDatetime: UTCDatetimeArray,
+}
+
+# flags
+_DELTA = 1
+
+_get_us = attrgetter("_us")
+
+
+def dumps_many(values: Iterable[BaseDatetime], *, delta: bool = False) -> bytes:
+    """
+    Encode a sequence of Datetimes as bytes.
+
+    All the values must be the same type, either LocalDatetime or UTCDatetime.
+    A LocalDatetimeArray or UTCDatetimeArray is encoded straight from its buffer.
+
+    :param values: The Datetimes to encode.
+    :param delta: If True, encode each value as the difference from the one
+        before it. The encoding is the same size, but compresses much better
+        when the values are sorted.
+    :return: The encoded bytes.
+    :raises TypeError: When the values aren't all LocalDatetime or all UTCDatetime.
+    """
+    if isinstance(values, BaseDatetimeArray):
+        type_byte = _TYPE_BYTES[values._item_type]
+        records = values.to_epoch_microseconds()
+    else:
+        values = list(values)
+        cls = common_type(values, "encode")
+        type_byte = _EMPTY if cls is None else _TYPE_BYTES[cls]
+        records = array("q", map(_get_us, values))
+
+    flags = 0
+    if delta:
+        flags |= _DELTA
+        records = array("q", map(sub, records, chain((0,), records)))
+
+    if sys.byteorder == "big":
+        records.byteswap()
+
+    return _HEADER.pack(_MAGIC, _VERSION, type_byte, flags) + records.tobytes()
+
+
+def loads_many(
+    data: bytes, *, packed: bool = False, intern: bool = False
+) -> Union[List[BaseDatetime], BaseDatetimeArray[Any]]:
+    """
+    Decode a sequence of Datetimes from bytes produced by dumps_many().
+
+    The Datetimes are built straight from the decoded integers, without the
+    validation done when initialising them from a datetime.
+
+    :param data: The encoded bytes.
+    :param packed: If True, return a LocalDatetimeArray or UTCDatetimeArray rather
+        than a list. An empty sequence of unknown type is always an empty list.
+    :param intern: If True, take the Datetimes in a list from the intern pool of
+        their type, see BaseDatetime.intern().
+    :return: The decoded Datetimes.
+    :raises ValueError: When the bytes aren't a valid encoding.
+    :raises OverflowError: When a decoded value is out of range.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < _HEADER.size or (len(view) - _HEADER.size) % 8:
+        raise ValueError("data is not a valid encoding of Datetimes")
+
+    magic, version, type_byte, flags = _HEADER.unpack_from(view)
+    if magic != _MAGIC:
+        raise ValueError("data is not a valid encoding of Datetimes")
+    if version != _VERSION:
+        raise ValueError(f"unsupported encoding version {version}")
+    if type_byte != _EMPTY and type_byte not in _TYPES:
+        raise ValueError(f"unknown Datetime type {type_byte}")
+
+    records = array("q")
+    records.frombytes(view[_HEADER.size :])
+    if sys.byteorder == "big":
+        records.byteswap()
+
+    if flags & _DELTA:
+        records = array("q", accumulate(records))
+
+    if not records:
+        if type_byte == _EMPTY or not packed:
+            return []
+        return _ARRAY_TYPES[_TYPES[type_byte]]()
+    if type_byte == _EMPTY:
+        raise ValueError("data is not a valid encoding of Datetimes")
+
+    if min(records) < MIN_EPOCH_US or max(records) > MAX_EPOCH_US:
+        raise OverflowError("date value out of range")
+
+    cls = _TYPES[type_byte]
+    if packed:
+        return _ARRAY_TYPES[cls]._from_view(memoryview(records))
+    elif intern:
+        return list(_intern_us_many(cls, records))
+    else:
+        return list(map(cls._from_us, records))
@@ -0,0 +1,395 @@
+"""
+Compiled strftime/strptime style format strings.
+"""
+from __future__ import annotations
+
+__all__ = ("Format",)
+
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter, methodcaller
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from ._internal import contains_timezone
+from .types import BaseDatetime, LocalDatetime, ParseResult, UTCDatetime, _parse_many
+
+# How many compiled formats are kept for LocalDatetime/UTCDatetime strftime/strptime
+_CACHE_SIZE = 256
+
+# strftime zero pads "%Y" to 4 digits on some platforms and not on others.
+_YEAR_SPEC = "%04d" if datetime(1, 1, 1).strftime("%Y") == "0001" else "%d"
+
+# Directives rendered from a datetime attribute, as (attribute, "%" format spec).
+_RENDER_FIELDS: Dict[str, Tuple[str, str]] = {
+    "d": ("day", "%02d"),
+    "f": ("microsecond", "%06d"),
+    "H": ("hour", "%02d"),
+    "m": ("month", "%02d"),
+    "M": ("minute", "%02d"),
+    "S": ("second", "%02d"),
+    "Y": ("year", _YEAR_SPEC),
+}
+
+# Directives with constant output for a UTCDatetime.
+_RENDER_UTC_CONSTANTS = {"z": "+0000", "Z": "UTC"}
+
+# Regular expressions for the directives parsed without datetime.strptime().
+# These are the same as the _strptime module's, except they only match ASCII digits.
+_PARSE_PATTERNS = {
+    "d": r"(?P<d>3[01]|[12][0-9]|0[1-9]|[1-9]| [1-9])",
+    "f": r"(?P<f>[0-9]{1,6})",
+    "H": r"(?P<H>2[0-3]|[0-1][0-9]|[0-9])",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "M": r"(?P<M>[0-5][0-9]|[0-9])",
+    "S": r"(?P<S>6[0-1]|[0-5][0-9]|[0-9])",
+    "Y": r"(?P<Y>[0-9][0-9][0-9][0-9])",
+    "z": r"(?P<z>[+-][0-9][0-9]:?[0-5][0-9](:?[0-5][0-9](\.[0-9]{1,6})?)?|Z)",
+}
+
+# Matches one directive, including any glibc style flag or E/O modifier.
+_DIRECTIVE = re.compile(r"%[-_0^#]?[EO]?.?", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+
+# UTC offsets parsed by %z, keyed by the matched text. Offsets with seconds are
+# left to datetime.strptime().
+_OFFSET = re.compile(r"([+-])([0-9][0-9]):?([0-9][0-9])")
+_parsed_timezones: Dict[str, timezone] = {"Z": timezone.utc}
+
+
+class Format:
+    """
+    A strftime/strptime style format string, compiled once so it can be used to
+    format and parse many Datetimes quickly.
+
+    The format string has the same meaning as for LocalDatetime.strftime() and
+    UTCDatetime.strftime(), and for the strptime() constructors.
+    Whether it contains timezone directives is checked when it is compiled,
+    rather than every time it is used.
+
+    LocalDatetime and UTCDatetime use a cache of compiled Formats for their
+    strftime() and strptime() methods.
+    """
+
+    # Instance Attributes
+
+    _format_string: str
+    _has_timezone: bool
+    _parses_utc: bool
+    _render: Callable[[datetime], str]
+    _parse_regex: Optional[re.Pattern[str]]
+
+    __slots__ = (
+        "_format_string",
+        "_has_timezone",
+        "_parses_utc",
+        "_render",
+        "_parse_regex",
+    )
+
+    # Special Methods
+
+    def __init__(self, format_string: str) -> None:
+        """
+        Compile a format string.
+
+        :param format_string: The strftime/strptime style format string.
+        """
+        self._format_string = format_string
+        self._has_timezone = contains_timezone(format_string)
+
+        tokens = _tokenize(format_string)
+        self._parses_utc = "%z" in tokens
+        self._render = _compile_render(tokens)
+        self._parse_regex = _compile_parse_regex(tokens)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._format_string!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Format):
+            return self._format_string == other._format_string
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._format_string)
+
+    # Instance Properties
+
+    @property
+    def format_string(self) -> str:
+        return self._format_string
+
+    @property
+    def has_timezone(self) -> bool:
+        """
+        True if the format string contains a timezone directive (%z, %Z).
+        """
+        return self._has_timezone
+
+    # Instance Methods
+
+    def format(self, value: BaseDatetime) -> str:
+        """
+        Return a string representation of the Datetime, controlled by this format.
+        The same as value.strftime(self.format_string).
+
+        :param value: The Datetime to format.
+        :return: The string representation of the Datetime.
+        :raises ValueError: When formatting a LocalDatetime with a format that
+            contains timezone directives.
+        """
+        if self._has_timezone and not isinstance(value, UTCDatetime):
+            raise ValueError(
+                "format string for LocalDatetime must not contain timezone "
+                "directives ('%z', '%Z')"
+            )
+        return self._render(value.as_datetime())
+
+    def format_many(self, values: Iterable[BaseDatetime]) -> List[str]:
+        """
+        Format many Datetimes, as format() would.
+
+        :param values: The Datetimes to format.
+        :return: A list of the string representations.
+        """
+        if self._has_timezone:
+            return [self.format(value) for value in values]
+        else:
+            render = self._render
+            return [render(value.as_datetime()) for value in values]
+
+    def parse(self, date_string: str) -> Union[LocalDatetime, UTCDatetime]:
+        """
+        Parse a datetime string according to this format.
+
+        When the format contains a UTC offset directive (%z) the result is a
+        UTCDatetime, otherwise it is a LocalDatetime.
+
+        :param date_string: The datetime string.
+        :return: The corresponding LocalDatetime or UTCDatetime instance.
+        :raises ValueError: When the string doesn't match the format.
+        :raises OverflowError: When a UTCDatetime would be out of range in UTC.
+        """
+        if self._parses_utc:
+            return UTCDatetime(self._parse_datetime(date_string))
+        else:
+            return LocalDatetime.trusted(self._parse_datetime(date_string))
+
+    def parse_many(
+        self, date_strings: Iterable[str], *, packed: bool = False, intern: bool = False
+    ) -> ParseResult:
+        """
+        Parse many datetime strings, as parse() would.
+
+        A string that fails to parse, or that is out of range in UTC, doesn't stop
+        the others being parsed, instead its exception is recorded in the result's
+        errors.
+
+        :param date_strings: The datetime strings.
+        :param packed: If True, return the values as a LocalDatetimeArray or
+            UTCDatetimeArray rather than a list.
+        :param intern: If True, take the values in a list from the intern pool of
+            their type, see BaseDatetime.intern().
+        :return: A ParseResult of the values and any errors.
+        """
+        from .array import LocalDatetimeArray, UTCDatetimeArray
+
+        if self._parses_utc:
+            return _parse_many(
+                date_strings,
+                self._parse_utc,
+                UTCDatetime,
+                UTCDatetimeArray,
+                packed,
+                intern,
+            )
+        else:
+            return _parse_many(
+                date_strings,
+                self._parse_datetime,
+                LocalDatetime,
+                LocalDatetimeArray,
+                packed,
+                intern,
+            )
+
+    def _parse_datetime(self, date_string: str) -> datetime:
+        """
+        Parse a datetime string according to this format.
+        Gives exactly the same result as datetime.strptime().
+
+        :param date_string: The datetime string.
+        :return: The parsed datetime.datetime, which is aware when the format
+            contains %z.
+        """
+        if self._parse_regex is not None:
+            found = self._parse_regex.match(date_string)
+            if found is not None and found.end() == len(date_string):
+                try:
+                    parsed = _datetime_from_match(found)
+                except ValueError:
+                    parsed = None
+                if parsed is not None:
+                    return parsed
+
+        # the fast path couldn't handle the string, so let strptime parse it,
+        # or raise its usual error
+        return datetime.strptime(date_string, self._format_string)
+
+    def _parse_utc(self, date_string: str) -> datetime:
+        """
+        Parse a datetime string according to this format, to a datetime in UTC.
+
+        :raises OverflowError: When the datetime is out of range in UTC.
+        """
+        return self._parse_datetime(date_string).astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def compile_format(format_string: str) -> Format:
+    """
+    Return the compiled Format for a format string, from a bounded LRU cache.
+
+    :param format_string: The strftime/strptime style format string.
+    :return: The compiled Format.
+    """
+    return Format(format_string)
+
+
+def _tokenize(format_string: str) -> List[str]:
+    """
+    Split a format string into directives (beginning with "%") and literal text.
+    """
+    tokens = []
+    position = 0
+    for match in _DIRECTIVE.finditer(format_string):
+        if match.start() > position:
+            tokens.append(format_string[position : match.start()])
+        tokens.append(match.group())
+        position = match.end()
+    if position < len(format_string):
+        tokens.append(format_string[position:])
+    return tokens
+
+
+def _compile_render(tokens: List[str]) -> Callable[[datetime], str]:
+    """
+    Build a function that renders a datetime according to the tokens.
+
+    Directives that come straight from a datetime attribute become part of a
+    printf style template. Anything else is rendered by datetime.strftime().
+    Timezone directives are rendered as they would be for UTC, so the function
+    must only be used with UTC or (when there are no timezone directives)
+    naive datetimes.
+    """
+    template = []
+    attributes = []
+    fields: List[Callable[[datetime], Any]] = []
+
+    for token in tokens:
+        directive = token[1:] if token.startswith("%") else None
+        if directive in _RENDER_FIELDS:
+            attribute, spec = _RENDER_FIELDS[directive]
+            template.append(spec)
+            attributes.append(attribute)
+            fields.append(attrgetter(attribute))
+        elif directive in _RENDER_UTC_CONSTANTS:
+            template.append(_RENDER_UTC_CONSTANTS[directive])
+        elif directive == "%":
+            template.append("%%")
+        elif directive is not None:
+            template.append("%s")
+            fields.append(methodcaller("strftime", token))
+        else:
+            template.append(token.replace("%", "%%"))
+
+    template_string = "".join(template)
+
+    if not fields:
+        literal = template_string % ()
+        return lambda at: literal
+    elif len(attributes) == len(fields) > 1:
+        # a single attrgetter fetches all the attributes as a tuple
+        getter = attrgetter(*attributes)
+        return lambda at: template_string % getter(at)
+    else:
+        return lambda at: template_string % tuple([field(at) for field in fields])
+
+
+def _compile_parse_regex(tokens: List[str]) -> Optional[re.Pattern[str]]:
+    """
+    Build a regular expression that parses strings according to the tokens.
+
+    :return: The compiled regular expression, or None if the tokens contain
+        directives that must be left to datetime.strptime().
+    """
+    pattern = []
+    seen = set()
+
+    for token in tokens:
+        if token.startswith("%"):
+            directive = token[1:]
+            if directive == "%":
+                pattern.append("%")
+            elif directive in _PARSE_PATTERNS and directive not in seen:
+                pattern.append(_PARSE_PATTERNS[directive])
+                seen.add(directive)
+            else:
+                return None
+        else:
+            pattern.append(
+                "\\s+".join(re.escape(part) for part in _WHITESPACE.split(token))
+            )
+
+    return re.compile("".join(pattern))
+
+
+def _datetime_from_match(found: re.Match[str]) -> Optional[datetime]:
+    """
+    Build the datetime that datetime.strptime() would for a successful match.
+
+    :return: The datetime, or None when the match contains a UTC offset that must
+        be left to datetime.strptime().
+    """
+    groups = found.groupdict()
+
+    offset = groups.get("z")
+    if offset is None:
+        tzinfo = None
+    else:
+        tzinfo = _parsed_timezone(offset)
+        if tzinfo is None:
+            return None
+
+    microsecond = groups.get("f")
+    return datetime(
+        int(groups.get("Y") or 1900),
+        int(groups.get("m") or 1),
+        int(groups.get("d") or 1),
+        int(groups.get("H") or 0),
+        int(groups.get("M") or 0),
+        int(groups.get("S") or 0),
+        int(microsecond.ljust(6, "0")) if microsecond else 0,
+        tzinfo,
+    )
+
+
+def _parsed_timezone(offset: str) -> Optional[timezone]:
+    """
+    Return the timezone for a %z offset string, like "+0530" or "-08:00".
+
+    :return: The timezone, or None when the offset isn't of that simple form.
+    """
+    tzinfo = _parsed_timezones.get(offset)
+    if tzinfo is None:
+        match = _OFFSET.fullmatch(offset)
+        if match is None:
+            return None
+
+        sign, hours, minutes = match.groups()
+        delta = timedelta(hours=int(hours), minutes=int(minutes))
+        tzinfo = timezone(-delta if sign == "-" else delta)
+        _parsed_timezones[offset] = tzinfo
+    return tzinfo
@@ -0,0 +1,854 @@
+"""
+Sorted containers keyed by the datetime and interval types that Fourth provides.
+"""
+from __future__ import annotations
+
+__all__ = (
+    "BaseIntervalIndex",
+    "BaseTimeIndex",
+    "LocalIntervalIndex",
+    "LocalTimeIndex",
+    "UTCIntervalIndex",
+    "UTCTimeIndex",
+)
+
+from bisect import bisect_left, bisect_right
+from heapq import heapify, heappop, heappush, merge
+from itertools import islice
+from operator import itemgetter
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .interval import BaseInterval, LocalInterval, UTCInterval
+from .types import BaseDatetime, LocalDatetime, UTCDatetime
+
+D = TypeVar("D", bound=BaseDatetime)
+I = TypeVar("I", bound=BaseInterval[Any])
+V = TypeVar("V")
+
+_first = itemgetter(0)
+# orders interval entries by start, then end, then the order they were added
+_entry_order = itemgetter(0, 1, 2)
+# orders the active entries of a sweep, which are (end, sequence number, start, _)
+_active_order = itemgetter(2, 0, 1)
+
+
+class BaseTimeIndex(Generic[D, V]):
+    """
+    Base class for Fourth's mutable sorted containers of (Datetime, value) entries.
+
+    Entries are kept sorted by their Datetime key. Many entries can have the same
+    key, and entries with equal keys are kept in the order they were added.
+
+    The keys are stored as integer microseconds since the epoch, split into
+    sorted chunks, so lookups bisect integers rather than comparing Datetimes,
+    and adding an entry only shifts the entries of one chunk.
+
+    Queries return (Datetime, value) tuples.
+    """
+
+    # Class Attributes
+
+    _key_type: ClassVar[Type[BaseDatetime]]
+    # the number of entries chunks are split back down to
+    _load: ClassVar[int] = 1_000
+
+    # Instance Attributes
+
+    # the sorted keys of each chunk, and the values in the same order
+    _keys: List[List[int]]
+    _values: List[List[V]]
+    # the greatest key in each chunk
+    _maxes: List[int]
+    _len: int
+
+    __slots__ = ("_keys", "_values", "_maxes", "_len")
+
+    # Special Methods
+
+    def __init__(self, entries: Iterable[Tuple[D, V]] = ()) -> None:
+        """
+        Initialise an index from an iterable of (Datetime, value) entries.
+
+        :param entries: The entries to add. They don't need to be sorted.
+        :raises TypeError: When a key isn't the index's key type.
+        """
+        self._keys = []
+        self._values = []
+        self._maxes = []
+        self._len = 0
+        self.extend(entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Tuple[D, V]]:
+        return self._entries(0, 0, len(self._keys), 0)
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Check if there are any entries with the key.
+        """
+        if not isinstance(key, self._key_type):
+            return False
+        chunk, offset = self._locate_left(key._us)
+        return chunk < len(self._keys) and self._keys[chunk][offset] == key._us
+
+    # Instance Methods
+
+    def add(self, key: D, value: V) -> None:
+        """
+        Add an entry, after any entries with the same key.
+
+        :param key: The Datetime key of the entry.
+        :param value: The value of the entry.
+        :raises TypeError: When the key isn't the index's key type.
+        """
+        us = self._to_us(key)
+
+        if not self._maxes:
+            self._keys.append([us])
+            self._values.append([value])
+            self._maxes.append(us)
+            self._len = 1
+            return
+
+        chunk = bisect_right(self._maxes, us)
+        if chunk == len(self._maxes):
+            # after every key, so goes on the end of the last chunk
+            chunk -= 1
+            self._keys[chunk].append(us)
+            self._values[chunk].append(value)
+            self._maxes[chunk] = us
+        else:
+            keys = self._keys[chunk]
+            offset = bisect_right(keys, us)
+            keys.insert(offset, us)
+            self._values[chunk].insert(offset, value)
+
+        self._len += 1
+        if len(self._keys[chunk]) > 2 * self._load:
+            self._split(chunk)
+
+    def extend(self, entries: Iterable[Tuple[D, V]]) -> None:
+        """
+        Add many entries.
+
+        This is fastest when the entries are already sorted by key, and they all
+        come at or after the last key in the index.
+
+        :param entries: The (Datetime, value) entries to add.
+        :raises TypeError: When a key isn't the index's key type.
+        """
+        to_us = self._to_us
+        new = [(to_us(key), value) for key, value in entries]
+        if not new:
+            return
+
+        if any(a[0] > b[0] for a, b in zip(new, islice(new, 1, None))):
+            new.sort(key=_first)
+
+        if self._maxes and new[0][0] < self._maxes[-1]:
+            # the entries are among the existing ones, so merge them all
+            merged = list(merge(self._items(), new, key=_first))
+            self._keys, self._values, self._maxes, self._len = [], [], [], 0
+            self._append_sorted(merged)
+        else:
+            self._append_sorted(new)
+
+    def remove(self, key: D, value: V) -> None:
+        """
+        Remove the first entry with the key and an equal value.
+
+        :param key: The Datetime key of the entry.
+        :param value: The value of the entry.
+        :raises ValueError: When there is no such entry.
+        """
+        if isinstance(key, self._key_type):
+            us = key._us
+            chunk, offset = self._locate_left(us)
+            while chunk < len(self._keys):
+                keys = self._keys[chunk]
+                while offset < len(keys) and keys[offset] == us:
+                    if self._values[chunk][offset] == value:
+                        self._delete(chunk, offset)
+                        return
+                    offset += 1
+                if offset < len(keys):
+                    break
+                chunk, offset = chunk + 1, 0
+
+        raise ValueError(f"({key!r}, {value!r}) is not in {self.__class__.__name__}")
+
+    def clear(self) -> None:
+        """
+        Remove all the entries.
+        """
+        self._keys, self._values, self._maxes, self._len = [], [], [], 0
+
+    def range(
+        self, start: Optional[D] = None, end: Optional[D] = None
+    ) -> List[Tuple[D, V]]:
+        """
+        Return the entries with keys in the half open range [start, end).
+
+        :param start: The earliest key to include. None for no lower bound.
+        :param end: The key to stop before. None for no upper bound.
+        :return: A list of (Datetime, value) entries, sorted by key.
+        """
+        if start is None:
+            start_chunk, start_offset = 0, 0
+        else:
+            start_chunk, start_offset = self._locate_left(self._to_us(start))
+
+        if end is None:
+            end_chunk, end_offset = len(self._keys), 0
+        else:
+            end_chunk, end_offset = self._locate_left(self._to_us(end))
+
+        return list(self._entries(start_chunk, start_offset, end_chunk, end_offset))
+
+    def floor(self, key: D) -> Optional[Tuple[D, V]]:
+        """
+        Return the entry with the latest key at or before the key.
+        If many entries have that key, the last one added is returned.
+
+        :param key: The Datetime to search from.
+        :return: The (Datetime, value) entry, or None if there isn't one.
+        """
+        us = self._to_us(key)
+        chunk = bisect_right(self._maxes, us)
+        if chunk == len(self._keys):
+            return self._entry(chunk - 1, -1) if self._keys else None
+
+        offset = bisect_right(self._keys[chunk], us)
+        if offset:
+            return self._entry(chunk, offset - 1)
+        elif chunk:
+            return self._entry(chunk - 1, -1)
+        else:
+            return None
+
+    def ceiling(self, key: D) -> Optional[Tuple[D, V]]:
+        """
+        Return the entry with the earliest key at or after the key.
+        If many entries have that key, the first one added is returned.
+
+        :param key: The Datetime to search from.
+        :return: The (Datetime, value) entry, or None if there isn't one.
+        """
+        chunk, offset = self._locate_left(self._to_us(key))
+        if chunk == len(self._keys):
+            return None
+        return self._entry(chunk, offset)
+
+    def nearest(self, key: D) -> Optional[Tuple[D, V]]:
+        """
+        Return the entry with the key closest to the key.
+        When the closest keys before and after are equally close, the entry
+        before is returned.
+
+        :param key: The Datetime to search from.
+        :return: The (Datetime, value) entry, or None if the index is empty.
+        """
+        before = self.floor(key)
+        after = self.ceiling(key)
+        if before is None or after is None:
+            return after if before is None else before
+
+        us = key._us
+        if us - before[0]._us <= after[0]._us - us:
+            return before
+        else:
+            return after
+
+    def keys(self) -> Iterator[D]:
+        """
+        Iterate over the keys of the entries, in order.
+        """
+        from_us = self._key_type._from_us
+        for keys in self._keys:
+            yield from map(from_us, keys)
+
+    def values(self) -> Iterator[V]:
+        """
+        Iterate over the values of the entries, in order of their keys.
+        """
+        for values in self._values:
+            yield from values
+
+    def _to_us(self, key: Any) -> int:
+        """
+        Convert a key to microseconds since the epoch.
+
+        :raises TypeError: When the key isn't the index's key type.
+        """
+        if not isinstance(key, self._key_type):
+            raise TypeError(
+                f"{self.__class__.__name__} keys must be "
+                f"{self._key_type.__name__}, not '{type(key).__name__}'"
+            )
+        return key._us
+
+    def _locate_left(self, us: int) -> Tuple[int, int]:
+        """
+        Return the (chunk, offset) position of the first key at or after us.
+        The chunk is len(self._keys) when there isn't one.
+        """
+        chunk = bisect_left(self._maxes, us)
+        if chunk == len(self._keys):
+            return chunk, 0
+        return chunk, bisect_left(self._keys[chunk], us)
+
+    def _entry(self, chunk: int, offset: int) -> Tuple[D, V]:
+        return (
+            self._key_type._from_us(self._keys[chunk][offset]),  # type: ignore[return-value]
+            self._values[chunk][offset],
+        )
+
+    def _entries(
+        self, start_chunk: int, start_offset: int, end_chunk: int, end_offset: int
+    ) -> Iterator[Tuple[D, V]]:
+        """
+        Iterate over the entries from the start position, up to the end position.
+        """
+        from_us = self._key_type._from_us
+        chunk, offset = start_chunk, start_offset
+        while chunk < end_chunk or (chunk == end_chunk and offset < end_offset):
+            stop = end_offset if chunk == end_chunk else len(self._keys[chunk])
+            yield from zip(
+                map(from_us, self._keys[chunk][offset:stop]),
+                self._values[chunk][offset:stop],
+            )
+            chunk, offset = chunk + 1, 0
+
+    def _items(self) -> Iterator[Tuple[int, V]]:
+        """
+        Iterate over the entries as (microseconds, value) tuples.
+        """
+        for keys, values in zip(self._keys, self._values):
+            yield from zip(keys, values)
+
+    def _append_sorted(self, entries: List[Tuple[int, V]]) -> None:
+        """
+        Add (microseconds, value) entries that are sorted, and all at or after
+        the last key, as new chunks.
+        """
+        load = self._load
+        position = 0
+
+        # top up the last chunk first
+        if self._keys and len(self._keys[-1]) < load:
+            position = load - len(self._keys[-1])
+            self._keys[-1].extend(map(_first, entries[:position]))
+            self._values[-1].extend([value for _, value in entries[:position]])
+            self._maxes[-1] = self._keys[-1][-1]
+
+        for start in range(position, len(entries), load):
+            chunk = entries[start : start + load]
+            self._keys.append([us for us, _ in chunk])
+            self._values.append([value for _, value in chunk])
+            self._maxes.append(chunk[-1][0])
+
+        self._len += len(entries)
+
+    def _split(self, chunk: int) -> None:
+        """
+        Split a chunk that has grown too big into two.
+        """
+        keys, values = self._keys[chunk], self._values[chunk]
+        half = len(keys) // 2
+        self._keys[chunk : chunk + 1] = [keys[:half], keys[half:]]
+        self._values[chunk : chunk + 1] = [values[:half], values[half:]]
+        self._maxes[chunk : chunk + 1] = [keys[half - 1], keys[-1]]
+
+    def _delete(self, chunk: int, offset: int) -> None:
+        """
+        Delete the entry at a position, removing its chunk if it becomes empty.
+        """
+        keys = self._keys[chunk]
+        del keys[offset]
+        del self._values[chunk][offset]
+        self._len -= 1
+
+        if keys:
+            self._maxes[chunk] = keys[-1]
+        else:
+            del self._keys[chunk], self._values[chunk], self._maxes[chunk]
+
+
+class LocalTimeIndex(BaseTimeIndex[LocalDatetime, V]):
+    """
+    A mutable sorted container of entries keyed by LocalDatetime.
+    """
+
+    _key_type = LocalDatetime
+
+    __slots__ = ()
+
+
+class UTCTimeIndex(BaseTimeIndex[UTCDatetime, V]):
+    """
+    A mutable sorted container of entries keyed by UTCDatetime.
+    """
+
+    _key_type = UTCDatetime
+
+    __slots__ = ()
+
+
+# An entry of an interval index, as (start, end, sequence number, value), where
+# the bounds are microseconds since the epoch, and the sequence number counts up
+# as entries are added.
+_IntervalEntry = Tuple[int, int, int, Any]
+
+
+class _IntervalTree:
+    """
+    A static interval tree, built once from entries sorted by their start.
+
+    The tree is implicit in the sorted lists, like a binary search tree laid out
+    in order: the leaves are the even positions, and the node at a position with
+    k trailing one bits is at level k, with children half a subtree either side.
+    Each node stores the greatest end in its subtree, so a query can skip every
+    subtree whose intervals all end before the query starts.
+
+    This is the layout used by the cgranges library.
+    """
+
+    # Class Attributes
+
+    # subtrees at or below this level are scanned rather than searched
+    _scan_level: ClassVar[int] = 3
+
+    # Instance Attributes
+
+    starts: List[int]
+    ends: List[int]
+    seqs: List[int]
+    values: List[Any]
+    # the greatest end in the subtree of each node
+    maxes: List[int]
+    root_level: int
+
+    __slots__ = ("starts", "ends", "seqs", "values", "maxes", "root_level")
+
+    # Special Methods
+
+    def __init__(self, entries: List[_IntervalEntry]) -> None:
+        """
+        :param entries: The entries of the tree, sorted by start, end and sequence
+            number. There must be at least one.
+        """
+        starts, ends, seqs, values = map(list, zip(*entries))
+        self.starts, self.ends, self.seqs, self.values = starts, ends, seqs, values
+
+        size = len(starts)
+        maxes = list(ends)
+        # the last node, and the greatest end in its subtree, which stands in for
+        # the subtrees of nodes that are past the end of the lists
+        last_index = (size - 1) & ~1
+        last = ends[last_index]
+
+        level = 1
+        while 1 << level <= size:
+            half = 1 << (level - 1)
+            for index in range((half << 1) - 1, size, half << 2):
+                right = maxes[index + half] if index + half < size else last
+                maxes[index] = max(ends[index], maxes[index - half], right)
+            # move up to the parent of the last node, which may be past the end
+            if (last_index >> level) & 1:
+                last_index -= half
+            else:
+                last_index += half
+            if last_index < size and maxes[last_index] > last:
+                last = maxes[last_index]
+            level += 1
+
+        self.maxes = maxes
+        self.root_level = level - 1
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    # Instance Methods
+
+    def entries(self) -> List[_IntervalEntry]:
+        return list(zip(self.starts, self.ends, self.seqs, self.values))
+
+    def overlapping(self, low: int, high: int) -> List[int]:
+        """
+        Return the positions of the non-empty intervals that overlap [low, high),
+        in order.
+        """
+        starts, ends, maxes = self.starts, self.ends, self.maxes
+        size = len(starts)
+        scan_level = self._scan_level
+        found = []
+
+        # (level, position, whether the left subtree has been searched)
+        stack = [(self.root_level, (1 << self.root_level) - 1, False)]
+        while stack:
+            level, index, left_done = stack.pop()
+            if level <= scan_level:
+                first = index >> level << level
+                for index in range(first, min(first + (2 << level) - 1, size)):
+                    if starts[index] >= high:
+                        break
+                    if ends[index] > low and starts[index] < ends[index]:
+                        found.append(index)
+            elif not left_done:
+                stack.append((level, index, True))
+                left = index - (1 << (level - 1))
+                if left >= size or maxes[left] > low:
+                    stack.append((level - 1, left, False))
+            elif index < size and starts[index] < high:
+                if ends[index] > low and starts[index] < ends[index]:
+                    found.append(index)
+                stack.append((level - 1, index + (1 << (level - 1)), False))
+
+        return found
+
+
+class BaseIntervalIndex(Generic[I, V]):
+    """
+    Base class for Fourth's mutable containers of (interval, value) entries,
+    that find the entries overlapping a span of time, or active at an instant.
+
+    The entries are kept in static interval trees of decreasing size. Adding
+    entries builds a new small tree, and trees of similar size are merged, so
+    each entry is rebuilt O(log n) times. Removed entries are only marked as
+    removed until their tree is rebuilt.
+
+    Queries take O(log n + k) time in each tree, for k matching entries, and
+    return (interval, value) tuples sorted by interval start, then end, then the
+    order the entries were added. Empty intervals are stored, but like
+    BaseInterval.overlaps() they never overlap anything.
+    """
+
+    # Class Attributes
+
+    _interval_type: ClassVar[Type[BaseInterval[Any]]]
+    # how many more entries than are active can start between two instants
+    # before containing_many() searches the trees rather than sweeping
+    _sweep_limit: ClassVar[int] = 32
+
+    # Instance Attributes
+
+    _trees: List[_IntervalTree]
+    # the sequence numbers of entries that are removed, but still in a tree
+    _removed: Set[int]
+    _next_seq: int
+    _len: int
+
+    __slots__ = ("_trees", "_removed", "_next_seq", "_len")
+
+    # Special Methods
+
+    def __init__(self, entries: Iterable[Tuple[I, V]] = ()) -> None:
+        """
+        Initialise an index from an iterable of (interval, value) entries.
+        Building an index from many entries at once is much faster than adding
+        them one at a time.
+
+        :param entries: The entries to add.
+        :raises TypeError: When an interval isn't the index's interval type.
+        """
+        self._trees = []
+        self._removed = set()
+        self._next_seq = 0
+        self._len = 0
+        self.extend(entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Tuple[I, V]]:
+        return iter(self._box(self._live_entries()))
+
+    # Instance Methods
+
+    def add(self, interval: I, value: V) -> None:
+        """
+        Add an entry.
+
+        :param interval: The interval of the entry.
+        :param value: The value of the entry.
+        :raises TypeError: When the interval isn't the index's interval type.
+        """
+        self.extend(((interval, value),))
+
+    def extend(self, entries: Iterable[Tuple[I, V]]) -> None:
+        """
+        Add many entries.
+
+        :param entries: The (interval, value) entries to add.
+        :raises TypeError: When an interval isn't the index's interval type.
+        """
+        check = self._check_interval
+        new = [
+            (check(interval)._start, interval._end, seq, value)
+            for seq, (interval, value) in enumerate(entries, self._next_seq)
+        ]
+        if not new:
+            return
+
+        new.sort(key=_entry_order)
+        self._next_seq += len(new)
+        self._len += len(new)
+        self._trees.append(_IntervalTree(new))
+
+        # merge the last two trees while the last isn't much smaller, which keeps
+        # the trees halving in size
+        trees = self._trees
+        while len(trees) > 1 and len(trees[-2]) <= 2 * len(trees[-1]):
+            self._merge(len(trees) - 2)
+
+    def remove(self, interval: I, value: V) -> None:
+        """
+        Remove the first added entry with the interval and an equal value.
+
+        :param interval: The interval of the entry.
+        :param value: The value of the entry.
+        :raises ValueError: When there is no such entry.
+        """
+        first: Optional[int] = None
+        if isinstance(interval, self._interval_type):
+            start, end = interval._start, interval._end
+            for tree in self._trees:
+                index = bisect_left(tree.starts, start)
+                while index < len(tree) and tree.starts[index] == start:
+                    seq = tree.seqs[index]
+                    if (
+                        tree.ends[index] == end
+                        and seq not in self._removed
+                        and tree.values[index] == value
+                        and (first is None or seq < first)
+                    ):
+                        first = seq
+                    index += 1
+
+        if first is None:
+            raise ValueError(
+                f"({interval!r}, {value!r}) is not in {self.__class__.__name__}"
+            )
+
+        self._removed.add(first)
+        self._len -= 1
+        # rebuild once most of the stored entries are removed ones
+        if len(self._removed) > self._len:
+            entries = self._live_entries()
+            self._trees = [_IntervalTree(entries)] if entries else []
+            self._removed = set()
+
+    def clear(self) -> None:
+        """
+        Remove all the entries.
+        """
+        self._trees, self._removed, self._len = [], set(), 0
+
+    def overlapping(self, interval: I) -> List[Tuple[I, V]]:
+        """
+        Return the entries whose intervals share any time with an interval.
+
+        :param interval: The interval to search. An empty interval overlaps
+            nothing.
+        :return: A list of (interval, value) entries.
+        :raises TypeError: When the interval isn't the index's interval type.
+        """
+        self._check_interval(interval)
+        return self._box(self._overlapping(interval._start, interval._end))
+
+    def containing(self, instant: BaseDatetime) -> List[Tuple[I, V]]:
+        """
+        Return the entries whose intervals contain an instant, so are active then.
+
+        :param instant: The Datetime to search.
+        :return: A list of (interval, value) entries.
+        :raises TypeError: When the instant isn't the index's Datetime type.
+        """
+        us = self._to_us(instant)
+        return self._box(self._overlapping(us, us + 1))
+
+    def containing_many(
+        self, instants: Iterable[BaseDatetime]
+    ) -> List[List[Tuple[I, V]]]:
+        """
+        Find the entries containing each of many instants, in one sweep.
+
+        Rather than searching the trees for every instant, this sweeps forward
+        through the entries that start between each instant and the next,
+        keeping the entries that are active in a heap ordered by their end.
+        Where so many entries start between two instants that searching would be
+        quicker, it searches the trees again instead.
+
+        :param instants: The Datetimes to search, sorted.
+        :return: A list with the entries containing each instant, as if from
+            containing().
+        :raises TypeError: When an instant isn't the index's Datetime type.
+        :raises ValueError: When the instants aren't sorted.
+        """
+        probes = [self._to_us(instant) for instant in instants]
+        if any(a > b for a, b in zip(probes, islice(probes, 1, None))):
+            raise ValueError("instants must be sorted")
+
+        from_us = self._interval_type._from_us
+        removed = self._removed
+        trees = self._trees
+        # the position in each tree of the first entry the sweep hasn't reached
+        positions = [0] * len(trees)
+        # (end, sequence number, start, boxed entry)
+        active: List[Tuple[int, int, int, Tuple[I, V]]] = []
+
+        results = []
+        for probe in probes:
+            reached = [bisect_right(tree.starts, probe) for tree in trees]
+            starting = sum(reached) - sum(positions)
+
+            if starting > len(active) + self._sweep_limit:
+                found = self._overlapping(probe, probe + 1)
+                result = self._box(found)
+                active = [
+                    (end, seq, start, boxed)
+                    for (start, end, seq, _), boxed in zip(found, result)
+                ]
+                heapify(active)
+            else:
+                for tree, first, last in zip(trees, positions, reached):
+                    starts, ends, seqs = tree.starts, tree.ends, tree.seqs
+                    for index in range(first, last):
+                        start, end, seq = starts[index], ends[index], seqs[index]
+                        if end > probe and start < end and seq not in removed:
+                            boxed = (from_us(start, end), tree.values[index])
+                            heappush(active, (end, seq, start, boxed))  # type: ignore[misc]
+                while active and active[0][0] <= probe:
+                    heappop(active)
+                result = [item[3] for item in sorted(active, key=_active_order)]
+
+            positions = reached
+            results.append(result)
+
+        return results
+
+    def _check_interval(self, interval: Any) -> I:
+        """
+        :raises TypeError: When the interval isn't the index's interval type.
+        """
+        if not isinstance(interval, self._interval_type):
+            raise TypeError(
+                f"{self.__class__.__name__} intervals must be "
+                f"{self._interval_type.__name__}, not '{type(interval).__name__}'"
+            )
+        return interval  # type: ignore[return-value]
+
+    def _to_us(self, instant: Any) -> int:
+        """
+        Convert an instant to microseconds since the epoch.
+
+        :raises TypeError: When the instant isn't the index's Datetime type.
+        """
+        datetime_type = self._interval_type._datetime_type
+        if not isinstance(instant, datetime_type):
+            raise TypeError(
+                f"{self.__class__.__name__} instants must be "
+                f"{datetime_type.__name__}, not '{type(instant).__name__}'"
+            )
+        return instant._us
+
+    def _overlapping(self, low: int, high: int) -> List[_IntervalEntry]:
+        """
+        Return the entries that overlap [low, high), in order.
+        """
+        found: List[_IntervalEntry] = []
+        if low >= high:
+            return found
+
+        removed = self._removed
+        for tree in self._trees:
+            starts, ends, seqs, values = tree.starts, tree.ends, tree.seqs, tree.values
+            for index in tree.overlapping(low, high):
+                if seqs[index] not in removed:
+                    found.append(
+                        (starts[index], ends[index], seqs[index], values[index])
+                    )
+
+        if len(self._trees) > 1:
+            found.sort(key=_entry_order)
+        return found
+
+    def _live_entries(self) -> List[_IntervalEntry]:
+        """
+        Return all the entries that aren't removed, in order.
+        """
+        removed = self._removed
+        entries = [
+            entry
+            for tree in self._trees
+            for entry in tree.entries()
+            if entry[2] not in removed
+        ]
+        entries.sort(key=_entry_order)
+        return entries
+
+    def _merge(self, position: int) -> None:
+        """
+        Merge a tree with the next one, dropping any removed entries.
+        """
+        trees = self._trees
+        merged = trees[position].entries()
+        merged.extend(trees[position + 1].entries())
+
+        removed = self._removed
+        if removed:
+            self._removed = removed - {entry[2] for entry in merged}
+            merged = [entry for entry in merged if entry[2] not in removed]
+        # the trees are each sorted, so this merges them in linear time
+        merged.sort(key=_entry_order)
+
+        trees[position : position + 2] = [_IntervalTree(merged)] if merged else []
+
+    def _box(self, entries: List[_IntervalEntry]) -> List[Tuple[I, V]]:
+        from_us = self._interval_type._from_us
+        return [
+            (from_us(start, end), value)  # type: ignore[misc]
+            for start, end, _, value in entries
+        ]
+
+
+class LocalIntervalIndex(BaseIntervalIndex[LocalInterval, V]):
+    """
+    A mutable container of entries keyed by LocalInterval, that finds the entries
+    overlapping a span of time, or active at an instant.
+    """
+
+    _interval_type = LocalInterval
+
+    __slots__ = ()
+
+
+class UTCIntervalIndex(BaseIntervalIndex[UTCInterval, V]):
+    """
+    A mutable container of entries keyed by UTCInterval, that finds the entries
+    overlapping a span of time, or active at an instant.
+    """
+
+    _interval_type = UTCInterval
+
+    __slots__ = ()
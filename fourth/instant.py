@@ -0,0 +1,237 @@
+"""
+A point on the monotonic clock, for measuring elapsed time.
+"""
+from __future__ import annotations
+
+__all__ = ("Instant",)
+
+from datetime import timedelta
+from time import monotonic_ns, time_ns
+from typing import Any, ClassVar, NamedTuple, NoReturn, Tuple
+
+from ._internal import MAX_EPOCH_US, MIN_EPOCH_US, ONE_MICROSECOND, timedelta_to_us
+from .types import UTCDatetime
+
+
+class _Anchor(NamedTuple):
+    """
+    A reading of the monotonic clock, and the wall clock at the same moment.
+    """
+
+    monotonic_ns: int
+    epoch_us: int
+
+
+def _take_anchor() -> _Anchor:
+    """
+    Read the wall clock between two readings of the monotonic clock, and pair it
+    with their midpoint.
+    """
+    before = monotonic_ns()
+    epoch_us = time_ns() // 1_000
+    after = monotonic_ns()
+    return _Anchor((before + after) // 2, epoch_us)
+
+
+class Instant:
+    """
+    An immutable point on the monotonic clock.
+
+    Instants can't be set back or forward by changes to the system clock, so the
+    time between two of them is the real time that passed. Taking one is a
+    single call to time.monotonic_ns(), and comparing or subtracting them is
+    integer math.
+
+    An Instant is converted to a UTCDatetime with to_utc(), through an anchor: a
+    reading of the monotonic clock paired with the wall clock at the same
+    moment. The anchor is taken when this module is imported, and taken again
+    when converting an Instant over a minute after it, so conversions follow
+    changes to the system clock. Instants have no meaning outside the process
+    that took them.
+
+    Implements __setattr__ and __delattr__ to make instances pseudo-immutable.
+    """
+
+    # Class Attributes
+
+    # how long an anchor is used before another is taken
+    _anchor_lifetime_ns: ClassVar[int] = 60_000_000_000
+    _anchor: ClassVar[_Anchor] = _take_anchor()
+
+    # Instance Attributes
+
+    _ns: int
+
+    __slots__ = ("_ns",)
+
+    # Special Methods
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        """
+        Setting attributes is disallowed for pseudo-immutability.
+
+        :raises AttributeError: Always raised.
+        """
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """
+        Deleting attributes is disallowed for pseudo-immutability.
+
+        :raises AttributeError: Always raised.
+        """
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __repr__(self) -> str:
+        """
+        Construct a command-line representation of the Instant.
+        Should be able to eval() this and get back an equal instance.
+        """
+        return f"{self.__class__.__name__}.from_monotonic_ns({self._ns})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Instant):
+            return self._ns == other._ns
+        else:
+            return NotImplemented
+
+    def __lt__(self, other: Any) -> bool:
+        if isinstance(other, Instant):
+            return self._ns < other._ns
+        else:
+            return NotImplemented
+
+    def __le__(self, other: Any) -> bool:
+        if isinstance(other, Instant):
+            return self._ns <= other._ns
+        else:
+            return NotImplemented
+
+    def __gt__(self, other: Any) -> bool:
+        if isinstance(other, Instant):
+            return self._ns > other._ns
+        else:
+            return NotImplemented
+
+    def __ge__(self, other: Any) -> bool:
+        if isinstance(other, Instant):
+            return self._ns >= other._ns
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._ns)
+
+    def __add__(self, other: Any) -> Instant:
+        """
+        Add a timedelta to the Instant.
+
+        :return: A new Instant. Otherwise NotImplemented.
+        """
+        if isinstance(other, timedelta):
+            return self._from_ns(self._ns + timedelta_to_us(other) * 1_000)
+        else:
+            return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> Any:
+        """
+        Subtract an Instant or timedelta from the Instant.
+
+        :return: The timedelta between the Instants, truncated to the
+            microsecond, or a new Instant. Otherwise NotImplemented.
+        """
+        if isinstance(other, Instant):
+            return ONE_MICROSECOND * _truncate_to_us(self._ns - other._ns)
+        elif isinstance(other, timedelta):
+            return self._from_ns(self._ns - timedelta_to_us(other) * 1_000)
+        else:
+            return NotImplemented
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__._from_ns, (self._ns,)
+
+    # Constructors
+
+    @classmethod
+    def now(cls) -> Instant:
+        """
+        Return the current Instant.
+        """
+        instance = object.__new__(cls)
+        _set_ns(instance, monotonic_ns())
+        return instance
+
+    @classmethod
+    def from_monotonic_ns(cls, nanoseconds: int) -> Instant:
+        """
+        Return the Instant of a reading of time.monotonic_ns().
+
+        :param nanoseconds: The reading.
+        :raises TypeError: When the reading isn't an int.
+        """
+        if not isinstance(nanoseconds, int):
+            raise TypeError(
+                f"nanoseconds must be int, not '{type(nanoseconds).__name__}'"
+            )
+        return cls._from_ns(nanoseconds)
+
+    @classmethod
+    def _from_ns(cls, nanoseconds: int) -> Instant:
+        instance = object.__new__(cls)
+        _set_ns(instance, nanoseconds)
+        return instance
+
+    # Instance Properties
+
+    @property
+    def monotonic_ns(self) -> int:
+        """
+        The reading of time.monotonic_ns() at this Instant. Subtracting these
+        skips building a timedelta, for the hottest paths.
+        """
+        return self._ns
+
+    # Instance Methods
+
+    def elapsed(self) -> timedelta:
+        """
+        Return the time since this Instant, truncated to the microsecond.
+        """
+        return ONE_MICROSECOND * _truncate_to_us(monotonic_ns() - self._ns)
+
+    def to_utc(self) -> UTCDatetime:
+        """
+        Return the UTCDatetime of the Instant, by the wall clock of the anchor.
+
+        :raises OverflowError: When the UTCDatetime is out of range.
+        """
+        anchor = Instant._anchor
+        nanoseconds = self._ns - anchor.monotonic_ns
+        if nanoseconds > self._anchor_lifetime_ns:
+            anchor = Instant._anchor = _take_anchor()
+            nanoseconds = self._ns - anchor.monotonic_ns
+
+        us = anchor.epoch_us + _truncate_to_us(nanoseconds)
+        if not MIN_EPOCH_US <= us <= MAX_EPOCH_US:
+            raise OverflowError("date value out of range")
+        return UTCDatetime._from_us(us)
+
+
+# Set the slot of an Instant, getting around pseudo immutability.
+_set_ns = Instant.__dict__["_ns"].__set__
+
+
+def _truncate_to_us(nanoseconds: int) -> int:
+    """
+    Convert nanoseconds to microseconds, truncating towards zero, so that
+    a - b is always -(b - a) for Instants.
+    """
+    if nanoseconds >= 0:
+        return nanoseconds // 1_000
+    return -(-nanoseconds // 1_000)
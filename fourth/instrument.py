@@ -0,0 +1,319 @@
+"""
+Opt-in counters and timings of the hot paths of the datetime types, to tell how
+much of a program's time goes into Fourth.
+
+Instrumentation costs nothing while it is disabled: enable() swaps counting
+wrappers in for the constructors and methods it measures, and disable() puts
+the originals back. So only use it while measuring, e.g.
+
+    with instrumented():
+        run_workload()
+    print(snapshot())
+"""
+from __future__ import annotations
+
+__all__ = (
+    "Snapshot",
+    "Timing",
+    "disable",
+    "enable",
+    "instrumented",
+    "is_enabled",
+    "reset",
+    "snapshot",
+)
+
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Tuple
+
+from . import format as _format
+from ._internal import contains_timezone
+from .types import BaseDatetime, LocalDatetime, UTCDatetime
+
+# the constructors counted for each type
+_CONSTRUCTORS = (
+    "at",
+    "now",
+    "from_iso_format",
+    "strptime",
+    "from_timestamp",
+    "from_epoch_seconds",
+    "from_epoch_milliseconds",
+    "from_epoch_microseconds",
+    "from_epoch_nanoseconds",
+    "from_http_date",
+    "from_rfc2822",
+    "from_rfc3339",
+)
+# the constructors and methods whose calls are timed, by the types defining them
+_PARSERS = (
+    "from_iso_format",
+    "strptime",
+    "from_http_date",
+    "from_rfc2822",
+    "from_rfc3339",
+)
+_FORMATTERS: Tuple[Tuple[type, str], ...] = (
+    (BaseDatetime, "iso_format"),
+    (LocalDatetime, "strftime"),
+    (UTCDatetime, "strftime"),
+    (UTCDatetime, "to_http_date"),
+    (UTCDatetime, "to_rfc2822"),
+    (UTCDatetime, "to_rfc3339"),
+)
+
+
+class Timing(NamedTuple):
+    """
+    The sampled times of the calls to a parse or format method.
+    """
+
+    calls: int
+    samples: int
+    total_ns: int
+    max_ns: int
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.samples if self.samples else 0.0
+
+
+class Snapshot(NamedTuple):
+    """
+    The counters and timings recorded since they were last reset, as returned by
+    snapshot().
+
+    Keys are "{type}.{method}", like "UTCDatetime.from_iso_format".
+    `constructions` counts the successful calls to each constructor, and
+    `failures` counts the calls that raised an exception. UTCDatetime() and
+    LocalDatetime() are counted as "__init__", including when
+    UTCDatetime.from_iso_format() and UTCDatetime.strptime() call them.
+    `utc_normalizations` counts UTCDatetime() calls with a datetime in a timezone
+    other than timezone.utc, which has to be converted to UTC.
+    `timezone_scans` counts the format strings scanned for a timezone directive,
+    which happens when a format string isn't in the compiled format cache.
+    """
+
+    constructions: Dict[str, int]
+    failures: Dict[str, int]
+    utc_normalizations: int
+    timezone_scans: int
+    timings: Dict[str, Timing]
+
+
+# the state of the instrumentation, only changed while holding the lock
+_lock = threading.Lock()
+# (owner, name, original attribute) of each wrapper swapped in by enable()
+_patches: List[Tuple[Any, str, Any]] = []
+_sample_every = 1
+_constructions: Dict[str, int] = {}
+_failures: Dict[str, int] = {}
+_utc_normalizations = 0
+_timezone_scans = 0
+# [calls, samples, total_ns, max_ns] of each timed method
+_timings: Dict[str, List[int]] = {}
+
+
+def enable(*, sample_every: int = 1) -> None:
+    """
+    Start counting and timing calls. Counters keep their values from before,
+    until reset() is called.
+
+    Calls made through references taken before instrumentation was enabled,
+    like a bound UTCDatetime.from_iso_format kept by a ParseCache, aren't counted.
+
+    :param sample_every: Time one in this many calls to each parse or format
+        method, since timing a call costs more than the call itself for the
+        fastest ones.
+    :raises ValueError: When sample_every isn't positive.
+    """
+    global _sample_every
+
+    if sample_every <= 0:
+        raise ValueError("sample_every must be positive")
+
+    with _lock:
+        _sample_every = sample_every
+        if _patches:
+            return
+
+        for cls in (LocalDatetime, UTCDatetime):
+            _patch(cls, "__init__", _wrap_init(cls))
+            for name in _CONSTRUCTORS:
+                if name in cls.__dict__:
+                    _patch(cls, name, _wrap_constructor(cls, name))
+        for owner, name in _FORMATTERS:
+            _patch(owner, name, _wrap_formatter(owner, name))
+        _patch(_format, "contains_timezone", _counted_contains_timezone)
+
+
+def disable() -> None:
+    """
+    Stop counting and timing calls, putting back the original methods. The
+    counters keep their values until reset() is called.
+    """
+    with _lock:
+        while _patches:
+            owner, name, original = _patches.pop()
+            setattr(owner, name, original)
+
+
+def is_enabled() -> bool:
+    """
+    Return whether calls are being counted and timed.
+    """
+    return bool(_patches)
+
+
+def snapshot() -> Snapshot:
+    """
+    Return a copy of the counters and timings.
+    """
+    with _lock:
+        return Snapshot(
+            dict(_constructions),
+            dict(_failures),
+            _utc_normalizations,
+            _timezone_scans,
+            {key: Timing(*timing) for key, timing in _timings.items()},
+        )
+
+
+def reset() -> None:
+    """
+    Set all the counters and timings back to zero.
+    """
+    global _utc_normalizations, _timezone_scans
+
+    with _lock:
+        _constructions.clear()
+        _failures.clear()
+        _timings.clear()
+        _utc_normalizations = _timezone_scans = 0
+
+
+@contextmanager
+def instrumented(*, sample_every: int = 1) -> Iterator[None]:
+    """
+    A context manager that resets the counters, and counts and times calls
+    within it. Instrumentation is left enabled afterwards if it already was.
+
+    :param sample_every: Time one in this many calls to each parse or format
+        method, see enable().
+    """
+    was_enabled = is_enabled()
+    reset()
+    enable(sample_every=sample_every)
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def _patch(owner: Any, name: str, wrapper: Any) -> None:
+    """
+    Swap a wrapper in for an attribute defined on the owner, remembering the
+    original so disable() can put it back.
+    """
+    _patches.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, wrapper)
+
+
+def _count(counters: Dict[str, int], key: str) -> None:
+    with _lock:
+        counters[key] = counters.get(key, 0) + 1
+
+
+def _record(key: str, elapsed_ns: int) -> None:
+    with _lock:
+        # the counters can have been reset since the call started
+        timing = _timings.setdefault(key, [0, 0, 0, 0])
+        timing[1] += 1
+        timing[2] += elapsed_ns
+        if elapsed_ns > timing[3]:
+            timing[3] = elapsed_ns
+
+
+def _should_sample(key: str) -> bool:
+    """
+    Count a call to a timed method, and return whether to time it.
+    """
+    with _lock:
+        timing = _timings.get(key)
+        if timing is None:
+            timing = _timings[key] = [0, 0, 0, 0]
+        timing[0] += 1
+        return timing[0] % _sample_every == 1 % _sample_every
+
+
+def _wrap_init(cls: type) -> Callable[..., None]:
+    key = f"{cls.__name__}.__init__"
+    init = cls.__dict__["__init__"]
+    normalizes = cls is UTCDatetime
+
+    @wraps(init)
+    def wrapper(self: Any, at: datetime) -> None:
+        global _utc_normalizations
+
+        try:
+            init(self, at)
+        except Exception:
+            _count(_failures, key)
+            raise
+        _count(_constructions, key)
+        if normalizes and at.tzinfo is not timezone.utc:
+            with _lock:
+                _utc_normalizations += 1
+
+    return wrapper
+
+
+def _wrap_constructor(cls: type, name: str) -> Any:
+    key = f"{cls.__name__}.{name}"
+    constructor = cls.__dict__[name].__func__
+    timed = name in _PARSERS
+
+    @wraps(constructor)
+    def wrapper(owner: type, *args: Any, **kwargs: Any) -> Any:
+        sample = timed and _should_sample(key)
+        start = perf_counter_ns() if sample else 0
+        try:
+            value = constructor(owner, *args, **kwargs)
+        except Exception:
+            _count(_failures, key)
+            raise
+        if sample:
+            _record(key, perf_counter_ns() - start)
+        _count(_constructions, key)
+        return value
+
+    return classmethod(wrapper)
+
+
+def _wrap_formatter(cls: type, name: str) -> Callable[..., str]:
+    method = cls.__dict__[name]
+
+    @wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> str:
+        key = f"{type(self).__name__}.{name}"
+        if not _should_sample(key):
+            return method(self, *args, **kwargs)  # type: ignore[no-any-return]
+        start = perf_counter_ns()
+        result = method(self, *args, **kwargs)
+        _record(key, perf_counter_ns() - start)
+        return result  # type: ignore[no-any-return]
+
+    return wrapper
+
+
+def _counted_contains_timezone(format_string: str) -> bool:
+    global _timezone_scans
+
+    with _lock:
+        _timezone_scans += 1
+    return contains_timezone(format_string)
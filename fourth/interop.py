@@ -0,0 +1,201 @@
+"""
+Converting between Fourth's Datetimes and NumPy datetime64 arrays, and between
+datetime64 arrays and array.array("q") buffers of microseconds since the epoch.
+
+NumPy is an optional dependency: this module can be imported without it, and
+only the functions that build or read NumPy arrays need it.
+
+datetime64 values have no time zone. LocalDatetimes map to their wall time, and
+UTCDatetimes to their time in UTC, so both are stored as the same microseconds
+since 1970-01-01T00:00:00 that the Datetime arrays hold. Those are the int64
+items of a datetime64[us] array, so converting between the two wraps the buffer
+without copying it where possible.
+"""
+from __future__ import annotations
+
+__all__ = (
+    "datetime64_to_epoch",
+    "epoch_to_datetime64",
+    "from_datetime64",
+    "to_datetime64",
+)
+
+from array import array
+from importlib import import_module
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Type
+
+from ._internal import common_type
+from .array import (
+    BaseDatetimeArray,
+    LocalDatetimeArray,
+    UTCDatetimeArray,
+    _as_int64_view,
+)
+from .types import BaseDatetime, LocalDatetime, UTCDatetime
+
+_ARRAY_TYPES: Dict[Type[BaseDatetime], Type[BaseDatetimeArray[Any]]] = {
+    LocalDatetime: LocalDatetimeArray,
+    UTCDatetime: UTCDatetimeArray,
+}
+
+# the microseconds since the epoch whose nanoseconds fit in a datetime64[ns],
+# leaving out the smallest int64, which is NaT
+_MIN_NS_US = -((2 ** 63 - 1) // 1_000)
+_MAX_NS_US = (2 ** 63 - 1) // 1_000
+
+_get_us = attrgetter("_us")
+
+
+def to_datetime64(values: Iterable[BaseDatetime], *, unit: str = "us") -> Any:
+    """
+    Convert Datetimes to a NumPy datetime64 array.
+
+    A LocalDatetimeArray or UTCDatetimeArray converted to datetime64[us] shares
+    its buffer, without copying it, so the result is read-only.
+
+    :param values: The Datetimes, all LocalDatetime or all UTCDatetime, or a
+        LocalDatetimeArray or UTCDatetimeArray.
+    :param unit: The unit of the datetime64 array, "us" or "ns".
+    :return: A datetime64[us] or datetime64[ns] array.
+    :raises TypeError: When the values aren't all LocalDatetime or all UTCDatetime.
+    :raises ValueError: When the unit isn't "us" or "ns".
+    :raises OverflowError: When a value is out of range of datetime64[ns].
+    :raises ImportError: When NumPy isn't installed.
+    """
+    numpy = _numpy()
+    _check_unit(unit)
+
+    if isinstance(values, BaseDatetimeArray):
+        microseconds = numpy.asarray(values._data)
+        microseconds.flags.writeable = False
+    else:
+        values = list(values)
+        common_type(values, "convert")
+        microseconds = numpy.fromiter(
+            map(_get_us, values), dtype=numpy.int64, count=len(values)
+        )
+    return _microseconds_to_datetime64(numpy, microseconds, unit)
+
+
+def from_datetime64(values: Any, cls: Type[BaseDatetime]) -> BaseDatetimeArray[Any]:
+    """
+    Convert a NumPy datetime64 array to a LocalDatetimeArray or UTCDatetimeArray.
+
+    A one dimensional, contiguous datetime64[us] array is wrapped without copying.
+    Note that means changes to it will be visible through the returned array.
+    Arrays of other units are converted to microseconds first, rounding down.
+
+    :param values: The datetime64 array.
+    :param cls: LocalDatetime or UTCDatetime, whether the values are wall times
+        or times in UTC.
+    :return: An array of the values, of cls.
+    :raises TypeError: When values isn't a one dimensional datetime64 array, or cls
+        isn't LocalDatetime or UTCDatetime.
+    :raises OverflowError: When a value, including NaT, is out of range.
+    :raises ImportError: When NumPy isn't installed.
+    """
+    array_type = _ARRAY_TYPES.get(cls)
+    if array_type is None:
+        raise TypeError(f"cls must be LocalDatetime or UTCDatetime, not {cls!r}")
+
+    numpy = _numpy()
+    microseconds = numpy.ascontiguousarray(_datetime64_to_microseconds(numpy, values))
+    return array_type.from_epoch_microseconds(microseconds)
+
+
+def epoch_to_datetime64(microseconds: Any, *, unit: str = "us") -> Any:
+    """
+    Convert a buffer of microseconds since the epoch, like the array.array("q")
+    returned by to_epoch_microseconds(), to a NumPy datetime64 array.
+
+    Converted to datetime64[us], the buffer is wrapped without copying. Note that
+    means changes to either are visible through the other.
+
+    :param microseconds: The microseconds since 1970-01-01T00:00:00, as a buffer
+        with signed 64 bit integer items.
+    :param unit: The unit of the datetime64 array, "us" or "ns".
+    :return: A datetime64[us] or datetime64[ns] array.
+    :raises TypeError: When the buffer's items can't be viewed as 64 bit integers.
+    :raises ValueError: When the unit isn't "us" or "ns".
+    :raises OverflowError: When a value is out of range of datetime64[ns].
+    :raises ImportError: When NumPy isn't installed.
+    """
+    numpy = _numpy()
+    _check_unit(unit)
+    return _microseconds_to_datetime64(
+        numpy, numpy.asarray(_as_int64_view(microseconds)), unit
+    )
+
+
+def datetime64_to_epoch(values: Any) -> array[int]:
+    """
+    Convert a NumPy datetime64 array to microseconds since the epoch, rounding
+    down. array.array can't wrap another object's memory, so this is a copy.
+
+    :param values: The datetime64 array.
+    :return: An array("q") of microseconds since 1970-01-01T00:00:00.
+    :raises TypeError: When values isn't a one dimensional datetime64 array.
+    :raises ImportError: When NumPy isn't installed.
+    """
+    numpy = _numpy()
+    microseconds = numpy.ascontiguousarray(_datetime64_to_microseconds(numpy, values))
+    result = array("q")
+    result.frombytes(memoryview(microseconds).cast("B"))
+    return result
+
+
+def _numpy() -> Any:
+    """
+    Return the numpy module.
+
+    :raises ImportError: When it isn't installed.
+    """
+    try:
+        return import_module("numpy")
+    except ImportError:
+        raise ImportError("datetime64 conversions need the numpy package") from None
+
+
+def _check_unit(unit: str) -> None:
+    if unit not in ("us", "ns"):
+        raise ValueError(f"unit must be 'us' or 'ns', not {unit!r}")
+
+
+def _microseconds_to_datetime64(numpy: Any, microseconds: Any, unit: str) -> Any:
+    """
+    Return an int64 array of microseconds since the epoch as datetime64 of the unit.
+
+    :raises OverflowError: When a value is out of range of datetime64[ns].
+    """
+    if unit == "us":
+        return microseconds.view("datetime64[us]")
+
+    if len(microseconds) and (
+        microseconds.min() < _MIN_NS_US or microseconds.max() > _MAX_NS_US
+    ):
+        raise OverflowError("date value out of range for datetime64[ns]")
+    return (microseconds * 1_000).view("datetime64[ns]")
+
+
+def _datetime64_to_microseconds(numpy: Any, values: Any) -> Any:
+    """
+    Return a datetime64 array as an int64 array of microseconds since the epoch,
+    a view of it when it is already datetime64[us].
+
+    :raises TypeError: When values isn't a one dimensional datetime64 array.
+    """
+    dtype = getattr(values, "dtype", None)
+    if dtype is None or dtype.kind != "M":
+        name = type(values).__name__ if dtype is None else dtype.name
+        raise TypeError(f"expected a datetime64 array, not '{name}'")
+    if values.ndim != 1:
+        raise TypeError(
+            f"expected a one dimensional datetime64 array, not {values.ndim} dimensions"
+        )
+
+    # a non-native byte order has the unit too, but its bytes can't be viewed as
+    # native integers
+    if dtype != numpy.dtype("datetime64[us]"):
+        values = values.astype("datetime64[us]")
+    return values.view(numpy.int64)
@@ -0,0 +1,514 @@
+"""
+Spans of time between two of the datetime types that Fourth provides, and sets
+of them.
+"""
+from __future__ import annotations
+
+__all__ = (
+    "BaseInterval",
+    "BaseIntervalSet",
+    "LocalInterval",
+    "LocalIntervalSet",
+    "UTCInterval",
+    "UTCIntervalSet",
+)
+
+from bisect import bisect_right
+from datetime import timedelta
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from ._internal import MAX_EPOCH_US, ONE_MICROSECOND
+from .types import BaseDatetime, LocalDatetime, UTCDatetime
+
+D = TypeVar("D", bound=BaseDatetime)
+T = TypeVar("T", bound="BaseInterval[Any]")
+S = TypeVar("S", bound="BaseIntervalSet[Any]")
+
+# a bound after every possible bound
+_AFTER_ALL = MAX_EPOCH_US + 1
+
+
+class BaseInterval(Generic[D]):
+    """
+    Base class for Fourth's interval types.
+
+    An interval is the half open span of time [start, end), including its start
+    but not its end. An interval whose start and end are equal is empty.
+
+    The bounds are stored as integer microseconds since the epoch.
+
+    Implements __setattr__ and __delattr__ to make instances pseudo-immutable.
+    """
+
+    # Class Attributes
+
+    _datetime_type: ClassVar[Type[BaseDatetime]]
+
+    # Instance Attributes
+
+    _start: int
+    _end: int
+
+    __slots__ = ("_start", "_end")
+
+    # Special Methods
+
+    def __init__(self, start: D, end: D) -> None:
+        """
+        Initialise an interval from its start and end.
+
+        :param start: The start of the interval, which is included.
+        :param end: The end of the interval, which isn't included.
+        :raises TypeError: When the bounds aren't the interval's Datetime type.
+        :raises ValueError: When the start is after the end.
+        """
+        for bound in (start, end):
+            if not isinstance(bound, self._datetime_type):
+                raise TypeError(
+                    f"{self.__class__.__name__} bounds must be "
+                    f"{self._datetime_type.__name__}, not '{type(bound).__name__}'"
+                )
+        if start._us > end._us:
+            raise ValueError(f"{self.__class__.__name__} start must not be after end")
+
+        # use object.__setattr__ to get around pseudo immutability.
+        object.__setattr__(self, "_start", start._us)
+        object.__setattr__(self, "_end", end._us)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        """
+        Setting attributes is disallowed for pseudo-immutability.
+
+        :raises AttributeError: Always raised.
+        """
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __delattr__(self, name: str) -> NoReturn:
+        """
+        Deleting attributes is disallowed for pseudo-immutability.
+
+        :raises AttributeError: Always raised.
+        """
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __repr__(self) -> str:
+        """
+        Construct a command-line representation of the interval.
+        Should be able to eval() this and get back an equal instance.
+        """
+        return f"{self.__class__.__name__}({self.start!r}, {self.end!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, self.__class__):
+            return self._start == other._start and self._end == other._end
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._start, self._end))
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if a Datetime is in the interval, or another interval is within it.
+        """
+        if isinstance(value, self._datetime_type):
+            return self._start <= value._us < self._end
+        elif isinstance(value, self.__class__):
+            return value._start == value._end or (
+                self._start <= value._start and value._end <= self._end
+            )
+        else:
+            return False
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Called when the interval is pickled.
+        Pickles the integer bounds, rather than the Datetimes.
+        """
+        return self.__class__._from_us, (self._start, self._end)
+
+    # Constructors
+
+    @classmethod
+    def _from_us(cls: Type[T], start: int, end: int) -> T:
+        """
+        Return a new interval from bounds in microseconds since the epoch.
+        The bounds are trusted to be in range and in order.
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "_start", start)
+        object.__setattr__(instance, "_end", end)
+        return instance
+
+    # Instance Properties
+
+    @property
+    def start(self) -> D:
+        return self._datetime_type._from_us(self._start)  # type: ignore[return-value]
+
+    @property
+    def end(self) -> D:
+        return self._datetime_type._from_us(self._end)  # type: ignore[return-value]
+
+    @property
+    def duration(self) -> timedelta:
+        return ONE_MICROSECOND * (self._end - self._start)
+
+    # Instance Methods
+
+    def is_empty(self) -> bool:
+        return self._start == self._end
+
+    def overlaps(self: T, other: T) -> bool:
+        """
+        Check if this interval and another share any time.
+
+        :param other: An interval of the same type.
+        :return: True if they overlap. Empty intervals never overlap.
+        """
+        self._check_same_type(other)
+        return (
+            self._start < other._end
+            and other._start < self._end
+            and self._start < self._end
+            and other._start < other._end
+        )
+
+    def intersection(self: T, other: T) -> Optional[T]:
+        """
+        Return the interval of time shared by this interval and another.
+
+        :param other: An interval of the same type.
+        :return: The shared interval, or None if they don't overlap.
+        """
+        if not self.overlaps(other):
+            return None
+        return self._from_us(max(self._start, other._start), min(self._end, other._end))
+
+    def _check_same_type(self, other: Any) -> None:
+        if not isinstance(other, self.__class__):
+            raise TypeError(
+                f"expected {self.__class__.__name__}, not '{type(other).__name__}'"
+            )
+
+
+class LocalInterval(BaseInterval[LocalDatetime]):
+    """
+    An immutable half open span of time [start, end) between two LocalDatetimes.
+    """
+
+    _datetime_type = LocalDatetime
+
+    __slots__ = ()
+
+
+class UTCInterval(BaseInterval[UTCDatetime]):
+    """
+    An immutable half open span of time [start, end) between two UTCDatetimes.
+    """
+
+    _datetime_type = UTCDatetime
+
+    __slots__ = ()
+
+
+class BaseIntervalSet(Generic[T]):
+    """
+    Base class for Fourth's immutable sets of time, made of intervals.
+
+    The set is stored as a single sorted tuple of integer bounds,
+    (start, end, start, end, ...), of intervals that are non-empty and don't
+    overlap or touch. Intervals added to the set are coalesced to keep it that way.
+
+    Union (|), intersection (&), difference (-), symmetric difference (^),
+    complement and subset tests merge the bounds of the sets in a single pass,
+    so take time linear in the number of intervals. Checking if a Datetime or
+    interval is in the set is a binary search.
+    """
+
+    # Class Attributes
+
+    _interval_type: ClassVar[Type[BaseInterval[Any]]]
+
+    # Instance Attributes
+
+    _bounds: Tuple[int, ...]
+
+    __slots__ = ("_bounds",)
+
+    # Special Methods
+
+    def __init__(self, intervals: Iterable[T] = ()) -> None:
+        """
+        Initialise a set from intervals, which may overlap and be in any order.
+
+        :param intervals: The intervals of time in the set.
+        :raises TypeError: When an interval isn't the set's interval type.
+        """
+        spans = []
+        for interval in intervals:
+            if not isinstance(interval, self._interval_type):
+                raise TypeError(
+                    f"{self.__class__.__name__} can only contain "
+                    f"{self._interval_type.__name__}, not '{type(interval).__name__}'"
+                )
+            if interval._start < interval._end:
+                spans.append((interval._start, interval._end))
+        spans.sort()
+        self._bounds = tuple(_coalesce(spans))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __len__(self) -> int:
+        """
+        The number of separate intervals in the set.
+        """
+        return len(self._bounds) // 2
+
+    def __iter__(self) -> Iterator[T]:
+        """
+        Iterate over the separate intervals in the set, in order.
+        """
+        from_us = self._interval_type._from_us
+        bounds = self._bounds
+        for index in range(0, len(bounds), 2):
+            yield from_us(bounds[index], bounds[index + 1])  # type: ignore[misc]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, self.__class__):
+            return self._bounds == other._bounds
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._bounds)
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if a Datetime is in the set, or an interval is entirely within it.
+        """
+        bounds = self._bounds
+        if isinstance(value, self._interval_type._datetime_type):
+            # inside an interval when it is after an odd number of bounds
+            return bisect_right(bounds, value._us) % 2 == 1
+        elif isinstance(value, self._interval_type):
+            if value._start == value._end:
+                return True
+            index = bisect_right(bounds, value._start)
+            return index % 2 == 1 and value._end <= bounds[index]
+        else:
+            return False
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """
+        Called when the set is pickled.
+        Pickles the bounds, rather than the individual intervals.
+        """
+        return self.__class__._from_bounds, (self._bounds,)
+
+    def __or__(self: S, other: Any) -> S:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        # both sets are already coalesced, so coalescing all their intervals
+        # together is the union, and takes fewer steps than merging every bound
+        a, b = self._bounds, other._bounds
+        spans = list(zip(a[::2], a[1::2]))
+        spans.extend(zip(b[::2], b[1::2]))
+        spans.sort()
+        return self._from_bounds(_coalesce(spans))
+
+    def __and__(self: S, other: Any) -> S:
+        return self._combine(other, _in_both)
+
+    def __sub__(self: S, other: Any) -> S:
+        return self._combine(other, _in_first_only)
+
+    def __xor__(self: S, other: Any) -> S:
+        return self._combine(other, _in_one_only)
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return not (self - other)._bounds
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return not (other - self)._bounds
+
+    # Constructors
+
+    @classmethod
+    def _from_bounds(cls: Type[S], bounds: Sequence[int]) -> S:
+        """
+        Return a new set from bounds which are trusted to be sorted and coalesced.
+        """
+        instance = cls.__new__(cls)
+        instance._bounds = tuple(bounds)
+        return instance
+
+    # Instance Properties
+
+    @property
+    def duration(self) -> timedelta:
+        """
+        The total length of time in the set.
+        """
+        bounds = self._bounds
+        return ONE_MICROSECOND * (sum(bounds[1::2]) - sum(bounds[::2]))
+
+    # Instance Methods
+
+    def union(self: S, other: S) -> S:
+        return self | other
+
+    def intersection(self: S, other: S) -> S:
+        return self & other
+
+    def difference(self: S, other: S) -> S:
+        return self - other
+
+    def symmetric_difference(self: S, other: S) -> S:
+        return self ^ other
+
+    def issubset(self: S, other: S) -> bool:
+        return self <= other
+
+    def issuperset(self: S, other: S) -> bool:
+        return self >= other
+
+    def complement(self: S, start: Any, end: Any) -> S:
+        """
+        Return the time between start and end which isn't in this set.
+
+        :param start: The start of the time to consider, which is included.
+        :param end: The end of the time to consider, which isn't included.
+        :return: A new set of the time in [start, end) that is not in this set.
+        """
+        window = self.__class__([self._interval_type(start, end)])
+        return window - self
+
+    def _combine(self: S, other: Any, keep: Callable[[bool, bool], bool]) -> S:
+        """
+        Combine this set with another, keeping the time where keep(in this set,
+        in the other set) is True. This method contains the common logic for all
+        the set operations.
+
+        The sorted bounds of both sets are merged, tracking whether each set is
+        entered or left at every bound, so it takes linear time.
+
+        :return: A new set. Otherwise NotImplemented.
+        """
+        if not isinstance(other, self.__class__):
+            return NotImplemented  # type: ignore[no-any-return]
+
+        # whether to keep the time for each state, where bit 1 of the state is set
+        # when in this set, and bit 2 when in the other set
+        keep_states = tuple(
+            keep(bool(state & 1), bool(state & 2)) for state in range(4)
+        )
+
+        # end with a sentinel, so the loop doesn't need to check the lengths
+        a = list(self._bounds)
+        a.append(_AFTER_ALL)
+        b = list(other._bounds)
+        b.append(_AFTER_ALL)
+
+        bounds: List[int] = []
+        i = j = state = 0
+        inside = False
+        x, y = a[0], b[0]
+
+        # bounds within a set are strictly increasing, so each set has at most
+        # one bound at any time
+        while x != y or x != _AFTER_ALL:
+            if x < y:
+                at = x
+                state ^= 1
+                i += 1
+                x = a[i]
+            elif y < x:
+                at = y
+                state ^= 2
+                j += 1
+                y = b[j]
+            else:
+                at = x
+                state ^= 3
+                i += 1
+                j += 1
+                x, y = a[i], b[j]
+
+            if keep_states[state] is not inside:
+                inside = not inside
+                bounds.append(at)
+
+        return self._from_bounds(bounds)
+
+
+def _coalesce(spans: List[Tuple[int, int]]) -> List[int]:
+    """
+    Return the bounds of sorted (start, end) spans, with spans that overlap or
+    touch joined together.
+    """
+    bounds: List[int] = []
+    for start, end in spans:
+        if bounds and start <= bounds[-1]:
+            # overlaps or touches the previous interval, so extend that one
+            if end > bounds[-1]:
+                bounds[-1] = end
+        else:
+            bounds.append(start)
+            bounds.append(end)
+    return bounds
+
+
+def _in_both(in_a: bool, in_b: bool) -> bool:
+    return in_a and in_b
+
+
+def _in_first_only(in_a: bool, in_b: bool) -> bool:
+    return in_a and not in_b
+
+
+def _in_one_only(in_a: bool, in_b: bool) -> bool:
+    return in_a != in_b
+
+
+class LocalIntervalSet(BaseIntervalSet[LocalInterval]):
+    """
+    An immutable set of time made of LocalIntervals.
+    """
+
+    _interval_type = LocalInterval
+
+    __slots__ = ()
+
+
+class UTCIntervalSet(BaseIntervalSet[UTCInterval]):
+    """
+    An immutable set of time made of UTCIntervals.
+    """
+
+    _interval_type = UTCInterval
+
+    __slots__ = ()
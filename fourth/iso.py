@@ -0,0 +1,289 @@
+"""
+Writing many Datetimes as ISO 8601 text, straight into a bytearray or a binary
+file, for exporting columns of them to CSV or NDJSON.
+
+The text of each value is the same as its iso_format(), followed by a line
+ending, but without the str that iso_format() builds for each value, or the
+joining of them afterwards. The text of the date, and of the time to the minute,
+is reused across consecutive values that share them, which is most of the text
+for values that are close together, like the timestamps of a log.
+"""
+from __future__ import annotations
+
+__all__ = ("write_epoch_iso_format_many", "write_iso_format_many")
+
+from array import array
+from datetime import date, datetime
+from itertools import islice
+from operator import attrgetter
+from typing import Any, BinaryIO, Iterable, Optional, Tuple, Type, Union
+
+from ._internal import (
+    EPOCH_ORDINAL,
+    ISO_SUFFIXES,
+    MAX_EPOCH_US,
+    MIN_EPOCH_US,
+    common_type,
+)
+from .array import BaseDatetimeArray, _as_int64_view
+from .types import BaseDatetime, LocalDatetime, UTCDatetime
+
+# how many values are formatted between writes to a file
+_CHUNK_SIZE = 4096
+
+# by timespec, the format of the fraction of a second, and what to divide the
+# microseconds by for it
+_FRACTIONS = {
+    "auto": (b".%06d", 1),
+    "milliseconds": (b".%03d", 1_000),
+    "microseconds": (b".%06d", 1),
+}
+
+# the text of each second of a minute, for the timespecs that write the second
+_SECONDS = tuple(b":%02d" % second for second in range(60))
+_NO_SECONDS = (b"",) * 60
+
+_get_us = attrgetter("_us")
+
+_Output = Union[bytearray, BinaryIO]
+
+
+def write_iso_format_many(
+    values: Iterable[BaseDatetime],
+    out: _Output,
+    *,
+    sep: str = "T",
+    timespec: str = "microseconds",
+    end: str = "\n",
+) -> int:
+    """
+    Write the ISO 8601 text of many Datetimes, as their iso_format() would, each
+    followed by a line ending.
+
+    :param values: The Datetimes, all LocalDatetime or all UTCDatetime, or a
+        LocalDatetimeArray or UTCDatetimeArray.
+    :param out: A bytearray to append the text to, or a binary file to write it to.
+    :param sep: Character to separate the date and time components.
+    :param timespec: How to format the time component, as for iso_format().
+    :param end: The text written after each value.
+    :return: The number of bytes written.
+    :raises TypeError: When the values aren't all LocalDatetime or all UTCDatetime.
+    :raises ValueError: When the timespec isn't known.
+    """
+    cls: Optional[Type[BaseDatetime]]
+    microseconds: Iterable[int]
+    if isinstance(values, BaseDatetimeArray):
+        cls = values._item_type
+        microseconds = values._data
+    else:
+        values = list(values)
+        cls = common_type(values, "write")
+        microseconds = map(_get_us, values)
+
+    # the arguments are checked even when there are no values to write
+    writer = _IsoWriter(UTCDatetime if cls is None else cls, sep, timespec, end)
+    return writer.write(microseconds, out)
+
+
+def write_epoch_iso_format_many(
+    microseconds: Any,
+    out: _Output,
+    cls: Type[BaseDatetime],
+    *,
+    sep: str = "T",
+    timespec: str = "microseconds",
+    end: str = "\n",
+) -> int:
+    """
+    Write the ISO 8601 text of a column of integer microseconds since the epoch,
+    as iso_format() would for Datetimes of cls with those values, each followed
+    by a line ending.
+
+    :param microseconds: The microseconds since 1970-01-01T00:00:00, as a buffer
+        with signed 64 bit integer items (e.g. array.array("q")) or an iterable
+        of integers.
+    :param out: A bytearray to append the text to, or a binary file to write it to.
+    :param cls: LocalDatetime or UTCDatetime, the type of the values.
+    :param sep: Character to separate the date and time components.
+    :param timespec: How to format the time component, as for iso_format().
+    :param end: The text written after each value.
+    :return: The number of bytes written.
+    :raises TypeError: When cls isn't LocalDatetime or UTCDatetime.
+    :raises ValueError: When the timespec isn't known.
+    :raises OverflowError: When a value is out of range.
+    """
+    if cls not in (LocalDatetime, UTCDatetime):
+        raise TypeError(f"cls must be LocalDatetime or UTCDatetime, not {cls!r}")
+    writer = _IsoWriter(cls, sep, timespec, end)
+
+    try:
+        memoryview(microseconds)
+    except TypeError:
+        microseconds = array("q", microseconds)
+    else:
+        microseconds = _as_int64_view(microseconds)
+    if len(microseconds) and (
+        min(microseconds) < MIN_EPOCH_US or max(microseconds) > MAX_EPOCH_US
+    ):
+        raise OverflowError("date value out of range")
+
+    return writer.write(microseconds, out)
+
+
+class _IsoWriter:
+    """
+    Formats microseconds since the epoch as ISO 8601 text.
+
+    The text of each second is kept as a template to format the fraction of the
+    second into, and the text of the date and time to the minute is kept for
+    building the templates, for as long as consecutive values share them.
+    """
+
+    # Instance Attributes
+
+    _sep: bytes
+    # whether a zero fraction of a second isn't written, for timespec="auto"
+    _auto: bool
+    # what to divide the microseconds by for the fraction of a second, or 0 if
+    # it isn't written
+    _divisor: int
+    _hours_only: bool
+    _seconds: Tuple[bytes, ...]
+    # the text after the time, and the template of the fraction and that text
+    _tail: bytes
+    _fraction_tail: bytes
+    # the day and minute since the epoch of the last value, and their texts
+    _day: Optional[int]
+    _date: bytes
+    _minute: Optional[int]
+    _minute_text: bytes
+    _minute_template: bytes
+
+    __slots__ = (
+        "_sep",
+        "_auto",
+        "_divisor",
+        "_hours_only",
+        "_seconds",
+        "_tail",
+        "_fraction_tail",
+        "_day",
+        "_date",
+        "_minute",
+        "_minute_text",
+        "_minute_template",
+    )
+
+    # Special Methods
+
+    def __init__(
+        self, cls: Type[BaseDatetime], sep: str, timespec: str, end: str
+    ) -> None:
+        # raises the same errors for sep and timespec that iso_format() does
+        datetime(1970, 1, 1).isoformat(sep=sep, timespec=timespec)
+
+        fraction_format, divisor = _FRACTIONS.get(timespec, (b"", 0))
+        self._sep = sep.encode()
+        self._auto = timespec == "auto"
+        self._divisor = 0 if self._auto else divisor
+        self._hours_only = timespec == "hours"
+        self._seconds = _NO_SECONDS if timespec in ("hours", "minutes") else _SECONDS
+        self._tail = (ISO_SUFFIXES[cls._tzinfo] + end).encode()
+        self._fraction_tail = fraction_format + self._tail.replace(b"%", b"%%")
+        self._day = self._minute = None
+        self._date = self._minute_text = self._minute_template = b""
+
+    # Instance Methods
+
+    def write(self, microseconds: Iterable[int], out: _Output) -> int:
+        """
+        Write the text of the values to a bytearray or a binary file.
+
+        :return: The number of bytes written.
+        """
+        if isinstance(out, bytearray):
+            start = len(out)
+            self._format(microseconds, out)
+            return len(out) - start
+
+        write = out.write
+        buffer = bytearray()
+        written = 0
+        iterator = iter(microseconds)
+        while True:
+            self._format(islice(iterator, _CHUNK_SIZE), buffer)
+            if not buffer:
+                return written
+            write(buffer)
+            written += len(buffer)
+            buffer.clear()
+
+    def _format(self, microseconds: Iterable[int], out: bytearray) -> None:
+        """
+        Append the text of the values to a bytearray.
+        """
+        second = None
+        template = whole = b""
+        divisor = self._divisor
+
+        if divisor:
+            for value in microseconds:
+                current, fraction = divmod(value, 1_000_000)
+                if current != second:
+                    second = current
+                    template = self._template(second)
+                out += template % (fraction // divisor)
+        elif self._auto:
+            for value in microseconds:
+                current, fraction = divmod(value, 1_000_000)
+                if current != second:
+                    second = current
+                    template = self._template(second)
+                    whole = self._whole(second)
+                out += template % fraction if fraction else whole
+        else:
+            for value in microseconds:
+                current = value // 1_000_000
+                if current != second:
+                    second = current
+                    whole = self._whole(second)
+                out += whole
+
+    def _template(self, second: int) -> bytes:
+        """
+        Return the text of a second since the epoch, as a template to format the
+        fraction of the second into.
+        """
+        minute, second_of_minute = divmod(second, 60)
+        if minute != self._minute:
+            self._set_minute(minute)
+        text = self._minute_template + self._seconds[second_of_minute]
+        return text + self._fraction_tail
+
+    def _whole(self, second: int) -> bytes:
+        """
+        Return the text of a second since the epoch, without a fraction.
+        """
+        minute, second_of_minute = divmod(second, 60)
+        if minute != self._minute:
+            self._set_minute(minute)
+        return self._minute_text + self._seconds[second_of_minute] + self._tail
+
+    def _set_minute(self, minute: int) -> None:
+        """
+        Keep the text of the date and time of a minute since the epoch.
+        """
+        day, minute_of_day = divmod(minute, 1_440)
+        if day != self._day:
+            self._day = day
+            ordinal = EPOCH_ORDINAL + day
+            self._date = date.fromordinal(ordinal).isoformat().encode() + self._sep
+
+        hour, minute_of_hour = divmod(minute_of_day, 60)
+        if self._hours_only:
+            text = self._date + b"%02d" % hour
+        else:
+            text = self._date + b"%02d:%02d" % (hour, minute_of_hour)
+        self._minute = minute
+        self._minute_text = text
+        self._minute_template = text.replace(b"%", b"%%")
@@ -0,0 +1,320 @@
+"""
+Encoding Datetimes to JSON, and decoding them back from JSON, for payloads with
+many of them, like arrays of records with timestamp fields.
+
+    text = dumps(records)
+    records = loads(text, ["created", "updated"])
+
+DatetimeEncoder writes each Datetime as its iso_format() text, building the text
+of each second once for the values that share it, rather than going through
+str() and a datetime for each value.
+
+DatetimeHook decodes only the fields it is given. As an object_hook it collects
+the strings of those fields while the JSON is decoded, then parses each field's
+strings in one batch. Strings in the shape iso_format() writes are parsed from
+the microseconds of their second, which are also shared by the strings of the
+same second. Any others are parsed with from_iso_format_many().
+"""
+from __future__ import annotations
+
+__all__ = ("DatetimeEncoder", "DatetimeHook", "dump", "dumps", "load", "loads")
+
+import json
+import re
+from datetime import date, datetime
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ._internal import EPOCH_ORDINAL, ISO_SUFFIXES, datetime_to_epoch_us
+from .types import BaseDatetime, LocalDatetime, UTCDatetime
+
+# the length of the date, time and "." before the fraction of a second, and the
+# length of the fraction, in the text iso_format() writes
+_SECOND_LENGTH = 20
+_FRACTION_LENGTH = 6
+# the date, time and "." before the fraction of a second, in the text iso_format()
+# writes
+_SECOND_PATTERN = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}:[0-9]{2}\."
+)
+
+# how many seconds are kept by the encoder and the decoder, before starting over
+_MAX_CACHED_SECONDS = 4096
+
+_DatetimeType = Type[Union[LocalDatetime, UTCDatetime]]
+_Fields = Union[Iterable[str], Mapping[str, _DatetimeType]]
+
+
+class DatetimeEncoder(json.JSONEncoder):
+    """
+    A JSONEncoder that writes LocalDatetime and UTCDatetime values as the text
+    of their iso_format().
+
+    The text of each second written is kept as a template for the fraction of
+    the second, so values close together, like the timestamps of records in
+    time order, are cheap to write.
+
+    A default function passed to the encoder is called for any other objects
+    it can't serialize.
+    """
+
+    # Special Methods
+
+    def __init__(
+        self, *, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self._fallback = default
+        # by type, the templates of the seconds since the epoch written
+        self._templates: Dict[type, Dict[int, str]] = {
+            LocalDatetime: {},
+            UTCDatetime: {},
+        }
+
+    # Instance Methods
+
+    def default(self, o: Any) -> Any:
+        cls = type(o)
+        templates = self._templates.get(cls)
+        if templates is None:
+            if isinstance(o, BaseDatetime):
+                return o.iso_format()
+            if self._fallback is not None:
+                return self._fallback(o)
+            return super().default(o)
+
+        second, fraction = divmod(o._us, 1_000_000)
+        template = templates.get(second)
+        if template is None:
+            if len(templates) >= _MAX_CACHED_SECONDS:
+                templates.clear()
+            template = templates[second] = _template(second, ISO_SUFFIXES[cls._tzinfo])
+        return template % fraction
+
+
+class DatetimeHook:
+    """
+    An object_hook for json.load() and json.loads() that decodes the ISO 8601
+    strings of known fields into Datetimes.
+
+    The strings are collected as the objects are decoded, and only parsed when
+    resolve() is called after decoding, all the strings of each field at once.
+    Fields are matched by key in objects at any depth. Values of the fields that
+    aren't strings, like null, are left as they are.
+    """
+
+    # Instance Attributes
+
+    # (key, type, objects, strings) of each field
+    _fields: Tuple[Tuple[str, _DatetimeType, List[Dict[str, Any]], List[str]], ...]
+
+    __slots__ = ("_fields",)
+
+    # Special Methods
+
+    def __init__(self, fields: _Fields) -> None:
+        """
+        :param fields: The keys of the fields to decode as UTCDatetime, or a
+            mapping of the keys to decode to LocalDatetime or UTCDatetime.
+        :raises TypeError: When a field is mapped to any other type.
+        """
+        if not isinstance(fields, Mapping):
+            fields = dict.fromkeys(fields, UTCDatetime)
+
+        for cls in fields.values():
+            if cls not in (LocalDatetime, UTCDatetime):
+                raise TypeError(
+                    f"fields must be LocalDatetime or UTCDatetime, not {cls!r}"
+                )
+        self._fields = tuple((key, cls, [], []) for key, cls in fields.items())
+
+    def __repr__(self) -> str:
+        fields = {key: cls for key, cls, _, _ in self._fields}
+        return f"{self.__class__.__name__}({fields!r})"
+
+    def __call__(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        for key, _, objects, strings in self._fields:
+            value = obj.get(key)
+            if value.__class__ is str:
+                objects.append(obj)
+                strings.append(value)
+        return obj
+
+    # Instance Methods
+
+    def resolve(self) -> None:
+        """
+        Parse the strings collected since the last call, replacing them with
+        Datetimes in the decoded objects.
+
+        :raises ValueError: When a string isn't valid for its field's type, or is
+            out of range, with the field's key before the message of the error.
+            The objects are left with their strings.
+        """
+        try:
+            results = [_parse_many(cls, strings) for _, cls, _, strings in self._fields]
+            for (key, _, _, _), (_, errors) in zip(self._fields, results):
+                if errors:
+                    error = errors[min(errors)]
+                    raise ValueError(f"{key}: {error}") from error
+
+            for (key, _, objects, _), (values, _) in zip(self._fields, results):
+                for obj, value in zip(objects, values):
+                    obj[key] = value
+        finally:
+            for _, _, objects, strings in self._fields:
+                objects.clear()
+                strings.clear()
+
+
+def dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialize an object to a JSON string, as json.dumps() does, writing Datetimes
+    as their iso_format() text.
+
+    :param obj: The object to serialize.
+    :param kwargs: Any other arguments of json.dumps(), including a default
+        function for other objects.
+    :return: The JSON string.
+    """
+    return json.dumps(obj, cls=DatetimeEncoder, **kwargs)
+
+
+def dump(obj: Any, fp: IO[str], **kwargs: Any) -> None:
+    """
+    Serialize an object as JSON to a text file, as json.dump() does, writing
+    Datetimes as their iso_format() text.
+
+    :param obj: The object to serialize.
+    :param fp: The file to write to.
+    :param kwargs: Any other arguments of json.dump(), including a default
+        function for other objects.
+    """
+    json.dump(obj, fp, cls=DatetimeEncoder, **kwargs)
+
+
+def loads(s: Union[str, bytes], fields: _Fields, **kwargs: Any) -> Any:
+    """
+    Deserialize a JSON document, as json.loads() does, decoding the ISO 8601
+    strings of the given fields into Datetimes.
+
+    :param s: The JSON document.
+    :param fields: The keys of the fields to decode as UTCDatetime, or a mapping
+        of the keys to decode to LocalDatetime or UTCDatetime.
+    :param kwargs: Any other arguments of json.loads(), except object_hook and
+        object_pairs_hook.
+    :return: The deserialized object.
+    :raises ValueError: When the document isn't valid JSON, or a string of a field
+        isn't valid for its type or is out of range.
+    """
+    hook = DatetimeHook(fields)
+    result = json.loads(s, object_hook=hook, **kwargs)
+    hook.resolve()
+    return result
+
+
+def load(fp: IO[Any], fields: _Fields, **kwargs: Any) -> Any:
+    """
+    Deserialize a JSON document from a file, as json.load() does, decoding the
+    ISO 8601 strings of the given fields into Datetimes.
+
+    :param fp: The file to read.
+    :param fields: The keys of the fields to decode as UTCDatetime, or a mapping
+        of the keys to decode to LocalDatetime or UTCDatetime.
+    :param kwargs: Any other arguments of json.load(), except object_hook and
+        object_pairs_hook.
+    :return: The deserialized object.
+    :raises ValueError: When the document isn't valid JSON, or a string of a field
+        isn't valid for its type or is out of range.
+    """
+    return loads(fp.read(), fields, **kwargs)
+
+
+def _template(second: int, suffix: str) -> str:
+    """
+    Return the iso_format() text of a second since the epoch, as a template to
+    format the microseconds of the second into.
+    """
+    days, second_of_day = divmod(second, 86_400)
+    minutes, seconds = divmod(second_of_day, 60)
+    return "%sT%02d:%02d:%02d.%%06d%s" % (
+        date.fromordinal(EPOCH_ORDINAL + days).isoformat(),
+        *divmod(minutes, 60),
+        seconds,
+        suffix,
+    )
+
+
+def _parse_many(
+    cls: _DatetimeType, strings: List[str]
+) -> Tuple[List[Optional[BaseDatetime]], Dict[int, Exception]]:
+    """
+    Parse ISO 8601 strings as cls.from_iso_format_many() would, parsing the ones
+    in the shape cls.iso_format() writes from the microseconds of their second.
+
+    :return: The values, with None for the strings that failed to parse, and the
+        exceptions of those strings by index.
+    """
+    length = _SECOND_LENGTH + _FRACTION_LENGTH
+    suffix = ISO_SUFFIXES[cls._tzinfo]
+    total_length = length + len(suffix)
+    from_us = cls._from_us
+    # the microseconds since the epoch of the date, time and "." of each second
+    seconds: Dict[str, Optional[int]] = {}
+    values: List[Optional[BaseDatetime]] = []
+    append = values.append
+    # the indexes of the strings left to from_iso_format_many()
+    others = []
+
+    for index, string in enumerate(strings):
+        if len(string) == total_length and string.endswith(suffix):
+            prefix = string[:_SECOND_LENGTH]
+            try:
+                second = seconds[prefix]
+            except KeyError:
+                if len(seconds) >= _MAX_CACHED_SECONDS:
+                    seconds.clear()
+                second = seconds[prefix] = _second_us(prefix)
+            fraction = string[_SECOND_LENGTH:length]
+            if second is not None and fraction.isdigit() and fraction.isascii():
+                append(from_us(second + int(fraction)))
+                continue
+        others.append(index)
+        append(None)
+
+    errors: Dict[int, Exception] = {}
+    if others:
+        result = cls.from_iso_format_many([strings[index] for index in others])
+        for index, value in zip(others, result.values):
+            values[index] = value
+        for position, error in result.errors.items():
+            errors[others[position]] = error
+    return values, errors
+
+
+def _second_us(prefix: str) -> Optional[int]:
+    """
+    Return the microseconds since the epoch of the date, time and "." at the
+    start of the text iso_format() writes, or None if it isn't valid.
+    """
+    # fromisoformat() accepts other shapes too, like ones with a UTC offset
+    if _SECOND_PATTERN.fullmatch(prefix) is None:
+        return None
+    try:
+        at = datetime.fromisoformat(prefix[:-1])
+    except ValueError:
+        return None
+    if at.tzinfo is not None:
+        return None
+    return datetime_to_epoch_us(at)
@@ -0,0 +1,459 @@
+"""
+Reading the timestamps of large log files, without reading them line by line.
+
+A LogScanner memory maps a log file, and reads it in chunks of many lines. The
+ISO 8601 timestamp of each line is found by a regular expression run over the
+bytes of the whole chunk, without decoding it, and the timestamps are converted
+to microseconds since the epoch in bulk, into a packed array. Chunks with lines
+that aren't simple to convert fall back to converting a line at a time, with
+integer math. They can be read as (UTCDatetime, line offset) pairs, or as a
+packed column.
+
+Files sorted by timestamp can be searched for a time range, by a binary search
+over the bytes of the file.
+"""
+from __future__ import annotations
+
+__all__ = ("LogColumn", "LogScanner")
+
+import mmap
+import os
+import re
+from array import array
+from datetime import datetime
+from itertools import accumulate, chain, repeat
+from operator import add, floordiv, sub
+from types import TracebackType
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple, Type, Union
+
+from ._internal import (
+    EPOCH_UTC,
+    MAX_EPOCH_US,
+    MIN_EPOCH_US,
+    ONE_MICROSECOND,
+    datetime_to_epoch_us,
+)
+from .array import UTCDatetimeArray
+from .types import UTCDatetime
+
+# An ISO 8601 timestamp with a UTC offset, like the output of UTCDatetime.iso_format(),
+# e.g. "2020-01-01T00:00:00.000000+00:00". A space can separate the date and time,
+# the fraction of a second is optional, and the offset can be "Z" or "+HHMM".
+# Out of range hours, minutes, seconds and offsets don't match, so only the date
+# is left to validate.
+_MINUTE = r"[0-9]{4}-[0-9]{2}-[0-9]{2}[T ](?:[01][0-9]|2[0-3]):[0-5][0-9]"
+_SECOND = r"[0-5][0-9]"
+_FRACTION = r"[0-9]{1,6}"
+_OFFSET = r"Z|[+-](?:[01][0-9]|2[0-3]):?[0-5][0-9]"
+# the whole timestamp, found in the lines
+_TIMESTAMP = rf"({_MINUTE}:{_SECOND}(?:\.{_FRACTION})?(?:{_OFFSET}))"
+# the parts of a timestamp that was found, for converting a line at a time
+_TIMESTAMP_PARTS = re.compile(
+    rf"({_MINUTE}):({_SECOND})(?:\.({_FRACTION}))?({_OFFSET})".encode()
+)
+
+# how many bytes of lines are read at a time
+_CHUNK_SIZE = 1 << 20
+# how many minutes are cached while scanning, logs repeat the same ones many times
+_MINUTES_CACHE_SIZE = 4096
+# what to multiply a fraction of a second by for microseconds, by its length
+_FRACTION_SCALES = (0, 100_000, 10_000, 1_000, 100, 10, 1)
+
+
+class LogColumn(NamedTuple):
+    """
+    The timestamps of many lines of a log file, read by LogScanner.read_column().
+
+    `values` has the timestamp of each line, and `offsets` has the byte offset
+    of the start of each line, in the same order.
+    """
+
+    values: UTCDatetimeArray
+    offsets: array[int]
+
+
+class LogScanner:
+    """
+    Reads the timestamps of the lines of a log file.
+
+    The timestamp of each line is found at a byte offset from the start of the
+    line, or from the start of a field of the line. Fields are separated by a
+    single byte delimiter, e.g. with delimiter=b"\\t" and field=2 the timestamp is
+    after the second tab. Timestamps are ISO 8601, with the date, the time to the
+    second or finer, and a UTC offset.
+
+    By default a line without a valid timestamp raises a ValueError. With
+    strict=False those lines are skipped instead, like the continuation lines
+    of a multi-line log message.
+
+    The file is memory mapped until the scanner is closed, by close() or by using
+    it as a context manager.
+    """
+
+    # Instance Attributes
+
+    _path: str
+    _file: Any
+    _data: Union[mmap.mmap, bytes]
+    # finds the timestamp of each line, in the bytes of the file
+    _pattern: re.Pattern[bytes]
+    _strict: bool
+
+    __slots__ = ("_path", "_file", "_data", "_pattern", "_strict")
+
+    # Special Methods
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        offset: int = 0,
+        delimiter: Optional[bytes] = None,
+        field: int = 0,
+        strict: bool = True,
+    ) -> None:
+        """
+        Open and memory map a log file.
+
+        :param path: The path of the log file.
+        :param offset: How many bytes the timestamp is from the start of each line,
+            or from the start of its field.
+        :param delimiter: The byte that separates the fields of each line.
+        :param field: The index of the field the timestamp is in, counting from 0.
+            Needs a delimiter.
+        :param strict: If True, raise a ValueError for lines without a valid
+            timestamp, otherwise skip them.
+        :raises ValueError: When the offset or field is negative, the delimiter
+            isn't a single byte, or a field is given without a delimiter.
+        :raises OSError: When the file can't be opened.
+        """
+        if offset < 0 or field < 0:
+            raise ValueError("offset and field must not be negative")
+
+        # the pattern is built as text, and encoded as latin-1, which maps each
+        # character back to the byte it was decoded from
+        prefix = "(?m)^"
+        if delimiter is not None:
+            if not isinstance(delimiter, bytes) or len(delimiter) != 1:
+                raise ValueError(f"delimiter must be a single byte, not {delimiter!r}")
+            escaped = re.escape(delimiter.decode("latin-1"))
+            prefix += f"(?:[^\\n{escaped}]*{escaped}){{{field}}}"
+        elif field:
+            raise ValueError("field can't be given without a delimiter")
+        if offset:
+            prefix += f"[^\\n]{{{offset}}}"
+
+        self._path = os.fspath(path)
+        # matching the rest of the line skips straight to the start of the next one,
+        # rather than searching every position in between for it
+        self._pattern = re.compile((prefix + _TIMESTAMP + "[^\\n]*").encode("latin-1"))
+        self._strict = strict
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be memory mapped
+            self._data = b""
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._path!r})"
+
+    def __enter__(self) -> LogScanner:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Tuple[UTCDatetime, int]]:
+        return self.scan()
+
+    # Instance Methods
+
+    def close(self) -> None:
+        """
+        Unmap and close the file.
+        """
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def scan(
+        self, start: Optional[UTCDatetime] = None, stop: Optional[UTCDatetime] = None
+    ) -> Iterator[Tuple[UTCDatetime, int]]:
+        """
+        Iterate over the timestamps of the lines, with the byte offset of the
+        start of each line.
+
+        :param start: If given, start at the first line at or after this time, found
+            by a binary search. The file must be sorted by timestamp.
+        :param stop: If given, stop at the first line at or after this time.
+            The file must be sorted by timestamp.
+        :return: An iterator of (UTCDatetime, line offset) pairs.
+        :raises TypeError: When start or stop isn't a UTCDatetime.
+        :raises ValueError: When strict, and a line has no valid timestamp.
+        """
+        from_us = UTCDatetime._from_us
+        for values, lines in self._chunks(start, stop):
+            yield from zip(map(from_us, values), lines)
+
+    def read_column(
+        self, start: Optional[UTCDatetime] = None, stop: Optional[UTCDatetime] = None
+    ) -> LogColumn:
+        """
+        Read the timestamps of the lines into a packed column, with the byte
+        offset of the start of each line.
+
+        Takes the same arguments as scan().
+
+        :return: A LogColumn of the timestamps and line offsets.
+        :raises TypeError: When start or stop isn't a UTCDatetime.
+        :raises ValueError: When strict, and a line has no valid timestamp.
+        """
+        values = array("q")
+        offsets = array("q")
+        for chunk_values, chunk_offsets in self._chunks(start, stop):
+            values.extend(chunk_values)
+            offsets.extend(chunk_offsets)
+        return LogColumn(UTCDatetimeArray._from_view(memoryview(values)), offsets)
+
+    def find(self, value: UTCDatetime) -> int:
+        """
+        Find the first line with a timestamp at or after a time, by a binary
+        search. The file must be sorted by timestamp. Lines without a valid
+        timestamp are skipped over.
+
+        :param value: The time to find.
+        :return: The byte offset of the start of the line, or the size of the
+            file if every line is before the time.
+        :raises TypeError: When the value isn't a UTCDatetime.
+        """
+        if not isinstance(value, UTCDatetime):
+            raise TypeError(f"expected UTCDatetime, not '{type(value).__name__}'")
+
+        target = value._us
+        low, high = 0, len(self._data)
+        minutes: Dict[bytes, int] = {}
+        offsets: Dict[bytes, int] = {}
+        # find the first position where the next timestamp is at or after the time
+        while low < high:
+            middle = (low + high) // 2
+            found = self._next_timestamp(middle, minutes, offsets)
+            if found is None or found[0] >= target:
+                high = middle
+            else:
+                low = middle + 1
+
+        found = self._next_timestamp(low, minutes, offsets)
+        return len(self._data) if found is None else found[1]
+
+    def _chunks(
+        self, start: Optional[UTCDatetime], stop: Optional[UTCDatetime]
+    ) -> Iterator[Tuple[array[int], array[int]]]:
+        """
+        Iterate over chunks of the lines, as packed arrays of their timestamps in
+        microseconds since the epoch, and of the byte offsets of their starts.
+        """
+        if stop is not None and not isinstance(stop, UTCDatetime):
+            raise TypeError(f"expected UTCDatetime, not '{type(stop).__name__}'")
+
+        data = self._data
+        size = len(data)
+        position = 0 if start is None else self.find(start)
+
+        # the microseconds of each minute and UTC offset, for the chunks read a line
+        # at a time, since logs repeat the same ones many times over
+        minutes: Dict[bytes, int] = {}
+        offsets: Dict[bytes, int] = {}
+
+        while position < size:
+            # chunks end at the end of a line
+            end = data.find(b"\n", position + _CHUNK_SIZE) + 1 or size
+            chunk = self._read_chunk(position, end)
+            if chunk is None:
+                chunk = self._read_lines(position, end, minutes, offsets)
+
+            values = chunk[0]
+            if stop is not None and values and max(values) >= stop._us:
+                cut = next(i for i, value in enumerate(values) if value >= stop._us)
+                yield values[:cut], chunk[1][:cut]
+                return
+
+            yield chunk
+            position = end
+
+    def _read_chunk(
+        self, start: int, end: int
+    ) -> Optional[Tuple[array[int], array[int]]]:
+        """
+        Read the lines between two byte offsets in bulk, with datetime.fromisoformat().
+
+        The timestamps are found in the bytes of the file, and only they are decoded,
+        for fromisoformat(). They are ASCII, since the pattern matched them.
+
+        :return: The timestamps and line offsets, or None if any line doesn't have a
+            timestamp that fromisoformat() can parse within range, so the chunk
+            should be read a line at a time instead.
+        """
+        data = self._data
+        lines = data[start:end].split(b"\n")
+        if not lines[-1]:
+            # the chunk ends with a newline, not an unterminated last line
+            lines.pop()
+
+        # there can only be one match per line, since it is anchored to the start
+        timestamps = self._pattern.findall(data, start, end)
+        if len(timestamps) != len(lines):
+            return None
+        try:
+            values = array(
+                "q",
+                map(
+                    floordiv,
+                    map(
+                        sub,
+                        map(datetime.fromisoformat, map(bytes.decode, timestamps)),
+                        repeat(EPOCH_UTC),
+                    ),
+                    repeat(ONE_MICROSECOND),
+                ),
+            )
+        except ValueError:
+            # an invalid date, or a format older versions of fromisoformat() reject
+            return None
+        if min(values) < MIN_EPOCH_US or max(values) > MAX_EPOCH_US:
+            return None
+
+        line_lengths = map(add, map(len, lines), repeat(1))
+        offsets = array("q", accumulate(chain((start,), line_lengths)))
+        offsets.pop()
+        return values, offsets
+
+    def _read_lines(
+        self,
+        start: int,
+        end: int,
+        minutes: Dict[bytes, int],
+        offsets: Dict[bytes, int],
+    ) -> Tuple[array[int], array[int]]:
+        """
+        Read the lines between two byte offsets a line at a time, skipping lines
+        without a valid timestamp unless strict.
+
+        :return: The timestamps and line offsets.
+        :raises ValueError: When strict, and a line has no valid timestamp.
+        """
+        data = self._data
+        strict = self._strict
+        find_newline = data.find
+        values = array("q")
+        lines = array("q")
+        position = start
+
+        for match in self._pattern.finditer(data, start, end):
+            line = match.start()
+            if strict and line != position:
+                raise ValueError(f"no valid timestamp in the line at offset {position}")
+
+            try:
+                values.append(_match_to_us(match, minutes, offsets))
+            except ValueError:
+                if strict:
+                    raise ValueError(
+                        f"no valid timestamp in the line at offset {line}"
+                    ) from None
+                position = line
+                continue
+
+            lines.append(line)
+            position = find_newline(b"\n", match.end(), end) + 1 or end
+
+        if strict and position < end:
+            raise ValueError(f"no valid timestamp in the line at offset {position}")
+        return values, lines
+
+    def _next_timestamp(
+        self, position: int, minutes: Dict[bytes, int], offsets: Dict[bytes, int]
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Return the timestamp and byte offset of the first line with a valid
+        timestamp that starts at or after a position, or None if there isn't one.
+        """
+        data = self._data
+        if position:
+            # the start of the next line, unless the position already is one
+            position = data.find(b"\n", position - 1) + 1
+            if not position:
+                return None
+
+        for match in self._pattern.finditer(data, position):
+            try:
+                return _match_to_us(match, minutes, offsets), match.start()
+            except ValueError:
+                continue
+        return None
+
+
+def _match_to_us(
+    match: re.Match[bytes], minutes: Dict[bytes, int], offsets: Dict[bytes, int]
+) -> int:
+    """
+    Convert a matched timestamp to microseconds since the epoch, caching the
+    microseconds of each minute and UTC offset along the way.
+
+    :raises ValueError: When the timestamp isn't a valid date, or is out of range.
+    """
+    # the timestamp was found by a pattern of the same parts, so always matches
+    parts = _TIMESTAMP_PARTS.fullmatch(match[1])
+    minute, second, fraction, offset = parts.groups()  # type: ignore[union-attr]
+
+    microseconds = minutes.get(minute)
+    if microseconds is None:
+        microseconds = _parse_minute(minute, minutes)
+    offset_us = offsets.get(offset)
+    if offset_us is None:
+        offset_us = offsets[offset] = _parse_offset(offset)
+
+    microseconds += int(second) * 1_000_000 - offset_us
+    if fraction is not None:
+        microseconds += int(fraction) * _FRACTION_SCALES[len(fraction)]
+
+    if not MIN_EPOCH_US <= microseconds <= MAX_EPOCH_US:
+        raise ValueError("date value out of range")
+    return microseconds
+
+
+def _parse_minute(minute: bytes, minutes: Dict[bytes, int]) -> int:
+    """
+    Return the microseconds since the epoch of a "YYYY-MM-DDTHH:MM" minute, and
+    cache it. The cache is emptied when it is full.
+
+    :raises ValueError: When the date is invalid.
+    """
+    at = datetime(
+        int(minute[:4]),
+        int(minute[5:7]),
+        int(minute[8:10]),
+        int(minute[11:13]),
+        int(minute[14:]),
+    )
+    if len(minutes) >= _MINUTES_CACHE_SIZE:
+        minutes.clear()
+    microseconds = minutes[minute] = datetime_to_epoch_us(at)
+    return microseconds
+
+
+def _parse_offset(offset: bytes) -> int:
+    """
+    Return the microseconds of a "Z", "+HH:MM" or "+HHMM" UTC offset.
+    """
+    if offset == b"Z":
+        return 0
+
+    hours, minutes = int(offset[1:3]), int(offset[-2:])
+    microseconds = (hours * 60 + minutes) * 60_000_000
+    return -microseconds if offset[:1] == b"-" else microseconds
@@ -0,0 +1,241 @@
+"""
+Parsing huge numbers of datetime strings or timestamps in a pool of worker
+processes.
+
+The input is split into chunks, and each chunk is parsed by a worker process
+into a packed array of microseconds since the epoch. Only those arrays are sent
+back, rather than a pickled UTCDatetime for each value, so the cost of moving
+the results between processes stays small. The arrays are joined in the order
+of the input into a single UTCDatetimeArray.
+"""
+from __future__ import annotations
+
+__all__ = ("ParallelParser",)
+
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from .array import UTCDatetimeArray
+from .format import compile_format
+from .types import ParseResult, UTCDatetime, _timestamps_to_epoch_us
+
+# the microseconds of the values in a chunk, and the errors by their index in it
+_Chunk = Tuple["array[int]", Dict[int, Exception]]
+
+# how many chunks are queued for each worker, so workers don't sit idle between
+# chunks but a huge input isn't read into memory all at once
+_CHUNKS_PER_WORKER = 2
+
+
+class ParallelParser:
+    """
+    Parses many datetime strings or POSIX timestamps to UTCDatetimes, split into
+    chunks that are parsed in parallel by a pool of worker processes.
+
+    Each method parses the same as the UTCDatetime constructor of the same name,
+    and returns a ParseResult like UTCDatetime.from_iso_format_many() with
+    packed=True. The values are in the same order as the input.
+
+    The worker processes are started when the first input with more than one
+    chunk is parsed, and are kept until the parser is closed, by close() or by
+    using it as a context manager. An input of a single chunk is parsed in this
+    process, since sending it to a worker would only add to the time it takes.
+    """
+
+    # Instance Attributes
+
+    _max_workers: int
+    _chunk_size: int
+    _executor: Optional[ProcessPoolExecutor]
+
+    __slots__ = ("_max_workers", "_chunk_size", "_executor")
+
+    # Special Methods
+
+    def __init__(
+        self, *, max_workers: Optional[int] = None, chunk_size: int = 65_536
+    ) -> None:
+        """
+        Initialise a parser, without starting any worker processes.
+
+        :param max_workers: How many worker processes to parse with. Defaults to
+            the number of CPUs.
+        :param chunk_size: How many values each worker parses at a time.
+        :raises ValueError: When max_workers or chunk_size isn't positive.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._executor = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_workers={self._max_workers}, "
+            f"chunk_size={self._chunk_size})"
+        )
+
+    def __enter__(self) -> ParallelParser:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    # Instance Properties
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    # Instance Methods
+
+    def from_iso_format(self, date_strings: Iterable[str]) -> ParseResult:
+        """
+        Parse many ISO 8601 formatted datetime strings, as
+        UTCDatetime.from_iso_format() would.
+
+        :param date_strings: The ISO 8601 formatted datetime strings.
+        :return: A ParseResult of a UTCDatetimeArray and any errors.
+        """
+        return self._parse(_from_iso_format_chunk, date_strings)
+
+    def strptime(self, date_strings: Iterable[str], format_string: str) -> ParseResult:
+        """
+        Parse many datetime strings according to a format string, as
+        UTCDatetime.strptime() would.
+
+        :param date_strings: The datetime strings.
+        :param format_string: The format string, which must have a %z directive.
+        :return: A ParseResult of a UTCDatetimeArray and any errors.
+        :raises ValueError: When the format string has no %z directive, so no
+            string could be parsed to a UTCDatetime.
+        """
+        if not compile_format(format_string)._parses_utc:
+            raise ValueError("strptime: format_string has no %z directive")
+        return self._parse(partial(_strptime_chunk, format_string), date_strings)
+
+    def from_timestamp(self, timestamps: Iterable[Union[int, float]]) -> ParseResult:
+        """
+        Convert many POSIX timestamps, as UTCDatetime.from_timestamp() would.
+
+        A timestamp that is out of range is recorded in the errors as a ValueError,
+        even where from_timestamp() would raise an OverflowError. One that isn't a
+        number is recorded as a TypeError.
+
+        :param timestamps: The POSIX timestamps.
+        :return: A ParseResult of a UTCDatetimeArray and any errors.
+        """
+        return self._parse(_timestamps_to_epoch_us, timestamps)
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes, waiting for them to exit.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _parse(
+        self, parse_chunk: Callable[[List[Any]], _Chunk], items: Iterable[Any]
+    ) -> ParseResult:
+        """
+        Parse the items a chunk at a time, and join the chunks in order.
+        """
+        chunks = _chunked(items, self._chunk_size)
+        first = next(chunks, None)
+        second = next(chunks, None)
+
+        results: Iterable[_Chunk]
+        if first is None:
+            results = ()
+        elif second is None:
+            results = (parse_chunk(first),)
+        else:
+            results = self._map(parse_chunk, chain((first, second), chunks))
+
+        values = array("q")
+        errors: Dict[int, Exception] = {}
+        for chunk_values, chunk_errors in results:
+            start = len(values)
+            values.extend(chunk_values)
+            for index, error in chunk_errors.items():
+                errors[start + index] = error
+        return ParseResult(UTCDatetimeArray._from_view(memoryview(values)), errors)
+
+    def _map(
+        self, parse_chunk: Callable[[List[Any]], _Chunk], chunks: Iterator[List[Any]]
+    ) -> Iterator[_Chunk]:
+        """
+        Parse the chunks in the worker processes, yielding the results in the order
+        of the chunks. Only a few chunks per worker are queued at a time.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self._max_workers)
+        submit = self._executor.submit
+        queued = self._max_workers * _CHUNKS_PER_WORKER
+
+        pending: Deque[Future[_Chunk]] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(submit(parse_chunk, chunk))
+                if len(pending) >= queued:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # when a chunk failed, don't parse the rest
+            for future in pending:
+                future.cancel()
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split the items into lists of the size, the last of which can be shorter.
+    """
+    iterator = iter(items)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _from_iso_format_chunk(date_strings: List[str]) -> _Chunk:
+    values, errors = UTCDatetime.from_iso_format_many(date_strings, packed=True)
+    return values.to_epoch_microseconds(), errors  # type: ignore[union-attr]
+
+
+def _strptime_chunk(format_string: str, date_strings: List[str]) -> _Chunk:
+    values, errors = compile_format(format_string).parse_many(date_strings, packed=True)
+    return values.to_epoch_microseconds(), errors  # type: ignore[union-attr]
@@ -0,0 +1,353 @@
+"""
+Formatting and parsing the date and time formats of internet protocols, for
+microseconds since the epoch:
+
+* HTTP-date (RFC 7231), e.g. "Sun, 06 Nov 1994 08:49:37 GMT"
+* RFC 2822 date-time, e.g. "Sun, 06 Nov 1994 08:49:37 +0000"
+* RFC 3339 date-time, e.g. "1994-11-06T08:49:37.000000Z"
+
+These are what UTCDatetime.to_http_date(), from_http_date() and the like are
+built on. The formats are fixed, so they are formatted and parsed directly
+rather than through strftime() and strptime().
+
+Servers format the same second over and over, e.g. for the Date header of each
+response, so each formatter keeps the text of the last second it formatted, as
+an immutable (second, text) tuple that is swapped whole, so it is safe to share
+between threads without a lock.
+"""
+from __future__ import annotations
+
+__all__ = (
+    "format_http_date",
+    "format_rfc2822",
+    "format_rfc3339",
+    "parse_http_date",
+    "parse_rfc2822",
+    "parse_rfc3339",
+)
+
+import re
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from ._internal import EPOCH_ORDINAL, MAX_EPOCH_US, MIN_EPOCH_US
+from .types import UTCDatetime
+
+_DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH_NAMES = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+_MONTHS = {name: month for month, name in enumerate(_MONTH_NAMES, 1)}
+_MONTHS_LOWER = {name.lower(): month for name, month in _MONTHS.items()}
+
+# the fraction of a second written for each timespec of format_rfc3339()
+_RFC3339_FRACTIONS: Dict[str, Tuple[str, int]] = {
+    "seconds": ("", 0),
+    "milliseconds": (".%03d", 1_000),
+    "microseconds": (".%06d", 1),
+}
+
+# the obsolete zone names of RFC 2822, as their UTC offset in minutes
+_RFC2822_ZONES = {
+    "ut": 0,
+    "gmt": 0,
+    "est": -300,
+    "edt": -240,
+    "cst": -360,
+    "cdt": -300,
+    "mst": -420,
+    "mdt": -360,
+    "pst": -480,
+    "pdt": -420,
+}
+
+_DAY = "(?:" + "|".join(_DAY_NAMES) + ")"
+_MONTH = "(" + "|".join(_MONTH_NAMES) + ")"
+_TIME = "([01][0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9])"
+
+# the preferred IMF-fixdate format of HTTP-date, and the two obsolete formats
+# that recipients must also accept
+_IMF_FIXDATE = re.compile(f"{_DAY}, ([0-9]{{2}}) {_MONTH} ([0-9]{{4}}) {_TIME} GMT")
+_RFC850_DATE = re.compile(
+    "(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday), "
+    f"([0-9]{{2}})-{_MONTH}-([0-9]{{2}}) {_TIME} GMT"
+)
+_ASCTIME_DATE = re.compile(f"{_DAY} {_MONTH} ([ 0-9][0-9]) {_TIME} ([0-9]{{4}})")
+
+_RFC2822_DATE = re.compile(
+    r"\s*(?:" + _DAY + r"\s*,\s*)?([0-9]{1,2})\s+([a-z]{3})\s+([0-9]{2,4})"
+    r"\s+([01][0-9]|2[0-3])\s*:\s*([0-5][0-9])(?:\s*:\s*([0-5][0-9]))?"
+    r"\s+([+-][0-9]{2}[0-5][0-9]|[a-z]{2,3})\s*",
+    re.IGNORECASE,
+)
+_RFC3339_DATE = re.compile(
+    r"([0-9]{4})-([0-9]{2})-([0-9]{2})[Tt ]"
+    r"([01][0-9]|2[0-3]):([0-5][0-9]):([0-5][0-9])(?:\.([0-9]+))?"
+    r"(?:[Zz]|([+-])([01][0-9]|2[0-3]):([0-5][0-9]))"
+)
+
+# the (second since the epoch, text) last formatted by each formatter, and the
+# (string, microseconds since the epoch) last parsed by parse_http_date()
+_http_date_cache: Tuple[Optional[int], str] = (None, "")
+_rfc2822_cache: Tuple[Optional[int], str] = (None, "")
+_rfc3339_cache: Tuple[Optional[int], str] = (None, "")
+_http_parse_cache: Tuple[Optional[str], int] = (None, 0)
+
+
+def format_http_date(microseconds: int) -> str:
+    """
+    Format microseconds since the epoch as an HTTP-date, in the preferred
+    IMF-fixdate format of RFC 7231, e.g. "Sun, 06 Nov 1994 08:49:37 GMT".
+
+    The fraction of a second is truncated, since the format has none.
+
+    :param microseconds: The microseconds since 1970-01-01T00:00:00Z.
+    :return: The HTTP-date string.
+    """
+    global _http_date_cache
+
+    second = microseconds // 1_000_000
+    cached_second, text = _http_date_cache
+    if second != cached_second:
+        text = _format_day_and_time(second) + " GMT"
+        _http_date_cache = (second, text)
+    return text
+
+
+def format_rfc2822(microseconds: int) -> str:
+    """
+    Format microseconds since the epoch as an RFC 2822 date-time, in UTC,
+    e.g. "Sun, 06 Nov 1994 08:49:37 +0000".
+
+    The fraction of a second is truncated, since the format has none.
+
+    :param microseconds: The microseconds since 1970-01-01T00:00:00Z.
+    :return: The RFC 2822 date-time string.
+    """
+    global _rfc2822_cache
+
+    second = microseconds // 1_000_000
+    cached_second, text = _rfc2822_cache
+    if second != cached_second:
+        text = _format_day_and_time(second) + " +0000"
+        _rfc2822_cache = (second, text)
+    return text
+
+
+def format_rfc3339(microseconds: int, *, timespec: str = "microseconds") -> str:
+    """
+    Format microseconds since the epoch as an RFC 3339 date-time, in UTC,
+    e.g. "1994-11-06T08:49:37.000000Z".
+
+    :param microseconds: The microseconds since 1970-01-01T00:00:00Z.
+    :param timespec: How much of the fraction of a second to write, one of
+        "seconds", "milliseconds" or "microseconds".
+    :return: The RFC 3339 date-time string.
+    :raises ValueError: When the timespec isn't known.
+    """
+    global _rfc3339_cache
+
+    try:
+        fraction_format, divisor = _RFC3339_FRACTIONS[timespec]
+    except KeyError:
+        raise ValueError("Unknown timespec value") from None
+
+    second, fraction = divmod(microseconds, 1_000_000)
+    cached_second, text = _rfc3339_cache
+    if second != cached_second:
+        days, second_of_day = divmod(second, 86_400)
+        day = date.fromordinal(EPOCH_ORDINAL + days)
+        minutes, seconds = divmod(second_of_day, 60)
+        text = "%sT%02d:%02d:%02d" % (day.isoformat(), *divmod(minutes, 60), seconds)
+        _rfc3339_cache = (second, text)
+
+    if divisor:
+        return text + fraction_format % (fraction // divisor) + "Z"
+    return text + "Z"
+
+
+def parse_http_date(date_string: str) -> int:
+    """
+    Parse an HTTP-date, in any of the three formats of RFC 7231 that recipients
+    must accept, e.g. "Sun, 06 Nov 1994 08:49:37 GMT", the obsolete
+    "Sunday, 06-Nov-94 08:49:37 GMT" or "Sun Nov  6 08:49:37 1994".
+
+    Two digit years are taken to be in the last 50 years or next 50 years. The
+    name of the day isn't checked against the date.
+
+    :param date_string: The HTTP-date string.
+    :return: The microseconds since 1970-01-01T00:00:00Z.
+    :raises ValueError: When the string isn't a valid HTTP-date.
+    """
+    global _http_parse_cache
+
+    cached_string, microseconds = _http_parse_cache
+    if date_string == cached_string:
+        return microseconds
+
+    match = _IMF_FIXDATE.fullmatch(date_string)
+    if match is not None:
+        day, month, year, hour, minute, second = match.groups()
+        year_number = int(year)
+    else:
+        match = _RFC850_DATE.fullmatch(date_string)
+        if match is not None:
+            day, month, year, hour, minute, second = match.groups()
+            year_number = _expand_two_digit_year(int(year))
+        else:
+            match = _ASCTIME_DATE.fullmatch(date_string)
+            if match is None:
+                raise ValueError(f"Invalid HTTP-date string: {date_string!r}")
+            month, day, hour, minute, second, year = match.groups()
+            year_number = int(year)
+
+    microseconds = _to_epoch_us(
+        year_number, _MONTHS[month], int(day), int(hour), int(minute), int(second), 0, 0
+    )
+    _http_parse_cache = (date_string, microseconds)
+    return microseconds
+
+
+def parse_rfc2822(date_string: str) -> int:
+    """
+    Parse an RFC 2822 date-time, e.g. "Sun, 06 Nov 1994 08:49:37 +0000".
+
+    Names are matched ignoring case, and the obsolete two and three digit years
+    and zone names like "GMT" and "EST" are accepted. Comments aren't. The name
+    of the day isn't checked against the date.
+
+    :param date_string: The RFC 2822 date-time string.
+    :return: The microseconds since 1970-01-01T00:00:00Z.
+    :raises ValueError: When the string isn't a valid RFC 2822 date-time.
+    :raises OverflowError: When the date-time is out of range in UTC.
+    """
+    match = _RFC2822_DATE.fullmatch(date_string)
+    month = zone_minutes = None
+    if match is not None:
+        day, month_name, year, hour, minute, second, zone = match.groups()
+        month = _MONTHS_LOWER.get(month_name.lower())
+        if zone[0] in "+-":
+            zone_minutes = int(zone[1:3]) * 60 + int(zone[3:])
+            if zone[0] == "-":
+                zone_minutes = -zone_minutes
+        else:
+            zone_minutes = _RFC2822_ZONES.get(zone.lower())
+    if month is None or zone_minutes is None:
+        raise ValueError(f"Invalid RFC 2822 date-time string: {date_string!r}")
+
+    # the obsolete years of two digits, or of three since 1900
+    year_number = int(year)
+    if len(year) == 2:
+        year_number += 2000 if year_number < 50 else 1900
+    elif len(year) == 3:
+        year_number += 1900
+
+    return _to_epoch_us(
+        year_number,
+        month,
+        int(day),
+        int(hour),
+        int(minute),
+        int(second or 0),
+        0,
+        zone_minutes,
+    )
+
+
+def parse_rfc3339(date_string: str) -> int:
+    """
+    Parse an RFC 3339 date-time, e.g. "1994-11-06T08:49:37Z" or
+    "1994-11-06 16:49:37.5+08:00".
+
+    Digits of the fraction of a second past the microseconds are truncated.
+
+    :param date_string: The RFC 3339 date-time string.
+    :return: The microseconds since 1970-01-01T00:00:00Z.
+    :raises ValueError: When the string isn't a valid RFC 3339 date-time.
+    :raises OverflowError: When the date-time is out of range in UTC.
+    """
+    match = _RFC3339_DATE.fullmatch(date_string)
+    if match is None:
+        raise ValueError(f"Invalid RFC 3339 date-time string: {date_string!r}")
+
+    year, month, day, hour, minute, second, fraction, sign, *offset = match.groups()
+    zone_minutes = 0
+    if sign is not None:
+        zone_minutes = int(offset[0]) * 60 + int(offset[1])
+        if sign == "-":
+            zone_minutes = -zone_minutes
+
+    return _to_epoch_us(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        zone_minutes,
+    )
+
+
+def _format_day_and_time(second: int) -> str:
+    """
+    Format a second since the epoch as the text shared by HTTP-date and RFC 2822,
+    e.g. "Sun, 06 Nov 1994 08:49:37".
+    """
+    days, second_of_day = divmod(second, 86_400)
+    day = date.fromordinal(EPOCH_ORDINAL + days)
+    minutes, seconds = divmod(second_of_day, 60)
+    return "%s, %02d %s %04d %02d:%02d:%02d" % (
+        _DAY_NAMES[day.weekday()],
+        day.day,
+        _MONTH_NAMES[day.month - 1],
+        day.year,
+        *divmod(minutes, 60),
+        seconds,
+    )
+
+
+def _expand_two_digit_year(year: int) -> int:
+    """
+    Return the year ending in the two digits that is no more than 50 years after
+    the current year, as RFC 7231 requires of the obsolete HTTP-date format.
+    """
+    current = UTCDatetime.now().year
+    expanded = current - current % 100 + year
+    return expanded - 100 if expanded > current + 50 else expanded
+
+
+def _to_epoch_us(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    microsecond: int,
+    zone_minutes: int,
+) -> int:
+    """
+    Return the microseconds since the epoch of a parsed date and time, at a UTC
+    offset in minutes.
+
+    :raises ValueError: When the date is invalid.
+    :raises OverflowError: When the date and time are out of range in UTC.
+    """
+    days = date(year, month, day).toordinal() - EPOCH_ORDINAL
+    seconds = days * 86_400 + hour * 3_600 + (minute - zone_minutes) * 60 + second
+    microseconds = seconds * 1_000_000 + microsecond
+    if not MIN_EPOCH_US <= microseconds <= MAX_EPOCH_US:
+        raise OverflowError("date value out of range")
+    return microseconds
@@ -0,0 +1,317 @@
+"""
+Rounding Datetimes down, up or to the nearest boundary of calendar units and
+fixed intervals, one at a time or in bulk.
+
+Calendar and fixed units are rounded with integer math on the microseconds since
+the epoch, so no datetime objects are made along the way.
+"""
+from __future__ import annotations
+
+__all__ = ("ceil_many", "floor_many", "round_many")
+
+from array import array
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ._internal import common_type, timedelta_to_us
+from .types import (
+    BaseDatetime,
+    LocalDatetime,
+    UTCDatetime,
+    _check_epoch_us,
+    _from_us_many,
+    _intern_us_many,
+)
+
+_DAY_US = 86_400_000_000
+
+# the units of a fixed length
+_FIXED_UNITS: Dict[str, int] = {
+    "microsecond": 1,
+    "millisecond": 1_000,
+    "second": 1_000_000,
+    "minute": 60_000_000,
+    "hour": 3_600_000_000,
+    "day": _DAY_US,
+    "week": 7 * _DAY_US,
+}
+# the calendar units, as a number of months
+_CALENDAR_UNITS: Dict[str, int] = {"month": 1, "quarter": 3, "year": 12}
+
+# ISO weeks start on a Monday, and 1970-01-01 was a Thursday
+_WEEK_ORIGIN = -3 * _DAY_US
+
+# (step, origin, months) as returned by _compile_unit()
+_Unit = Tuple[int, int, int]
+
+
+def floor_many(
+    values: Any,
+    unit: Union[str, timedelta],
+    *,
+    origin: Optional[BaseDatetime] = None,
+    packed: bool = False,
+    intern: bool = False,
+) -> Any:
+    """
+    Round many values down to the start of their unit, as BaseDatetime.floor()
+    does for each one.
+
+    :param values: The values to round. Either Datetimes, which are returned as a
+        list, a LocalDatetimeArray or UTCDatetimeArray, which is returned as the
+        same type of array, or a buffer of signed 64 bit integer microseconds
+        since the epoch (e.g. array.array("q")), which is returned as an
+        array.array("q").
+    :param unit: A calendar unit ("microsecond", "millisecond", "second",
+        "minute", "hour", "day", "week", "month", "quarter" or "year"), or a
+        timedelta for a fixed interval.
+    :param origin: A time the fixed intervals are counted from. Defaults to the
+        epoch, or the Monday before it for weeks. Can't be given for months,
+        quarters or years.
+    :param packed: If True, return Datetimes as an array rather than a list.
+    :param intern: If True, take Datetimes in a list from the intern pool of their
+        type, see BaseDatetime.intern(). Rounded values often repeat, so this can
+        save a lot of memory.
+    :return: The rounded values, in the same order.
+    :raises OverflowError: When a rounded value is out of range.
+    """
+    return _round_many(values, unit, origin, packed, intern, _floor_fixed_many, _floor)
+
+
+def ceil_many(
+    values: Any,
+    unit: Union[str, timedelta],
+    *,
+    origin: Optional[BaseDatetime] = None,
+    packed: bool = False,
+    intern: bool = False,
+) -> Any:
+    """
+    Round many values up to the start of the next unit, unless they are already
+    at the start of one, as BaseDatetime.ceil() does for each one.
+
+    Takes the same arguments as floor_many().
+    """
+    return _round_many(values, unit, origin, packed, intern, _ceil_fixed_many, _ceil)
+
+
+def round_many(
+    values: Any,
+    unit: Union[str, timedelta],
+    *,
+    origin: Optional[BaseDatetime] = None,
+    packed: bool = False,
+    intern: bool = False,
+) -> Any:
+    """
+    Round many values to the nearest start of a unit, as BaseDatetime.round()
+    does for each one. Values halfway between are rounded up.
+
+    Takes the same arguments as floor_many().
+    """
+    return _round_many(values, unit, origin, packed, intern, _round_fixed_many, _round)
+
+
+def _round_many(
+    values: Any,
+    unit: Union[str, timedelta],
+    origin: Optional[BaseDatetime],
+    packed: bool,
+    intern: bool,
+    fixed_many: Callable[[Iterable[int], int, int], List[int]],
+    round_one: Callable[[int, int, int], int],
+) -> Any:
+    """
+    Round many values, with fixed_many() for fixed units and by finding the
+    bounds of each calendar unit. The bounds are reused while the values stay in
+    the same unit, so sorted values rarely need them found again.
+    """
+    from .array import (
+        BaseDatetimeArray,
+        LocalDatetimeArray,
+        UTCDatetimeArray,
+        _as_int64_view,
+    )
+
+    # find the type to return, and the microseconds to round
+    cls: Any
+    array_type: Any
+    source: Iterable[int]
+    if isinstance(values, BaseDatetimeArray):
+        cls, array_type, source = values._item_type, type(values), values._data
+        packed = True
+    else:
+        try:
+            source = _as_int64_view(values)
+        except TypeError:
+            is_buffer = False
+        else:
+            is_buffer = True
+            cls = array_type = None
+        if not is_buffer:
+            values = list(values)
+            cls = common_type(values, "round") or BaseDatetime
+            array_type = {
+                LocalDatetime: LocalDatetimeArray,
+                UTCDatetime: UTCDatetimeArray,
+            }.get(cls)
+            source = [value._us for value in values]
+
+    _check_origin(origin, BaseDatetime if cls is None else cls)
+    step, origin_us, months = _compile_unit(unit, origin)
+
+    if months:
+        result: List[int] = []
+        append = result.append
+        start = end = 0
+        for us in source:
+            if not start <= us < end:
+                start, end = _month_bounds(us, months)
+            append(round_one(us, start, end))
+    else:
+        result = fixed_many(source, step, origin_us)
+
+    if result:
+        _check_epoch_us(min(result))
+        _check_epoch_us(max(result))
+    if cls is None:
+        return array("q", result)
+    elif packed and array_type is not None:
+        return array_type._from_view(memoryview(array("q", result)))
+    elif intern:
+        return list(_intern_us_many(cls, result))
+    else:
+        return list(_from_us_many(cls, result))
+
+
+def _compile_unit(unit: Any, origin: Optional[BaseDatetime]) -> _Unit:
+    """
+    Return the step and origin in microseconds of a fixed unit, with 0 months,
+    or the number of months in a calendar unit.
+
+    :raises TypeError: When the unit isn't a str or timedelta.
+    :raises ValueError: When the unit isn't known, or can't have an origin.
+    """
+    if isinstance(unit, timedelta):
+        step = timedelta_to_us(unit)
+        if step <= 0:
+            raise ValueError("unit must be a positive timedelta")
+        return step, 0 if origin is None else origin._us, 0
+    elif not isinstance(unit, str):
+        raise TypeError(f"unit must be str or timedelta, not '{type(unit).__name__}'")
+    elif unit in _FIXED_UNITS:
+        if origin is not None:
+            return _FIXED_UNITS[unit], origin._us, 0
+        return _FIXED_UNITS[unit], _WEEK_ORIGIN if unit == "week" else 0, 0
+    elif unit in _CALENDAR_UNITS:
+        if origin is not None:
+            raise ValueError(f"origin can't be given for unit {unit!r}")
+        return 0, 0, _CALENDAR_UNITS[unit]
+    else:
+        raise ValueError(
+            f"unit must be a timedelta or one of "
+            f"{', '.join(map(repr, [*_FIXED_UNITS, *_CALENDAR_UNITS]))}, not {unit!r}"
+        )
+
+
+def _round_us(
+    value: BaseDatetime,
+    unit: Any,
+    origin: Optional[BaseDatetime],
+    round_one: Callable[[int, int, int], int],
+) -> int:
+    """
+    Round a value, for the Datetime methods.
+
+    :raises TypeError: When the origin isn't the value's type.
+    :raises OverflowError: When the rounded value is out of range.
+    """
+    _check_origin(origin, type(value))
+    step, origin_us, months = _compile_unit(unit, origin)
+    us = value._us
+    if months:
+        start, end = _month_bounds(us, months)
+    else:
+        start = us - (us - origin_us) % step
+        end = start + step
+    return _check_epoch_us(round_one(us, start, end))
+
+
+def _check_origin(origin: Optional[BaseDatetime], cls: Type[BaseDatetime]) -> None:
+    if origin is not None and not isinstance(origin, cls):
+        raise TypeError(f"origin must be {cls.__name__}, not '{type(origin).__name__}'")
+
+
+def _floor(us: int, start: int, end: int) -> int:
+    return start
+
+
+def _ceil(us: int, start: int, end: int) -> int:
+    return us if us == start else end
+
+
+def _round(us: int, start: int, end: int) -> int:
+    return start if us - start < end - us else end
+
+
+def _floor_fixed_many(source: Iterable[int], step: int, origin: int) -> List[int]:
+    return [us - (us - origin) % step for us in source]
+
+
+def _ceil_fixed_many(source: Iterable[int], step: int, origin: int) -> List[int]:
+    return [us + (origin - us) % step for us in source]
+
+
+def _round_fixed_many(source: Iterable[int], step: int, origin: int) -> List[int]:
+    # the floor of us + half a step, which rounds halfway values up
+    half = step // 2
+    origin -= half
+    return [us + half - (us - origin) % step for us in source]
+
+
+def _month_bounds(us: int, months: int) -> Tuple[int, int]:
+    """
+    Return the microseconds since the epoch of the start of the unit of months a
+    value is in, and of the start of the next one. Units start in January.
+    """
+    year, month = _year_month(us // _DAY_US)
+    index = (year * 12 + month - 1) // months * months
+    return _month_start(index), _month_start(index + months)
+
+
+def _month_start(index: int) -> int:
+    """
+    Return the microseconds since the epoch of the start of a month, numbered
+    from January in the year 0.
+    """
+    year, month = divmod(index, 12)
+    return _days_from_civil(year, month + 1) * _DAY_US
+
+
+# The two functions below convert between days since the epoch and proleptic
+# Gregorian dates, from http://howardhinnant.github.io/date_algorithms.html
+# They count years from March, so the leap day is last.
+
+
+def _year_month(days: int) -> Tuple[int, int]:
+    days += 719_468
+    era = days // 146_097
+    day_of_era = days - era * 146_097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36_524 - day_of_era // 146_096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    month = (5 * day_of_year + 2) // 153
+    month += 3 if month < 10 else -9
+    return year_of_era + era * 400 + (month <= 2), month
+
+
+def _days_from_civil(year: int, month: int) -> int:
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month - 3 if month > 2 else month + 9) + 2) // 5
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146_097 + day_of_era - 719_468
@@ -3,46 +3,148 @@ Source code for the datetime types that Fourth provides.
 """
 from __future__ import annotations
 
-__all__ = ("BaseDatetime", "LocalDatetime", "UTCDatetime")
+__all__ = ("BaseDatetime", "LocalDatetime", "ParseResult", "UTCDatetime")
 
+import operator
+import re
+import threading
 from abc import ABCMeta, abstractmethod
+from array import array
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from operator import ge, gt, le, lt
-from typing import Any, Callable, ClassVar, NoReturn, Union
+from functools import partial
+from itertools import repeat
+from math import isfinite, modf, trunc
+from operator import add, ge, gt, le, lt, mul, sub
+from time import time_ns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from ._internal import (
+    EPOCH_NAIVE,
+    EPOCH_ORDINAL,
+    EPOCH_UTC,
+    MAX_EPOCH_US,
+    MIN_EPOCH_US,
+    ONE_MICROSECOND,
+    datetime_to_epoch_us,
+    epoch_us_to_datetime,
+    timedelta_to_us,
+)
+
+if TYPE_CHECKING:
+    from .array import BaseDatetimeArray, LocalDatetimeRange, UTCDatetimeRange
+    from .zone import Zone
+
+B = TypeVar("B", bound="BaseDatetime")
+
+# Returns the current time for UTCDatetime.now(), when a clock other than the
+# system clock is set with fourth.clock.set_clock().
+_now_hook: Optional[Callable[[], UTCDatetime]] = None
+
+# Bulk ISO 8601 parsing has a fast path for strings shaped like the output of
+# iso_format(), e.g. "2020-01-01T00:00:00.000000+05:30". Non-zero UTC offsets seen
+# at the end of those strings are cached (as the wall time of the epoch in that
+# offset) so the rest of the string can be parsed as a naive datetime, without
+# building a new tzinfo for every string.
+_ISO_NAIVE_LENGTH = 26
+_ISO_AWARE_LENGTH = 32
+_ISO_OFFSET_PATTERN = re.compile(r"([+-])(\d\d):(\d\d)")
+_iso_local_epochs: Dict[str, datetime] = {}
+
+# Interned Datetimes of each type, keyed on their microseconds since the epoch.
+# Each pool holds up to _INTERN_POOL_SIZE values, evicting the earliest added first.
+# Looking values up doesn't take the lock, since dict.get() is atomic. The keys of
+# each pool are also queued in the order they were added, for eviction.
+_INTERN_POOL_SIZE = 65_536
+_intern_pools: Dict[type, Dict[int, Any]] = {}
+_intern_queues: Dict[type, Deque[int]] = {}
+_intern_lock = threading.Lock()
+
+
+class ParseResult(NamedTuple):
+    """
+    The result of parsing many datetime strings at once.
+
+    `values` has one item for each string parsed, in the same order.
+    It is either a list, or a packed array when one was asked for.
+    `errors` maps the index of each string that failed to parse to the exception
+    that was raised for it: a ValueError when it is invalid, an OverflowError
+    when it is out of range, or a TypeError when it isn't a string. Those
+    indexes hold None in a list, and 0 in a packed array.
+    """
+
+    values: Union[List[Optional[BaseDatetime]], BaseDatetimeArray[Any]]
+    errors: Dict[int, Exception]
+
 
-from ._internal import contains_timezone
+# the exceptions recorded for a row of a bulk parse, rather than raised
+_ROW_ERRORS = (ValueError, OverflowError, TypeError)
 
 
 class BaseDatetime(metaclass=ABCMeta):
     """
     Abstract base class for Fourth datetime types.
 
-    Contains a single real attribute `_at` which is a datetime.datetime
-    instance which the Datetime is "at".
+    The value is stored in the attribute `_us`, an integer number of microseconds
+    since the epoch, so comparing, hashing and arithmetic between Datetimes are
+    integer operations.
+
+    The datetime.datetime instance which the Datetime is "at" is available as
+    the `_at` property. It is only built when it is first needed, then cached in
+    the `_dt` attribute.
 
     Implements __setattr__ and __delattr__ to make instances pseudo-immutable.
     """
 
+    # Class Attributes
+
+    _tzinfo: ClassVar[Optional[timezone]]
+
     # Instance Attributes
 
-    _at: datetime
+    _us: int
+    _dt: Optional[datetime]
 
-    __slots__ = ("_at",)
+    __slots__ = ("_us", "_dt")
 
     # Special Methods
 
     @abstractmethod
     def __init__(self, from_datetime: datetime) -> None:
         """
-        Set the _at attribute to the datetime we are initialising from.
+        Set the _us attribute from the datetime we are initialising from.
 
         Subclasses should implement some validation of from_datetime before
         passing it here.
 
         :param from_datetime: The datetime to initialise from.
+        :raises OverflowError: When the datetime is out of range in UTC.
         """
-        # use object.__setattr__ to get around pseudo immutability.
-        object.__setattr__(self, "_at", from_datetime)
+        microseconds = datetime_to_epoch_us(from_datetime)
+        # an aware datetime near datetime.min or datetime.max can be out of range
+        # once its UTC offset is applied
+        if not MIN_EPOCH_US <= microseconds <= MAX_EPOCH_US:
+            raise OverflowError("date value out of range")
+        _set_us(self, microseconds)
+        # keep the datetime if it is already the one _at would build
+        _set_dt(self, from_datetime if from_datetime.tzinfo is self._tzinfo else None)
 
     def __setattr__(self, name: str, value: Any) -> NoReturn:
         """
@@ -74,15 +176,16 @@ class BaseDatetime(metaclass=ABCMeta):
 
         :return: The representation of the Datetime.
         """
+        at = self._at
         return "{}.at({}, {}, {}, {}, {}, {}, {})".format(
             self.__class__.__name__,
-            self._at.year,
-            self._at.month,
-            self._at.day,
-            self._at.hour,
-            self._at.minute,
-            self._at.second,
-            self._at.microsecond,
+            at.year,
+            at.month,
+            at.day,
+            at.hour,
+            at.minute,
+            at.second,
+            at.microsecond,
         )
 
     def __str__(self) -> str:
@@ -105,9 +208,19 @@ class BaseDatetime(metaclass=ABCMeta):
         else:
             return self.strftime(format_spec)
 
-    def __getstate__(self) -> datetime:
+    def __reduce__(self) -> Tuple[Any, ...]:
         """
         Called when the object is pickled.
+        Pickles the integer microseconds, rather than a datetime.
+
+        :return: A function to rebuild the instance, and its arguments.
+        """
+        return _reconstruct, (self.__class__, self._us)
+
+    def __getstate__(self) -> datetime:
+        """
+        The content of the instance that was pickled before __reduce__() was
+        implemented.
 
         :return: The content of the instance to pickle.
         """
@@ -116,14 +229,85 @@ class BaseDatetime(metaclass=ABCMeta):
     def __setstate__(self, state: datetime) -> None:
         """
         Called with the result of self.__getstate__() when unpickling.
+        Pickles made before __reduce__() was implemented are loaded with this.
 
         :param state: The self._at datetime instance that was pickled.
         """
-        # use object.__setattr__ to get around pseudo immutability.
-        object.__setattr__(self, "_at", state)
+        _set_us(self, datetime_to_epoch_us(state))
+        _set_dt(self, state)
+
+    def __copy__(self: B) -> B:
+        """
+        Called by copy.copy(). Instances are immutable, so return the same instance.
+        """
+        return self
+
+    def __deepcopy__(self: B, memo: Dict[int, Any]) -> B:
+        """
+        Called by copy.deepcopy(). Instances are immutable, so return the same
+        instance.
+        """
+        return self
 
     # Constructors
 
+    @classmethod
+    def trusted(cls: Type[B], at: datetime) -> B:
+        """
+        Return a new instance at the datetime, without validating it.
+
+        This is a faster alternative to calling the class, for datetimes that are
+        already known to be valid for it: naive for LocalDatetime, and with
+        `tzinfo=timezone.utc` for UTCDatetime. Any other datetime gives an
+        instance that behaves incorrectly.
+
+        :param at: A valid datetime.datetime instance.
+        :return: An instance at the datetime.
+        """
+        instance = object.__new__(cls)
+        _set_us(instance, datetime_to_epoch_us(at))
+        _set_dt(instance, at)
+        return instance
+
+    @classmethod
+    def _from_us(cls: Type[B], microseconds: int) -> B:
+        """
+        Return a new instance from microseconds since the epoch, without building
+        a datetime. The microseconds are trusted to be in range.
+        """
+        instance = object.__new__(cls)
+        _set_us(instance, microseconds)
+        _set_dt(instance, None)
+        return instance
+
+    @classmethod
+    def intern(cls: Type[B], value: B) -> B:
+        """
+        Return the shared instance equal to the value from the type's intern pool,
+        adding the value to the pool if it has no equal instance.
+
+        Values that repeat many times, like timestamps truncated to the minute,
+        can be interned to keep one instance of each rather than many equal ones.
+        Equal interned values are then the same object, so comparing them is an
+        identity check. The pool holds up to 65,536 values of each type, evicting
+        the earliest added first.
+
+        The bulk constructors, like from_iso_format_many(), can intern the values
+        they build with intern=True.
+
+        :param value: The value to intern.
+        :return: The interned instance equal to the value.
+        :raises TypeError: When the value isn't an instance of this type.
+        """
+        if not isinstance(value, cls):
+            raise TypeError(f"expected {cls.__name__}, not '{type(value).__name__}'")
+
+        pool = _intern_pool(type(value))
+        pooled = pool.get(value._us)
+        if pooled is None:
+            pooled = _add_to_pool(pool, value)
+        return pooled
+
     @classmethod
     @abstractmethod
     def at(
@@ -145,6 +329,18 @@ class BaseDatetime(metaclass=ABCMeta):
 
     # Instance Properties
 
+    @property
+    def _at(self) -> datetime:
+        """
+        The datetime.datetime instance this Datetime is "at".
+        Built from _us the first time it is needed, and cached.
+        """
+        at = self._dt
+        if at is None:
+            at = epoch_us_to_datetime(self._us, self._tzinfo)
+            _set_dt(self, at)
+        return at
+
     @property
     def year(self) -> int:
         return self._at.year
@@ -209,6 +405,59 @@ class BaseDatetime(metaclass=ABCMeta):
             f"{self.__class__.__name__} does not implement strftime()"
         )
 
+    def floor(self: B, unit: Union[str, timedelta], *, origin: Optional[B] = None) -> B:
+        """
+        Round down to the start of a unit of time.
+
+        :param unit: A calendar unit ("microsecond", "millisecond", "second",
+            "minute", "hour", "day", "week", "month", "quarter" or "year"), or a
+            timedelta for a fixed interval. Weeks start on Mondays, quarters and
+            years start in January.
+        :param origin: A time the fixed intervals are counted from. Defaults to
+            the epoch, or the Monday before it for weeks. Can't be given for
+            months, quarters or years.
+        :return: A new instance at the start of the unit.
+        :raises OverflowError: When the result is out of range.
+        """
+        return self._from_us(_round_us(self, unit, origin, _floor))
+
+    def ceil(self: B, unit: Union[str, timedelta], *, origin: Optional[B] = None) -> B:
+        """
+        Round up to the start of the next unit of time, unless already at the
+        start of one. Takes the same arguments as floor().
+
+        :return: A new instance at the start of the unit.
+        :raises OverflowError: When the result is out of range.
+        """
+        return self._from_us(_round_us(self, unit, origin, _ceil))
+
+    def round(self: B, unit: Union[str, timedelta], *, origin: Optional[B] = None) -> B:
+        """
+        Round to the nearest start of a unit of time, rounding up when halfway
+        between. Takes the same arguments as floor().
+
+        :return: A new instance at the start of the unit.
+        :raises OverflowError: When the result is out of range.
+        """
+        return self._from_us(_round_us(self, unit, origin, _round))
+
+    def _plus_us(self: B, microseconds: int) -> B:
+        """
+        Return a new instance, this many microseconds after this one.
+
+        :raises OverflowError: When the result is out of range.
+        """
+        result = self._us + microseconds
+        if not MIN_EPOCH_US <= result <= MAX_EPOCH_US:
+            raise OverflowError("date value out of range")
+        return self._from_us(result)
+
+
+# Set the slots of a Datetime, getting around pseudo immutability.
+# Calling the slot descriptors directly is cheaper than object.__setattr__().
+_set_us = BaseDatetime.__dict__["_us"].__set__
+_set_dt = BaseDatetime.__dict__["_dt"].__set__
+
 
 class LocalDatetime(BaseDatetime):
     """
@@ -221,6 +470,7 @@ class LocalDatetime(BaseDatetime):
 
     min: ClassVar[LocalDatetime]
     max: ClassVar[LocalDatetime]
+    _tzinfo = None
 
     # Instance Attributes
 
@@ -250,8 +500,10 @@ class LocalDatetime(BaseDatetime):
         :param other: The object to check if equal to.
         :return: True if equal. False if not. NotImplemented otherwise.
         """
-        if isinstance(other, LocalDatetime):
-            return other._at == self._at
+        if other is self:
+            return True
+        elif isinstance(other, LocalDatetime):
+            return other._us == self._us
         elif isinstance(other, datetime):
             return other.tzinfo is None and other == self._at
         else:
@@ -262,6 +514,9 @@ class LocalDatetime(BaseDatetime):
         The hash is the same as the internal datetime's hash. This satisfies the
         property that objects which compare equal have the same hash value.
 
+        Naive datetimes hash their individual fields, so the internal datetime is
+        built to be hashed.
+
         :return: The hash as an integer.
         """
         return hash(self._at)
@@ -281,7 +536,7 @@ class LocalDatetime(BaseDatetime):
         :return: True/False if determined. Otherwise NotImplemented.
         """
         if isinstance(other, LocalDatetime):
-            return compare(self._at, other._at)
+            return compare(self._us, other._us)
         elif isinstance(other, datetime) and other.tzinfo is None:
             return compare(self._at, other)
         else:
@@ -309,7 +564,7 @@ class LocalDatetime(BaseDatetime):
         :return: A LocalDatetime which is the result.
         """
         if isinstance(other, timedelta):
-            return LocalDatetime(self._at + other)
+            return self._plus_us(timedelta_to_us(other))
         else:
             return NotImplemented
 
@@ -325,11 +580,11 @@ class LocalDatetime(BaseDatetime):
             or a LocalDatetime.
         """
         if isinstance(other, LocalDatetime):
-            return self._at - other._at
+            return ONE_MICROSECOND * (self._us - other._us)
         elif isinstance(other, datetime) and other.tzinfo is None:
             return self._at - other
         elif isinstance(other, timedelta):
-            return LocalDatetime(self._at - other)
+            return self._plus_us(-timedelta_to_us(other))
         else:
             return NotImplemented
 
@@ -373,7 +628,7 @@ class LocalDatetime(BaseDatetime):
         :param microsecond:
         :return: A LocalDatetime instance at the specified time.
         """
-        return cls(
+        return cls.trusted(
             datetime(
                 year=year,
                 month=month,
@@ -393,7 +648,30 @@ class LocalDatetime(BaseDatetime):
 
         :return: A LocalDatetime instance for the current date and time.
         """
-        return cls(datetime.now())
+        return cls.trusted(datetime.now())
+
+    @classmethod
+    def range(
+        cls, start: LocalDatetime, stop: LocalDatetime, step: timedelta
+    ) -> LocalDatetimeRange:
+        """
+        Return a lazy range of the LocalDatetimes from start, up to but not including
+        stop, step apart. Like range() does for integers.
+
+        The range takes constant time to build, measure, index, slice and search,
+        however many LocalDatetimes are in it, and they are built without validation
+        as it is iterated over.
+
+        :param start: The first LocalDatetime in the range.
+        :param stop: The LocalDatetime the range stops before.
+        :param step: The difference between each LocalDatetime and the next.
+            A negative step counts down from start to stop.
+        :return: A LocalDatetimeRange.
+        :raises ValueError: When step is zero.
+        """
+        from .array import LocalDatetimeRange
+
+        return LocalDatetimeRange(start, stop, step)
 
     @classmethod
     def from_iso_format(cls, date_string: str) -> LocalDatetime:
@@ -413,7 +691,35 @@ class LocalDatetime(BaseDatetime):
         datetime_obj = datetime.fromisoformat(date_string)
         if datetime_obj.tzinfo is not None:
             raise ValueError("fromisoformat: date_string contained tz info")
-        return cls(datetime_obj)
+        return cls.trusted(datetime_obj)
+
+    @classmethod
+    def from_iso_format_many(
+        cls, date_strings: Iterable[str], *, packed: bool = False, intern: bool = False
+    ) -> ParseResult:
+        """
+        Parse many ISO 8601 formatted datetime strings, as from_iso_format() would.
+
+        A string that fails to parse doesn't stop the others being parsed,
+        instead its exception is recorded in the result's errors.
+
+        :param date_strings: The ISO 8601 formatted datetime strings.
+        :param packed: If True, return the values as a LocalDatetimeArray rather
+            than a list of LocalDatetime.
+        :param intern: If True, take the values in a list from the intern pool, as
+            LocalDatetime.intern() would.
+        :return: A ParseResult of the values and any errors.
+        """
+        from .array import LocalDatetimeArray
+
+        return _parse_many(
+            date_strings,
+            _parse_local_iso_format,
+            cls,
+            LocalDatetimeArray,
+            packed,
+            intern,
+        )
 
     @classmethod
     def strptime(cls, date_string: str, format_string: str) -> LocalDatetime:
@@ -421,7 +727,8 @@ class LocalDatetime(BaseDatetime):
         Returns a new LocalDatetime instance corresponding to the datetime
         string after being parsed according to the format string.
 
-        Uses datetime.datetime.strptime to parse the strings.
+        Parses the strings the same as datetime.datetime.strptime.
+        The format string is compiled to a Format, which is cached.
 
         The datetime and format strings must not have a timezone component.
 
@@ -430,10 +737,10 @@ class LocalDatetime(BaseDatetime):
         :return: The corresponding LocalDatetime instance.
         :raises ValueError: When the strings have a timezone component.
         """
-        datetime_obj = datetime.strptime(date_string, format_string)
+        datetime_obj = compile_format(format_string)._parse_datetime(date_string)
         if datetime_obj.tzinfo is not None:
             raise ValueError("strptime: date_string contained tz info")
-        return cls(datetime_obj)
+        return cls.trusted(datetime_obj)
 
     # Instance Methods
 
@@ -449,13 +756,40 @@ class LocalDatetime(BaseDatetime):
         :return: The string representation of the date and time.
         :raises ValueError: When the format string contains timezone directives.
         """
-        if contains_timezone(format_string):
+        compiled = compile_format(format_string)
+        if compiled.has_timezone:
             raise ValueError(
                 "format string for LocalDatetime.strftime() must not contain timezone "
                 "directives ('%z', '%Z')"
             )
 
-        return self._at.strftime(format_string)
+        return compiled._render(self._at)
+
+    def to_utc(
+        self,
+        zone: Union[str, Zone],
+        *,
+        ambiguous: str = "raise",
+        nonexistent: str = "raise",
+    ) -> UTCDatetime:
+        """
+        Return the UTC instant of this wall time in a time zone.
+
+        :param zone: The IANA name of the zone, like "Australia/Perth", or a Zone.
+        :param ambiguous: How to convert a wall time that happens twice, when the
+            clocks go back. "raise" to raise a ValueError, "earlier" for the first
+            time it happens, "later" for the second time.
+        :param nonexistent: How to convert a wall time that never happens, when the
+            clocks go forward. "raise" to raise a ValueError, "shift_forward" for
+            the instant the clocks go forward, "shift_backward" for the last
+            microsecond before that.
+        :return: The UTCDatetime of the instant.
+        :raises ValueError: When the wall time is ambiguous or doesn't exist, and
+            that is set to "raise".
+        """
+        if isinstance(zone, str):
+            zone = get_zone(zone)
+        return zone.to_utc(self, ambiguous=ambiguous, nonexistent=nonexistent)
 
 
 LocalDatetime.min = LocalDatetime(datetime.min)
@@ -473,6 +807,7 @@ class UTCDatetime(BaseDatetime):
 
     min: ClassVar[UTCDatetime]
     max: ClassVar[UTCDatetime]
+    _tzinfo = timezone.utc
 
     # Instance Attributes
 
@@ -486,12 +821,11 @@ class UTCDatetime(BaseDatetime):
 
         :param at: An aware datetime.datetime instance for this UTCDatetime.
         :raises ValueError: When the `at` argument is naive.
+        :raises OverflowError: When the `at` argument is out of range in UTC.
         """
         if at.tzinfo is None:
             raise ValueError("UTCDatetime can't be initialised with a naive datetime")
 
-        at = at.astimezone(timezone.utc)
-
         super().__init__(at)
 
     def __eq__(self, other: Any) -> bool:
@@ -503,8 +837,10 @@ class UTCDatetime(BaseDatetime):
         :param other: The object to check if equal to.
         :return: True if equal. False if not. NotImplemented otherwise.
         """
-        if isinstance(other, UTCDatetime):
-            return other._at == self._at
+        if other is self:
+            return True
+        elif isinstance(other, UTCDatetime):
+            return other._us == self._us
         elif isinstance(other, datetime):
             return other.tzinfo is not None and other == self._at
         else:
@@ -515,9 +851,18 @@ class UTCDatetime(BaseDatetime):
         The hash is the same as the internal datetime's hash. This satisfies the
         property that objects which compare equal have the same hash value.
 
+        Aware datetimes hash their (days, seconds, microseconds) since 0001-01-01
+        UTC, so the same hash is computed from _us without building the datetime.
+
         :return: The hash as an integer.
         """
-        return hash(self._at)
+        if self._dt is not None:
+            # datetimes cache their hash
+            return hash(self._dt)
+
+        seconds, microseconds = divmod(self._us, 1_000_000)
+        days, seconds = divmod(seconds, 86_400)
+        return hash((days + EPOCH_ORDINAL, seconds, microseconds))
 
     # Rich Comparison Methods
 
@@ -534,7 +879,7 @@ class UTCDatetime(BaseDatetime):
         :return: True/False if determined. Otherwise NotImplemented.
         """
         if isinstance(other, UTCDatetime):
-            return compare(self._at, other._at)
+            return compare(self._us, other._us)
         elif isinstance(other, datetime) and other.tzinfo is not None:
             return compare(self._at, other)
         else:
@@ -562,7 +907,7 @@ class UTCDatetime(BaseDatetime):
         :return: A UTCDatetime which is the result.
         """
         if isinstance(other, timedelta):
-            return UTCDatetime(self._at + other)
+            return self._plus_us(timedelta_to_us(other))
         else:
             return NotImplemented
 
@@ -578,11 +923,11 @@ class UTCDatetime(BaseDatetime):
             or a UTCDatetime.
         """
         if isinstance(other, UTCDatetime):
-            return self._at - other._at
+            return ONE_MICROSECOND * (self._us - other._us)
         elif isinstance(other, datetime) and other.tzinfo is not None:
             return self._at - other
         elif isinstance(other, timedelta):
-            return UTCDatetime(self._at - other)
+            return self._plus_us(-timedelta_to_us(other))
         else:
             return NotImplemented
 
@@ -626,7 +971,7 @@ class UTCDatetime(BaseDatetime):
         :param microsecond:
         :return: A UTCDatetime instance at the specified time.
         """
-        return cls(
+        return cls.trusted(
             datetime(
                 year=year,
                 month=month,
@@ -644,9 +989,38 @@ class UTCDatetime(BaseDatetime):
         """
         Return a new UTCDatetime instance for the current UTC date and time.
 
+        The time is read from the system clock, unless another clock has been set
+        with fourth.clock.set_clock().
+
         :return: A UTCDatetime instance for the current UTC date and time.
         """
-        return cls(datetime.now(timezone.utc))
+        hook = _now_hook
+        if hook is not None:
+            return hook()
+        return cls._from_us(time_ns() // 1_000)
+
+    @classmethod
+    def range(
+        cls, start: UTCDatetime, stop: UTCDatetime, step: timedelta
+    ) -> UTCDatetimeRange:
+        """
+        Return a lazy range of the UTCDatetimes from start, up to but not including
+        stop, step apart. Like range() does for integers.
+
+        The range takes constant time to build, measure, index, slice and search,
+        however many UTCDatetimes are in it, and they are built without validation
+        as it is iterated over.
+
+        :param start: The first UTCDatetime in the range.
+        :param stop: The UTCDatetime the range stops before.
+        :param step: The difference between each UTCDatetime and the next.
+            A negative step counts down from start to stop.
+        :return: A UTCDatetimeRange.
+        :raises ValueError: When step is zero.
+        """
+        from .array import UTCDatetimeRange
+
+        return UTCDatetimeRange(start, stop, step)
 
     @classmethod
     def from_timestamp(cls, timestamp: Union[int, float]) -> UTCDatetime:
@@ -661,7 +1035,101 @@ class UTCDatetime(BaseDatetime):
         :param timestamp: The POSIX timestamp.
         :return: The corresponding UTCDatetime instance.
         """
-        return cls(datetime.fromtimestamp(timestamp, timezone.utc))
+        return cls.trusted(datetime.fromtimestamp(timestamp, timezone.utc))
+
+    @classmethod
+    def from_timestamp_many(
+        cls,
+        timestamps: Iterable[Union[int, float]],
+        *,
+        packed: bool = False,
+        intern: bool = False,
+    ) -> ParseResult:
+        """
+        Convert many POSIX timestamps, as from_timestamp() would, but with integer
+        math rather than building a datetime for each one.
+
+        Float timestamps are rounded to the nearest microsecond, half to even,
+        the same as from_timestamp(). A timestamp that isn't finite or is out of
+        range doesn't stop the others being converted, instead a ValueError is
+        recorded in the result's errors, as is a TypeError for one that isn't a
+        number.
+
+        :param timestamps: The POSIX timestamps, e.g. a list, an array.array, or a
+            NumPy array.
+        :param packed: If True, return the values as a UTCDatetimeArray rather
+            than a list of UTCDatetime.
+        :param intern: If True, take the values in a list from the intern pool, as
+            UTCDatetime.intern() would.
+        :return: A ParseResult of the values and any errors.
+        """
+        from .array import UTCDatetimeArray
+
+        microseconds, errors = _timestamps_to_epoch_us(timestamps)
+        if packed:
+            return ParseResult(
+                UTCDatetimeArray._from_view(memoryview(microseconds)), errors
+            )
+
+        build = _intern_us_many if intern else _from_us_many
+        values: List[Optional[BaseDatetime]] = list(build(cls, microseconds))
+        for index in errors:
+            values[index] = None
+        return ParseResult(values, errors)
+
+    @classmethod
+    def from_epoch_seconds(cls, seconds: int) -> UTCDatetime:
+        """
+        Return a new UTCDatetime instance from an integer number of seconds since
+        the epoch, 1970-01-01T00:00:00Z.
+
+        :param seconds: The seconds since the epoch.
+        :return: The corresponding UTCDatetime instance.
+        :raises TypeError: When seconds isn't an integer.
+        :raises OverflowError: When the value is out of range.
+        """
+        return cls._from_us(_check_epoch_us(operator.index(seconds) * 1_000_000))
+
+    @classmethod
+    def from_epoch_milliseconds(cls, milliseconds: int) -> UTCDatetime:
+        """
+        Return a new UTCDatetime instance from an integer number of milliseconds
+        since the epoch, 1970-01-01T00:00:00Z.
+
+        :param milliseconds: The milliseconds since the epoch.
+        :return: The corresponding UTCDatetime instance.
+        :raises TypeError: When milliseconds isn't an integer.
+        :raises OverflowError: When the value is out of range.
+        """
+        return cls._from_us(_check_epoch_us(operator.index(milliseconds) * 1_000))
+
+    @classmethod
+    def from_epoch_microseconds(cls, microseconds: int) -> UTCDatetime:
+        """
+        Return a new UTCDatetime instance from an integer number of microseconds
+        since the epoch, 1970-01-01T00:00:00Z.
+
+        :param microseconds: The microseconds since the epoch.
+        :return: The corresponding UTCDatetime instance.
+        :raises TypeError: When microseconds isn't an integer.
+        :raises OverflowError: When the value is out of range.
+        """
+        return cls._from_us(_check_epoch_us(operator.index(microseconds)))
+
+    @classmethod
+    def from_epoch_nanoseconds(cls, nanoseconds: int) -> UTCDatetime:
+        """
+        Return a new UTCDatetime instance from an integer number of nanoseconds
+        since the epoch, 1970-01-01T00:00:00Z.
+
+        The nanoseconds are rounded down to the microsecond.
+
+        :param nanoseconds: The nanoseconds since the epoch.
+        :return: The corresponding UTCDatetime instance.
+        :raises TypeError: When nanoseconds isn't an integer.
+        :raises OverflowError: When the value is out of range.
+        """
+        return cls._from_us(_check_epoch_us(operator.index(nanoseconds) // 1_000))
 
     @classmethod
     def from_iso_format(cls, date_string: str) -> UTCDatetime:
@@ -684,13 +1152,40 @@ class UTCDatetime(BaseDatetime):
             raise ValueError("fromisoformat: date_string didn't contain tz info")
         return cls(datetime_obj)
 
+    @classmethod
+    def from_iso_format_many(
+        cls, date_strings: Iterable[str], *, packed: bool = False, intern: bool = False
+    ) -> ParseResult:
+        """
+        Parse many ISO 8601 formatted datetime strings, as from_iso_format() would.
+
+        A string that fails to parse doesn't stop the others being parsed,
+        instead its exception is recorded in the result's errors.
+
+        Strings in the same shape as the output of UTCDatetime.iso_format() are
+        parsed faster, especially when many of them share the same UTC offset.
+
+        :param date_strings: The ISO 8601 formatted datetime strings.
+        :param packed: If True, return the values as a UTCDatetimeArray rather
+            than a list of UTCDatetime.
+        :param intern: If True, take the values in a list from the intern pool, as
+            UTCDatetime.intern() would.
+        :return: A ParseResult of the values and any errors.
+        """
+        from .array import UTCDatetimeArray
+
+        return _parse_many(
+            date_strings, _parse_utc_iso_format, cls, UTCDatetimeArray, packed, intern
+        )
+
     @classmethod
     def strptime(cls, date_string: str, format_string: str) -> UTCDatetime:
         """
         Returns a new UTCDatetime instance corresponding to the datetime string
         after being parsed according to the format string.
 
-        Uses datetime.datetime.strptime to parse the strings.
+        Parses the strings the same as datetime.datetime.strptime.
+        The format string is compiled to a Format, which is cached.
 
         The datetime and format strings must have a timezone component so that
         the date and time can be converted to UTC.
@@ -700,11 +1195,57 @@ class UTCDatetime(BaseDatetime):
         :return: The corresponding UTCDatetime instance.
         :raises ValueError: When the strings don't have a timezone component.
         """
-        datetime_obj = datetime.strptime(date_string, format_string)
+        datetime_obj = compile_format(format_string)._parse_datetime(date_string)
         if datetime_obj.tzinfo is None:
             raise ValueError("strptime: date_string didn't contain tz info")
         return cls(datetime_obj)
 
+    @classmethod
+    def from_http_date(cls, date_string: str) -> UTCDatetime:
+        """
+        Return a new UTCDatetime instance corresponding to the HTTP-date string,
+        as sent in HTTP headers like If-Modified-Since.
+
+        Accepts the preferred format, e.g. "Sun, 06 Nov 1994 08:49:37 GMT", and
+        the two obsolete formats that RFC 7231 requires recipients to accept.
+        This is the inverse of UTCDatetime.to_http_date().
+
+        :param date_string: The HTTP-date string.
+        :return: The corresponding UTCDatetime instance.
+        :raises ValueError: When the string isn't a valid HTTP-date.
+        """
+        return cls._from_us(parse_http_date(date_string))
+
+    @classmethod
+    def from_rfc2822(cls, date_string: str) -> UTCDatetime:
+        """
+        Return a new UTCDatetime instance corresponding to the RFC 2822 date-time
+        string, e.g. "Sun, 06 Nov 1994 08:49:37 +0000", as used in email headers.
+
+        This is the inverse of UTCDatetime.to_rfc2822().
+
+        :param date_string: The RFC 2822 date-time string.
+        :return: The corresponding UTCDatetime instance.
+        :raises ValueError: When the string isn't a valid RFC 2822 date-time.
+        :raises OverflowError: When the date-time is out of range in UTC.
+        """
+        return cls._from_us(parse_rfc2822(date_string))
+
+    @classmethod
+    def from_rfc3339(cls, date_string: str) -> UTCDatetime:
+        """
+        Return a new UTCDatetime instance corresponding to the RFC 3339 date-time
+        string, e.g. "1994-11-06T08:49:37Z".
+
+        This is the inverse of UTCDatetime.to_rfc3339().
+
+        :param date_string: The RFC 3339 date-time string.
+        :return: The corresponding UTCDatetime instance.
+        :raises ValueError: When the string isn't a valid RFC 3339 date-time.
+        :raises OverflowError: When the date-time is out of range in UTC.
+        """
+        return cls._from_us(parse_rfc3339(date_string))
+
     # Instance Methods
 
     def strftime(self, format_string: str) -> str:
@@ -715,8 +1256,392 @@ class UTCDatetime(BaseDatetime):
         :param format_string: The format string the representation will match.
         :return: The string representation of the date and time.
         """
-        return self._at.strftime(format_string)
+        return compile_format(format_string)._render(self._at)
+
+    def to_timestamp(self) -> float:
+        """
+        Return the POSIX timestamp of the UTCDatetime, as datetime.timestamp()
+        does. The inverse of UTCDatetime.from_timestamp().
+
+        A float can't hold every microsecond of recent dates exactly, so prefer
+        the integer to_epoch_*() methods for storing or sending values.
+
+        :return: The seconds since the epoch, as a float.
+        """
+        return self._us / 1_000_000
+
+    def to_epoch_seconds(self) -> int:
+        """
+        Return the integer number of seconds since the epoch, 1970-01-01T00:00:00Z,
+        rounded down. The inverse of UTCDatetime.from_epoch_seconds().
+
+        :return: The seconds since the epoch.
+        """
+        return self._us // 1_000_000
+
+    def to_epoch_milliseconds(self) -> int:
+        """
+        Return the integer number of milliseconds since the epoch,
+        1970-01-01T00:00:00Z, rounded down.
+        The inverse of UTCDatetime.from_epoch_milliseconds().
+
+        :return: The milliseconds since the epoch.
+        """
+        return self._us // 1_000
+
+    def to_epoch_microseconds(self) -> int:
+        """
+        Return the integer number of microseconds since the epoch,
+        1970-01-01T00:00:00Z. The inverse of UTCDatetime.from_epoch_microseconds().
+
+        :return: The microseconds since the epoch.
+        """
+        return self._us
+
+    def to_epoch_nanoseconds(self) -> int:
+        """
+        Return the integer number of nanoseconds since the epoch,
+        1970-01-01T00:00:00Z. The inverse of UTCDatetime.from_epoch_nanoseconds().
+
+        :return: The nanoseconds since the epoch.
+        """
+        return self._us * 1_000
+
+    def to_http_date(self) -> str:
+        """
+        Construct an HTTP-date string of the UTCDatetime, in the preferred format
+        of RFC 7231, e.g. "Sun, 06 Nov 1994 08:49:37 GMT", for HTTP headers like
+        Date and Last-Modified.
+
+        The string of the last second formatted is reused, so formatting the
+        current time many times a second is cheap.
+        The microseconds are truncated, since the format has no fraction of a second.
+
+        :return: The HTTP-date string.
+        """
+        return format_http_date(self._us)
+
+    def to_rfc2822(self) -> str:
+        """
+        Construct an RFC 2822 date-time string of the UTCDatetime,
+        e.g. "Sun, 06 Nov 1994 08:49:37 +0000", as used in email headers.
+
+        The microseconds are truncated, since the format has no fraction of a second.
+
+        :return: The RFC 2822 date-time string.
+        """
+        return format_rfc2822(self._us)
+
+    def to_rfc3339(self, *, timespec: str = "microseconds") -> str:
+        """
+        Construct an RFC 3339 date-time string of the UTCDatetime,
+        e.g. "1994-11-06T08:49:37.000000Z".
+
+        :param timespec: How much of the fraction of a second to include, one of
+            "seconds", "milliseconds" or "microseconds".
+        :return: The RFC 3339 date-time string.
+        :raises ValueError: When the timespec isn't known.
+        """
+        return format_rfc3339(self._us, timespec=timespec)
+
+    def to_local(self, zone: Union[str, Zone]) -> LocalDatetime:
+        """
+        Return the wall time in a time zone at this instant.
+
+        :param zone: The IANA name of the zone, like "Australia/Perth", or a Zone.
+        :return: The LocalDatetime of the wall time.
+        """
+        if isinstance(zone, str):
+            zone = get_zone(zone)
+        return zone.to_local(self)
 
 
 UTCDatetime.min = UTCDatetime(datetime.min.replace(tzinfo=timezone.utc))
 UTCDatetime.max = UTCDatetime(datetime.max.replace(tzinfo=timezone.utc))
+
+
+def _from_us_many(cls: Type[B], microseconds: Iterable[int]) -> Iterator[B]:
+    """
+    Build Datetimes from many microseconds since the epoch, which are trusted to be
+    in range. Does the same as map(cls._from_us, microseconds), without a call to
+    _from_us() for each instance.
+    """
+    new = object.__new__
+    set_us, set_dt = _set_us, _set_dt
+    for us in microseconds:
+        instance = new(cls)
+        set_us(instance, us)
+        set_dt(instance, None)
+        yield instance
+
+
+def _intern_pool(cls: Type[B]) -> Dict[int, B]:
+    """
+    Return the intern pool of a Datetime type.
+    """
+    try:
+        return _intern_pools[cls]
+    except KeyError:
+        return _intern_pools.setdefault(cls, {})
+
+
+def _add_to_pool(pool: Dict[int, B], value: B) -> B:
+    """
+    Add a value to an intern pool, evicting the earliest added value if the pool
+    is full. If another thread added an equal value first, that one is kept and
+    returned instead.
+    """
+    with _intern_lock:
+        pooled = pool.setdefault(value._us, value)
+        if pooled is value:
+            # the pool is the one of the value's type
+            try:
+                queue = _intern_queues[type(value)]
+            except KeyError:
+                queue = _intern_queues[type(value)] = deque()
+            queue.append(value._us)
+            while len(queue) > _INTERN_POOL_SIZE:
+                del pool[queue.popleft()]
+    return pooled
+
+
+def _intern_datetime(cls: Type[B], pool: Dict[int, B], at: datetime) -> B:
+    """
+    Return the interned Datetime at a datetime, which is trusted to be valid for
+    the type, building it only if the pool doesn't have it.
+    """
+    microseconds = datetime_to_epoch_us(at)
+    value = pool.get(microseconds)
+    if value is None:
+        value = _add_to_pool(pool, cls._from_us(microseconds))
+    return value
+
+
+def _intern_us_many(cls: Type[B], microseconds: Iterable[int]) -> Iterator[B]:
+    """
+    Return the interned Datetimes of many microseconds since the epoch, which are
+    trusted to be in range. Does the same as _from_us_many(), but with instances
+    from the type's intern pool.
+    """
+    pool = _intern_pool(cls)
+    get = pool.get
+    for us in microseconds:
+        value = get(us)
+        if value is None:
+            value = _add_to_pool(pool, cls._from_us(us))
+        yield value
+
+
+def _check_epoch_us(microseconds: int) -> int:
+    """
+    Return microseconds since the epoch, after checking they're in range.
+
+    :raises OverflowError: When the microseconds are out of range.
+    """
+    if not MIN_EPOCH_US <= microseconds <= MAX_EPOCH_US:
+        raise OverflowError("date value out of range")
+    return microseconds
+
+
+def _timestamp_to_epoch_us(timestamp: Union[int, float]) -> int:
+    """
+    Convert a POSIX timestamp to microseconds since the epoch. A float is rounded
+    to the nearest microsecond, half to even, as datetime.fromtimestamp() does.
+
+    :raises TypeError: When the timestamp isn't a float or an integer.
+    :raises ValueError: When the timestamp isn't finite or is out of range.
+    """
+    if isinstance(timestamp, float):
+        fraction, whole = modf(timestamp)
+        if not isfinite(whole):
+            raise ValueError(f"timestamp out of range: {timestamp!r}")
+        microseconds = int(whole) * 1_000_000 + round(fraction * 1e6)
+    else:
+        microseconds = operator.index(timestamp) * 1_000_000
+
+    if not MIN_EPOCH_US <= microseconds <= MAX_EPOCH_US:
+        raise ValueError(f"timestamp out of range: {timestamp!r}")
+    return microseconds
+
+
+def _timestamps_to_epoch_us(
+    timestamps: Iterable[Union[int, float]]
+) -> Tuple[array[int], Dict[int, Exception]]:
+    """
+    Convert many POSIX timestamps to microseconds since the epoch, as
+    _timestamp_to_epoch_us() does for each one, collecting errors rather than
+    raising them. The microseconds of a timestamp with an error are 0.
+
+    When all the timestamps are valid, they are converted with map() rather than
+    one function call each. Otherwise they are converted again one at a time, to
+    find the errors.
+    """
+    values: List[Any]
+    try:
+        # buffers of numbers, like array.array("d") or NumPy arrays
+        values = memoryview(timestamps).tolist()  # type: ignore[arg-type]
+    except (TypeError, NotImplementedError):
+        values = list(timestamps)
+
+    try:
+        # the same math as _timestamp_to_epoch_us(), since the fraction of a float
+        # is exactly it minus its truncated value
+        wholes = list(map(trunc, values))
+        microseconds = array(
+            "q",
+            map(
+                add,
+                map(mul, wholes, repeat(1_000_000)),
+                map(round, map(mul, map(sub, values, wholes), repeat(1e6))),
+            ),
+        )
+    except (TypeError, ValueError, OverflowError):
+        pass
+    else:
+        if not microseconds or (
+            min(microseconds) >= MIN_EPOCH_US and max(microseconds) <= MAX_EPOCH_US
+        ):
+            return microseconds, {}
+
+    errors: Dict[int, Exception] = {}
+    microseconds = array("q")
+    append = microseconds.append
+    for index, timestamp in enumerate(values):
+        try:
+            append(_timestamp_to_epoch_us(timestamp))
+        except (ValueError, TypeError) as e:
+            errors[index] = e
+            append(0)
+    return microseconds, errors
+
+
+def _reconstruct(cls: Type[B], microseconds: int) -> B:
+    """
+    Rebuild a pickled Datetime from its integer microseconds.
+
+    :raises OverflowError: When the microseconds are out of range.
+    """
+    if not MIN_EPOCH_US <= microseconds <= MAX_EPOCH_US:
+        raise OverflowError("date value out of range")
+    return cls._from_us(microseconds)
+
+
+def _parse_local_iso_format(date_string: str) -> datetime:
+    """
+    Parse an ISO 8601 string to the naive datetime for a LocalDatetime.
+
+    :raises ValueError: When the string is invalid or contains tz info.
+    """
+    datetime_obj = datetime.fromisoformat(date_string)
+    if datetime_obj.tzinfo is not None:
+        raise ValueError("fromisoformat: date_string contained tz info")
+    return datetime_obj
+
+
+def _parse_utc_iso_format(date_string: str) -> datetime:
+    """
+    Parse an ISO 8601 string to the aware datetime, in UTC, for a UTCDatetime.
+
+    :raises ValueError: When the string is invalid or doesn't contain tz info.
+    """
+    offset_string = None
+
+    if len(date_string) == _ISO_AWARE_LENGTH:
+        offset_string = date_string[_ISO_NAIVE_LENGTH:]
+        local_epoch = _iso_local_epochs.get(offset_string)
+        if local_epoch is not None:
+            datetime_obj = datetime.fromisoformat(date_string[:_ISO_NAIVE_LENGTH])
+            if datetime_obj.tzinfo is None:
+                return EPOCH_UTC + (datetime_obj - local_epoch)
+
+    datetime_obj = datetime.fromisoformat(date_string)
+    tzinfo = datetime_obj.tzinfo
+    if tzinfo is timezone.utc:
+        return datetime_obj
+    elif tzinfo is None:
+        raise ValueError("fromisoformat: date_string didn't contain tz info")
+
+    if offset_string is not None:
+        _cache_iso_offset(offset_string, datetime_obj.utcoffset())
+    return datetime_obj.astimezone(timezone.utc)
+
+
+def _cache_iso_offset(offset_string: str, offset: Optional[timedelta]) -> None:
+    """
+    Cache a UTC offset seen at the end of a canonical length ISO 8601 string,
+    if the offset string is a plain "+HH:MM" that means exactly that offset.
+    """
+    match = _ISO_OFFSET_PATTERN.fullmatch(offset_string)
+    if match is None:
+        return
+
+    sign, hours, minutes = match.groups()
+    expected = timedelta(hours=int(hours), minutes=int(minutes))
+    if sign == "-":
+        expected = -expected
+
+    if offset == expected:
+        _iso_local_epochs[offset_string] = EPOCH_NAIVE + expected
+
+
+def _parse_many(
+    date_strings: Iterable[str],
+    parse: Callable[[str], datetime],
+    cls: Type[BaseDatetime],
+    array_cls: Any,
+    packed: bool,
+    intern: bool = False,
+) -> ParseResult:
+    """
+    Parse many strings, collecting errors rather than raising them.
+    The common logic of the from_iso_format_many() methods.
+
+    :param date_strings: The strings to parse.
+    :param parse: A function to parse a single string into a valid datetime.
+    :param cls: The type to build from each parsed datetime.
+    :param array_cls: The packed array type of cls.
+    :param packed: Whether to return a packed array, or a list.
+    :param intern: Whether to take the values in a list from the intern pool.
+    :return: A ParseResult of the values and any errors.
+    """
+    errors: Dict[int, Exception] = {}
+
+    if packed:
+        buffer = array("q")
+        append = buffer.append
+        for index, date_string in enumerate(date_strings):
+            try:
+                append(datetime_to_epoch_us(parse(date_string)))
+            except _ROW_ERRORS as e:
+                errors[index] = e
+                append(0)
+        return ParseResult(array_cls.from_epoch_microseconds(buffer), errors)
+    else:
+        build: Callable[[datetime], BaseDatetime] = cls.trusted
+        if intern:
+            build = partial(_intern_datetime, cls, _intern_pool(cls))
+
+        values: List[Optional[BaseDatetime]] = []
+        append_value = values.append
+        for index, date_string in enumerate(date_strings):
+            try:
+                append_value(build(parse(date_string)))
+            except _ROW_ERRORS as e:
+                errors[index] = e
+                append_value(None)
+        return ParseResult(values, errors)
+
+
+# imported last, since the format, rfc, rounding and zone modules depend on the types
+# defined here
+from .format import compile_format  # noqa: E402
+from .rfc import (  # noqa: E402
+    format_http_date,
+    format_rfc2822,
+    format_rfc3339,
+    parse_http_date,
+    parse_rfc2822,
+    parse_rfc3339,
+)
+from .rounding import _ceil, _floor, _round, _round_us  # noqa: E402
+from .zone import get_zone  # noqa: E402
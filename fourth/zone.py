@@ -0,0 +1,629 @@
+"""
+Conversions between LocalDatetime and UTCDatetime through IANA time zones.
+"""
+from __future__ import annotations
+
+__all__ = ("Zone",)
+
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from datetime import timedelta, tzinfo
+from functools import lru_cache
+from importlib import import_module
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from ._internal import EPOCH_UTC, MAX_EPOCH_US, MIN_EPOCH_US, ONE_MICROSECOND
+from .types import (
+    BaseDatetime,
+    LocalDatetime,
+    UTCDatetime,
+    _check_epoch_us,
+    _from_us_many,
+)
+
+if TYPE_CHECKING:
+    from .array import BaseDatetimeArray, LocalDatetimeArray, UTCDatetimeArray
+
+# The options for resolving wall times that happen twice, when the clocks go back.
+_AMBIGUOUS = ("raise", "earlier", "later")
+# The options for resolving wall times that never happen, when the clocks go forward.
+_NONEXISTENT = ("raise", "shift_forward", "shift_backward")
+
+# a horizon after every Datetime, for zones with no transitions left to find
+_NO_HORIZON = MAX_EPOCH_US + 1
+# how far the transition table reaches when a zone is compiled, and how much
+# further it is extended when a conversion goes past it
+_INITIAL_HORIZON = 4_102_444_800_000_000  # 2100-01-01T00:00:00
+_EXTEND_US = 100 * 31_556_952_000_000  # 100 years
+# where transitions are searched from, when the zone's TZif file can't be read
+_FALLBACK_START = -3_786_825_600_000_000  # 1850-01-01T00:00:00
+# POSIX TZ rules repeat every 400 years, the 146097 days of the Gregorian cycle
+_CYCLE_US = 146_097 * 86_400_000_000
+# UTC offsets are checked a week apart when searching for transitions, so
+# transitions that revert within a week are missed. Future transitions follow
+# the zone's POSIX TZ rule, which only changes the offset twice a year.
+_PROBE_STEP_SECONDS = 7 * 86_400
+# zoneinfo can't find UTC offsets in the last days before datetime.max
+_PROBE_LIMIT_SECONDS = MAX_EPOCH_US // 1_000_000 - 2 * 86_400
+# wall times are at most this far from UTC
+_MAX_OFFSET_US = 86_400_000_000
+
+_TZIF_HEADER = struct.Struct(">4sc15x6l")
+
+
+class _ZoneTable(NamedTuple):
+    """
+    The UTC offsets of a zone, as of a horizon.
+
+    Period k is from transitions[k - 1] up to transitions[k], with offsets[k]. The
+    first period has no start, and the last has no end.
+
+    safe_starts[k] and safe_ends[k] bound the wall times that are only in period
+    k + 1 and period k, so between safe_ends[k] and safe_starts[k] are the wall
+    times of the gap or fold made by transitions[k].
+    """
+
+    transitions: List[int]
+    offsets: List[int]
+    safe_starts: List[int]
+    safe_ends: List[int]
+    # the table is only complete for UTC instants before the horizon
+    horizon: int
+
+
+class Zone:
+    """
+    An IANA time zone, like "Australia/Perth", compiled for fast conversions
+    between LocalDatetime and UTCDatetime.
+
+    The zone's transitions are read once from its TZif file, into a sorted table
+    of the instants its UTC offset changes. Converting a value is then a bisect
+    of that table. Converting many values only bisects when a value isn't in the
+    same period as the value before it, and then only the periods after or
+    before that one, so sorted values rarely need a bisect.
+
+    Transitions after those in the TZif file are found from the zoneinfo module,
+    up to the year 2100 at first, and further when a conversion needs them. They
+    follow the zone's POSIX TZ rule, which repeats every 400 years, so after 400
+    years of them the rest are copied rather than found.
+
+    Zones are compiled with the zoneinfo module's tz database, so need Python 3.9,
+    or the backports.zoneinfo package.
+    """
+
+    # Instance Attributes
+
+    _key: str
+    _zone_info: tzinfo
+    _rule_start: int
+    _table: _ZoneTable
+
+    __slots__ = ("_key", "_zone_info", "_rule_start", "_table")
+
+    # Special Methods
+
+    def __init__(self, key: str) -> None:
+        """
+        Compile a time zone.
+
+        :param key: The IANA name of the zone, like "Australia/Perth".
+        :raises zoneinfo.ZoneInfoNotFoundError: When there is no zone with the name.
+        :raises ImportError: When the zoneinfo module isn't available.
+        """
+        self._key = key
+        self._zone_info = _zoneinfo().ZoneInfo(key)
+
+        data = _read_tzif(key)
+        if data is None:
+            transitions: List[int] = []
+            offsets = [self._probe(_FALLBACK_START // 1_000_000)]
+            horizon = _FALLBACK_START
+            # the transitions can't be known to follow a rule
+            self._rule_start = _NO_HORIZON
+        else:
+            transitions, offsets, has_rule = _parse_tzif(data)
+            if not has_rule:
+                horizon = _NO_HORIZON
+            elif transitions:
+                horizon = transitions[-1]
+            else:
+                horizon = _FALLBACK_START
+            self._rule_start = horizon
+
+        self._table = _build_table(transitions, offsets, horizon)
+        if horizon < _INITIAL_HORIZON:
+            self._extend(_INITIAL_HORIZON)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._key!r})"
+
+    # Instance Properties
+
+    @property
+    def key(self) -> str:
+        """
+        The IANA name of the zone.
+        """
+        return self._key
+
+    # Instance Methods
+
+    def to_local(self, value: UTCDatetime) -> LocalDatetime:
+        """
+        Return the wall time in the zone at a UTC instant.
+
+        :param value: The UTCDatetime to convert.
+        :return: The LocalDatetime of the wall time.
+        :raises TypeError: When the value isn't a UTCDatetime.
+        :raises OverflowError: When the wall time is out of range.
+        """
+        us = _check_type(value, UTCDatetime)._us
+        table = self._table
+        if us >= table.horizon:
+            table = self._table_until(us)
+        local = us + table.offsets[bisect_right(table.transitions, us)]
+        return LocalDatetime._from_us(_check_epoch_us(local))
+
+    def to_utc(
+        self,
+        value: LocalDatetime,
+        *,
+        ambiguous: str = "raise",
+        nonexistent: str = "raise",
+    ) -> UTCDatetime:
+        """
+        Return the UTC instant of a wall time in the zone.
+
+        When the clocks go back, the wall times in between happen twice, so are
+        ambiguous. When the clocks go forward, the wall times in between never
+        happen, so don't exist.
+
+        :param value: The LocalDatetime of the wall time to convert.
+        :param ambiguous: How to convert an ambiguous wall time. "raise" to raise
+            a ValueError, "earlier" for the first time it happens, "later" for
+            the second time.
+        :param nonexistent: How to convert a wall time that doesn't exist. "raise"
+            to raise a ValueError, "shift_forward" for the instant the clocks go
+            forward, "shift_backward" for the last microsecond before that.
+        :return: The UTCDatetime of the instant.
+        :raises TypeError: When the value isn't a LocalDatetime.
+        :raises ValueError: When the wall time is ambiguous or doesn't exist, and
+            that is set to "raise".
+        :raises OverflowError: When the UTC instant is out of range.
+        """
+        _check_options(ambiguous, nonexistent)
+        wall = _check_type(value, LocalDatetime)._us
+        table = self._table_until(wall + _MAX_OFFSET_US)
+
+        period = bisect_right(table.safe_starts, wall)
+        if period == len(table.transitions) or wall < table.safe_ends[period]:
+            us = wall - table.offsets[period]
+        else:
+            us = self._resolve(table, period, wall, ambiguous, nonexistent)
+
+        return UTCDatetime._from_us(_check_epoch_us(us))
+
+    def to_local_many(
+        self, values: Iterable[UTCDatetime], *, packed: bool = False
+    ) -> Union[List[LocalDatetime], LocalDatetimeArray]:
+        """
+        Convert many UTC instants to wall times in the zone, as to_local() would.
+        This is fastest when the values are sorted.
+
+        :param values: The UTCDatetimes to convert. Can be a UTCDatetimeArray.
+        :param packed: If True, return a LocalDatetimeArray rather than a list.
+        :return: The LocalDatetimes of the wall times, in the same order.
+        :raises TypeError: When a value isn't a UTCDatetime.
+        :raises OverflowError: When a wall time is out of range.
+        """
+        from .array import LocalDatetimeArray, UTCDatetimeArray
+
+        source = _us_many(values, UTCDatetime, UTCDatetimeArray)
+        result: List[int] = []
+        if source:
+            table = self._table_until(max(source))
+            result = _shift_many(source, table.transitions, table.offsets)
+            _check_epoch_us(min(result))
+            _check_epoch_us(max(result))
+        if packed:
+            return LocalDatetimeArray._from_view(memoryview(array("q", result)))
+        return list(_from_us_many(LocalDatetime, result))
+
+    def to_utc_many(
+        self,
+        values: Iterable[LocalDatetime],
+        *,
+        ambiguous: str = "raise",
+        nonexistent: str = "raise",
+        packed: bool = False,
+    ) -> Union[List[UTCDatetime], UTCDatetimeArray]:
+        """
+        Convert many wall times in the zone to UTC instants, as to_utc() would.
+        This is fastest when the values are sorted.
+
+        :param values: The LocalDatetimes to convert. Can be a LocalDatetimeArray.
+        :param ambiguous: How to convert ambiguous wall times, as for to_utc().
+        :param nonexistent: How to convert wall times that don't exist, as for
+            to_utc().
+        :param packed: If True, return a UTCDatetimeArray rather than a list.
+        :return: The UTCDatetimes of the instants, in the same order.
+        :raises TypeError: When a value isn't a LocalDatetime.
+        :raises ValueError: When a wall time is ambiguous or doesn't exist, and
+            that is set to "raise".
+        :raises OverflowError: When a UTC instant is out of range.
+        """
+        from .array import LocalDatetimeArray, UTCDatetimeArray
+
+        _check_options(ambiguous, nonexistent)
+        source = _us_many(values, LocalDatetime, LocalDatetimeArray)
+        result: List[int] = []
+        if source:
+            result = self._unshift_many(source, ambiguous, nonexistent)
+            _check_epoch_us(min(result))
+            _check_epoch_us(max(result))
+        if packed:
+            return UTCDatetimeArray._from_view(memoryview(array("q", result)))
+        return list(_from_us_many(UTCDatetime, result))
+
+    def _unshift_many(
+        self, source: Sequence[int], ambiguous: str, nonexistent: str
+    ) -> List[int]:
+        """
+        Return the UTC instant of each wall time.
+        """
+        table = self._table_until(max(source) + _MAX_OFFSET_US)
+        offsets, safe_starts, safe_ends = (
+            table.offsets,
+            table.safe_starts,
+            table.safe_ends,
+        )
+        last = len(safe_starts)
+        result: List[int] = []
+        append = result.append
+
+        # the wall times only in the current period are [start, end)
+        period, offset = 0, offsets[0]
+        start, end = MIN_EPOCH_US, safe_ends[0] if last else _NO_HORIZON
+        for wall in source:
+            if not start <= wall < end:
+                # only bisect the periods after or before the current one
+                if wall >= end:
+                    period = bisect_right(safe_starts, wall, period)
+                else:
+                    period = bisect_right(safe_starts, wall, 0, period)
+                start = safe_starts[period - 1] if period else MIN_EPOCH_US
+                end = safe_ends[period] if period < last else _NO_HORIZON
+                offset = offsets[period]
+                if wall >= end:
+                    # in the gap or fold at the end of the period
+                    append(self._resolve(table, period, wall, ambiguous, nonexistent))
+                    continue
+            append(wall - offset)
+
+        return result
+
+    def _table_until(self, us: int) -> _ZoneTable:
+        """
+        Return the table, extending it first if it doesn't reach a UTC instant.
+        Instants after the range of Datetimes need the table to reach the end
+        of the range.
+        """
+        table = self._table
+        us = min(us, MAX_EPOCH_US)
+        while us >= table.horizon:
+            table = self._extend(us)
+        return table
+
+    def _extend(self, until: int) -> _ZoneTable:
+        """
+        Find the transitions from the horizon towards a UTC instant, by checking
+        the zone's UTC offset a week apart, then bisecting to the second where it
+        changes. Once 400 years of transitions follow the zone's rule, copy the
+        transitions from 400 years before instead.
+
+        The new table is swapped in all at once, so conversions on other threads
+        always see a complete table.
+
+        :return: The new table, which may not reach the instant yet.
+        """
+        table = self._table
+        transitions, offsets = list(table.transitions), list(table.offsets)
+        target = max(until + 1, table.horizon + _EXTEND_US)
+
+        if table.horizon - self._rule_start >= _CYCLE_US:
+            horizon = min(target, _NO_HORIZON)
+            index = bisect_right(transitions, table.horizon - _CYCLE_US)
+            while index < len(transitions):
+                at = transitions[index] + _CYCLE_US
+                if at >= horizon:
+                    break
+                transitions.append(at)
+                offsets.append(offsets[index + 1])
+                index += 1
+        else:
+            target = min(target, self._rule_start + _CYCLE_US)
+            start = table.horizon // 1_000_000
+            end = min(-(-target // 1_000_000), _PROBE_LIMIT_SECONDS)
+            current = offsets[-1]
+            while start < end:
+                step = min(start + _PROBE_STEP_SECONDS, end)
+                if self._probe(step) == current:
+                    start = step
+                    continue
+
+                # the offset changes after start, by step
+                low, high = start, step
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._probe(middle) == current:
+                        low = middle
+                    else:
+                        high = middle
+                current = self._probe(high)
+                transitions.append(high * 1_000_000)
+                offsets.append(current)
+                start = high
+            horizon = _NO_HORIZON if end == _PROBE_LIMIT_SECONDS else end * 1_000_000
+
+        self._table = table = _build_table(transitions, offsets, horizon)
+        return table
+
+    def _probe(self, seconds: int) -> int:
+        """
+        Return the UTC offset in microseconds at seconds since the epoch, from
+        zoneinfo.
+        """
+        at = (EPOCH_UTC + timedelta(seconds=seconds)).astimezone(self._zone_info)
+        return at.utcoffset() // ONE_MICROSECOND  # type: ignore[operator]
+
+    def _resolve(
+        self,
+        table: _ZoneTable,
+        transition: int,
+        wall: int,
+        ambiguous: str,
+        nonexistent: str,
+    ) -> int:
+        """
+        Return the UTC instant of a wall time in the gap or fold of a transition.
+
+        :raises ValueError: When the option for the wall time is "raise".
+        """
+        at = table.transitions[transition]
+        before, after = table.offsets[transition], table.offsets[transition + 1]
+
+        if after > before:
+            if nonexistent == "shift_forward":
+                return at
+            elif nonexistent == "shift_backward":
+                return at - 1
+            raise ValueError(
+                f"{LocalDatetime._from_us(wall)!r} doesn't exist in {self._key}"
+            )
+        else:
+            if ambiguous == "earlier":
+                return wall - before
+            elif ambiguous == "later":
+                return wall - after
+            raise ValueError(
+                f"{LocalDatetime._from_us(wall)!r} is ambiguous in {self._key}"
+            )
+
+
+@lru_cache(maxsize=None)
+def get_zone(key: str) -> Zone:
+    """
+    Return the compiled Zone for an IANA zone name, from a cache.
+
+    :param key: The IANA name of the zone, like "Australia/Perth".
+    :return: The compiled Zone.
+    """
+    return Zone(key)
+
+
+def _zoneinfo() -> Any:
+    """
+    Return the zoneinfo module, or its backport.
+
+    :raises ImportError: When neither is available.
+    """
+    for name in ("zoneinfo", "backports.zoneinfo"):
+        try:
+            return import_module(name)
+        except ImportError:
+            pass
+    raise ImportError(
+        "time zones need the zoneinfo module, from Python 3.9, "
+        "or the backports.zoneinfo package"
+    )
+
+
+def _read_tzif(key: str) -> Optional[bytes]:
+    """
+    Read the TZif file of a zone from the places zoneinfo looks for it.
+
+    :return: The file's contents, or None if it can't be found.
+    """
+    for directory in _zoneinfo().TZPATH:
+        path = os.path.join(directory, *key.split("/"))
+        if os.path.isfile(path):
+            with open(path, "rb") as file:
+                return file.read()
+
+    try:
+        from importlib.resources import files
+    except ImportError:
+        return None
+    *packages, resource = key.split("/")
+    try:
+        return (
+            files(".".join(["tzdata.zoneinfo", *packages]))
+            .joinpath(resource)
+            .read_bytes()
+        )
+    except (ImportError, OSError):
+        return None
+
+
+def _parse_tzif(data: bytes) -> Tuple[List[int], List[int], bool]:
+    """
+    Parse the transitions from a TZif file, as described by RFC 8536.
+
+    :return: The UTC instants the offset changes and the offsets, in
+        microseconds, as for _ZoneTable, and whether the file has a POSIX TZ
+        rule with more transitions after the last one.
+    :raises ValueError: When the data isn't a TZif file.
+    """
+    magic, version, *counts = _TZIF_HEADER.unpack_from(data)
+    if magic != b"TZif":
+        raise ValueError("data is not a TZif file")
+    offset = _TZIF_HEADER.size
+    time_format = "l"
+
+    if version != b"\x00":
+        # skip the version 1 data, for the version 2 data with 64 bit times
+        (
+            is_ut_count,
+            is_std_count,
+            leap_count,
+            time_count,
+            type_count,
+            char_count,
+        ) = counts
+        offset += (
+            time_count * 5
+            + type_count * 6
+            + char_count
+            + leap_count * 8
+            + is_std_count
+            + is_ut_count
+        )
+        _, _, *counts = _TZIF_HEADER.unpack_from(data, offset)
+        offset += _TZIF_HEADER.size
+        time_format = "q"
+
+    is_ut_count, is_std_count, leap_count, time_count, type_count, char_count = counts
+    times = struct.unpack_from(f">{time_count}{time_format}", data, offset)
+    offset += time_count * struct.calcsize(time_format)
+    type_indexes = struct.unpack_from(f">{time_count}B", data, offset)
+    offset += time_count
+    type_offsets = [
+        struct.unpack_from(">l", data, offset + 6 * index)[0] * 1_000_000
+        for index in range(type_count)
+    ]
+    offset += (
+        type_count * 6
+        + char_count
+        + leap_count * (12 if time_format == "q" else 8)
+        + is_std_count
+        + is_ut_count
+    )
+
+    # before the first transition is the first type
+    transitions: List[int] = []
+    offsets = [type_offsets[0]]
+    for seconds, index in zip(times, type_indexes):
+        at = seconds * 1_000_000
+        if at > MAX_EPOCH_US:
+            break
+        if at < MIN_EPOCH_US:
+            offsets[0] = type_offsets[index]
+        elif type_offsets[index] != offsets[-1]:
+            # only keep transitions that change the offset
+            transitions.append(at)
+            offsets.append(type_offsets[index])
+
+    # the footer holds a POSIX TZ string, with a comma when it has DST rules
+    footer = data[offset:].strip().split(b"\n")[0] if version != b"\x00" else b""
+    return transitions, offsets, b"," in footer
+
+
+def _build_table(
+    transitions: List[int], offsets: List[int], horizon: int
+) -> _ZoneTable:
+    pairs = list(zip(offsets, offsets[1:]))
+    return _ZoneTable(
+        transitions,
+        offsets,
+        [at + max(pair) for at, pair in zip(transitions, pairs)],
+        [at + min(pair) for at, pair in zip(transitions, pairs)],
+        horizon,
+    )
+
+
+def _shift_many(
+    source: Sequence[int], transitions: List[int], offsets: List[int]
+) -> List[int]:
+    """
+    Return each UTC instant plus the UTC offset at that instant.
+    """
+    last = len(transitions)
+    result: List[int] = []
+    append = result.append
+
+    # the instants in the current period are [start, end)
+    period, offset = 0, offsets[0]
+    start, end = MIN_EPOCH_US, transitions[0] if last else _NO_HORIZON
+    for us in source:
+        if not start <= us < end:
+            # only bisect the periods after or before the current one
+            if us >= end:
+                period = bisect_right(transitions, us, period + 1)
+            else:
+                period = bisect_right(transitions, us, 0, period)
+            start = transitions[period - 1] if period else MIN_EPOCH_US
+            end = transitions[period] if period < last else _NO_HORIZON
+            offset = offsets[period]
+        append(us + offset)
+
+    return result
+
+
+def _check_options(ambiguous: str, nonexistent: str) -> None:
+    if ambiguous not in _AMBIGUOUS:
+        raise ValueError(
+            f"ambiguous must be one of {', '.join(map(repr, _AMBIGUOUS))}, "
+            f"not {ambiguous!r}"
+        )
+    if nonexistent not in _NONEXISTENT:
+        raise ValueError(
+            f"nonexistent must be one of {', '.join(map(repr, _NONEXISTENT))}, "
+            f"not {nonexistent!r}"
+        )
+
+
+def _check_type(value: Any, cls: Type[BaseDatetime]) -> Any:
+    if not isinstance(value, cls):
+        raise TypeError(f"expected {cls.__name__}, not '{type(value).__name__}'")
+    return value
+
+
+def _us_many(
+    values: Iterable[BaseDatetime],
+    cls: Type[BaseDatetime],
+    array_type: Type[BaseDatetimeArray[Any]],
+) -> Sequence[int]:
+    """
+    Return the microseconds since the epoch of many values of a Datetime type.
+
+    :raises TypeError: When a value isn't the type.
+    """
+    if isinstance(values, array_type):
+        return values._data
+    values = list(values)
+    for value in values:
+        _check_type(value, cls)
+    return [value._us for value in values]
@@ -0,0 +1,513 @@
+from __future__ import annotations
+
+import datetime as datetime_module
+import pickle
+from array import array
+from datetime import datetime, timedelta, timezone
+
+from fourth import (
+    LocalDatetime,
+    LocalDatetimeArray,
+    LocalDatetimeRange,
+    UTCDatetime,
+    UTCDatetimeArray,
+    UTCDatetimeRange,
+)
+from fourth.array import BaseDatetimeArray, BaseDatetimeRange
+
+from . import FourthTestCase
+
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class UTCDatetimeArrayTests(FourthTestCase):
+    def setUp(self):
+        self.values = [
+            UTCDatetime.at(2020, 1, 1),
+            UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6),
+            UTCDatetime.at(1969, 12, 31, 23, 59, 59, 999999),
+            UTCDatetime.at(2038, 1, 19, 3, 14, 8),
+        ]
+        self.array = UTCDatetimeArray(self.values)
+
+    def test_slots(self):
+        self.assertEqual(BaseDatetimeArray.__slots__, ("_data",))
+        self.assertEqual(UTCDatetimeArray.__slots__, ())
+
+    def test_init_empty(self):
+        foo = UTCDatetimeArray()
+
+        self.assertEqual(len(foo), 0)
+        self.assertEqual(list(foo), [])
+
+    def test_init_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError, r"^UTCDatetimeArray can only store UTCDatetime, not 'datetime'$"
+        ):
+            UTCDatetimeArray([datetime.now(timezone.utc)])
+
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^UTCDatetimeArray can only store UTCDatetime, not 'LocalDatetime'$",
+        ):
+            UTCDatetimeArray([LocalDatetime.now()])
+
+    def test_len(self):
+        self.assertEqual(len(self.array), 4)
+
+    def test_getitem(self):
+        for i, value in enumerate(self.values):
+            self.assertIsInstance(self.array[i], UTCDatetime)
+            self.assertEqual(self.array[i], value)
+
+        self.assertEqual(self.array[-1], self.values[-1])
+
+        with self.assertRaises(IndexError):
+            self.array[4]
+
+    def test_slice_is_view(self):
+        buffer = array("q", [0, 1_000_000, 2_000_000, 3_000_000])
+        foo = UTCDatetimeArray.from_epoch_microseconds(buffer)
+        bar = foo[1:3]
+
+        self.assertIsInstance(bar, UTCDatetimeArray)
+        self.assertEqual(list(bar), [UTCDatetime.from_timestamp(1), foo[2]])
+
+        buffer[1] = 5_000_000
+        self.assertEqual(bar[0], UTCDatetime.from_timestamp(5))
+
+    def test_slice_step(self):
+        self.assertEqual(list(self.array[::-2]), self.values[::-2])
+
+    def test_iter(self):
+        self.assertEqual(list(self.array), self.values)
+
+    def test_reversed(self):
+        self.assertEqual(list(reversed(self.array)), self.values[::-1])
+
+    def test_contains(self):
+        self.assertIn(UTCDatetime.at(2020, 1, 1), self.array)
+        self.assertNotIn(UTCDatetime.at(2020, 1, 3), self.array)
+        self.assertNotIn(LocalDatetime.at(2020, 1, 1), self.array)
+        self.assertNotIn("foo", self.array)
+
+    def test_count_and_index(self):
+        foo = UTCDatetimeArray(self.values + self.values[:1])
+
+        self.assertEqual(foo.count(self.values[0]), 2)
+        self.assertEqual(foo.count(self.values[1]), 1)
+        self.assertEqual(foo.count(LocalDatetime.at(2020, 1, 1)), 0)
+        self.assertEqual(foo.index(self.values[0]), 0)
+        self.assertEqual(foo.index(self.values[0], 1), 4)
+
+        with self.assertRaises(ValueError):
+            foo.index(UTCDatetime.at(2000, 1, 1))
+
+    def test_repr(self):
+        foo = UTCDatetimeArray(self.values[:2])
+
+        self.assertEqual(
+            repr(foo),
+            "UTCDatetimeArray([UTCDatetime.at(2020, 1, 1, 0, 0, 0, 0), "
+            "UTCDatetime.at(2020, 1, 2, 3, 4, 5, 6)])",
+        )
+        self.assertEqual(list(eval(repr(foo))), list(foo))
+
+    def test_repr_long(self):
+        foo = UTCDatetimeArray.from_epoch_microseconds(range(10))
+
+        self.assertRegex(
+            repr(foo), r"^UTCDatetimeArray\(\[(UTCDatetime\.at\(.*?\), ){3}\.\.\., "
+        )
+
+    def test_from_epoch_microseconds_no_copy(self):
+        buffer = array("q", [0, 1])
+        foo = UTCDatetimeArray.from_epoch_microseconds(buffer)
+
+        self.assertEqual(foo[0], UTCDatetime.at(1970, 1, 1))
+        buffer[0] = 86_400_000_000
+        self.assertEqual(foo[0], UTCDatetime.at(1970, 1, 2))
+
+    def test_from_epoch_microseconds_bytes(self):
+        raw = array("q", [0, 1]).tobytes()
+        foo = UTCDatetimeArray.from_epoch_microseconds(raw)
+
+        self.assertEqual(
+            list(foo),
+            [UTCDatetime.at(1970, 1, 1), UTCDatetime.at(1970, 1, 1, microsecond=1)],
+        )
+
+    def test_from_epoch_microseconds_exceptions(self):
+        with self.assertRaisesRegex(TypeError, r"^can't view a buffer with format 'd'"):
+            UTCDatetimeArray.from_epoch_microseconds(array("d", [0.0]))
+
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetimeArray.from_epoch_microseconds([2 ** 62])
+
+    def test_to_epoch_microseconds(self):
+        foo = self.array.to_epoch_microseconds()
+
+        self.assertIsInstance(foo, array)
+        self.assertEqual(foo[0], 1_577_836_800_000_000)
+        self.assertEqual(foo[2], -1)
+
+    def test_from_epoch_units(self):
+        self.assertEqual(
+            list(UTCDatetimeArray.from_epoch_seconds(array("q", [0, -1]))),
+            [UTCDatetime.at(1970, 1, 1), UTCDatetime.at(1969, 12, 31, 23, 59, 59)],
+        )
+        self.assertEqual(
+            list(UTCDatetimeArray.from_epoch_milliseconds([1_500])),
+            [UTCDatetime.at(1970, 1, 1, 0, 0, 1, 500_000)],
+        )
+        self.assertEqual(
+            list(UTCDatetimeArray.from_epoch_nanoseconds(iter([1_999, -1]))),
+            [
+                UTCDatetime.at(1970, 1, 1, microsecond=1),
+                UTCDatetime.at(1969, 12, 31, 23, 59, 59, 999_999),
+            ],
+        )
+        self.assertEqual(len(UTCDatetimeArray.from_epoch_seconds([])), 0)
+
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetimeArray.from_epoch_seconds([UTCDatetime.max._us // 1_000_000 + 1])
+
+    def test_to_epoch_units(self):
+        self.assertEqual(
+            list(self.array.to_epoch_seconds()),
+            [1_577_836_800, 1_577_934_245, -1, 2_147_483_648],
+        )
+        self.assertEqual(
+            list(self.array.to_epoch_milliseconds()),
+            [1_577_836_800_000, 1_577_934_245_000, -1, 2_147_483_648_000],
+        )
+        self.assertEqual(
+            list(self.array.to_epoch_nanoseconds()),
+            [
+                1_577_836_800_000_000_000,
+                1_577_934_245_000_006_000,
+                -1_000,
+                2_147_483_648_000_000_000,
+            ],
+        )
+
+        with self.assertRaisesRegex(
+            OverflowError, r"^date value out of range for nanoseconds$"
+        ):
+            UTCDatetimeArray([UTCDatetime.max]).to_epoch_nanoseconds()
+
+    def test_compare_scalar(self):
+        pivot = UTCDatetime.at(2020, 1, 1)
+
+        self.assertEqual(self.array < pivot, [False, False, True, False])
+        self.assertEqual(self.array <= pivot, [True, False, True, False])
+        self.assertEqual(self.array > pivot, [False, True, False, True])
+        self.assertEqual(self.array >= pivot, [True, True, False, True])
+        self.assertEqual(self.array == pivot, [True, False, False, False])
+        self.assertEqual(self.array != pivot, [False, True, True, True])
+
+    def test_compare_aware_datetime(self):
+        pivot = datetime(2020, 1, 1, 8, tzinfo=timezone(timedelta(hours=8)))
+
+        self.assertEqual(self.array == pivot, [True, False, False, False])
+
+    def test_compare_array(self):
+        other = UTCDatetimeArray(reversed(self.values))
+
+        self.assertEqual(self.array < other, [True, False, True, False])
+        self.assertEqual(self.array == other, [False] * 4)
+
+        with self.assertRaisesRegex(ValueError, r"^operands have different lengths"):
+            self.array < other[1:]
+
+    def test_compare_not_implemented(self):
+        with self.assertRaises(TypeError):
+            self.array < LocalDatetime.at(2020, 1, 1)
+        with self.assertRaises(TypeError):
+            self.array < datetime(2020, 1, 1)
+
+        self.assertIs(self.array.__eq__(1), NotImplemented)
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(self.array)
+
+    def test_add(self):
+        foo = self.array + timedelta(days=1, microseconds=1)
+
+        self.assertIsInstance(foo, UTCDatetimeArray)
+        self.assertEqual(
+            list(foo), [v + timedelta(days=1, microseconds=1) for v in self.values]
+        )
+        self.assertEqual(
+            list(timedelta(hours=1) + self.array),
+            [v + timedelta(hours=1) for v in self.values],
+        )
+
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            self.array + timedelta(days=3_000_000)
+
+        with self.assertRaises(TypeError):
+            self.array + 1
+
+    def test_sub(self):
+        foo = self.array - timedelta(minutes=1)
+        self.assertIsInstance(foo, UTCDatetimeArray)
+        self.assertEqual(list(foo), [v - timedelta(minutes=1) for v in self.values])
+
+        bar = self.array - UTCDatetime.at(2020, 1, 1)
+        self.assertIsInstance(bar, array)
+        self.assertEqual(
+            list(bar),
+            [(v - self.values[0]) // timedelta(microseconds=1) for v in self.values],
+        )
+
+        baz = self.array - self.array
+        self.assertEqual(list(baz), [0, 0, 0, 0])
+
+        with self.assertRaises(TypeError):
+            self.array - LocalDatetime.at(2020, 1, 1)
+
+    def test_pickle(self):
+        for protocol in range(0, pickle.HIGHEST_PROTOCOL + 1):
+            foo = pickle.loads(pickle.dumps(self.array, protocol=protocol))
+            self.assertIsInstance(foo, UTCDatetimeArray)
+            self.assertEqual(list(foo), self.values)
+
+        bar = pickle.loads(pickle.dumps(self.array[1::2]))
+        self.assertEqual(list(bar), self.values[1::2])
+
+
+class LocalDatetimeArrayTests(FourthTestCase):
+    def setUp(self):
+        self.values = [
+            LocalDatetime.at(2020, 1, 1),
+            LocalDatetime.at(1900, 2, 3, 4, 5, 6, 7),
+            LocalDatetime.at(2020, 1, 1, 0, 0, 0, 1),
+        ]
+        self.array = LocalDatetimeArray(self.values)
+
+    def test_slots(self):
+        self.assertEqual(LocalDatetimeArray.__slots__, ())
+
+    def test_init_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^LocalDatetimeArray can only store LocalDatetime, not 'UTCDatetime'$",
+        ):
+            LocalDatetimeArray([UTCDatetime.now()])
+
+    def test_getitem_and_iter(self):
+        self.assertIsInstance(self.array[0], LocalDatetime)
+        self.assertEqual(list(self.array), self.values)
+        self.assertEqual(list(self.array[1:]), self.values[1:])
+
+    def test_to_epoch_microseconds(self):
+        self.assertEqual(
+            list(self.array.to_epoch_microseconds()),
+            [1_577_836_800_000_000, -2_206_122_893_999_993, 1_577_836_800_000_001],
+        )
+
+    def test_compare(self):
+        pivot = LocalDatetime.at(2020, 1, 1)
+
+        self.assertEqual(self.array < pivot, [False, True, False])
+        self.assertEqual(self.array == datetime(2020, 1, 1), [True, False, False])
+
+        with self.assertRaises(TypeError):
+            self.array < UTCDatetime.at(2020, 1, 1)
+        with self.assertRaises(TypeError):
+            self.array < datetime(2020, 1, 1, tzinfo=timezone.utc)
+        with self.assertRaises(TypeError):
+            self.array < UTCDatetimeArray([UTCDatetime.at(2020, 1, 1)] * 3)
+
+    def test_arithmetic(self):
+        foo = self.array + timedelta(days=1)
+
+        self.assertIsInstance(foo, LocalDatetimeArray)
+        self.assertEqual(list(foo), [v + timedelta(days=1) for v in self.values])
+        self.assertEqual(list(self.array - self.array), [0, 0, 0])
+        self.assertEqual(
+            list(self.array - datetime(2020, 1, 1)), [0, -3_783_959_693_999_993, 1]
+        )
+
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            self.array - timedelta(days=800_000)
+
+    def test_pickle(self):
+        foo = pickle.loads(pickle.dumps(self.array))
+
+        self.assertIsInstance(foo, LocalDatetimeArray)
+        self.assertEqual(list(foo), self.values)
+
+
+class UTCDatetimeRangeTests(FourthTestCase):
+    def setUp(self):
+        self.start = UTCDatetime.at(2020, 1, 1)
+        self.stop = UTCDatetime.at(2020, 1, 2)
+        self.step = timedelta(hours=1)
+        self.range = UTCDatetime.range(self.start, self.stop, self.step)
+        self.expected = [self.start + self.step * i for i in range(24)]
+
+    def test_slots(self):
+        self.assertEqual(BaseDatetimeRange.__slots__, ("_range",))
+        self.assertEqual(UTCDatetimeRange.__slots__, ())
+
+    def test_init(self):
+        self.assertIsInstance(self.range, UTCDatetimeRange)
+        self.assertEqual(UTCDatetimeRange(self.start, self.stop, self.step), self.range)
+        self.assertEqual(self.range.step, self.step)
+        self.assertEqual(list(self.range), self.expected)
+
+    def test_init_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^UTCDatetimeRange start and stop must be UTCDatetime, "
+            r"not 'LocalDatetime'$",
+        ):
+            UTCDatetime.range(self.start, LocalDatetime.at(2020, 1, 2), self.step)
+        with self.assertRaisesRegex(
+            TypeError, r"^UTCDatetimeRange step must be timedelta, not 'int'$"
+        ):
+            UTCDatetime.range(self.start, self.stop, 1)
+        with self.assertRaisesRegex(
+            ValueError, r"^UTCDatetimeRange step must not be zero$"
+        ):
+            UTCDatetime.range(self.start, self.stop, timedelta(0))
+
+    def test_len(self):
+        self.assertEqual(len(self.range), 24)
+        self.assertEqual(len(UTCDatetime.range(self.stop, self.start, self.step)), 0)
+        self.assertEqual(
+            len(UTCDatetime.range(UTCDatetime.min, UTCDatetime.max, ONE_MICROSECOND)),
+            UTCDatetime.max._us - UTCDatetime.min._us,
+        )
+
+    def test_getitem(self):
+        self.assertEqual(self.range[0], self.start)
+        self.assertEqual(self.range[5], self.expected[5])
+        self.assertEqual(self.range[-1], self.expected[-1])
+        self.assertIsInstance(self.range[0], UTCDatetime)
+
+        with self.assertRaises(IndexError):
+            self.range[24]
+
+    def test_slice(self):
+        for index in (
+            slice(None),
+            slice(2, 5),
+            slice(None, None, 3),
+            slice(None, None, -1),
+            slice(-3, 2, -2),
+            slice(30, 40),
+        ):
+            with self.subTest(index=index):
+                result = self.range[index]
+
+                self.assertIsInstance(result, UTCDatetimeRange)
+                self.assertEqual(list(result), self.expected[index])
+
+    def test_reversed(self):
+        self.assertEqual(list(reversed(self.range)), self.expected[::-1])
+
+    def test_negative_step(self):
+        foo = UTCDatetime.range(self.stop, self.start, -self.step)
+
+        self.assertEqual(list(foo), [self.stop - self.step * i for i in range(24)])
+
+    def test_contains(self):
+        self.assertIn(self.start, self.range)
+        self.assertIn(self.expected[-1], self.range)
+        self.assertNotIn(self.stop, self.range)
+        self.assertNotIn(self.start + timedelta(minutes=30), self.range)
+        self.assertNotIn(LocalDatetime.at(2020, 1, 1), self.range)
+        self.assertNotIn(self.start.as_datetime(), self.range)
+
+    def test_count_and_index(self):
+        self.assertEqual(self.range.count(self.expected[3]), 1)
+        self.assertEqual(self.range.count(self.stop), 0)
+        self.assertEqual(self.range.count(LocalDatetime.at(2020, 1, 1)), 0)
+        self.assertEqual(self.range.index(self.expected[3]), 3)
+        self.assertEqual(self.range.index(self.expected[3], 2, 4), 3)
+        self.assertEqual(self.range.index(self.expected[3], -22), 3)
+
+        for args in ((self.stop,), (self.expected[3], 4), (self.expected[3], 0, -21)):
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    self.range.index(*args)
+
+    def test_eq_and_hash(self):
+        other = UTCDatetime.range(
+            self.start, self.stop - timedelta(minutes=1), self.step
+        )
+        empty = UTCDatetime.range(self.stop, self.start, self.step)
+
+        self.assertSymmetricEqual(self.range, other)
+        self.assertEqual(hash(self.range), hash(other))
+        self.assertSymmetricEqual(empty, self.range[30:])
+        self.assertSymmetricNotEqual(self.range, self.range[1:])
+        self.assertSymmetricNotEqual(self.range, self.expected)
+
+    def test_repr(self):
+        for foo in (
+            self.range,
+            self.range[::-1],
+            self.range[5:5],
+            UTCDatetime.range(UTCDatetime.max, self.start, -timedelta(days=1000)),
+        ):
+            with self.subTest(foo=foo):
+                self.assertEqual(
+                    eval(repr(foo), {**globals(), "datetime": datetime_module}), foo
+                )
+
+        self.assertEqual(
+            repr(self.range),
+            "UTCDatetimeRange(UTCDatetime.at(2020, 1, 1, 0, 0, 0, 0), "
+            "UTCDatetime.at(2020, 1, 2, 0, 0, 0, 0), "
+            "datetime.timedelta(seconds=3600))",
+        )
+
+    def test_repr_at_limits(self):
+        foo = UTCDatetime.range(
+            UTCDatetime.min, UTCDatetime.min + 3 * ONE_MICROSECOND, ONE_MICROSECOND
+        )
+
+        self.assertRegex(
+            repr(foo[::-1]),
+            r"^UTCDatetimeRange\(\[UTCDatetime\.at\(1, 1, 1, 0, 0, 0, 2\), \.\.\., "
+            r"UTCDatetime\.at\(1, 1, 1, 0, 0, 0, 0\)\], ",
+        )
+
+    def test_to_array(self):
+        array_ = self.range.to_array()
+
+        self.assertIsInstance(array_, UTCDatetimeArray)
+        self.assertEqual(list(array_), self.expected)
+        self.assertEqual(
+            self.range.to_epoch_microseconds(),
+            array("q", (value._us for value in self.expected)),
+        )
+
+    def test_pickle(self):
+        for foo in (self.range, self.range[::-1]):
+            with self.subTest(foo=foo):
+                self.assertEqual(pickle.loads(pickle.dumps(foo)), foo)
+
+
+class LocalDatetimeRangeTests(FourthTestCase):
+    def test_range(self):
+        start = LocalDatetime.at(2020, 1, 1)
+        foo = LocalDatetime.range(
+            start, LocalDatetime.at(2020, 1, 8), timedelta(days=2)
+        )
+
+        self.assertIsInstance(foo, LocalDatetimeRange)
+        self.assertEqual(list(foo), [start + timedelta(days=2 * i) for i in range(4)])
+        self.assertIsInstance(foo.to_array(), LocalDatetimeArray)
+        self.assertNotIn(UTCDatetime.at(2020, 1, 1), foo)
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^LocalDatetimeRange start and stop must be LocalDatetime, "
+            r"not 'UTCDatetime'$",
+        ):
+            LocalDatetime.range(start, UTCDatetime.at(2020, 1, 2), timedelta(days=1))
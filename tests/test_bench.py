@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest import TestCase
+
+from fourth.bench import (
+    Benchmark,
+    BenchmarkResult,
+    MemoryBenchmark,
+    MemoryResult,
+    compare_results,
+    measure_memory,
+    results_from_json,
+    results_to_json,
+    run_benchmarks,
+)
+from fourth.bench.__main__ import main
+from fourth.bench.cases import all_benchmarks, memory_benchmarks
+
+
+class BenchmarkResultTests(TestCase):
+    def test_ratio(self):
+        self.assertEqual(BenchmarkResult("foo", 300.0, 100.0).ratio, 3.0)
+        self.assertIsNone(BenchmarkResult("foo", 300.0, None).ratio)
+
+
+class RunBenchmarksTests(TestCase):
+    def test_run_benchmarks(self):
+        calls = []
+        progress = []
+
+        results = run_benchmarks(
+            [
+                Benchmark("foo", lambda: calls.append("fourth"), list),
+                Benchmark("bar", dict, None),
+            ],
+            repeat=2,
+            min_time=0.0,
+            progress=progress.append,
+        )
+
+        self.assertEqual([result.name for result in results], ["foo", "bar"])
+        self.assertEqual(progress, results)
+        self.assertEqual(calls, ["fourth", "fourth"])
+        self.assertGreater(results[0].fourth_ns, 0)
+        self.assertGreater(results[0].stdlib_ns, 0)
+        self.assertIsNone(results[1].stdlib_ns)
+
+    def test_run_self_timed_benchmarks(self):
+        times = iter([30, 10, 20, 5, 7, 6])
+
+        (result,) = run_benchmarks(
+            [Benchmark("foo", lambda: next(times), lambda: next(times), True)],
+            repeat=3,
+        )
+
+        self.assertEqual(result, BenchmarkResult("foo", 10.0, 5.0))
+
+    def test_all_benchmarks(self):
+        """
+        Test every benchmark's operations can be called
+        """
+        benchmarks = all_benchmarks()
+        names = [benchmark.name for benchmark in benchmarks]
+        self.assertEqual(len(names), len(set(names)))
+
+        for benchmark in benchmarks:
+            if benchmark.self_timed:
+                continue
+            with self.subTest(benchmark=benchmark.name):
+                benchmark.fourth()
+                if benchmark.stdlib is not None:
+                    benchmark.stdlib()
+
+
+class MeasureMemoryTests(TestCase):
+    def test_measure_memory(self):
+        shared = "x" * 1000
+        progress = []
+
+        results = measure_memory(
+            [
+                MemoryBenchmark("foo", lambda: [shared] * 10, lambda: [shared * 2]),
+                MemoryBenchmark("bar", list, None),
+            ],
+            progress=progress.append,
+        )
+
+        self.assertEqual(progress, results)
+        foo, bar = results
+        # the shared string is only counted once
+        self.assertGreater(foo.fourth_bytes, 1000)
+        self.assertLess(foo.fourth_bytes, 2000)
+        self.assertGreater(foo.stdlib_bytes, 2000)
+        self.assertLess(foo.ratio, 1)
+        self.assertIsNone(bar.stdlib_bytes)
+        self.assertIsNone(bar.ratio)
+
+    def test_ratio(self):
+        self.assertEqual(MemoryResult("foo", 300, 100).ratio, 3.0)
+
+    def test_memory_benchmarks(self):
+        names = [benchmark.name for benchmark in memory_benchmarks()]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn("memory.utc_minutes_interned", names)
+
+
+class CompareResultsTests(TestCase):
+    def test_compare_ratios(self):
+        baseline = [
+            BenchmarkResult("foo", 200.0, 100.0),
+            BenchmarkResult("bar", 200.0, 100.0),
+            BenchmarkResult("baz", 200.0, 100.0),
+        ]
+        current = [
+            # slower, but so is the stdlib
+            BenchmarkResult("foo", 400.0, 200.0),
+            BenchmarkResult("bar", 300.0, 100.0),
+            BenchmarkResult("new", 300.0, 100.0),
+        ]
+
+        comparisons = compare_results(baseline, current, 0.25)
+
+        self.assertEqual([c.name for c in comparisons], ["foo", "bar"])
+        self.assertEqual((comparisons[0].baseline, comparisons[0].current), (2, 2))
+        self.assertFalse(comparisons[0].regressed)
+        self.assertEqual((comparisons[1].baseline, comparisons[1].current), (2, 3))
+        self.assertTrue(comparisons[1].regressed)
+        self.assertAlmostEqual(comparisons[1].change, 0.5)
+
+    def test_compare_times(self):
+        baseline = [BenchmarkResult("foo", 100.0, None)]
+
+        (ok,) = compare_results(baseline, [BenchmarkResult("foo", 120.0, None)], 0.25)
+        (slow,) = compare_results(baseline, [BenchmarkResult("foo", 130.0, None)], 0.25)
+
+        self.assertFalse(ok.regressed)
+        self.assertTrue(slow.regressed)
+
+
+class JSONTests(TestCase):
+    def test_roundtrip(self):
+        results = [
+            BenchmarkResult("foo", 200.0, 100.0),
+            BenchmarkResult("bar", 200.0, None),
+        ]
+
+        data = json.loads(json.dumps(results_to_json(results)))
+
+        self.assertEqual(data["results"]["foo"]["ratio"], 2.0)
+        self.assertIn("python", data)
+        self.assertEqual(results_from_json(data), results)
+
+
+class MainTests(TestCase):
+    def run_main(self, *arguments):
+        output = StringIO()
+        with redirect_stdout(output):
+            status = main(list(arguments))
+        return status, output.getvalue()
+
+    def test_list(self):
+        status, output = self.run_main("--list", "-k", "compare.")
+
+        self.assertEqual(status, 0)
+        self.assertIn("compare.utc_lt\n", output)
+        self.assertNotIn("hash.", output)
+
+    def test_memory(self):
+        status, output = self.run_main("--memory", "-k", "utc_minutes_interned")
+
+        self.assertEqual(status, 0)
+        self.assertIn("memory.utc_minutes_interned ", output)
+        self.assertIn(" KiB", output)
+
+    def test_output_and_compare(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            arguments = ["-k", "compare.utc_eq", "--repeat", "1", "--min-time", "0"]
+
+            status, output = self.run_main(*arguments, "--output", path)
+            self.assertEqual(status, 0)
+            self.assertIn("compare.utc_eq ", output)
+
+            with open(path) as file:
+                data = json.load(file)
+            self.assertEqual(
+                set(data["results"]), {"compare.utc_eq", "compare.utc_eq_datetime"}
+            )
+
+            # make the baseline impossibly fast, so the current run regresses
+            for values in data["results"].values():
+                values["fourth_ns"] = values["stdlib_ns"] / 1000
+            with open(path, "w") as file:
+                json.dump(data, file)
+
+            status, output = self.run_main(*arguments, "--compare", path)
+            self.assertEqual(status, 1)
+            self.assertIn("2 of 2 benchmarks regressed", output)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import threading
+from unittest import TestCase
+
+from fourth import LocalDatetime, ParseCache, UTCDatetime
+from fourth.cache import CacheInfo
+
+
+class ParseCacheTests(TestCase):
+    def setUp(self):
+        self.cache = ParseCache(UTCDatetime, maxsize=2)
+
+    def test_from_iso_format(self):
+        first = self.cache.from_iso_format("2020-01-01T00:00:00+08:00")
+
+        self.assertEqual(first, UTCDatetime.at(2019, 12, 31, 16))
+        self.assertIs(self.cache.from_iso_format("2020-01-01T00:00:00+08:00"), first)
+        self.assertEqual(self.cache.cache_info(), CacheInfo(1, 1, 0, 2, 1))
+
+    def test_strptime(self):
+        first = self.cache.strptime("2020-01-01 00:00:00+0000", "%Y-%m-%d %H:%M:%S%z")
+
+        self.assertEqual(first, UTCDatetime.at(2020, 1, 1))
+        self.assertIs(
+            self.cache.strptime("2020-01-01 00:00:00+0000", "%Y-%m-%d %H:%M:%S%z"),
+            first,
+        )
+        # keyed on the format too
+        self.assertEqual(
+            self.cache.strptime("2020-01-01 00:00:00+0000", "%Y-%d-%m %H:%M:%S%z"),
+            first,
+        )
+        self.assertEqual(self.cache.cache_info(), CacheInfo(1, 2, 0, 2, 2))
+
+    def test_local(self):
+        cache = ParseCache(LocalDatetime)
+
+        value = cache.from_iso_format("2020-01-01T12:00:00")
+        self.assertIsInstance(value, LocalDatetime)
+        self.assertIs(cache.from_iso_format("2020-01-01T12:00:00"), value)
+        with self.assertRaisesRegex(ValueError, r"contained tz info$"):
+            cache.from_iso_format("2020-01-01T12:00:00+00:00")
+
+    def test_evicts_least_recently_used(self):
+        a = self.cache.from_iso_format("2020-01-01T00:00:00+00:00")
+        self.cache.from_iso_format("2020-01-02T00:00:00+00:00")
+        # a is now more recently used than b
+        self.cache.from_iso_format("2020-01-01T00:00:00+00:00")
+        self.cache.from_iso_format("2020-01-03T00:00:00+00:00")
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIs(self.cache.from_iso_format("2020-01-01T00:00:00+00:00"), a)
+        self.assertEqual(self.cache.cache_info(), CacheInfo(2, 3, 1, 2, 2))
+
+        self.cache.from_iso_format("2020-01-02T00:00:00+00:00")
+        self.assertEqual(self.cache.cache_info(), CacheInfo(2, 4, 2, 2, 2))
+
+    def test_errors_not_cached(self):
+        for _ in range(2):
+            with self.assertRaisesRegex(ValueError, r"didn't contain tz info$"):
+                self.cache.from_iso_format("2020-01-01T00:00:00")
+
+        self.assertEqual(self.cache.cache_info(), CacheInfo(0, 0, 0, 2, 0))
+
+    def test_clear(self):
+        self.cache.from_iso_format("2020-01-01T00:00:00+00:00")
+        self.cache.from_iso_format("2020-01-01T00:00:00+00:00")
+        self.cache.cache_info()
+
+        self.cache.clear()
+
+        self.assertEqual(self.cache.cache_info(), CacheInfo(0, 0, 0, 2, 0))
+        self.cache.from_iso_format("2020-01-01T00:00:00+00:00")
+        self.cache.from_iso_format("2020-01-01T00:00:00+00:00")
+        self.assertEqual(self.cache.cache_info(), CacheInfo(1, 1, 0, 2, 1))
+
+    def test_threads(self):
+        cache = ParseCache(UTCDatetime, maxsize=8)
+        strings = [f"2020-01-01T00:00:{second:02}+00:00" for second in range(16)]
+        results = []
+
+        def parse():
+            results.append([cache.from_iso_format(s) for s in strings * 50])
+
+        threads = [threading.Thread(target=parse) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = [UTCDatetime.from_iso_format(s) for s in strings * 50]
+        for result in results:
+            self.assertEqual(result, expected)
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 4 * 50 * 16)
+        self.assertEqual(info.currsize, 8)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.cache), "ParseCache(UTCDatetime, maxsize=2)")
+        self.assertEqual(self.cache.maxsize, 2)
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError, r"^cls must be LocalDatetime or UTCDatetime, not 'foo'$"
+        ):
+            ParseCache("foo")
+        with self.assertRaisesRegex(ValueError, r"^maxsize must be positive$"):
+            ParseCache(UTCDatetime, maxsize=0)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from fourth import UTCDatetime
+from fourth.clock import Clock, CoarseClock, PreciseClock, get_clock, set_clock
+
+
+class FixedClock(Clock):
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def now(self):
+        return self.value
+
+
+class PreciseClockTests(TestCase):
+    def test_now(self):
+        before = datetime.now(timezone.utc)
+        now = PreciseClock().now()
+        after = datetime.now(timezone.utc)
+
+        self.assertIsInstance(now, UTCDatetime)
+        self.assertLessEqual(before, now.as_datetime())
+        self.assertLessEqual(now.as_datetime(), after)
+
+
+class CoarseClockTests(TestCase):
+    def test_reuses_value(self):
+        clock = CoarseClock(timedelta(hours=1))
+
+        self.assertIs(clock.now(), clock.now())
+        self.assertLess(
+            abs(clock.now().as_datetime() - datetime.now(timezone.utc)),
+            timedelta(seconds=1),
+        )
+        self.assertEqual(clock.tick, timedelta(hours=1))
+
+    def test_refreshes_lazily(self):
+        clock = CoarseClock(timedelta(milliseconds=1))
+        first = clock.now()
+
+        time.sleep(0.01)
+
+        self.assertGreater(clock.now(), first)
+
+    def test_background(self):
+        with CoarseClock(timedelta(milliseconds=1), background=True) as clock:
+            self.assertEqual(
+                repr(clock),
+                "CoarseClock(datetime.timedelta(microseconds=1000), background=True)",
+            )
+            first = clock.now()
+            deadline = time.monotonic() + 5
+            while clock.now() == first and time.monotonic() < deadline:
+                time.sleep(0.001)
+
+            self.assertGreater(clock.now(), first)
+
+        self.assertEqual(
+            repr(clock),
+            "CoarseClock(datetime.timedelta(microseconds=1000), background=False)",
+        )
+        # refreshed lazily after the thread stops
+        stopped = clock.now()
+        time.sleep(0.01)
+        self.assertGreater(clock.now(), stopped)
+
+    def test_tick_must_be_positive(self):
+        for tick in (timedelta(0), timedelta(microseconds=-1)):
+            with self.subTest(tick=tick):
+                with self.assertRaisesRegex(ValueError, r"^tick must be positive$"):
+                    CoarseClock(tick)
+
+
+class SetClockTests(TestCase):
+    def tearDown(self):
+        set_clock(None)
+
+    def test_default(self):
+        self.assertIsInstance(get_clock(), PreciseClock)
+
+    def test_set_clock(self):
+        fixed = FixedClock(UTCDatetime.at(2020, 1, 1))
+
+        previous = set_clock(fixed)
+
+        self.assertIsInstance(previous, PreciseClock)
+        self.assertIs(get_clock(), fixed)
+        self.assertIs(UTCDatetime.now(), fixed.value)
+
+        self.assertIs(set_clock(None), fixed)
+        self.assertIs(get_clock(), previous)
+        self.assertNotEqual(UTCDatetime.now(), fixed.value)
+
+    def test_coarse(self):
+        set_clock(CoarseClock(timedelta(hours=1)))
+
+        self.assertIs(UTCDatetime.now(), UTCDatetime.now())
+
+    def test_not_a_clock(self):
+        with self.assertRaisesRegex(TypeError, r"^clock must be a Clock, not 'str'$"):
+            set_clock("foo")
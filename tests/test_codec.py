@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import pickle
+import zlib
+from datetime import timedelta
+from unittest import TestCase
+
+from fourth import LocalDatetime, LocalDatetimeArray, UTCDatetime, UTCDatetimeArray
+from fourth.codec import dumps_many, loads_many
+
+
+class DumpsManyTests(TestCase):
+    def test_format(self):
+        data = dumps_many([UTCDatetime.at(1970, 1, 1, 0, 0, 0, 1), UTCDatetime.min])
+
+        self.assertEqual(data[:8], b"4th\x01\x02\x00\x00\x00")
+        self.assertEqual(data[8:16], (1).to_bytes(8, "little", signed=True))
+        self.assertEqual(
+            data[16:], (-62_135_596_800_000_000).to_bytes(8, "little", signed=True)
+        )
+
+    def test_local_format(self):
+        data = dumps_many([LocalDatetime.at(1970, 1, 1, 0, 0, 1)])
+
+        self.assertEqual(data[:8], b"4th\x01\x01\x00\x00\x00")
+        self.assertEqual(data[8:], (1_000_000).to_bytes(8, "little", signed=True))
+
+    def test_delta_format(self):
+        values = [UTCDatetime.at(1970, 1, 1, 0, 0, 10), UTCDatetime.at(1970, 1, 1)]
+
+        data = dumps_many(values, delta=True)
+
+        self.assertEqual(data[:8], b"4th\x01\x02\x01\x00\x00")
+        self.assertEqual(data[8:16], (10_000_000).to_bytes(8, "little", signed=True))
+        self.assertEqual(data[16:], (-10_000_000).to_bytes(8, "little", signed=True))
+
+    def test_empty(self):
+        self.assertEqual(dumps_many([]), b"4th\x01\x00\x00\x00\x00")
+
+    def test_arrays(self):
+        values = [UTCDatetime.at(2020, 1, 1), UTCDatetime.at(2020, 1, 2)]
+        array = UTCDatetimeArray(values)
+
+        self.assertEqual(dumps_many(array), dumps_many(values))
+        self.assertEqual(dumps_many(array, delta=True), dumps_many(values, delta=True))
+        self.assertEqual(dumps_many(array[:0]), b"4th\x01\x02\x00\x00\x00")
+
+    def test_subclass(self):
+        class Subclass(LocalDatetime):
+            pass
+
+        values = [Subclass.at(2020, 1, 1), LocalDatetime.at(2020, 1, 2)]
+
+        self.assertEqual(dumps_many(values)[:8], b"4th\x01\x01\x00\x00\x00")
+
+    def test_mixed_types(self):
+        for values in (
+            [UTCDatetime.now(), LocalDatetime.now()],
+            [LocalDatetime.now(), UTCDatetime.now()],
+            [UTCDatetime.now(), "foo"],
+            ["foo"],
+        ):
+            with self.subTest(values=values):
+                with self.assertRaisesRegex(
+                    TypeError,
+                    r"^can only encode values that are all LocalDatetime or "
+                    r"UTCDatetime$",
+                ):
+                    dumps_many(values)
+
+
+class LoadsManyTests(TestCase):
+    def setUp(self):
+        start = UTCDatetime.at(2020, 1, 1)
+        self.utc_values = [start + timedelta(seconds=i * 1.5) for i in range(100)] + [
+            UTCDatetime.min,
+            UTCDatetime.max,
+        ]
+        self.local_values = [
+            LocalDatetime.min,
+            LocalDatetime.at(1969, 12, 31, 23, 59, 59, 999_999),
+            LocalDatetime.max,
+        ]
+
+    def test_roundtrip(self):
+        for values in (self.utc_values, self.local_values):
+            for delta in (False, True):
+                with self.subTest(type=type(values[0]), delta=delta):
+                    loaded = loads_many(dumps_many(values, delta=delta))
+
+                    self.assertEqual(loaded, values)
+                    self.assertEqual(
+                        [type(value) for value in loaded],
+                        [type(value) for value in values],
+                    )
+
+    def test_interned(self):
+        values = [UTCDatetime.at(2020, 1, 1)] * 3 + [UTCDatetime.at(2020, 1, 2)]
+
+        loaded = loads_many(dumps_many(values), intern=True)
+
+        self.assertEqual(loaded, values)
+        self.assertIs(loaded[0], loaded[2])
+        self.assertIs(loaded[0], UTCDatetime.intern(UTCDatetime.at(2020, 1, 1)))
+
+    def test_packed(self):
+        for values, array_type in (
+            (self.utc_values, UTCDatetimeArray),
+            (self.local_values, LocalDatetimeArray),
+        ):
+            with self.subTest(array_type=array_type):
+                loaded = loads_many(dumps_many(values), packed=True)
+
+                self.assertIsInstance(loaded, array_type)
+                self.assertEqual(list(loaded), values)
+
+    def test_empty(self):
+        self.assertEqual(loads_many(dumps_many([])), [])
+        self.assertEqual(loads_many(dumps_many([]), packed=True), [])
+
+        loaded = loads_many(dumps_many(UTCDatetimeArray()), packed=True)
+        self.assertIsInstance(loaded, UTCDatetimeArray)
+        self.assertEqual(len(loaded), 0)
+
+    def test_delta_compresses(self):
+        data = dumps_many(self.utc_values[:100])
+        delta_data = dumps_many(self.utc_values[:100], delta=True)
+
+        self.assertEqual(len(data), len(delta_data))
+        self.assertLess(len(zlib.compress(delta_data)), len(zlib.compress(data)) / 2)
+
+    def test_accepts_buffers(self):
+        data = dumps_many(self.local_values)
+
+        self.assertEqual(loads_many(bytearray(data)), self.local_values)
+        self.assertEqual(loads_many(memoryview(data)), self.local_values)
+
+    def test_invalid(self):
+        data = dumps_many(self.local_values)
+
+        for invalid, message in (
+            (b"", r"^data is not a valid encoding of Datetimes$"),
+            (data[:-1], r"^data is not a valid encoding of Datetimes$"),
+            (b"5th" + data[3:], r"^data is not a valid encoding of Datetimes$"),
+            (data[:3] + b"\x02" + data[4:], r"^unsupported encoding version 2$"),
+            (data[:4] + b"\x07" + data[5:], r"^unknown Datetime type 7$"),
+            (data[:4] + b"\x00" + data[5:], r"^data is not a valid encoding"),
+        ):
+            with self.subTest(invalid=invalid):
+                with self.assertRaisesRegex(ValueError, message):
+                    loads_many(invalid)
+
+    def test_out_of_range(self):
+        header = dumps_many([])[:4] + b"\x02\x00\x00\x00"
+        for microseconds in (
+            UTCDatetime.min._us - 1,
+            UTCDatetime.max._us + 1,
+            -(2 ** 63),
+            2 ** 63 - 1,
+        ):
+            data = header + microseconds.to_bytes(8, "little", signed=True)
+            with self.subTest(microseconds=microseconds):
+                with self.assertRaisesRegex(
+                    OverflowError, r"^date value out of range$"
+                ):
+                    loads_many(data)
+
+    def test_smaller_than_pickle(self):
+        data = dumps_many(self.utc_values)
+
+        self.assertEqual(len(data), 8 + 8 * len(self.utc_values))
+        self.assertLess(len(data), len(pickle.dumps(self.utc_values)))
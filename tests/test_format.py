@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fourth import Format, LocalDatetime, LocalDatetimeArray, ParseResult, UTCDatetime
+from fourth.format import compile_format
+
+from . import FourthTestCase
+
+FORMATS = [
+    "",
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%d/%m/%Y %H:%M",
+    "%a, %d %b %Y %H:%M:%S",
+    "%Y%m%d%H%M%S",
+    "%j %U %y %I%p",
+    "100%% %Y %%d {} %",
+    "%-d/%-m %e",
+    "%Y %Y",
+]
+
+UTC_FORMATS = ["%Y-%m-%d %H:%M:%S %z", "%Y-%m-%dT%H:%M:%S%z %Z", "%z"]
+
+
+class FormatTests(FourthTestCase):
+    def test_slots(self):
+        self.assertEqual(
+            Format.__slots__,
+            (
+                "_format_string",
+                "_has_timezone",
+                "_parses_utc",
+                "_render",
+                "_parse_regex",
+            ),
+        )
+
+    def test_repr(self):
+        self.assertEqual(repr(Format("%Y-%m")), "Format('%Y-%m')")
+
+    def test_eq_and_hash(self):
+        self.assertEqual(Format("%Y"), Format("%Y"))
+        self.assertNotEqual(Format("%Y"), Format("%m"))
+        self.assertNotEqual(Format("%Y"), "%Y")
+        self.assertEqual(hash(Format("%Y")), hash(Format("%Y")))
+
+    def test_properties(self):
+        foo = Format("%Y %z")
+
+        self.assertEqual(foo.format_string, "%Y %z")
+        self.assertTrue(foo.has_timezone)
+        self.assertTrue(Format("%Z").has_timezone)
+        self.assertFalse(Format("%%z").has_timezone)
+
+    def test_format_local_matches_strftime(self):
+        values = [
+            LocalDatetime.at(2020, 1, 2, 3, 4, 5, 6),
+            LocalDatetime.at(1999, 12, 31, 23, 59, 59, 999999),
+            LocalDatetime.at(5, 6, 7, 13),
+        ]
+        for format_string in FORMATS:
+            for value in values:
+                with self.subTest(format_string=format_string, value=value):
+                    self.assertEqual(
+                        Format(format_string).format(value),
+                        value.as_datetime().strftime(format_string),
+                    )
+
+    def test_format_utc_matches_strftime(self):
+        value = UTCDatetime.at(2020, 11, 12, 8, 36, 42, 433677)
+
+        for format_string in FORMATS + UTC_FORMATS:
+            with self.subTest(format_string=format_string):
+                self.assertEqual(
+                    Format(format_string).format(value),
+                    value.as_datetime().strftime(format_string),
+                )
+
+    def test_format_local_with_timezone(self):
+        with self.assertRaisesRegex(
+            ValueError,
+            r"^format string for LocalDatetime must not contain timezone directives",
+        ):
+            Format("%Y %Z").format(LocalDatetime.now())
+
+    def test_format_many(self):
+        values = [LocalDatetime.at(2020, 1, 1), LocalDatetime.at(2021, 2, 3)]
+
+        self.assertEqual(
+            Format("%d/%m/%Y").format_many(values), ["01/01/2020", "03/02/2021"]
+        )
+        self.assertEqual(
+            Format("%H%z").format_many([UTCDatetime.at(2020, 1, 1, 5)]), ["05+0000"]
+        )
+
+        with self.assertRaises(ValueError):
+            Format("%H%z").format_many(values)
+
+    def test_parse(self):
+        foo = Format("%Y-%m-%d %H:%M:%S.%f").parse("2020-01-02 03:04:05.6")
+
+        self.assertIsInstance(foo, LocalDatetime)
+        self.assertEqual(foo, LocalDatetime.at(2020, 1, 2, 3, 4, 5, 600000))
+
+    def test_parse_utc(self):
+        foo = Format("%Y-%m-%d %H:%M %z").parse("2020-01-02 03:04 +0530")
+
+        self.assertIsInstance(foo, UTCDatetime)
+        self.assertEqual(foo, UTCDatetime.at(2020, 1, 1, 21, 34))
+        self.assertIs(foo.as_datetime().tzinfo, timezone.utc)
+
+    def test_parse_matches_strptime(self):
+        cases = [
+            ("%Y-%m-%d", "2020-01-02"),
+            ("%Y-%m-%d", "2020-1-2"),
+            ("%d/%m/%Y %H:%M", " 1/12/2020   7:05"),
+            ("%Y%m%d%H%M%S", "20200102030405"),
+            ("%H:%M", "23:59"),
+            ("%Y-%m-%dT%H:%M:%S.%f", "2020-01-02t03:04:05.000001"),
+            ("%a, %d %b %Y", "Thu, 02 Jan 2020"),
+            ("100%% %Y", "100% 2021"),
+            ("%Y (%m)", "2021 (3)"),
+            ("%Y-%m-%d %z", "2020-01-02 +05:30"),
+            ("%Y-%m-%d %z", "2020-01-02 -0800"),
+            ("%Y-%m-%d %z", "2020-01-02 Z"),
+            ("%Y-%m-%d %z", "2020-01-02 +05:30:15.5"),
+            ("%Y-%m-%d %z", "2020-01-02 +0000"),
+            ("%Y-%m-%d %z", "2020-01-02 -00:00"),
+            ("%Y-%m-%d", "２０２０-01-02"),
+        ]
+        for format_string, date_string in cases:
+            with self.subTest(format_string=format_string, date_string=date_string):
+                expected = datetime.strptime(date_string, format_string)
+                actual = Format(format_string)._parse_datetime(date_string)
+
+                self.assertEqual(actual, expected)
+                self.assertEqual(actual.utcoffset(), expected.utcoffset())
+
+    def test_parse_errors_match_strptime(self):
+        cases = [
+            ("%Y-%m-%d", "2020-02-30"),
+            ("%Y-%m-%d", "2020-01-02 "),
+            ("%Y-%m-%d", "2020-13-01"),
+            ("%H:%M:%S", "12:00:61"),
+            ("%Y-%m-%d %z", "2020-01-02 +2500"),
+            ("%Y-%m-%d %z", "2020-01-02 +05:3015"),
+            ("%Y", "foo"),
+            ("%Y %Q", "2020 1"),
+        ]
+        for format_string, date_string in cases:
+            with self.subTest(format_string=format_string, date_string=date_string):
+                with self.assertRaises(ValueError) as expected:
+                    datetime.strptime(date_string, format_string)
+                with self.assertRaises(ValueError) as actual:
+                    Format(format_string).parse(date_string)
+
+                self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_parse_many(self):
+        result = Format("%d/%m/%Y").parse_many(["01/02/2020", "31/02/2020", "3/4/2021"])
+
+        self.assertIsInstance(result, ParseResult)
+        self.assertEqual(
+            result.values,
+            [LocalDatetime.at(2020, 2, 1), None, LocalDatetime.at(2021, 4, 3)],
+        )
+        self.assertEqual(list(result.errors), [1])
+        self.assertEqual(str(result.errors[1]), "day is out of range for month")
+
+    def test_parse_many_packed(self):
+        result = Format("%d/%m/%Y").parse_many(
+            ["01/01/1970", "02/01/1970"], packed=True
+        )
+
+        self.assertIsInstance(result.values, LocalDatetimeArray)
+        self.assertEqual(
+            list(result.values.to_epoch_microseconds()), [0, 86_400_000_000]
+        )
+        self.assertEqual(result.errors, {})
+
+    def test_parse_many_utc(self):
+        result = Format("%Y %z").parse_many(["2020 +1000", "2020"])
+
+        self.assertEqual(result.values, [UTCDatetime.at(2019, 12, 31, 14), None])
+        self.assertEqual(list(result.errors), [1])
+
+    def test_parse_many_utc_out_of_range(self):
+        strings = ["0001-01-01 +0100", "2020-01-01 +0000", "9999-12-31 23 -0200"]
+        for packed in (False, True):
+            with self.subTest(packed=packed):
+                result = Format("%Y-%m-%d %z").parse_many(strings[:2], packed=packed)
+
+                self.assertEqual(list(result.errors), [0])
+                self.assertIsInstance(result.errors[0], OverflowError)
+                self.assertEqual(result.values[1], UTCDatetime.at(2020, 1, 1))
+
+        result = Format("%Y-%m-%d %H %z").parse_many(strings[2:])
+        self.assertIsInstance(result.errors[0], OverflowError)
+
+    def test_parse_many_interned(self):
+        result = Format("%Y %z").parse_many(["2020 +1000", "2020 +1000"], intern=True)
+
+        self.assertIs(result.values[0], result.values[1])
+        self.assertEqual(result.values[0], UTCDatetime.at(2019, 12, 31, 14))
+
+    def test_compile_format_is_cached(self):
+        self.assertIs(compile_format("%Y-%m-%d %H"), compile_format("%Y-%m-%d %H"))
+        self.assertIsInstance(compile_format("%Y-%m-%d %H"), Format)
+        self.assertGreater(compile_format.cache_info().maxsize, 0)
@@ -0,0 +1,496 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from unittest import TestCase
+
+from fourth import (
+    LocalDatetime,
+    LocalInterval,
+    LocalIntervalIndex,
+    LocalTimeIndex,
+    UTCDatetime,
+    UTCInterval,
+    UTCIntervalIndex,
+    UTCTimeIndex,
+)
+
+
+class SmallUTCTimeIndex(UTCTimeIndex):
+    """
+    Splits into many chunks, to test the logic across chunk boundaries.
+    """
+
+    _load = 4
+
+
+class SweepingUTCIntervalIndex(UTCIntervalIndex):
+    """
+    Never searches the trees again in containing_many(), to test the sweep.
+    """
+
+    _sweep_limit = 10 ** 9
+
+
+class SearchingUTCIntervalIndex(UTCIntervalIndex):
+    """
+    Always searches the trees again in containing_many(), when anything starts.
+    """
+
+    _sweep_limit = -1
+
+
+class UTCTimeIndexTests(TestCase):
+    def setUp(self):
+        self.start = UTCDatetime.at(2020, 1, 1)
+
+    def at(self, seconds):
+        return self.start + timedelta(seconds=seconds)
+
+    def test_slots(self):
+        self.assertEqual(UTCTimeIndex.__slots__, ())
+
+    def test_init(self):
+        index = UTCTimeIndex([(self.at(3), "c"), (self.at(1), "a"), (self.at(2), "b")])
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(
+            list(index), [(self.at(1), "a"), (self.at(2), "b"), (self.at(3), "c")]
+        )
+        self.assertEqual(list(index.keys()), [self.at(1), self.at(2), self.at(3)])
+        self.assertEqual(list(index.values()), ["a", "b", "c"])
+
+    def test_empty(self):
+        index = UTCTimeIndex()
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(list(index), [])
+        self.assertEqual(index.range(), [])
+        self.assertIsNone(index.floor(self.start))
+        self.assertIsNone(index.ceiling(self.start))
+        self.assertIsNone(index.nearest(self.start))
+        self.assertNotIn(self.start, index)
+
+    def test_repr(self):
+        index = UTCTimeIndex([(self.start, 1)])
+
+        self.assertEqual(
+            repr(index), "UTCTimeIndex([(UTCDatetime.at(2020, 1, 1, 0, 0, 0, 0), 1)])"
+        )
+
+    def test_key_type(self):
+        index = UTCTimeIndex()
+
+        for key in (LocalDatetime.at(2020, 1, 1), self.start.as_datetime(), 5):
+            with self.subTest(key=key):
+                with self.assertRaisesRegex(
+                    TypeError, r"^UTCTimeIndex keys must be UTCDatetime, not '\w+'$"
+                ):
+                    index.add(key, None)
+                with self.assertRaises(TypeError):
+                    index.floor(key)
+                self.assertNotIn(key, index)
+
+    def test_equal_keys_keep_order(self):
+        index = SmallUTCTimeIndex()
+        for i in range(20):
+            index.add(self.start, i)
+        index.extend([(self.start, 20), (self.start, 21)])
+
+        self.assertEqual(list(index.values()), list(range(22)))
+        self.assertEqual(index.floor(self.start), (self.start, 21))
+        self.assertEqual(index.ceiling(self.start), (self.start, 0))
+
+    def test_range(self):
+        index = SmallUTCTimeIndex((self.at(i), i) for i in range(0, 100, 2))
+
+        self.assertEqual(
+            index.range(self.at(10), self.at(16)),
+            [(self.at(10), 10), (self.at(12), 12), (self.at(14), 14)],
+        )
+        self.assertEqual(index.range(self.at(9), self.at(11)), [(self.at(10), 10)])
+        self.assertEqual(index.range(self.at(11), self.at(11)), [])
+        self.assertEqual(index.range(self.at(20), self.at(10)), [])
+        self.assertEqual(len(index.range(end=self.at(10))), 5)
+        self.assertEqual(len(index.range(start=self.at(90))), 5)
+        self.assertEqual(len(index.range()), 50)
+
+    def test_floor_ceiling_nearest(self):
+        index = SmallUTCTimeIndex((self.at(i), i) for i in range(0, 100, 10))
+
+        self.assertIsNone(index.floor(self.at(-1)))
+        self.assertEqual(index.floor(self.at(0)), (self.at(0), 0))
+        self.assertEqual(index.floor(self.at(15)), (self.at(10), 10))
+        self.assertEqual(index.floor(self.at(1000)), (self.at(90), 90))
+
+        self.assertEqual(index.ceiling(self.at(-1)), (self.at(0), 0))
+        self.assertEqual(index.ceiling(self.at(15)), (self.at(20), 20))
+        self.assertEqual(index.ceiling(self.at(90)), (self.at(90), 90))
+        self.assertIsNone(index.ceiling(self.at(91)))
+
+        self.assertEqual(index.nearest(self.at(-5)), (self.at(0), 0))
+        self.assertEqual(index.nearest(self.at(14)), (self.at(10), 10))
+        self.assertEqual(index.nearest(self.at(15)), (self.at(10), 10))
+        self.assertEqual(index.nearest(self.at(16)), (self.at(20), 20))
+        self.assertEqual(index.nearest(self.at(1000)), (self.at(90), 90))
+
+    def test_remove(self):
+        index = SmallUTCTimeIndex((self.at(i // 3), i) for i in range(30))
+
+        index.remove(self.at(4), 13)
+        self.assertEqual(len(index), 29)
+        self.assertEqual(
+            index.range(self.at(4), self.at(5)), [(self.at(4), 12), (self.at(4), 14)]
+        )
+
+        for i in range(30):
+            if i != 13:
+                index.remove(self.at(i // 3), i)
+        self.assertEqual(len(index), 0)
+        self.assertEqual(list(index), [])
+
+        with self.assertRaisesRegex(ValueError, r"is not in SmallUTCTimeIndex$"):
+            index.remove(self.at(0), 0)
+
+    def test_remove_missing(self):
+        index = SmallUTCTimeIndex((self.at(i // 3), i) for i in range(30))
+
+        for key, value in ((self.at(4), 0), (self.at(100), 0), ("foo", 0)):
+            with self.subTest(key=key, value=value):
+                with self.assertRaises(ValueError):
+                    index.remove(key, value)
+        self.assertEqual(len(index), 30)
+
+    def test_clear(self):
+        index = UTCTimeIndex([(self.start, 1)])
+
+        index.clear()
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(list(index), [])
+
+    def test_extend_appends_sorted(self):
+        index = SmallUTCTimeIndex((self.at(i), i) for i in range(10))
+
+        index.extend((self.at(i), i) for i in range(9, 30))
+
+        self.assertEqual(len(index), 31)
+        self.assertEqual([key for key, _ in index], sorted(key for key, _ in index))
+        self.assertLessEqual(max(map(len, index._keys)), 4)
+
+    def test_matches_sorted_list(self):
+        """
+        Test a random sequence of operations against a brute force sorted list
+        """
+        rng = random.Random(4)
+        index = SmallUTCTimeIndex()
+        expected = []  # (seconds, order added) sorted
+
+        for step in range(2_000):
+            operation = rng.random()
+            if operation < 0.5:
+                seconds = rng.randrange(500)
+                index.add(self.at(seconds), step)
+                expected.insert(
+                    bisect_right([s for s, _ in expected], seconds), (seconds, step)
+                )
+            elif operation < 0.55:
+                entries = [
+                    (rng.randrange(500), step + i / 100)
+                    for i in range(rng.randrange(20))
+                ]
+                index.extend((self.at(s), v) for s, v in entries)
+                expected = sorted(expected + entries, key=lambda entry: entry[0])
+            elif operation < 0.7 and expected:
+                seconds, value = rng.choice(expected)
+                index.remove(self.at(seconds), value)
+                expected.remove((seconds, value))
+            else:
+                seconds = rng.randrange(-10, 510)
+                keys = [s for s, _ in expected]
+                left = bisect_left(keys, seconds)
+                right = bisect_right(keys, seconds)
+
+                floor = index.floor(self.at(seconds))
+                self.assertEqual(
+                    floor,
+                    (self.at(expected[right - 1][0]), expected[right - 1][1])
+                    if right
+                    else None,
+                )
+                ceiling = index.ceiling(self.at(seconds))
+                self.assertEqual(
+                    ceiling,
+                    (self.at(expected[left][0]), expected[left][1])
+                    if left < len(expected)
+                    else None,
+                )
+
+                end = seconds + rng.randrange(50)
+                self.assertEqual(
+                    [
+                        (key, value)
+                        for key, value in index.range(self.at(seconds), self.at(end))
+                    ],
+                    [
+                        (self.at(s), v)
+                        for s, v in expected[left : bisect_left(keys, end)]
+                    ],
+                )
+
+        self.assertEqual(len(index), len(expected))
+        self.assertEqual(list(index), [(self.at(s), v) for s, v in expected])
+
+
+class LocalTimeIndexTests(TestCase):
+    def test_local_keys(self):
+        start = LocalDatetime.at(2020, 1, 1)
+        index = LocalTimeIndex([(start + timedelta(hours=i), i) for i in range(5)])
+
+        self.assertEqual(
+            index.floor(start + timedelta(minutes=150)), (start + timedelta(hours=2), 2)
+        )
+        self.assertIn(start, index)
+        self.assertNotIn(UTCDatetime.at(2020, 1, 1), index)
+        with self.assertRaisesRegex(
+            TypeError, r"^LocalTimeIndex keys must be LocalDatetime, not 'UTCDatetime'$"
+        ):
+            index.add(UTCDatetime.at(2020, 1, 1), 0)
+
+
+class UTCIntervalIndexTests(TestCase):
+    def setUp(self):
+        self.start = UTCDatetime.at(2020, 1, 1)
+
+    def at(self, seconds):
+        return self.start + timedelta(seconds=seconds)
+
+    def span(self, start, end):
+        return UTCInterval(self.at(start), self.at(end))
+
+    def test_slots(self):
+        self.assertEqual(UTCIntervalIndex.__slots__, ())
+
+    def test_init(self):
+        index = UTCIntervalIndex(
+            [(self.span(5, 10), "b"), (self.span(0, 20), "a"), (self.span(5, 6), "c")]
+        )
+
+        self.assertEqual(len(index), 3)
+        self.assertEqual(
+            list(index),
+            [(self.span(0, 20), "a"), (self.span(5, 6), "c"), (self.span(5, 10), "b")],
+        )
+
+    def test_empty(self):
+        index = UTCIntervalIndex()
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(list(index), [])
+        self.assertEqual(index.overlapping(self.span(0, 10)), [])
+        self.assertEqual(index.containing(self.at(0)), [])
+        self.assertEqual(index.containing_many([self.at(0), self.at(1)]), [[], []])
+        self.assertEqual(index.containing_many([]), [])
+
+    def test_repr(self):
+        index = UTCIntervalIndex([(self.span(0, 1), 1)])
+
+        self.assertEqual(
+            repr(index),
+            "UTCIntervalIndex([(UTCInterval(UTCDatetime.at(2020, 1, 1, 0, 0, 0, 0), "
+            "UTCDatetime.at(2020, 1, 1, 0, 0, 1, 0)), 1)])",
+        )
+
+    def test_types(self):
+        index = UTCIntervalIndex()
+
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^UTCIntervalIndex intervals must be UTCInterval, not 'LocalInterval'$",
+        ):
+            index.add(LocalInterval(LocalDatetime.min, LocalDatetime.max), 0)
+        with self.assertRaisesRegex(
+            TypeError, r"^UTCIntervalIndex intervals must be UTCInterval, not 'tuple'$"
+        ):
+            index.overlapping((self.at(0), self.at(1)))
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^UTCIntervalIndex instants must be UTCDatetime, not 'LocalDatetime'$",
+        ):
+            index.containing(LocalDatetime.at(2020, 1, 1))
+        with self.assertRaisesRegex(
+            TypeError, r"^UTCIntervalIndex instants must be UTCDatetime, not 'int'$"
+        ):
+            index.containing_many([self.at(0), 5])
+
+    def test_overlapping(self):
+        index = UTCIntervalIndex(
+            [(self.span(0, 10), 1), (self.span(10, 20), 2), (self.span(5, 5), 3)]
+        )
+
+        self.assertEqual(index.overlapping(self.span(9, 10)), [(self.span(0, 10), 1)])
+        self.assertEqual(
+            index.overlapping(self.span(9, 11)),
+            [(self.span(0, 10), 1), (self.span(10, 20), 2)],
+        )
+        self.assertEqual(index.overlapping(self.span(20, 30)), [])
+        # empty intervals never overlap
+        self.assertEqual(index.overlapping(self.span(5, 5)), [])
+        self.assertEqual(index.overlapping(self.span(4, 6)), [(self.span(0, 10), 1)])
+
+    def test_containing(self):
+        index = UTCIntervalIndex(
+            [(self.span(0, 10), 1), (self.span(10, 20), 2), (self.span(5, 5), 3)]
+        )
+
+        self.assertEqual(index.containing(self.at(0)), [(self.span(0, 10), 1)])
+        self.assertEqual(index.containing(self.at(5)), [(self.span(0, 10), 1)])
+        self.assertEqual(index.containing(self.at(10)), [(self.span(10, 20), 2)])
+        self.assertEqual(index.containing(self.at(20)), [])
+        self.assertEqual(
+            index.containing_many([self.at(-1), self.at(5), self.at(10), self.at(10)]),
+            [
+                [],
+                [(self.span(0, 10), 1)],
+                [(self.span(10, 20), 2)],
+                [(self.span(10, 20), 2)],
+            ],
+        )
+
+    def test_containing_many_unsorted(self):
+        index = UTCIntervalIndex()
+
+        with self.assertRaisesRegex(ValueError, r"^instants must be sorted$"):
+            index.containing_many([self.at(1), self.at(0)])
+
+    def test_remove(self):
+        index = UTCIntervalIndex(
+            [(self.span(0, 10), "a"), (self.span(0, 10), "b"), (self.span(0, 10), "a")]
+        )
+
+        index.remove(self.span(0, 10), "a")
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(
+            index.containing(self.at(0)),
+            [(self.span(0, 10), "b"), (self.span(0, 10), "a")],
+        )
+        for interval, value in (
+            (self.span(0, 10), "c"),
+            (self.span(0, 11), "a"),
+            (LocalInterval(LocalDatetime.min, LocalDatetime.max), "a"),
+        ):
+            with self.subTest(interval=interval, value=value):
+                with self.assertRaisesRegex(
+                    ValueError, r"^\(.*\) is not in UTCIntervalIndex$"
+                ):
+                    index.remove(interval, value)
+
+        index.remove(self.span(0, 10), "b")
+        index.remove(self.span(0, 10), "a")
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index._trees, [])
+
+    def test_clear(self):
+        index = UTCIntervalIndex([(self.span(0, 10), 1)])
+        index.clear()
+
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.containing(self.at(0)), [])
+
+    def test_adding_merges_trees(self):
+        index = UTCIntervalIndex()
+        for i in range(1_000):
+            index.add(self.span(i, i + 1), i)
+
+        sizes = [len(tree) for tree in index._trees]
+        self.assertEqual(sum(sizes), 1_000)
+        self.assertLess(len(sizes), 20)
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+
+    def test_matches_brute_force(self):
+        """
+        Test a random sequence of operations against a brute force list
+        """
+        rng = random.Random(10)
+
+        def order(entry):
+            return entry[0].start, entry[0].end, entry[1]
+
+        for index in (
+            UTCIntervalIndex(),
+            SweepingUTCIntervalIndex(),
+            SearchingUTCIntervalIndex(),
+        ):
+            expected = []
+
+            for step in range(500):
+                operation = rng.random()
+                if operation < 0.4:
+                    start = rng.randrange(1_000)
+                    entry = (self.span(start, start + rng.randrange(50)), step)
+                    index.add(*entry)
+                    expected.append(entry)
+                elif operation < 0.45:
+                    entries = []
+                    for i in range(rng.randrange(100)):
+                        start = rng.randrange(1_000)
+                        entries.append(
+                            (
+                                self.span(start, start + rng.randrange(50)),
+                                step + i / 100,
+                            )
+                        )
+                    index.extend(entries)
+                    expected.extend(entries)
+                elif operation < 0.6 and expected:
+                    entry = rng.choice(expected)
+                    index.remove(*entry)
+                    expected.remove(entry)
+                elif operation < 0.8:
+                    start = rng.randrange(-10, 1_060)
+                    query = self.span(start, start + rng.randrange(20))
+                    self.assertEqual(
+                        index.overlapping(query),
+                        sorted(
+                            (entry for entry in expected if entry[0].overlaps(query)),
+                            key=order,
+                        ),
+                    )
+                else:
+                    instants = sorted(
+                        self.at(rng.randrange(-10, 1_060))
+                        for _ in range(rng.randrange(20))
+                    )
+                    results = index.containing_many(instants)
+                    self.assertEqual(
+                        results, [index.containing(instant) for instant in instants]
+                    )
+                    for instant, result in zip(instants, results):
+                        self.assertEqual(
+                            result,
+                            sorted(
+                                (entry for entry in expected if instant in entry[0]),
+                                key=order,
+                            ),
+                        )
+
+            self.assertEqual(len(index), len(expected))
+            self.assertEqual(list(index), sorted(expected, key=order))
+
+
+class LocalIntervalIndexTests(TestCase):
+    def test_local_intervals(self):
+        start = LocalDatetime.at(2020, 1, 1)
+        day = LocalInterval(start, start + timedelta(days=1))
+        index = LocalIntervalIndex([(day, "day")])
+
+        self.assertEqual(index.containing(start), [(day, "day")])
+        self.assertEqual(index.overlapping(day), [(day, "day")])
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^LocalIntervalIndex instants must be LocalDatetime, not 'UTCDatetime'$",
+        ):
+            index.containing(UTCDatetime.at(2020, 1, 1))
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from unittest import TestCase
+
+import fourth
+from fourth.index import UTCTimeIndex
+from fourth.interval import UTCInterval
+
+
+class PackageTests(TestCase):
+    def test_all(self):
+        for name in fourth.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(hasattr(fourth, name))
+                self.assertIn(name, dir(fourth))
+
+    def test_lazy_names(self):
+        self.assertIs(fourth.UTCTimeIndex, UTCTimeIndex)
+        self.assertIs(fourth.UTCInterval, UTCInterval)
+
+    def test_unknown_name(self):
+        with self.assertRaisesRegex(
+            AttributeError, r"^module 'fourth' has no attribute 'Foo'$"
+        ):
+            fourth.Foo
+
+    def test_optional_modules_not_imported(self):
+        modules = ["index", "interval"]
+        code = (
+            "import sys, fourth; "
+            f"print([m for m in {modules!r} if 'fourth.' + m in sys.modules])"
+        )
+
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        ).stdout
+
+        self.assertEqual(output.strip(), "[]")
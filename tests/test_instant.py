@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import pickle
+import time
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from fourth import Instant, UTCDatetime
+
+
+class InstantTests(TestCase):
+    def test_now(self):
+        before = time.monotonic_ns()
+        now = Instant.now()
+        after = time.monotonic_ns()
+
+        self.assertLessEqual(before, now.monotonic_ns)
+        self.assertLessEqual(now.monotonic_ns, after)
+
+    def test_from_monotonic_ns(self):
+        instant = Instant.from_monotonic_ns(1_234_567)
+
+        self.assertEqual(instant.monotonic_ns, 1_234_567)
+        self.assertEqual(repr(instant), "Instant.from_monotonic_ns(1234567)")
+        self.assertEqual(eval(repr(instant)), instant)
+
+        with self.assertRaisesRegex(
+            TypeError, r"^nanoseconds must be int, not 'float'$"
+        ):
+            Instant.from_monotonic_ns(1.5)
+
+    def test_immutable(self):
+        instant = Instant.now()
+
+        with self.assertRaisesRegex(
+            AttributeError, r"^'Instant' object has no attribute '_ns'$"
+        ):
+            instant._ns = 0
+        with self.assertRaisesRegex(
+            AttributeError, r"^'Instant' object has no attribute '_ns'$"
+        ):
+            del instant._ns
+
+    def test_subtract(self):
+        a = Instant.from_monotonic_ns(1_000)
+        b = Instant.from_monotonic_ns(5_501_999)
+
+        self.assertEqual(b - a, timedelta(microseconds=5_500))
+        # truncated towards zero, so the order doesn't change the magnitude
+        self.assertEqual(a - b, timedelta(microseconds=-5_500))
+        self.assertEqual(
+            b - timedelta(microseconds=5_500), Instant.from_monotonic_ns(1_999)
+        )
+
+    def test_add(self):
+        a = Instant.from_monotonic_ns(1_000)
+
+        self.assertEqual(
+            a + timedelta(seconds=1), Instant.from_monotonic_ns(1_000_001_000)
+        )
+        self.assertEqual(timedelta(seconds=1) + a, a + timedelta(seconds=1))
+        with self.assertRaises(TypeError):
+            a + 1
+        with self.assertRaises(TypeError):
+            a + a
+
+    def test_compare(self):
+        a = Instant.from_monotonic_ns(1)
+        b = Instant.from_monotonic_ns(2)
+
+        self.assertLess(a, b)
+        self.assertLessEqual(a, a)
+        self.assertGreater(b, a)
+        self.assertGreaterEqual(b, b)
+        self.assertNotEqual(a, b)
+        self.assertNotEqual(a, 1)
+        self.assertEqual(hash(a), hash(Instant.from_monotonic_ns(1)))
+        with self.assertRaises(TypeError):
+            a < 2
+
+    def test_elapsed(self):
+        start = Instant.now()
+        time.sleep(0.01)
+
+        self.assertGreaterEqual(start.elapsed(), timedelta(milliseconds=10))
+        self.assertLessEqual(start.elapsed(), Instant.now() - start)
+
+    def test_to_utc(self):
+        before = datetime.now(timezone.utc)
+        now = Instant.now().to_utc()
+        after = datetime.now(timezone.utc)
+
+        self.assertIsInstance(now, UTCDatetime)
+        # the anchor is read to the microsecond, but the clocks can drift apart
+        self.assertLessEqual(before - timedelta(milliseconds=10), now.as_datetime())
+        self.assertLessEqual(now.as_datetime(), after + timedelta(milliseconds=10))
+
+        start = Instant.now()
+        self.assertEqual(
+            (start + timedelta(seconds=30)).to_utc() - start.to_utc(),
+            timedelta(seconds=30),
+        )
+
+    def test_to_utc_refreshes_anchor(self):
+        anchor = Instant._anchor
+        later = Instant.from_monotonic_ns(
+            anchor.monotonic_ns + Instant._anchor_lifetime_ns + 1
+        )
+        try:
+            later.to_utc()
+            self.assertIsNot(Instant._anchor, anchor)
+            self.assertGreater(Instant._anchor.monotonic_ns, anchor.monotonic_ns)
+        finally:
+            Instant._anchor = anchor
+
+    def test_to_utc_out_of_range(self):
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            (Instant.now() - timedelta(days=800_000)).to_utc()
+
+    def test_pickle(self):
+        instant = Instant.now()
+
+        self.assertEqual(pickle.loads(pickle.dumps(instant)), instant)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+
+from fourth import Format, LocalDatetime, UTCDatetime, instrument
+from fourth.instrument import Snapshot, Timing
+
+
+class InstrumentTests(TestCase):
+    def setUp(self):
+        self.addCleanup(instrument.reset)
+        self.addCleanup(instrument.disable)
+
+    def test_disabled_by_default(self):
+        self.assertFalse(instrument.is_enabled())
+        UTCDatetime.at(2020, 1, 1)
+
+        self.assertEqual(instrument.snapshot(), Snapshot({}, {}, 0, 0, {}))
+
+    def test_constructions(self):
+        with instrument.instrumented():
+            UTCDatetime.at(2020, 1, 1)
+            UTCDatetime.now()
+            UTCDatetime.from_timestamp(0)
+            UTCDatetime.from_iso_format("2020-01-01T00:00:00+00:00")
+            LocalDatetime.at(2020, 1, 1)
+            LocalDatetime.now()
+            LocalDatetime.from_iso_format("2020-01-01T00:00:00")
+            LocalDatetime(datetime(2020, 1, 1))
+
+        self.assertEqual(
+            instrument.snapshot().constructions,
+            {
+                "UTCDatetime.at": 1,
+                "UTCDatetime.now": 1,
+                "UTCDatetime.from_timestamp": 1,
+                "UTCDatetime.from_iso_format": 1,
+                # from_iso_format() builds its value with UTCDatetime()
+                "UTCDatetime.__init__": 1,
+                "LocalDatetime.at": 1,
+                "LocalDatetime.now": 1,
+                "LocalDatetime.from_iso_format": 1,
+                "LocalDatetime.__init__": 1,
+            },
+        )
+
+    def test_failures(self):
+        with instrument.instrumented():
+            with self.assertRaises(ValueError):
+                UTCDatetime.from_iso_format("2020-01-01T00:00:00")
+            with self.assertRaises(ValueError):
+                UTCDatetime.at(2020, 2, 30)
+            with self.assertRaises(ValueError):
+                LocalDatetime(datetime(2020, 1, 1, tzinfo=timezone.utc))
+            with self.assertRaises(ValueError):
+                LocalDatetime.strptime("2020", "%d")
+
+        snapshot = instrument.snapshot()
+        self.assertEqual(
+            snapshot.failures,
+            {
+                "UTCDatetime.from_iso_format": 1,
+                "UTCDatetime.at": 1,
+                "LocalDatetime.__init__": 1,
+                "LocalDatetime.strptime": 1,
+            },
+        )
+        self.assertEqual(snapshot.constructions, {})
+
+    def test_utc_normalizations(self):
+        with instrument.instrumented():
+            UTCDatetime(datetime(2020, 1, 1, tzinfo=timezone.utc))
+            UTCDatetime(datetime(2020, 1, 1, tzinfo=timezone(timedelta(hours=8))))
+            UTCDatetime.from_iso_format("2020-01-01T00:00:00-05:00")
+
+        self.assertEqual(instrument.snapshot().utc_normalizations, 2)
+
+    def test_timezone_scans(self):
+        with instrument.instrumented():
+            Format("%Y-%m-%d instrument test %z")
+            Format("%Y-%m-%d instrument test")
+
+        self.assertEqual(instrument.snapshot().timezone_scans, 2)
+
+    def test_timings(self):
+        value = UTCDatetime.at(2020, 1, 1)
+        with instrument.instrumented(sample_every=2):
+            for _ in range(5):
+                UTCDatetime.strptime("2020 +0000", "%Y %z")
+                value.iso_format()
+            value.strftime("%Y")
+            LocalDatetime.at(2020, 1, 1).iso_format()
+
+        timings = instrument.snapshot().timings
+        self.assertEqual(
+            sorted(timings),
+            [
+                "LocalDatetime.iso_format",
+                "UTCDatetime.iso_format",
+                "UTCDatetime.strftime",
+                "UTCDatetime.strptime",
+            ],
+        )
+        timing = timings["UTCDatetime.strptime"]
+        self.assertEqual((timing.calls, timing.samples), (5, 3))
+        self.assertGreater(timing.total_ns, 0)
+        self.assertGreaterEqual(timing.max_ns, timing.mean_ns)
+        self.assertEqual(timings["UTCDatetime.strftime"].samples, 1)
+        self.assertEqual(Timing(0, 0, 0, 0).mean_ns, 0.0)
+
+    def test_disable_restores_originals(self):
+        originals = {
+            name: UTCDatetime.__dict__[name]
+            for name in ("__init__", "at", "from_iso_format", "strftime")
+        }
+
+        instrument.enable()
+        self.assertTrue(instrument.is_enabled())
+        self.assertIsNot(UTCDatetime.__dict__["at"], originals["at"])
+        instrument.disable()
+
+        self.assertFalse(instrument.is_enabled())
+        for name, original in originals.items():
+            self.assertIs(UTCDatetime.__dict__[name], original)
+
+    def test_counters_kept_until_reset(self):
+        with instrument.instrumented():
+            UTCDatetime.at(2020, 1, 1)
+        UTCDatetime.at(2020, 1, 1)
+        instrument.enable()
+        UTCDatetime.at(2020, 1, 1)
+
+        # instrumented() leaves instrumentation enabled when it already was
+        with instrument.instrumented():
+            self.assertEqual(instrument.snapshot().constructions, {})
+        self.assertTrue(instrument.is_enabled())
+
+        UTCDatetime.at(2020, 1, 1)
+        self.assertEqual(instrument.snapshot().constructions, {"UTCDatetime.at": 1})
+        instrument.reset()
+        self.assertEqual(instrument.snapshot(), Snapshot({}, {}, 0, 0, {}))
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(ValueError, r"^sample_every must be positive$"):
+            instrument.enable(sample_every=0)
+        self.assertFalse(instrument.is_enabled())
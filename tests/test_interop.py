@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from array import array
+from datetime import timedelta
+from importlib.util import find_spec
+from unittest import TestCase, mock, skipUnless
+
+from fourth import LocalDatetime, LocalDatetimeArray, UTCDatetime, UTCDatetimeArray
+from fourth.interop import (
+    datetime64_to_epoch,
+    epoch_to_datetime64,
+    from_datetime64,
+    to_datetime64,
+)
+
+HAS_NUMPY = find_spec("numpy") is not None
+
+if HAS_NUMPY:
+    import numpy
+
+
+@skipUnless(HAS_NUMPY, "needs numpy")
+class Datetime64Tests(TestCase):
+    def setUp(self):
+        start = UTCDatetime.at(2020, 1, 1)
+        self.values = [
+            start + timedelta(seconds=37, microseconds=1) * i for i in range(5)
+        ]
+        self.values.append(UTCDatetime.at(1969, 12, 31, 23, 59, 59, 999999))
+        self.expected = numpy.array(
+            [value.as_datetime().replace(tzinfo=None) for value in self.values],
+            dtype="datetime64[us]",
+        )
+
+    def test_to_datetime64(self):
+        result = to_datetime64(self.values)
+
+        self.assertEqual(result.dtype, numpy.dtype("datetime64[us]"))
+        self.assertEqual(result.tolist(), self.expected.tolist())
+
+    def test_to_datetime64_local(self):
+        values = [value.to_local("UTC") for value in self.values]
+
+        self.assertEqual(to_datetime64(values).tolist(), self.expected.tolist())
+
+    def test_to_datetime64_subclass(self):
+        class Subclass(UTCDatetime):
+            pass
+
+        values = [Subclass.trusted(value.as_datetime()) for value in self.values]
+
+        self.assertEqual(to_datetime64(values).tolist(), self.expected.tolist())
+
+    def test_to_datetime64_array_no_copy(self):
+        values = UTCDatetimeArray(self.values)
+
+        result = to_datetime64(values)
+
+        self.assertEqual(result.tolist(), self.expected.tolist())
+        self.assertTrue(numpy.shares_memory(result, numpy.asarray(values._data)))
+        self.assertFalse(result.flags.writeable)
+        self.assertEqual(
+            to_datetime64(values[::2]).tolist(), self.expected[::2].tolist()
+        )
+
+    def test_to_datetime64_ns(self):
+        result = to_datetime64(self.values, unit="ns")
+
+        self.assertEqual(result.dtype, numpy.dtype("datetime64[ns]"))
+        self.assertTrue((result == self.expected).all())
+
+        with self.assertRaisesRegex(
+            OverflowError, r"^date value out of range for datetime64\[ns\]$"
+        ):
+            to_datetime64([UTCDatetime.at(2300, 1, 1)], unit="ns")
+
+    def test_from_datetime64(self):
+        result = from_datetime64(self.expected, UTCDatetime)
+
+        self.assertIsInstance(result, UTCDatetimeArray)
+        self.assertEqual(list(result), self.values)
+        self.assertTrue(numpy.shares_memory(self.expected, numpy.asarray(result._data)))
+
+    def test_from_datetime64_other_units(self):
+        local = from_datetime64(self.expected.astype("datetime64[ns]"), LocalDatetime)
+        self.assertIsInstance(local, LocalDatetimeArray)
+        self.assertEqual(list(local), [value.to_local("UTC") for value in self.values])
+
+        minutes = numpy.array(["2020-01-01T00:01"], dtype="datetime64[m]")
+        self.assertEqual(
+            list(from_datetime64(minutes, UTCDatetime)),
+            [UTCDatetime.at(2020, 1, 1, 0, 1)],
+        )
+
+        big_endian = self.expected.astype(">M8[us]")
+        self.assertEqual(list(from_datetime64(big_endian, UTCDatetime)), self.values)
+
+        # rounded down, like from_epoch_nanoseconds()
+        nanoseconds = numpy.array([-1], dtype="datetime64[ns]")
+        self.assertEqual(
+            list(from_datetime64(nanoseconds, UTCDatetime)),
+            [UTCDatetime.at(1969, 12, 31, 23, 59, 59, 999999)],
+        )
+
+    def test_epoch(self):
+        microseconds = UTCDatetimeArray(self.values).to_epoch_microseconds()
+
+        result = epoch_to_datetime64(microseconds)
+        self.assertEqual(result.tolist(), self.expected.tolist())
+        microseconds[0] = 0
+        self.assertEqual(result[0], numpy.datetime64(0, "us"))
+
+        self.assertEqual(
+            epoch_to_datetime64(array("q", [1]), unit="ns").tolist(),
+            numpy.array([1_000], dtype="datetime64[ns]").tolist(),
+        )
+
+        epoch = datetime64_to_epoch(self.expected)
+        self.assertIsInstance(epoch, array)
+        self.assertEqual(epoch, UTCDatetimeArray(self.values).to_epoch_microseconds())
+        self.assertEqual(
+            datetime64_to_epoch(self.expected[::-2]).tolist(), epoch[::-2].tolist()
+        )
+
+    def test_empty(self):
+        self.assertEqual(len(to_datetime64([])), 0)
+        self.assertEqual(len(from_datetime64(self.expected[:0], UTCDatetime)), 0)
+        self.assertEqual(datetime64_to_epoch(self.expected[:0]), array("q"))
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^can only convert values that are all LocalDatetime or UTCDatetime$",
+        ):
+            to_datetime64([UTCDatetime.at(2020, 1, 1), LocalDatetime.at(2020, 1, 1)])
+        with self.assertRaisesRegex(
+            ValueError, r"^unit must be 'us' or 'ns', not 'ms'$"
+        ):
+            to_datetime64([], unit="ms")
+        with self.assertRaisesRegex(
+            TypeError, r"^expected a datetime64 array, not 'int64'$"
+        ):
+            from_datetime64(numpy.zeros(1, dtype="int64"), UTCDatetime)
+        square = numpy.zeros((2, 2), dtype="datetime64[us]")
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^expected a one dimensional datetime64 array, not 2 dimensions$",
+        ):
+            from_datetime64(square, UTCDatetime)
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^expected a one dimensional datetime64 array, not 2 dimensions$",
+        ):
+            datetime64_to_epoch(square)
+        with self.assertRaisesRegex(
+            TypeError, r"^cls must be LocalDatetime or UTCDatetime, not 'foo'$"
+        ):
+            from_datetime64(self.expected, "foo")
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            from_datetime64(numpy.array(["NaT"], dtype="datetime64[us]"), UTCDatetime)
+        with self.assertRaisesRegex(TypeError, r"^can't view a buffer with format 'd'"):
+            epoch_to_datetime64(array("d", [0.0]))
+
+
+class WithoutNumpyTests(TestCase):
+    def test_import_error(self):
+        with mock.patch.dict("sys.modules", {"numpy": None}):
+            with self.assertRaisesRegex(
+                ImportError, r"^datetime64 conversions need the numpy package$"
+            ):
+                to_datetime64([])
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import pickle
+import random
+from datetime import timedelta
+from unittest import TestCase
+
+from fourth import (
+    LocalDatetime,
+    LocalInterval,
+    LocalIntervalSet,
+    UTCDatetime,
+    UTCInterval,
+    UTCIntervalSet,
+)
+
+
+def at(seconds):
+    return UTCDatetime.at(2020, 1, 1) + timedelta(seconds=seconds)
+
+
+def span(start, end):
+    return UTCInterval(at(start), at(end))
+
+
+class UTCIntervalTests(TestCase):
+    def test_slots(self):
+        self.assertEqual(UTCInterval.__slots__, ())
+
+    def test_init(self):
+        interval = UTCInterval(at(0), at(10))
+
+        self.assertEqual(interval.start, at(0))
+        self.assertEqual(interval.end, at(10))
+        self.assertEqual(interval.duration, timedelta(seconds=10))
+        self.assertFalse(interval.is_empty())
+        self.assertTrue(UTCInterval(at(5), at(5)).is_empty())
+
+    def test_init_exceptions(self):
+        with self.assertRaisesRegex(
+            ValueError, r"^UTCInterval start must not be after end$"
+        ):
+            UTCInterval(at(10), at(0))
+        with self.assertRaisesRegex(
+            TypeError, r"^UTCInterval bounds must be UTCDatetime, not 'LocalDatetime'$"
+        ):
+            UTCInterval(at(0), LocalDatetime.at(2020, 1, 2))
+
+    def test_immutable(self):
+        interval = span(0, 10)
+
+        with self.assertRaisesRegex(
+            AttributeError, r"^'UTCInterval' object has no attribute '_start'$"
+        ):
+            interval._start = 5
+        with self.assertRaisesRegex(
+            AttributeError, r"^'UTCInterval' object has no attribute '_end'$"
+        ):
+            del interval._end
+
+    def test_repr(self):
+        interval = span(0, 10)
+
+        self.assertEqual(
+            repr(interval),
+            "UTCInterval(UTCDatetime.at(2020, 1, 1, 0, 0, 0, 0), "
+            "UTCDatetime.at(2020, 1, 1, 0, 0, 10, 0))",
+        )
+        self.assertEqual(eval(repr(interval)), interval)
+
+    def test_eq_and_hash(self):
+        self.assertEqual(span(0, 10), span(0, 10))
+        self.assertEqual(hash(span(0, 10)), hash(span(0, 10)))
+        self.assertNotEqual(span(0, 10), span(0, 11))
+        self.assertNotEqual(
+            span(0, 10),
+            LocalInterval(LocalDatetime.at(2020, 1, 1), LocalDatetime.at(2020, 1, 2)),
+        )
+
+    def test_contains(self):
+        interval = span(0, 10)
+
+        self.assertIn(at(0), interval)
+        self.assertIn(at(9.999999), interval)
+        self.assertNotIn(at(10), interval)
+        self.assertNotIn(at(-1), interval)
+        self.assertNotIn(at(0).as_datetime(), interval)
+
+        self.assertIn(span(2, 5), interval)
+        self.assertIn(span(0, 10), interval)
+        self.assertIn(span(20, 20), interval)
+        self.assertNotIn(span(5, 11), interval)
+
+    def test_overlaps_and_intersection(self):
+        interval = span(0, 10)
+
+        self.assertTrue(interval.overlaps(span(5, 15)))
+        self.assertEqual(interval.intersection(span(5, 15)), span(5, 10))
+        self.assertEqual(interval.intersection(span(2, 3)), span(2, 3))
+
+        self.assertFalse(interval.overlaps(span(10, 15)))
+        self.assertIsNone(interval.intersection(span(10, 15)))
+        self.assertFalse(interval.overlaps(span(5, 5)))
+
+        with self.assertRaisesRegex(TypeError, r"^expected UTCInterval, not 'str'$"):
+            interval.overlaps("foo")
+
+    def test_pickle(self):
+        interval = span(0, 10)
+
+        self.assertEqual(pickle.loads(pickle.dumps(interval)), interval)
+
+
+class UTCIntervalSetTests(TestCase):
+    def test_slots(self):
+        self.assertEqual(UTCIntervalSet.__slots__, ())
+
+    def test_coalesces(self):
+        intervals = UTCIntervalSet(
+            [span(20, 30), span(0, 10), span(5, 15), span(15, 16), span(40, 40)]
+        )
+
+        self.assertEqual(list(intervals), [span(0, 16), span(20, 30)])
+        self.assertEqual(len(intervals), 2)
+        self.assertEqual(intervals.duration, timedelta(seconds=26))
+
+    def test_empty(self):
+        intervals = UTCIntervalSet()
+
+        self.assertEqual(list(intervals), [])
+        self.assertFalse(intervals)
+        self.assertEqual(intervals.duration, timedelta(0))
+        self.assertNotIn(at(0), intervals)
+
+    def test_init_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError, r"^UTCIntervalSet can only contain UTCInterval, not 'str'$"
+        ):
+            UTCIntervalSet(["foo"])
+
+    def test_repr(self):
+        intervals = UTCIntervalSet([span(0, 10)])
+
+        self.assertEqual(eval(repr(intervals)), intervals)
+
+    def test_contains(self):
+        intervals = UTCIntervalSet([span(0, 10), span(20, 30)])
+
+        for seconds, expected in ((-1, False), (0, True), (10, False), (25, True)):
+            with self.subTest(seconds=seconds):
+                self.assertIs(at(seconds) in intervals, expected)
+
+        self.assertIn(span(20, 30), intervals)
+        self.assertIn(span(1, 2), intervals)
+        self.assertIn(span(50, 50), intervals)
+        self.assertNotIn(span(5, 25), intervals)
+        self.assertNotIn(span(30, 31), intervals)
+        self.assertNotIn("foo", intervals)
+
+    def test_operators(self):
+        a = UTCIntervalSet([span(0, 10), span(20, 30)])
+        b = UTCIntervalSet([span(5, 20), span(30, 35)])
+
+        self.assertEqual(list(a | b), [span(0, 35)])
+        self.assertEqual(list(a & b), [span(5, 10)])
+        self.assertEqual(list(a - b), [span(0, 5), span(20, 30)])
+        self.assertEqual(list(a ^ b), [span(0, 5), span(10, 35)])
+
+        self.assertEqual(a.union(b), a | b)
+        self.assertEqual(a.intersection(b), a & b)
+        self.assertEqual(a.difference(b), a - b)
+        self.assertEqual(a.symmetric_difference(b), a ^ b)
+
+        for operator in ("__or__", "__and__", "__sub__", "__xor__"):
+            with self.subTest(operator=operator):
+                self.assertIs(getattr(a, operator)("foo"), NotImplemented)
+
+    def test_subsets(self):
+        a = UTCIntervalSet([span(0, 10), span(20, 30)])
+        b = UTCIntervalSet([span(2, 5), span(25, 30)])
+
+        self.assertTrue(b <= a)
+        self.assertTrue(b.issubset(a))
+        self.assertTrue(a >= b)
+        self.assertTrue(a.issuperset(b))
+        self.assertFalse(a <= b)
+        self.assertTrue(a <= a)
+
+    def test_complement(self):
+        intervals = UTCIntervalSet([span(0, 10), span(20, 30)])
+
+        self.assertEqual(
+            list(intervals.complement(at(-5), at(25))), [span(-5, 0), span(10, 20)]
+        )
+        self.assertEqual(list(intervals.complement(at(2), at(8))), [])
+
+    def test_pickle(self):
+        intervals = UTCIntervalSet([span(0, 10), span(20, 30)])
+
+        self.assertEqual(pickle.loads(pickle.dumps(intervals)), intervals)
+
+    def test_matches_sets(self):
+        """
+        Test the set operations against python sets of whole seconds
+        """
+        rng = random.Random(9)
+
+        def random_intervals():
+            spans = []
+            for _ in range(rng.randrange(8)):
+                start = rng.randrange(60)
+                spans.append((start, start + rng.randrange(10)))
+            seconds = {s for start, end in spans for s in range(start, end)}
+            return UTCIntervalSet(span(start, end) for start, end in spans), seconds
+
+        def to_seconds(intervals):
+            start = at(0)
+            return {
+                int((interval.start - start).total_seconds()) + offset
+                for interval in intervals
+                for offset in range(int(interval.duration.total_seconds()))
+            }
+
+        for _ in range(300):
+            a, a_seconds = random_intervals()
+            b, b_seconds = random_intervals()
+
+            self.assertEqual(to_seconds(a), a_seconds)
+            self.assertEqual(to_seconds(a | b), a_seconds | b_seconds)
+            self.assertEqual(to_seconds(a & b), a_seconds & b_seconds)
+            self.assertEqual(to_seconds(a - b), a_seconds - b_seconds)
+            self.assertEqual(to_seconds(a ^ b), a_seconds ^ b_seconds)
+            self.assertEqual(
+                to_seconds(a.complement(at(10), at(50))),
+                set(range(10, 50)) - a_seconds,
+            )
+            self.assertIs(a <= b, a_seconds <= b_seconds)
+            self.assertEqual(a.duration, timedelta(seconds=len(a_seconds)))
+            for interval in a | b:
+                # coalesced, so no interval touches the next
+                self.assertNotIn(interval.end, a | b)
+
+
+class LocalIntervalSetTests(TestCase):
+    def test_local(self):
+        start = LocalDatetime.at(2020, 1, 1)
+        day = LocalInterval(start, start + timedelta(days=1))
+        intervals = LocalIntervalSet([day])
+
+        self.assertIn(start, intervals)
+        self.assertNotIn(UTCDatetime.at(2020, 1, 1), intervals)
+        self.assertEqual(
+            list(intervals.complement(start, start + timedelta(days=2))),
+            [LocalInterval(start + timedelta(days=1), start + timedelta(days=2))],
+        )
+        self.assertIs(intervals.__or__(UTCIntervalSet()), NotImplemented)
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import io
+from array import array
+from datetime import timedelta
+from unittest import TestCase, mock
+
+from fourth import LocalDatetime, UTCDatetime, UTCDatetimeArray
+from fourth.iso import write_epoch_iso_format_many, write_iso_format_many
+
+
+class WriteIsoFormatManyTests(TestCase):
+    def setUp(self):
+        start = UTCDatetime.at(2020, 1, 1, 23, 59, 58)
+        steps = [0, 1, 500_000, 1_000_000, 1_000_999, 2_000_001, 86_400_000_000]
+        self.values = [start + timedelta(microseconds=step) for step in steps]
+        self.values += [UTCDatetime.min, UTCDatetime.max]
+
+    def expected(self, values, **kwargs) -> bytes:
+        return "".join(value.iso_format(**kwargs) + "\n" for value in values).encode()
+
+    def test_bytearray(self):
+        out = bytearray(b"header\n")
+
+        written = write_iso_format_many(self.values, out)
+
+        self.assertEqual(out, b"header\n" + self.expected(self.values))
+        self.assertEqual(written, len(out) - 7)
+
+    def test_file(self):
+        out = io.BytesIO()
+
+        with mock.patch("fourth.iso._CHUNK_SIZE", 2):
+            written = write_iso_format_many(iter(self.values), out)
+
+        self.assertEqual(out.getvalue(), self.expected(self.values))
+        self.assertEqual(written, len(out.getvalue()))
+
+    def test_local(self):
+        values = [value.to_local("UTC") for value in self.values]
+        out = bytearray()
+
+        write_iso_format_many(values, out)
+
+        self.assertEqual(out, self.expected(values))
+        self.assertNotIn(b"+", out)
+
+    def test_array(self):
+        out = bytearray()
+
+        write_iso_format_many(UTCDatetimeArray(self.values), out)
+
+        self.assertEqual(out, self.expected(self.values))
+
+    def test_subclass(self):
+        class Subclass(UTCDatetime):
+            pass
+
+        values = [Subclass.trusted(value.as_datetime()) for value in self.values]
+        out = bytearray()
+
+        write_iso_format_many(values, out)
+
+        self.assertEqual(out, self.expected(self.values))
+
+    def test_options(self):
+        for timespec in [
+            "auto",
+            "hours",
+            "minutes",
+            "seconds",
+            "milliseconds",
+            "microseconds",
+        ]:
+            for sep in ["T", " ", "%"]:
+                with self.subTest(timespec=timespec, sep=sep):
+                    out = bytearray()
+                    write_iso_format_many(self.values, out, sep=sep, timespec=timespec)
+                    self.assertEqual(
+                        out, self.expected(self.values, sep=sep, timespec=timespec)
+                    )
+
+    def test_end(self):
+        out = bytearray()
+
+        write_iso_format_many(self.values[:2], out, end="%s,")
+
+        self.assertEqual(
+            out,
+            b"2020-01-01T23:59:58.000000+00:00%s,2020-01-01T23:59:58.000001+00:00%s,",
+        )
+
+    def test_empty(self):
+        out = bytearray()
+
+        self.assertEqual(write_iso_format_many([], out), 0)
+        self.assertEqual(out, b"")
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^can only write values that are all LocalDatetime or UTCDatetime$",
+        ):
+            write_iso_format_many(
+                [UTCDatetime.at(2020, 1, 1), LocalDatetime.at(2020, 1, 1)],
+                bytearray(),
+            )
+        with self.assertRaisesRegex(ValueError, r"^Unknown timespec value$"):
+            write_iso_format_many([], bytearray(), timespec="days")
+
+
+class WriteEpochIsoFormatManyTests(TestCase):
+    def test_buffer(self):
+        values = [UTCDatetime.at(2020, 1, 1), UTCDatetime.at(1969, 12, 31, 23, 59)]
+        out = bytearray()
+
+        written = write_epoch_iso_format_many(
+            array("q", [value._us for value in values]), out, UTCDatetime
+        )
+
+        self.assertEqual(
+            out, b"2020-01-01T00:00:00.000000+00:00\n1969-12-31T23:59:00.000000+00:00\n"
+        )
+        self.assertEqual(written, len(out))
+
+    def test_iterable(self):
+        out = io.BytesIO()
+
+        write_epoch_iso_format_many(
+            iter([0, 1_500]), out, LocalDatetime, sep=" ", timespec="milliseconds"
+        )
+
+        self.assertEqual(
+            out.getvalue(), b"1970-01-01 00:00:00.000\n1970-01-01 00:00:00.001\n"
+        )
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError, r"^cls must be LocalDatetime or UTCDatetime, not 'foo'$"
+        ):
+            write_epoch_iso_format_many([0], bytearray(), "foo")
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            write_epoch_iso_format_many(
+                [UTCDatetime.max._us + 1], bytearray(), UTCDatetime
+            )
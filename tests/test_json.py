@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest import TestCase
+
+from fourth import LocalDatetime, UTCDatetime
+from fourth.json import DatetimeEncoder, DatetimeHook, dump, dumps, load, loads
+
+
+class EncoderTests(TestCase):
+    def setUp(self):
+        start = UTCDatetime.at(2020, 1, 1, 23, 59, 59)
+        steps = [0, 1, 999_999, 1_000_000, 86_400_000_000]
+        self.values = [start + timedelta(microseconds=step) for step in steps]
+        self.values += [UTCDatetime.min, UTCDatetime.max, start]
+
+    def test_utc(self):
+        self.assertEqual(
+            json.loads(dumps(self.values)),
+            [value.iso_format() for value in self.values],
+        )
+
+    def test_local(self):
+        values = [value.to_local("UTC") for value in self.values]
+
+        self.assertEqual(
+            json.loads(dumps(values)), [value.iso_format() for value in values]
+        )
+
+    def test_mixed(self):
+        utc = UTCDatetime.at(2020, 1, 1)
+
+        self.assertEqual(
+            dumps({"utc": utc, "local": LocalDatetime.at(2020, 1, 1), "again": utc}),
+            '{"utc": "2020-01-01T00:00:00.000000+00:00", '
+            '"local": "2020-01-01T00:00:00.000000", '
+            '"again": "2020-01-01T00:00:00.000000+00:00"}',
+        )
+
+    def test_subclass(self):
+        class Subclass(UTCDatetime):
+            pass
+
+        value = Subclass.at(2020, 1, 1)
+
+        self.assertEqual(dumps(value), '"2020-01-01T00:00:00.000000+00:00"')
+
+    def test_default(self):
+        self.assertEqual(
+            dumps([Decimal("1.5"), UTCDatetime.at(2020, 1, 1)], default=str),
+            '["1.5", "2020-01-01T00:00:00.000000+00:00"]',
+        )
+        with self.assertRaisesRegex(
+            TypeError, r"^Object of type Decimal is not JSON serializable$"
+        ):
+            dumps(Decimal("1.5"))
+
+    def test_options(self):
+        self.assertEqual(
+            dumps({"b": UTCDatetime.at(2020, 1, 1), "a": 1}, indent=1, sort_keys=True),
+            '{\n "a": 1,\n "b": "2020-01-01T00:00:00.000000+00:00"\n}',
+        )
+
+    def test_json_cls(self):
+        self.assertEqual(
+            json.dumps(LocalDatetime.at(2020, 1, 1), cls=DatetimeEncoder),
+            '"2020-01-01T00:00:00.000000"',
+        )
+
+    def test_dump(self):
+        fp = io.StringIO()
+
+        dump([UTCDatetime.at(2020, 1, 1)], fp)
+
+        self.assertEqual(fp.getvalue(), '["2020-01-01T00:00:00.000000+00:00"]')
+
+
+class DecoderTests(TestCase):
+    def test_loads(self):
+        text = (
+            '[{"id": 1, "created": "2020-01-01T00:00:00.000000+00:00",'
+            ' "updated": "2020-01-01T08:00:00+08:00", "name": "2020-01-01"},'
+            ' {"id": 2, "created": "2020-01-02T00:00:00.000000+00:00",'
+            ' "updated": null}]'
+        )
+
+        self.assertEqual(
+            loads(text, ["created", "updated"]),
+            [
+                {
+                    "id": 1,
+                    "created": UTCDatetime.at(2020, 1, 1),
+                    "updated": UTCDatetime.at(2020, 1, 1),
+                    "name": "2020-01-01",
+                },
+                {"id": 2, "created": UTCDatetime.at(2020, 1, 2), "updated": None},
+            ],
+        )
+
+    def test_nested(self):
+        text = '{"at": "2020-01-01T00:00:00", "items": [{"at": "2020-01-02T00:00:00"}]}'
+
+        result = loads(text, {"at": LocalDatetime})
+
+        self.assertEqual(
+            result,
+            {
+                "at": LocalDatetime.at(2020, 1, 1),
+                "items": [{"at": LocalDatetime.at(2020, 1, 2)}],
+            },
+        )
+
+    def test_round_trip(self):
+        records = [
+            {"id": i, "at": UTCDatetime.at(2020, 1, 1) + timedelta(microseconds=i)}
+            for i in range(10)
+        ]
+
+        self.assertEqual(loads(dumps(records), ["at"]), records)
+
+    def test_load(self):
+        fp = io.StringIO('{"at": "2020-01-01T00:00:00Z"}')
+
+        self.assertEqual(load(fp, ["at"]), {"at": UTCDatetime.at(2020, 1, 1)})
+
+    def test_hook(self):
+        hook = DatetimeHook(["at"])
+
+        result = json.loads('[{"at": "2020-01-01T00:00:00Z"}]', object_hook=hook)
+        self.assertEqual(result, [{"at": "2020-01-01T00:00:00Z"}])
+
+        hook.resolve()
+        self.assertEqual(result, [{"at": UTCDatetime.at(2020, 1, 1)}])
+        self.assertEqual(repr(hook), f"DatetimeHook({{'at': {UTCDatetime!r}}})")
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(ValueError, r"^at: "):
+            loads('[{"at": "2020-01-01T00:00:00Z"}, {"at": "nope"}]', ["at"])
+        for text in [
+            '[{"t": "0001-01-01T00:00:00.000000+01:00"}]',
+            '[{"t": "9999-12-31T23:00:00.000000-02:00"}]',
+        ]:
+            with self.subTest(text=text):
+                with self.assertRaisesRegex(
+                    ValueError, r"^t: date value out of range$"
+                ) as context:
+                    loads(text, ["t"])
+                self.assertIsInstance(context.exception.__cause__, OverflowError)
+        # shaped like iso_format() text, but with a UTC offset in the time
+        for cls, string in [
+            (UTCDatetime, "2020-01-01T00:00+01.123456+00:00"),
+            (LocalDatetime, "2020-01-01T00:00+01.123456"),
+        ]:
+            with self.subTest(cls=cls, string=string):
+                (error,) = cls.from_iso_format_many([string]).errors.values()
+                with self.assertRaises(ValueError) as context:
+                    loads(json.dumps([{"t": string}]), {"t": cls})
+                self.assertEqual(str(context.exception), f"t: {error}")
+        with self.assertRaisesRegex(
+            TypeError, r"^fields must be LocalDatetime or UTCDatetime, not 'foo'$"
+        ):
+            DatetimeHook({"at": "foo"})
+
+        hook = DatetimeHook(["at"])
+        result = json.loads('{"at": "nope"}', object_hook=hook)
+        with self.assertRaises(ValueError):
+            hook.resolve()
+        self.assertEqual(result, {"at": "nope"})
+        # the failed strings aren't parsed again
+        hook.resolve()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import os
+import tempfile
+from datetime import timedelta
+from unittest import TestCase, mock
+
+from fourth import UTCDatetime, UTCDatetimeArray
+from fourth.logscan import LogScanner
+
+
+class LogScannerTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "test.log")
+
+    def scanner(self, text: str, **kwargs) -> LogScanner:
+        with open(self.path, "w", newline="") as file:
+            file.write(text)
+        scanner = LogScanner(self.path, **kwargs)
+        self.addCleanup(scanner.close)
+        return scanner
+
+    def test_scan(self):
+        scanner = self.scanner(
+            "2020-01-01T00:00:00.000000+00:00 INFO first\n"
+            "2020-01-01 08:00:01.5+08:00 INFO second\n"
+            "2020-01-01T00:00:02+0000 INFO third\n"
+        )
+
+        self.assertEqual(
+            list(scanner),
+            [
+                (UTCDatetime.at(2020, 1, 1), 0),
+                (UTCDatetime.at(2020, 1, 1, 0, 0, 1, 500_000), 44),
+                (UTCDatetime.at(2020, 1, 1, 0, 0, 2), 84),
+            ],
+        )
+
+    def test_read_column(self):
+        scanner = self.scanner(
+            "2020-01-01T00:00:00+00:00 a\n2020-01-01T00:00:01-01:30 b\r\n"
+        )
+
+        values, offsets = scanner.read_column()
+
+        self.assertIsInstance(values, UTCDatetimeArray)
+        self.assertEqual(
+            list(values),
+            [UTCDatetime.at(2020, 1, 1), UTCDatetime.at(2020, 1, 1, 1, 30, 1)],
+        )
+        self.assertEqual(list(offsets), [0, 28])
+
+    def test_no_final_newline(self):
+        scanner = self.scanner("2020-01-01T00:00:00+00:00\n2020-01-01T00:00:01+00:00")
+
+        self.assertEqual(list(scanner.read_column().offsets), [0, 26])
+
+    def test_chunks_read_by_line_match_bulk(self):
+        lines = [
+            f"2020-01-01T00:{i % 60:02}:00.{i:0{1 + i % 6}}{offset} line {i}"
+            for i, offset in enumerate(["+00:00", "-08:00", "+0530", "+23:59"] * 25)
+        ]
+        scanner = self.scanner("\n".join(lines) + "\n")
+        size = os.path.getsize(self.path)
+
+        bulk = scanner._read_chunk(0, size)
+        by_line = scanner._read_lines(0, size, {}, {})
+
+        self.assertIsNotNone(bulk)
+        self.assertEqual(bulk, by_line)
+
+    def test_chunks(self):
+        lines = [
+            f"{(UTCDatetime.at(2020, 1, 1) + timedelta(seconds=i)).iso_format()}\n"
+            for i in range(100)
+        ]
+        # a line with an invalid date is read a line at a time
+        lines[50] = "2020-02-30T00:00:00+00:00\n"
+        scanner = self.scanner("".join(lines), strict=False)
+
+        with mock.patch("fourth.logscan._CHUNK_SIZE", 100):
+            values, offsets = scanner.read_column()
+
+        self.assertEqual(len(values), 99)
+        self.assertEqual(values[50], UTCDatetime.at(2020, 1, 1, 0, 0, 51))
+        self.assertEqual(offsets[50], sum(map(len, lines[:51])))
+
+    def test_delimiter(self):
+        scanner = self.scanner(
+            "host-1\tINFO\t2020-01-01T00:00:00Z\tfirst\n"
+            "host-2\tWARN\t2020-01-01T00:00:01Z\tsecond\n",
+            delimiter=b"\t",
+            field=2,
+        )
+
+        self.assertEqual(
+            list(scanner.read_column().values),
+            [UTCDatetime.at(2020, 1, 1), UTCDatetime.at(2020, 1, 1, 0, 0, 1)],
+        )
+
+    def test_offset(self):
+        scanner = self.scanner(
+            "[2020-01-01T00:00:00+00:00] first\n[2020-01-01T00:00:01+00:00] second\n",
+            offset=1,
+        )
+
+        self.assertEqual(
+            list(scanner.read_column().values),
+            [UTCDatetime.at(2020, 1, 1), UTCDatetime.at(2020, 1, 1, 0, 0, 1)],
+        )
+
+    def test_strict(self):
+        text = (
+            "2020-01-01T00:00:00+00:00 first\n"
+            "  a continuation line\n"
+            "2020-01-01T00:00:01+00:00 second\n"
+        )
+
+        with self.assertRaisesRegex(
+            ValueError, r"^no valid timestamp in the line at offset 32$"
+        ):
+            self.scanner(text).read_column()
+
+        self.assertEqual(
+            list(self.scanner(text, strict=False)),
+            [
+                (UTCDatetime.at(2020, 1, 1), 0),
+                (UTCDatetime.at(2020, 1, 1, 0, 0, 1), 54),
+            ],
+        )
+
+    def test_strict_invalid(self):
+        for line in [
+            "2020-02-30T00:00:00+00:00",
+            "2020-01-01T24:00:00+00:00",
+            "2020-01-01T00:00:60+00:00",
+            "2020-01-01T00:00:00+24:00",
+            "2020-01-01T00:00:00",
+            "0001-01-01T00:00:00+00:01",
+        ]:
+            with self.subTest(line=line):
+                scanner = self.scanner(f"2020-01-01T00:00:00+00:00\n{line}\n")
+                with self.assertRaisesRegex(
+                    ValueError, r"^no valid timestamp in the line at offset 26$"
+                ):
+                    scanner.read_column()
+
+                scanner = self.scanner(f"{line}\n", strict=False)
+                self.assertEqual(list(scanner), [])
+
+    def test_range(self):
+        start = UTCDatetime.at(2020, 1, 1)
+        lines = [
+            f"{(start + timedelta(seconds=i)).iso_format()} line {i}\n"
+            for i in range(100)
+        ]
+        lines.insert(40, "  a continuation line\n")
+        scanner = self.scanner("".join(lines), strict=False)
+
+        values = scanner.read_column(
+            start + timedelta(seconds=30), start + timedelta(seconds=60)
+        ).values
+        self.assertEqual(
+            list(values), [start + timedelta(seconds=i) for i in range(30, 60)]
+        )
+
+        at = start + timedelta(seconds=39, microseconds=1)
+        self.assertEqual(scanner.find(at), sum(map(len, lines[:41])))
+        self.assertEqual(scanner.find(start - timedelta(days=1)), 0)
+        self.assertEqual(
+            scanner.find(start + timedelta(days=1)), os.path.getsize(self.path)
+        )
+        self.assertEqual(
+            list(scanner.scan(stop=start + timedelta(seconds=2))),
+            [(start, 0), (start + timedelta(seconds=1), len(lines[0]))],
+        )
+
+    def test_empty(self):
+        with self.scanner("") as scanner:
+            self.assertEqual(list(scanner), [])
+            self.assertEqual(len(scanner.read_column().values), 0)
+            self.assertEqual(scanner.find(UTCDatetime.at(2020, 1, 1)), 0)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.scanner("")), f"LogScanner({self.path!r})")
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(
+            ValueError, r"^offset and field must not be negative$"
+        ):
+            self.scanner("", offset=-1)
+        with self.assertRaisesRegex(
+            ValueError, r"^delimiter must be a single byte, not b'ab'$"
+        ):
+            self.scanner("", delimiter=b"ab")
+        with self.assertRaisesRegex(
+            ValueError, r"^field can't be given without a delimiter$"
+        ):
+            self.scanner("", field=1)
+
+        scanner = self.scanner("")
+        with self.assertRaisesRegex(TypeError, r"^expected UTCDatetime, not 'str'$"):
+            scanner.find("2020")
+        with self.assertRaisesRegex(TypeError, r"^expected UTCDatetime, not 'str'$"):
+            scanner.read_column(stop="2020")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest import TestCase
+
+from fourth import UTCDatetime, UTCDatetimeArray
+from fourth.parallel import ParallelParser
+
+
+class ParallelParserTests(TestCase):
+    def setUp(self):
+        self.parser = ParallelParser(max_workers=2, chunk_size=10)
+        self.addCleanup(self.parser.close)
+        start = UTCDatetime.at(2020, 1, 1)
+        self.values = [start + timedelta(minutes=i) for i in range(55)]
+
+    def test_from_iso_format(self):
+        strings = [value.iso_format() for value in self.values]
+        strings[3] = "2020-01-01T00:00:00"
+        strings[42] = "foo"
+        strings[50] = "0001-01-01T00:00:00+01:00"
+
+        values, errors = self.parser.from_iso_format(iter(strings))
+
+        self.assertIsInstance(values, UTCDatetimeArray)
+        self.assertEqual(len(values), 55)
+        self.assertEqual(sorted(errors), [3, 42, 50])
+        self.assertIsInstance(errors[42], ValueError)
+        self.assertIsInstance(errors[50], OverflowError)
+        self.assertEqual(values[42], UTCDatetime.at(1970, 1, 1))
+        for index in (0, 4, 41, 43, 54):
+            self.assertEqual(values[index], self.values[index])
+
+    def test_strptime(self):
+        strings = [value.strftime("%Y%m%d %H%M%S %z") for value in self.values]
+        strings[20] = "20200101"
+        strings[30] = "00010101 000000 +0100"
+
+        values, errors = self.parser.strptime(strings, "%Y%m%d %H%M%S %z")
+
+        self.assertEqual(sorted(errors), [20, 30])
+        self.assertIsInstance(errors[30], OverflowError)
+        self.assertEqual(list(values[21:30]), self.values[21:30])
+        self.assertEqual(list(values[31:]), self.values[31:])
+
+        with self.assertRaisesRegex(
+            ValueError, r"^strptime: format_string has no %z directive$"
+        ):
+            self.parser.strptime(strings, "%Y%m%d %H%M%S")
+
+    def test_from_timestamp(self):
+        timestamps = [value.as_datetime().timestamp() for value in self.values]
+        timestamps[1] = float("inf")
+        timestamps[2] = 1e12
+        timestamps[40] = None
+
+        values, errors = self.parser.from_timestamp(timestamps)
+
+        self.assertEqual(sorted(errors), [1, 2, 40])
+        self.assertIsInstance(errors[1], ValueError)
+        self.assertIsInstance(errors[40], TypeError)
+        self.assertEqual(list(values[3:40]), self.values[3:40])
+        self.assertEqual(list(values[41:]), self.values[41:])
+
+    def test_single_chunk(self):
+        values, errors = self.parser.from_iso_format(["2020-01-01T00:00:00+00:00"])
+
+        self.assertEqual(list(values), [UTCDatetime.at(2020, 1, 1)])
+        self.assertEqual(errors, {})
+        # parsed without starting the worker processes
+        self.assertIsNone(self.parser._executor)
+
+        values, errors = self.parser.from_iso_format([])
+        self.assertEqual(len(values), 0)
+
+    def test_close(self):
+        with ParallelParser(max_workers=1, chunk_size=1) as parser:
+            parser.from_timestamp([0, 1])
+            self.assertIsNotNone(parser._executor)
+        self.assertIsNone(parser._executor)
+
+        # workers are started again when needed
+        values, _ = parser.from_timestamp([0, 1])
+        self.assertEqual(
+            list(values), [UTCDatetime.at(1970, 1, 1, 0, 0, s) for s in (0, 1)]
+        )
+        parser.close()
+
+    def test_repr(self):
+        self.assertEqual(
+            repr(self.parser), "ParallelParser(max_workers=2, chunk_size=10)"
+        )
+        self.assertEqual(self.parser.max_workers, 2)
+        self.assertEqual(self.parser.chunk_size, 10)
+        self.assertGreater(ParallelParser().max_workers, 0)
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(ValueError, r"^max_workers must be positive$"):
+            ParallelParser(max_workers=0)
+        with self.assertRaisesRegex(ValueError, r"^chunk_size must be positive$"):
+            ParallelParser(chunk_size=0)
+        # rows that aren't strings are recorded, rather than raised
+        values, errors = self.parser.from_iso_format([1] * 30)
+        self.assertEqual(sorted(errors), list(range(30)))
+        self.assertIsInstance(errors[29], TypeError)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from unittest import TestCase, mock
+
+from fourth import UTCDatetime
+from fourth.rfc import (
+    format_http_date,
+    format_rfc2822,
+    format_rfc3339,
+    parse_http_date,
+    parse_rfc2822,
+    parse_rfc3339,
+)
+
+# 1994-11-06T08:49:37Z
+_US = 784_111_777_000_000
+
+
+class HttpDateTests(TestCase):
+    def test_format(self):
+        self.assertEqual(format_http_date(_US), "Sun, 06 Nov 1994 08:49:37 GMT")
+        self.assertEqual(format_http_date(_US + 999_999), format_http_date(_US))
+        self.assertEqual(
+            format_http_date(UTCDatetime.min._us), "Mon, 01 Jan 0001 00:00:00 GMT"
+        )
+        self.assertEqual(
+            format_http_date(UTCDatetime.max._us), "Fri, 31 Dec 9999 23:59:59 GMT"
+        )
+        self.assertEqual(format_http_date(-1), "Wed, 31 Dec 1969 23:59:59 GMT")
+
+    def test_parse(self):
+        for date_string in [
+            "Sun, 06 Nov 1994 08:49:37 GMT",
+            "Sunday, 06-Nov-94 08:49:37 GMT",
+            "Sun Nov  6 08:49:37 1994",
+        ]:
+            with self.subTest(date_string=date_string):
+                self.assertEqual(parse_http_date(date_string), _US)
+
+    def test_parse_two_digit_year(self):
+        # years more than 50 years in the future are in the last century
+        now = UTCDatetime.at(2030, 6, 1)
+        with mock.patch.object(UTCDatetime, "now", return_value=now):
+            self.assertEqual(
+                parse_http_date("Monday, 01-Jan-80 00:00:00 GMT"),
+                UTCDatetime.at(2080, 1, 1)._us,
+            )
+            self.assertEqual(
+                parse_http_date("Saturday, 01-Jan-81 00:00:00 GMT"),
+                UTCDatetime.at(1981, 1, 1)._us,
+            )
+
+    def test_parse_invalid(self):
+        for date_string in [
+            "",
+            "Sun, 06 Nov 1994 08:49:37 +0000",
+            "sun, 06 Nov 1994 08:49:37 GMT",
+            "Sun, 6 Nov 1994 08:49:37 GMT",
+            "Sun, 06 Nov 1994 24:00:00 GMT",
+            " Sun, 06 Nov 1994 08:49:37 GMT",
+            "Sun, 31 Nov 1994 08:49:37 GMT",
+        ]:
+            with self.subTest(date_string=date_string):
+                with self.assertRaises(ValueError):
+                    parse_http_date(date_string)
+
+    def test_threads(self):
+        values = [_US + i * 500_000 for i in range(2_000)]
+        expected = [
+            datetime.fromtimestamp(value // 1_000_000, timezone.utc).strftime(
+                "%a, %d %b %Y %H:%M:%S GMT"
+            )
+            for value in values
+        ]
+        results = {}
+
+        def run(index: int) -> None:
+            texts = [format_http_date(value) for value in values]
+            results[index] = texts == expected and all(
+                parse_http_date(text) == value - value % 1_000_000
+                for text, value in zip(texts, values)
+            )
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, {0: True, 1: True, 2: True, 3: True})
+
+
+class Rfc2822Tests(TestCase):
+    def test_format(self):
+        self.assertEqual(format_rfc2822(_US), "Sun, 06 Nov 1994 08:49:37 +0000")
+
+    def test_parse(self):
+        for date_string in [
+            "Sun, 06 Nov 1994 08:49:37 +0000",
+            "06 Nov 1994 08:49:37 GMT",
+            "sun,6 nov 1994 03:49:37 EST",
+            "  Sun , 06 Nov 94 09:49:37 +0100  ",
+            "Sun, 06 Nov 1994 08:19:37 -0030",
+        ]:
+            with self.subTest(date_string=date_string):
+                self.assertEqual(parse_rfc2822(date_string), _US)
+
+        self.assertEqual(
+            parse_rfc2822("1 Jan 2020 00:00 +0000"), UTCDatetime.at(2020, 1, 1)._us
+        )
+        self.assertEqual(
+            parse_rfc2822("1 Jan 120 00:00 +0000"), UTCDatetime.at(2020, 1, 1)._us
+        )
+
+    def test_parse_invalid(self):
+        for date_string in [
+            "",
+            "Sun, 06 Nov 1994 08:49:37",
+            "Sun, 06 Foo 1994 08:49:37 +0000",
+            "Sun, 06 Nov 1994 08:49:37 XYZ",
+            "Sun, 06 Nov 1994 08:49:37 +0060",
+            "Sun, 06 Nov 1994 08:49:37 +0000 (UTC)",
+        ]:
+            with self.subTest(date_string=date_string):
+                with self.assertRaises(ValueError):
+                    parse_rfc2822(date_string)
+
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            parse_rfc2822("31 Dec 9999 23:59:59 -0100")
+
+
+class Rfc3339Tests(TestCase):
+    def test_format(self):
+        self.assertEqual(format_rfc3339(_US + 1_500), "1994-11-06T08:49:37.001500Z")
+        self.assertEqual(
+            format_rfc3339(_US + 1_500, timespec="milliseconds"),
+            "1994-11-06T08:49:37.001Z",
+        )
+        self.assertEqual(
+            format_rfc3339(_US + 1_500, timespec="seconds"), "1994-11-06T08:49:37Z"
+        )
+        self.assertEqual(format_rfc3339(-1), "1969-12-31T23:59:59.999999Z")
+
+        with self.assertRaisesRegex(ValueError, r"^Unknown timespec value$"):
+            format_rfc3339(_US, timespec="auto")
+
+    def test_parse(self):
+        for date_string, microseconds in [
+            ("1994-11-06T08:49:37Z", _US),
+            ("1994-11-06t08:49:37z", _US),
+            ("1994-11-06 08:49:37+00:00", _US),
+            ("1994-11-06T08:49:37-00:00", _US),
+            ("1994-11-06T14:19:37+05:30", _US),
+            ("1994-11-06T08:49:37.5Z", _US + 500_000),
+            ("1994-11-06T08:49:37.1234567Z", _US + 123_456),
+        ]:
+            with self.subTest(date_string=date_string):
+                self.assertEqual(parse_rfc3339(date_string), microseconds)
+
+    def test_parse_invalid(self):
+        for date_string in [
+            "",
+            "1994-11-06T08:49:37",
+            "1994-11-06T08:49Z",
+            "1994-11-06T08:49:37.Z",
+            "1994-11-06T08:49:60Z",
+            "1994-02-30T08:49:37Z",
+            "1994-11-06T08:49:37+0000",
+            "19941106T084937Z",
+        ]:
+            with self.subTest(date_string=date_string):
+                with self.assertRaises(ValueError):
+                    parse_rfc3339(date_string)
+
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            parse_rfc3339("0001-01-01T00:00:00+00:01")
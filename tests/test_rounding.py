@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import random
+from array import array
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from fourth import LocalDatetime, LocalDatetimeArray, UTCDatetime, UTCDatetimeArray
+from fourth.rounding import ceil_many, floor_many, round_many
+
+
+class RoundingTests(TestCase):
+    def setUp(self):
+        self.value = UTCDatetime.at(2020, 5, 17, 13, 47, 31, 500)
+
+    def test_units(self):
+        for unit, floor, ceil, rounded in (
+            (
+                "second",
+                UTCDatetime.at(2020, 5, 17, 13, 47, 31),
+                UTCDatetime.at(2020, 5, 17, 13, 47, 32),
+                UTCDatetime.at(2020, 5, 17, 13, 47, 31),
+            ),
+            (
+                "hour",
+                UTCDatetime.at(2020, 5, 17, 13),
+                UTCDatetime.at(2020, 5, 17, 14),
+                UTCDatetime.at(2020, 5, 17, 14),
+            ),
+            (
+                "day",
+                UTCDatetime.at(2020, 5, 17),
+                UTCDatetime.at(2020, 5, 18),
+                UTCDatetime.at(2020, 5, 18),
+            ),
+            # 2020-05-17 was a Sunday
+            (
+                "week",
+                UTCDatetime.at(2020, 5, 11),
+                UTCDatetime.at(2020, 5, 18),
+                UTCDatetime.at(2020, 5, 18),
+            ),
+            (
+                "month",
+                UTCDatetime.at(2020, 5, 1),
+                UTCDatetime.at(2020, 6, 1),
+                UTCDatetime.at(2020, 6, 1),
+            ),
+            (
+                "quarter",
+                UTCDatetime.at(2020, 4, 1),
+                UTCDatetime.at(2020, 7, 1),
+                UTCDatetime.at(2020, 7, 1),
+            ),
+            (
+                "year",
+                UTCDatetime.at(2020, 1, 1),
+                UTCDatetime.at(2021, 1, 1),
+                UTCDatetime.at(2020, 1, 1),
+            ),
+        ):
+            with self.subTest(unit=unit):
+                self.assertEqual(self.value.floor(unit), floor)
+                self.assertEqual(self.value.ceil(unit), ceil)
+                self.assertEqual(self.value.round(unit), rounded)
+
+    def test_already_rounded(self):
+        value = UTCDatetime.at(2020, 5, 1)
+
+        for unit in ("hour", "day", "month", timedelta(minutes=5)):
+            with self.subTest(unit=unit):
+                self.assertEqual(value.floor(unit), value)
+                self.assertEqual(value.ceil(unit), value)
+                self.assertEqual(value.round(unit), value)
+
+    def test_fixed_intervals(self):
+        self.assertEqual(
+            self.value.floor(timedelta(minutes=15)), UTCDatetime.at(2020, 5, 17, 13, 45)
+        )
+        self.assertEqual(
+            self.value.ceil(timedelta(minutes=15)), UTCDatetime.at(2020, 5, 17, 14)
+        )
+        # halfway rounds up
+        self.assertEqual(
+            UTCDatetime.at(2020, 1, 1, 0, 7, 30).round(timedelta(minutes=15)),
+            UTCDatetime.at(2020, 1, 1, 0, 15),
+        )
+
+    def test_origin(self):
+        origin = UTCDatetime.at(2020, 1, 1, 0, 2)
+
+        self.assertEqual(
+            self.value.floor(timedelta(minutes=5), origin=origin),
+            UTCDatetime.at(2020, 5, 17, 13, 47),
+        )
+        self.assertEqual(
+            self.value.floor("hour", origin=origin),
+            UTCDatetime.at(2020, 5, 17, 13, 2),
+        )
+        # the origin can be after the value
+        self.assertEqual(
+            UTCDatetime.at(2000, 1, 1, 0, 4).floor(timedelta(minutes=5), origin=origin),
+            UTCDatetime.at(2000, 1, 1, 0, 2),
+        )
+
+    def test_local(self):
+        value = LocalDatetime.at(2020, 2, 29, 23, 59)
+
+        self.assertEqual(value.floor("month"), LocalDatetime.at(2020, 2, 1))
+        self.assertEqual(value.ceil("month"), LocalDatetime.at(2020, 3, 1))
+        self.assertEqual(value.round("minute"), value)
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(
+            ValueError, r"^unit must be a timedelta or one of 'microsecond', .*'fort'$"
+        ):
+            self.value.floor("fort")
+        with self.assertRaisesRegex(ValueError, r"^unit must be a positive timedelta$"):
+            self.value.ceil(timedelta(0))
+        with self.assertRaisesRegex(
+            ValueError, r"^origin can't be given for unit 'month'$"
+        ):
+            self.value.floor("month", origin=self.value)
+        with self.assertRaisesRegex(
+            TypeError, r"^unit must be str or timedelta, not 'int'$"
+        ):
+            self.value.round(5)
+        with self.assertRaisesRegex(
+            TypeError, r"^origin must be UTCDatetime, not 'LocalDatetime'$"
+        ):
+            self.value.floor("day", origin=LocalDatetime.at(2020, 1, 1))
+
+    def test_out_of_range(self):
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.max.ceil("day")
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.min.floor("day", origin=UTCDatetime.at(2020, 1, 1, 12))
+
+
+class RoundingManyTests(TestCase):
+    def setUp(self):
+        rng = random.Random(13)
+        self.values = [
+            UTCDatetime.at(2020, 1, 1) + timedelta(seconds=rng.randrange(10 ** 8))
+            for _ in range(500)
+        ]
+
+    def test_matches_methods(self):
+        for unit in ("minute", "week", "month", "year", timedelta(minutes=5)):
+            for function, method in (
+                (floor_many, UTCDatetime.floor),
+                (ceil_many, UTCDatetime.ceil),
+                (round_many, UTCDatetime.round),
+            ):
+                with self.subTest(unit=unit, function=function):
+                    self.assertEqual(
+                        function(self.values, unit),
+                        [method(value, unit) for value in self.values],
+                    )
+
+    def test_matches_datetime(self):
+        values = sorted(self.values)
+
+        self.assertEqual(
+            [value.as_datetime() for value in floor_many(values, "month")],
+            [
+                value.as_datetime().replace(day=1, hour=0, minute=0, second=0)
+                for value in values
+            ],
+        )
+
+    def test_arrays_and_buffers(self):
+        values = UTCDatetimeArray(self.values)
+
+        result = floor_many(values, "hour")
+        self.assertIsInstance(result, UTCDatetimeArray)
+        self.assertEqual(list(result), floor_many(self.values, "hour"))
+
+        packed = ceil_many([LocalDatetime.at(2020, 1, 1, 1)], "day", packed=True)
+        self.assertIsInstance(packed, LocalDatetimeArray)
+        self.assertEqual(list(packed), [LocalDatetime.at(2020, 1, 2)])
+
+        epochs = array("q", [1, 86_400_000_001, -1])
+        self.assertEqual(
+            floor_many(epochs, "day"), array("q", [0, 86_400_000_000, -86_400_000_000])
+        )
+        self.assertEqual(
+            floor_many(
+                memoryview(epochs), "day", origin=UTCDatetime.at(1970, 1, 1, 12)
+            ),
+            array("q", [-43_200_000_000, 43_200_000_000, -43_200_000_000]),
+        )
+
+    def test_subclass(self):
+        class Subclass(UTCDatetime):
+            pass
+
+        values = [Subclass.trusted(value.as_datetime()) for value in self.values]
+
+        self.assertEqual(floor_many(values, "hour"), floor_many(self.values, "hour"))
+
+    def test_interned(self):
+        rounded = floor_many(self.values, "month", intern=True)
+
+        self.assertEqual(rounded, floor_many(self.values, "month"))
+        self.assertLessEqual(len(set(map(id, rounded))), 40)
+        self.assertIs(rounded[0], UTCDatetime.intern(rounded[0]._plus_us(0)))
+
+    def test_empty(self):
+        self.assertEqual(floor_many([], "day"), [])
+        self.assertEqual(floor_many(array("q"), "day"), array("q"))
+        self.assertEqual(list(round_many(UTCDatetimeArray(), "day")), [])
+
+    def test_exceptions(self):
+        with self.assertRaisesRegex(
+            TypeError,
+            r"^can only round values that are all LocalDatetime or UTCDatetime$",
+        ):
+            floor_many([self.values[0], LocalDatetime.at(2020, 1, 1)], "day")
+        with self.assertRaisesRegex(
+            TypeError, r"^origin must be UTCDatetime, not 'datetime'$"
+        ):
+            floor_many(self.values, "day", origin=datetime(2020, 1, 1))
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            ceil_many([UTCDatetime.max], "second")
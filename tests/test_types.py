@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import copy
 import pickle
+from array import array
 from datetime import datetime, timedelta, timezone
-from unittest import TestCase
-
-from fourth import LocalDatetime, UTCDatetime
+from unittest import TestCase, mock
+
+from fourth import (
+    LocalDatetime,
+    LocalDatetimeArray,
+    ParseResult,
+    UTCDatetime,
+    UTCDatetimeArray,
+)
 from fourth.types import BaseDatetime
 
 from . import FourthTestCase
@@ -12,7 +20,7 @@ from . import FourthTestCase
 
 class BaseDatetimeTests(TestCase):
     def test_slots(self):
-        self.assertEqual(BaseDatetime.__slots__, ("_at",))
+        self.assertEqual(BaseDatetime.__slots__, ("_us", "_dt"))
 
     def test_cant_be_instantiated(self):
         with self.assertRaisesRegex(
@@ -35,6 +43,17 @@ class BaseDatetimeTests(TestCase):
         ):
             BaseDatetime.strftime(foo, "%Y")
 
+    def test_intern_pool_is_bounded(self):
+        values = [UTCDatetime.at(1999, 1, 1, second=second) for second in range(4)]
+
+        with mock.patch("fourth.types._INTERN_POOL_SIZE", 2):
+            for value in values:
+                UTCDatetime.intern(value)
+
+            # the earliest added were evicted, so equal values take their place
+            self.assertIsNot(UTCDatetime.intern(values[0]._plus_us(0)), values[0])
+            self.assertIs(UTCDatetime.intern(values[3]._plus_us(0)), values[3])
+
 
 class LocalDatetimeTests(FourthTestCase):
     def test_slots(self):
@@ -254,6 +273,19 @@ class LocalDatetimeTests(FourthTestCase):
             LocalDatetime.at(2020, 9, 8, 2),
         )
 
+    def test_addition_out_of_range(self):
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            LocalDatetime.max + timedelta(microseconds=1)
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            LocalDatetime.min - timedelta(microseconds=1)
+
+    def test_arithmetic_doesnt_build_datetime(self):
+        foo = LocalDatetime.at(2020, 9, 5) + timedelta(hours=12)
+
+        self.assertIsNone(foo._dt)
+        self.assertEqual(foo.hour, 12)
+        self.assertIs(foo._dt, foo._at)
+
     def test_sub(self):
         foo = LocalDatetime.at(2020, 9, 5)
 
@@ -319,6 +351,42 @@ class LocalDatetimeTests(FourthTestCase):
         for protocol in range(0, pickle.HIGHEST_PROTOCOL + 1):
             self.assertEqual(foo, pickle.loads(pickle.dumps(foo, protocol=protocol)))
 
+    def test_unpickle_datetime_state(self):
+        """
+        Test pickles with the datetime as their state still load
+        """
+        pickled = (
+            b"\x80\x04\x95O\x00\x00\x00\x00\x00\x00\x00\x8c\x0cfourth.types\x94"
+            b"\x8c\rLocalDatetime\x94\x93\x94)\x81\x94\x8c\x08datetime\x94\x8c\x08"
+            b"datetime\x94\x93\x94C\n\x07\xe4\x08\x1e\x01\x02\x03\x00\x00\x04\x94"
+            b"\x85\x94R\x94b."
+        )
+
+        self.assertEqual(
+            pickle.loads(pickled), LocalDatetime.at(2020, 8, 30, 1, 2, 3, 4)
+        )
+
+    def test_reduce(self):
+        foo = LocalDatetime.at(2020, 8, 30, 1, 2, 3, 4)
+
+        function, arguments = foo.__reduce__()
+
+        self.assertEqual(arguments, (LocalDatetime, foo._us))
+        self.assertEqual(function(*arguments), foo)
+
+    def test_unpickle_out_of_range(self):
+        function, arguments = LocalDatetime.max.__reduce__()
+
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            function(LocalDatetime, arguments[1] + 1)
+
+    def test_copy(self):
+        foo = LocalDatetime.now()
+
+        self.assertIs(copy.copy(foo), foo)
+        self.assertIs(copy.deepcopy(foo), foo)
+        self.assertIs(copy.deepcopy([foo])[0], foo)
+
     def test_bool(self):
         self.assertIs(True, bool(LocalDatetime.min))
         self.assertIs(True, bool(LocalDatetime.max))
@@ -364,6 +432,15 @@ class LocalDatetimeTests(FourthTestCase):
         self.assertIsInstance(local_now, LocalDatetime)
         self.assertLess(local_now._at - now, timedelta(seconds=1))
 
+    def test_trusted_constructor(self):
+        at = datetime(2020, 8, 30, 1, 2, 3, 4)
+        foo = LocalDatetime.trusted(at)
+
+        self.assertIsInstance(foo, LocalDatetime)
+        self.assertIs(foo._at, at)
+        self.assertEqual(foo, LocalDatetime(at))
+        self.assertEqual(hash(foo), hash(LocalDatetime(at)))
+
     def test_from_iso_format(self):
         foo = LocalDatetime.from_iso_format("2020-03-04T23:59:59.333444")
 
@@ -376,6 +453,72 @@ class LocalDatetimeTests(FourthTestCase):
         ):
             LocalDatetime.from_iso_format("2020-03-04T23:59:59.333444+00:00")
 
+    def test_from_iso_format_many(self):
+        result = LocalDatetime.from_iso_format_many(
+            ["2020-03-04T23:59:59.333444", "2020-03-04", "2020-03-04T23:59:59+00:00"]
+        )
+
+        self.assertIsInstance(result, ParseResult)
+        self.assertEqual(
+            result.values,
+            [
+                LocalDatetime.at(2020, 3, 4, 23, 59, 59, 333444),
+                LocalDatetime.at(2020, 3, 4),
+                None,
+            ],
+        )
+        self.assertEqual(list(result.errors), [2])
+        self.assertIsInstance(result.errors[2], ValueError)
+        self.assertEqual(
+            str(result.errors[2]), "fromisoformat: date_string contained tz info"
+        )
+
+    def test_from_iso_format_many_packed(self):
+        result = LocalDatetime.from_iso_format_many(
+            ["2020-03-04T23:59:59.333444", "foo", "1970-01-01T00:00:00.000001"],
+            packed=True,
+        )
+
+        self.assertIsInstance(result.values, LocalDatetimeArray)
+        self.assertEqual(
+            list(result.values.to_epoch_microseconds()), [1583366399333444, 0, 1]
+        )
+        self.assertEqual(list(result.errors), [1])
+        self.assertIsInstance(result.errors[1], ValueError)
+
+    def test_from_iso_format_many_empty(self):
+        self.assertEqual(LocalDatetime.from_iso_format_many([]), ([], {}))
+
+    def test_from_iso_format_many_interned(self):
+        result = LocalDatetime.from_iso_format_many(
+            ["2021-03-04T05:06:07", "foo", "2021-03-04T05:06:07"], intern=True
+        )
+
+        first, error, second = result.values
+        self.assertEqual(first, LocalDatetime.at(2021, 3, 4, 5, 6, 7))
+        self.assertIs(second, first)
+        self.assertIsNone(error)
+        self.assertEqual(list(result.errors), [1])
+        self.assertIs(
+            LocalDatetime.intern(LocalDatetime.at(2021, 3, 4, 5, 6, 7)), first
+        )
+
+    def test_intern(self):
+        first = LocalDatetime.at(2021, 3, 4, 5, 6, 8)
+        second = LocalDatetime.at(2021, 3, 4, 5, 6, 8)
+
+        self.assertIs(LocalDatetime.intern(first), first)
+        self.assertIs(LocalDatetime.intern(second), first)
+        # each type has its own pool
+        self.assertIsInstance(
+            UTCDatetime.intern(UTCDatetime.at(2021, 3, 4, 5, 6, 8)), UTCDatetime
+        )
+
+        with self.assertRaisesRegex(
+            TypeError, r"^expected LocalDatetime, not 'UTCDatetime'$"
+        ):
+            LocalDatetime.intern(UTCDatetime.at(2021, 3, 4))
+
     def test_strptime(self):
         foo = LocalDatetime.strptime("2020/05/22 12:02:04", "%Y/%m/%d %H:%M:%S")
 
@@ -519,6 +662,15 @@ class UTCDatetimeTests(FourthTestCase):
         self.assertEqual(now, utc_now._at)
         self.assertIs(now, utc_now._at)
 
+    def test_init_other_timezone(self):
+        at = datetime(2020, 9, 5, 17, 30, tzinfo=timezone(timedelta(hours=5)))
+        foo = UTCDatetime(at)
+
+        self.assertIsNone(foo._dt)
+        self.assertEqual(foo._at, at)
+        self.assertIs(foo._at.tzinfo, timezone.utc)
+        self.assertEqual(foo._at, datetime(2020, 9, 5, 12, 30, tzinfo=timezone.utc))
+
     def test_init_exceptions(self):
         now_naive = datetime.now()
 
@@ -527,6 +679,30 @@ class UTCDatetimeTests(FourthTestCase):
         ):
             UTCDatetime(now_naive)
 
+    def test_init_out_of_range(self):
+        for at in [
+            datetime(1, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+            datetime(9999, 12, 31, 23, tzinfo=timezone(timedelta(hours=-2))),
+        ]:
+            with self.subTest(at=at):
+                with self.assertRaisesRegex(
+                    OverflowError, r"^date value out of range$"
+                ):
+                    UTCDatetime(at)
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.from_iso_format("0001-01-01T00:00:00+01:00")
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.strptime("9999-12-31 23:00:00-0200", "%Y-%m-%d %H:%M:%S%z")
+
+        # the ends of the range are still valid
+        self.assertEqual(
+            UTCDatetime(datetime(1, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))),
+            UTCDatetime.min,
+        )
+        self.assertEqual(
+            UTCDatetime(datetime.max.replace(tzinfo=timezone.utc)), UTCDatetime.max
+        )
+
     def test_setattr(self):
         foo = UTCDatetime.now()
 
@@ -630,6 +806,18 @@ class UTCDatetimeTests(FourthTestCase):
         self.assertEqual(hash(foo), hash(foo_datetime))
         self.assertEqual(hash(foo), hash(foo_datetime_offset))
 
+    def test_hash_without_datetime(self):
+        for foo in (
+            UTCDatetime.min,
+            UTCDatetime.max,
+            UTCDatetime.at(1969, 12, 31, 23, 59, 59, 999_999),
+            UTCDatetime.at(1970, 1, 1),
+            UTCDatetime.at(2026, 3, 22, 12, 1, 5, 123_456),
+        ):
+            with self.subTest(foo=foo):
+                foo_hash = hash(UTCDatetime._from_us(foo._us))
+                self.assertEqual(foo_hash, hash(foo.as_datetime()))
+
     def test_lt(self):
         foo = UTCDatetime.at(1990, 3, 4)
 
@@ -770,6 +958,19 @@ class UTCDatetimeTests(FourthTestCase):
             UTCDatetime.at(2020, 9, 8, 2),
         )
 
+    def test_addition_out_of_range(self):
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.max + timedelta(microseconds=1)
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.min - timedelta(microseconds=1)
+
+    def test_arithmetic_doesnt_build_datetime(self):
+        foo = UTCDatetime.at(2020, 9, 5) + timedelta(hours=12)
+
+        self.assertIsNone(foo._dt)
+        self.assertEqual(foo.hour, 12)
+        self.assertIs(foo._dt, foo._at)
+
     def test_sub(self):
         foo = UTCDatetime.at(2020, 9, 5)
 
@@ -832,6 +1033,44 @@ class UTCDatetimeTests(FourthTestCase):
         for protocol in range(0, pickle.HIGHEST_PROTOCOL + 1):
             self.assertEqual(foo, pickle.loads(pickle.dumps(foo, protocol=protocol)))
 
+    def test_unpickle_datetime_state(self):
+        """
+        Test pickles with the datetime as their state still load
+        """
+        pickled = (
+            b"\x80\x04\x95z\x00\x00\x00\x00\x00\x00\x00\x8c\x0cfourth.types\x94"
+            b"\x8c\x0bUTCDatetime\x94\x93\x94)\x81\x94\x8c\x08datetime\x94\x8c\x08"
+            b"datetime\x94\x93\x94C\n\x07\xe4\x08\x1e\x01\x02\x03\x00\x00\x04\x94"
+            b"h\x04\x8c\x08timezone\x94\x93\x94h\x04\x8c\ttimedelta\x94\x93\x94K\x00"
+            b"K\x00K\x00\x87\x94R\x94\x85\x94R\x94\x86\x94R\x94b."
+        )
+
+        self.assertEqual(pickle.loads(pickled), UTCDatetime.at(2020, 8, 30, 1, 2, 3, 4))
+
+    def test_reduce(self):
+        foo = UTCDatetime.at(2020, 8, 30, 1, 2, 3, 4)
+
+        function, arguments = foo.__reduce__()
+
+        self.assertEqual(arguments, (UTCDatetime, foo._us))
+        self.assertEqual(function(*arguments), foo)
+
+        # smaller than pickling the datetime, which includes the timezone
+        self.assertLess(len(pickle.dumps(foo)), len(pickle.dumps(foo._at)))
+
+    def test_unpickle_out_of_range(self):
+        function, arguments = UTCDatetime.max.__reduce__()
+
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            function(UTCDatetime, arguments[1] + 1)
+
+    def test_copy(self):
+        foo = UTCDatetime.now()
+
+        self.assertIs(copy.copy(foo), foo)
+        self.assertIs(copy.deepcopy(foo), foo)
+        self.assertIs(copy.deepcopy([foo])[0], foo)
+
     def test_bool(self):
         self.assertIs(True, bool(UTCDatetime.min))
         self.assertIs(True, bool(UTCDatetime.max))
@@ -877,7 +1116,9 @@ class UTCDatetimeTests(FourthTestCase):
         utc_now = UTCDatetime.now()
 
         self.assertIsInstance(utc_now, UTCDatetime)
+        self.assertLessEqual(now, utc_now)
         self.assertLess(utc_now._at - now, timedelta(seconds=1))
+        self.assertIs(utc_now._at.tzinfo, timezone.utc)
 
     def test_from_timestamp_constructor(self):
         foo = UTCDatetime.from_timestamp(1_200_300_400)
@@ -889,6 +1130,86 @@ class UTCDatetimeTests(FourthTestCase):
 
         self.assertEqual(foo, UTCDatetime.at(2008, 1, 14, 8, 46, 40, 250000))
 
+    def test_from_timestamp_many(self):
+        timestamps = [1_200_300_400, 1_200_300_400.25, -0.5, 1e12, float("nan")]
+
+        result = UTCDatetime.from_timestamp_many(timestamps)
+
+        self.assertEqual(
+            result.values,
+            [
+                UTCDatetime.at(2008, 1, 14, 8, 46, 40),
+                UTCDatetime.at(2008, 1, 14, 8, 46, 40, 250000),
+                UTCDatetime.at(1969, 12, 31, 23, 59, 59, 500000),
+                None,
+                None,
+            ],
+        )
+        self.assertEqual(sorted(result.errors), [3, 4])
+        self.assertIsInstance(result.errors[3], ValueError)
+
+    def test_from_timestamp_many_records_non_numbers(self):
+        result = UTCDatetime.from_timestamp_many([0, None, "1", 1.5], packed=True)
+
+        self.assertEqual(sorted(result.errors), [1, 2])
+        self.assertIsInstance(result.errors[1], TypeError)
+        self.assertIsInstance(result.errors[2], TypeError)
+        self.assertEqual(
+            list(result.values.to_epoch_microseconds()), [0, 0, 0, 1_500_000]
+        )
+
+    def test_from_timestamp_many_matches_from_timestamp(self):
+        # floats are rounded to the microsecond half to even, like fromtimestamp()
+        timestamps = array("d", [1.0000005, 1.0000015, -1.0000005, 1_600_000_000.1])
+
+        result = UTCDatetime.from_timestamp_many(timestamps, packed=True)
+
+        self.assertIsInstance(result.values, UTCDatetimeArray)
+        self.assertEqual(
+            list(result.values), [UTCDatetime.from_timestamp(t) for t in timestamps]
+        )
+        self.assertEqual(result.errors, {})
+
+    def test_from_timestamp_many_interned(self):
+        result = UTCDatetime.from_timestamp_many([0, 0.0], intern=True)
+
+        self.assertIs(result.values[0], result.values[1])
+
+    def test_from_epoch_constructors(self):
+        expected = UTCDatetime.at(2020, 1, 2, 3, 4, 5)
+
+        self.assertEqual(UTCDatetime.from_epoch_seconds(1_577_934_245), expected)
+        self.assertEqual(
+            UTCDatetime.from_epoch_milliseconds(1_577_934_245_000), expected
+        )
+        self.assertEqual(
+            UTCDatetime.from_epoch_microseconds(1_577_934_245_000_000), expected
+        )
+        self.assertEqual(
+            UTCDatetime.from_epoch_nanoseconds(1_577_934_245_000_000_999), expected
+        )
+        self.assertEqual(
+            UTCDatetime.from_epoch_nanoseconds(-1),
+            UTCDatetime.at(1969, 12, 31, 23, 59, 59, 999999),
+        )
+
+    def test_from_epoch_constructors_exceptions(self):
+        with self.assertRaises(TypeError):
+            UTCDatetime.from_epoch_seconds(1.5)
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.from_epoch_seconds(253_402_300_800)
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.from_epoch_milliseconds(-62_135_596_800_001)
+
+    def test_trusted_constructor(self):
+        at = datetime(2020, 8, 30, 1, 2, 3, 4, tzinfo=timezone.utc)
+        foo = UTCDatetime.trusted(at)
+
+        self.assertIsInstance(foo, UTCDatetime)
+        self.assertIs(foo._at, at)
+        self.assertEqual(foo, UTCDatetime(at))
+        self.assertEqual(hash(foo), hash(UTCDatetime(at)))
+
     def test_from_iso_format(self):
         foo = UTCDatetime.from_iso_format("2020-03-04T23:59:59.333444+00:00")
 
@@ -907,6 +1228,99 @@ class UTCDatetimeTests(FourthTestCase):
         ):
             UTCDatetime.from_iso_format("2020-03-04T23:59:59.333444")
 
+    def test_from_iso_format_many(self):
+        strings = [
+            "2020-03-04T23:59:59.333444+00:00",
+            "2020-03-04T23:59:59.333444+04:30",
+            "2020-03-04T23:59:59.333444",
+            "2020-03-04T23:59:59.333444+04:30",
+            "2020-03-04T23:59:59.333444-04:30",
+            "2020-03-04 23:59:59+04:30",
+            "not a date",
+        ]
+        result = UTCDatetime.from_iso_format_many(iter(strings))
+
+        self.assertIsInstance(result, ParseResult)
+        self.assertEqual(
+            result.values,
+            [
+                UTCDatetime.at(2020, 3, 4, 23, 59, 59, 333444),
+                UTCDatetime.at(2020, 3, 4, 19, 29, 59, 333444),
+                None,
+                UTCDatetime.at(2020, 3, 4, 19, 29, 59, 333444),
+                UTCDatetime.at(2020, 3, 5, 4, 29, 59, 333444),
+                UTCDatetime.at(2020, 3, 4, 19, 29, 59),
+                None,
+            ],
+        )
+        for value in result.values:
+            if value is not None:
+                self.assertIs(value._at.tzinfo, timezone.utc)
+        self.assertEqual(list(result.errors), [2, 6])
+        self.assertEqual(
+            str(result.errors[2]), "fromisoformat: date_string didn't contain tz info"
+        )
+        self.assertIsInstance(result.errors[6], ValueError)
+
+    def test_from_iso_format_many_interned(self):
+        strings = ["2021-03-04T05:06:07+08:00", "2021-03-03T21:06:07+00:00"] * 2
+        result = UTCDatetime.from_iso_format_many(strings, intern=True)
+
+        self.assertEqual(result.errors, {})
+        self.assertEqual(result.values, [UTCDatetime.at(2021, 3, 3, 21, 6, 7)] * 4)
+        self.assertEqual(len(set(map(id, result.values))), 1)
+        # interned values compare equal by identity
+        self.assertTrue(result.values[0] == result.values[3])
+
+    def test_from_iso_format_many_matches_from_iso_format(self):
+        strings = [
+            "2020-03-04T23:59:59.333444+14:00",
+            "2020-03-04T23:59:59.333444-00:00",
+            "2020-03-04T23:59:59.333444+00:30",
+            "2020-03-04T23:59:59.333444+00:30",
+            "2020-03-04T23:59:59.333444+05:30:15",
+            "2020-03-04T23:59+05:30:15.000001",
+        ]
+        result = UTCDatetime.from_iso_format_many(strings)
+
+        self.assertEqual(result.errors, {})
+        self.assertEqual(
+            result.values, [UTCDatetime.from_iso_format(s) for s in strings]
+        )
+
+    def test_from_iso_format_many_packed(self):
+        result = UTCDatetime.from_iso_format_many(
+            ["1970-01-01T00:00:00.000001+00:00", "", "1970-01-01T10:00:00+10:00"],
+            packed=True,
+        )
+
+        self.assertIsInstance(result.values, UTCDatetimeArray)
+        self.assertEqual(list(result.values.to_epoch_microseconds()), [1, 0, 0])
+        self.assertEqual(list(result.errors), [1])
+
+    def test_from_iso_format_many_records_every_row_error(self):
+        strings = [
+            "0001-01-01T00:00:00+01:00",
+            "2020-01-01T00:00:00+00:00",
+            None,
+            "9999-12-31T23:00:00-02:00",
+        ]
+        for packed in (False, True):
+            with self.subTest(packed=packed):
+                result = UTCDatetime.from_iso_format_many(strings, packed=packed)
+
+                self.assertEqual(sorted(result.errors), [0, 2, 3])
+                self.assertIsInstance(result.errors[0], OverflowError)
+                self.assertIsInstance(result.errors[2], TypeError)
+                self.assertIsInstance(result.errors[3], OverflowError)
+                self.assertEqual(result.values[1], UTCDatetime.at(2020, 1, 1))
+
+    def test_from_iso_format_many_empty(self):
+        result = UTCDatetime.from_iso_format_many([], packed=True)
+
+        self.assertEqual(len(result.values), 0)
+        self.assertEqual(result.errors, {})
+
     def test_strptime(self):
         foo = UTCDatetime.strptime("2020/05/22 12:02:04 +0000", "%Y/%m/%d %H:%M:%S %z")
 
@@ -972,3 +1386,53 @@ class UTCDatetimeTests(FourthTestCase):
         foo = UTCDatetime.at(2030, 4, 5)
 
         self.assertEqual(foo.strftime("%Y-%m-%d %z %Z"), "2030-04-05 +0000 UTC")
+
+    def test_to_timestamp(self):
+        foo = UTCDatetime.at(2008, 1, 14, 8, 46, 40, 250000)
+
+        self.assertEqual(foo.to_timestamp(), 1_200_300_400.25)
+        self.assertEqual(foo.to_timestamp(), foo.as_datetime().timestamp())
+        self.assertEqual(UTCDatetime.from_timestamp(foo.to_timestamp()), foo)
+
+    def test_to_epoch(self):
+        foo = UTCDatetime.at(1969, 12, 31, 23, 59, 59, 999999)
+
+        self.assertEqual(foo.to_epoch_seconds(), -1)
+        self.assertEqual(foo.to_epoch_milliseconds(), -1)
+        self.assertEqual(foo.to_epoch_microseconds(), -1)
+        self.assertEqual(foo.to_epoch_nanoseconds(), -1_000)
+        self.assertEqual(
+            UTCDatetime.from_epoch_nanoseconds(UTCDatetime.max.to_epoch_nanoseconds()),
+            UTCDatetime.max,
+        )
+
+    def test_http_date(self):
+        foo = UTCDatetime.at(1994, 11, 6, 8, 49, 37, 123456)
+
+        self.assertEqual(foo.to_http_date(), "Sun, 06 Nov 1994 08:49:37 GMT")
+        self.assertEqual(
+            UTCDatetime.from_http_date("Sun, 06 Nov 1994 08:49:37 GMT"),
+            UTCDatetime.at(1994, 11, 6, 8, 49, 37),
+        )
+
+    def test_rfc2822(self):
+        foo = UTCDatetime.at(1994, 11, 6, 8, 49, 37, 123456)
+
+        self.assertEqual(foo.to_rfc2822(), "Sun, 06 Nov 1994 08:49:37 +0000")
+        self.assertEqual(
+            UTCDatetime.from_rfc2822("Sun, 06 Nov 1994 16:49:37 +0800"),
+            UTCDatetime.at(1994, 11, 6, 8, 49, 37),
+        )
+
+    def test_rfc3339(self):
+        foo = UTCDatetime.at(1994, 11, 6, 8, 49, 37, 123456)
+
+        self.assertEqual(foo.to_rfc3339(), "1994-11-06T08:49:37.123456Z")
+        self.assertEqual(
+            foo.to_rfc3339(timespec="milliseconds"), "1994-11-06T08:49:37.123Z"
+        )
+        self.assertEqual(foo.to_rfc3339(timespec="seconds"), "1994-11-06T08:49:37Z")
+        self.assertEqual(UTCDatetime.from_rfc3339("1994-11-06T08:49:37.123456Z"), foo)
+        self.assertEqual(
+            UTCDatetime.from_rfc3339("1994-11-06T03:49:37.123456-05:00"), foo
+        )
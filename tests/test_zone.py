@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from importlib.util import find_spec
+from unittest import TestCase, skipUnless
+
+from fourth import (
+    LocalDatetime,
+    LocalDatetimeArray,
+    UTCDatetime,
+    UTCDatetimeArray,
+    Zone,
+)
+
+HAS_ZONEINFO = find_spec("zoneinfo") is not None
+
+if HAS_ZONEINFO:
+    from zoneinfo import ZoneInfo
+
+
+@skipUnless(HAS_ZONEINFO, "needs zoneinfo")
+class ZoneTests(TestCase):
+    def test_repr(self):
+        zone = Zone("Australia/Perth")
+
+        self.assertEqual(repr(zone), "Zone('Australia/Perth')")
+        self.assertEqual(zone.key, "Australia/Perth")
+
+    def test_unknown_zone(self):
+        with self.assertRaises(KeyError):
+            Zone("Mars/Olympus_Mons")
+
+    def test_to_local(self):
+        zone = Zone("America/New_York")
+
+        for at, expected in (
+            (UTCDatetime.at(2021, 1, 1, 12), LocalDatetime.at(2021, 1, 1, 7)),
+            (UTCDatetime.at(2021, 7, 1, 12), LocalDatetime.at(2021, 7, 1, 8)),
+            (UTCDatetime.at(2021, 3, 14, 6, 59), LocalDatetime.at(2021, 3, 14, 1, 59)),
+            (UTCDatetime.at(2021, 3, 14, 7), LocalDatetime.at(2021, 3, 14, 3)),
+        ):
+            with self.subTest(at=at):
+                self.assertEqual(zone.to_local(at), expected)
+                self.assertEqual(at.to_local("America/New_York"), expected)
+
+    def test_to_utc(self):
+        zone = Zone("Australia/Lord_Howe")
+
+        # daylight saving time in Lord Howe is only half an hour
+        self.assertEqual(
+            zone.to_utc(LocalDatetime.at(2021, 1, 1, 11)),
+            UTCDatetime.at(2021, 1, 1),
+        )
+        self.assertEqual(
+            LocalDatetime.at(2021, 7, 1, 10, 30).to_utc(zone),
+            UTCDatetime.at(2021, 7, 1),
+        )
+
+    def test_nonexistent(self):
+        zone = Zone("Europe/London")
+        wall = LocalDatetime.at(2021, 3, 28, 1, 30)
+
+        with self.assertRaisesRegex(
+            ValueError,
+            r"^LocalDatetime.at\(2021, 3, 28, 1, 30, 0, 0\) doesn't exist in "
+            r"Europe/London$",
+        ):
+            zone.to_utc(wall)
+        self.assertEqual(
+            zone.to_utc(wall, nonexistent="shift_forward"),
+            UTCDatetime.at(2021, 3, 28, 1),
+        )
+        self.assertEqual(
+            zone.to_utc(wall, nonexistent="shift_backward"),
+            UTCDatetime.at(2021, 3, 28, 0, 59, 59, 999_999),
+        )
+
+    def test_ambiguous(self):
+        zone = Zone("Europe/London")
+        wall = LocalDatetime.at(2021, 10, 31, 1, 30)
+
+        with self.assertRaisesRegex(
+            ValueError,
+            r"^LocalDatetime.at\(2021, 10, 31, 1, 30, 0, 0\) is ambiguous in "
+            r"Europe/London$",
+        ):
+            zone.to_utc(wall)
+        self.assertEqual(
+            zone.to_utc(wall, ambiguous="earlier"), UTCDatetime.at(2021, 10, 31, 0, 30)
+        )
+        self.assertEqual(
+            zone.to_utc(wall, ambiguous="later"), UTCDatetime.at(2021, 10, 31, 1, 30)
+        )
+
+    def test_exceptions(self):
+        zone = Zone("UTC")
+
+        with self.assertRaisesRegex(
+            ValueError,
+            r"^ambiguous must be one of 'raise', 'earlier', 'later', not 'foo'$",
+        ):
+            zone.to_utc(LocalDatetime.at(2021, 1, 1), ambiguous="foo")
+        with self.assertRaisesRegex(
+            ValueError,
+            r"^nonexistent must be one of 'raise', 'shift_forward', "
+            r"'shift_backward', not 'foo'$",
+        ):
+            zone.to_utc_many([], nonexistent="foo")
+        with self.assertRaisesRegex(TypeError, r"^expected UTCDatetime, not 'str'$"):
+            zone.to_local("foo")
+        with self.assertRaisesRegex(
+            TypeError, r"^expected LocalDatetime, not 'UTCDatetime'$"
+        ):
+            zone.to_utc_many([UTCDatetime.now()])
+
+    def test_out_of_range(self):
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            UTCDatetime.max.to_local("Asia/Tokyo")
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            Zone("Asia/Tokyo").to_utc_many([LocalDatetime.min])
+
+    def test_end_of_range(self):
+        walls = [LocalDatetime.at(9999, 12, 31, 12), LocalDatetime.max]
+        for key, expected in [
+            ("UTC", [UTCDatetime.at(9999, 12, 31, 12), UTCDatetime.max]),
+            (
+                "Asia/Tokyo",
+                [
+                    UTCDatetime.at(9999, 12, 31, 3),
+                    UTCDatetime.at(9999, 12, 31, 14, 59, 59, 999_999),
+                ],
+            ),
+        ]:
+            zone = Zone(key)
+            with self.subTest(key=key):
+                self.assertEqual([zone.to_utc(wall) for wall in walls], expected)
+                self.assertEqual(zone.to_utc_many(walls), expected)
+                self.assertEqual(zone.to_local_many(expected), walls)
+
+        zone = Zone("America/New_York")
+        self.assertEqual(zone.to_utc(walls[0]), UTCDatetime.at(9999, 12, 31, 17))
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            zone.to_utc(walls[1])
+        with self.assertRaisesRegex(OverflowError, r"^date value out of range$"):
+            zone.to_utc_many(walls)
+
+    def test_matches_zoneinfo(self):
+        rng = random.Random(12)
+
+        for key in ("America/New_York", "Australia/Lord_Howe", "Europe/Dublin", "UTC"):
+            zone, zone_info = Zone(key), ZoneInfo(key)
+            for _ in range(500):
+                # from 1900 to past the year 2100, where the table is extended
+                seconds = rng.randrange(-2_208_988_800, 7_000_000_000)
+                at = datetime.fromtimestamp(seconds, timezone.utc)
+                wall = at.astimezone(zone_info).replace(tzinfo=None)
+
+                with self.subTest(key=key, at=at):
+                    self.assertEqual(
+                        zone.to_local(UTCDatetime.trusted(at)).as_datetime(), wall
+                    )
+                    for ambiguous, fold in (("earlier", 0), ("later", 1)):
+                        expected = wall.replace(tzinfo=zone_info, fold=fold)
+                        self.assertEqual(
+                            zone.to_utc(
+                                LocalDatetime.trusted(wall), ambiguous=ambiguous
+                            ).as_datetime(),
+                            expected.astimezone(timezone.utc),
+                        )
+
+    def test_many(self):
+        zone = Zone("America/New_York")
+        rng = random.Random(5)
+        start = LocalDatetime.at(2000, 1, 1)
+        walls = sorted(
+            start + timedelta(seconds=rng.randrange(10 ** 9)) for _ in range(2000)
+        )
+        # then some out of order
+        walls += rng.sample(walls, 200)
+        options = {"ambiguous": "later", "nonexistent": "shift_forward"}
+
+        instants = zone.to_utc_many(walls, **options)
+
+        self.assertEqual(instants, [zone.to_utc(wall, **options) for wall in walls])
+        self.assertEqual(
+            zone.to_local_many(instants), [zone.to_local(at) for at in instants]
+        )
+        self.assertEqual(zone.to_local_many([]), [])
+
+    def test_arrays(self):
+        zone = Zone("Europe/London")
+        walls = LocalDatetimeArray(
+            [LocalDatetime.at(2021, 1, 1), LocalDatetime.at(2021, 7, 1)]
+        )
+
+        instants = walls.to_utc("Europe/London")
+
+        self.assertIsInstance(instants, UTCDatetimeArray)
+        self.assertEqual(
+            list(instants),
+            [UTCDatetime.at(2021, 1, 1), UTCDatetime.at(2021, 6, 30, 23)],
+        )
+        self.assertIsInstance(instants.to_local(zone), LocalDatetimeArray)
+        self.assertEqual(list(instants.to_local(zone)), list(walls))
+        self.assertIsInstance(zone.to_utc_many([], packed=True), UTCDatetimeArray)